@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Replay SNMP dumps through JuniperSnmpAutoload.discover and report wall time, SNMP request count, peak memory and
+per-stage timings for each device profile.
+
+The dump is served by an in-process fake agent to JuniperSnmpService sessions, so the reported requests are the
+GETBULK and GET PDUs the service sends to a device.
+
+    python benchmarks/autoload_benchmark.py --output bench_output.txt
+    python benchmarks/autoload_benchmark.py --profile mx_large --max-workers 4 --latency 2
+    python benchmarks/autoload_benchmark.py --profile mx_large --stream
+    python benchmarks/autoload_benchmark.py --dump benchmarks/dumps/ex_small.json
+
+Run from the repository root with the package installed (or PYTHONPATH=.). Each profile runs in a separate process,
+so peak memory (ru_maxrss) is reported per profile. benchmarks/results/baseline.json is the recorded output of
+the default run (all profiles, 3 runs each).
+"""
+
+import argparse
+import json
+import logging
+import platform
+import resource
+import sys
+import time
+from multiprocessing import Pool
+
+from autoload_fixtures import PROFILES, build_dump, load_dump
+from fake_snmp_agent import FakeQualiSnmp, FakeSnmpAgent, SnmpStats
+
+from cloudshell.networking.juniper.autoload.juniper_snmp_autoload import JuniperSnmpAutoload
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import JuniperSnmpService
+
+SUPPORTED_OS = ['JUNOS']
+
+
+def create_snmp_service(agent, logger, max_repetitions):
+    """
+    :type agent: FakeSnmpAgent
+    :rtype: JuniperSnmpService
+    """
+    return JuniperSnmpService(FakeQualiSnmp(agent, logger), logger, max_repetitions)
+
+
+class BenchmarkAutoload(JuniperSnmpAutoload):
+    """
+    JuniperSnmpAutoload which measures its stages
+    """
+    STAGES = ['_is_valid_device_os', '_load_cached_tables', '_fetch_snmp_data', '_build_root', '_build_chassis',
+              '_build_power_modules', '_build_modules', '_build_sub_modules', '_build_ports', '_save_cached_tables',
+              '_log_autoload_details']
+
+    def iter_discover(self, supported_os):
+        # the stream is consumed by the caller, measure the whole emitting loop as one stage
+        start_time = time.time()
+        for autoload_details in JuniperSnmpAutoload.iter_discover(self, supported_os):
+            yield autoload_details
+        self.stage_timings['iter_discover'] = time.time() - start_time
+
+    def __init__(self, *args, **kwargs):
+        JuniperSnmpAutoload.__init__(self, *args, **kwargs)
+        self.stage_timings = {}
+        for stage in self.STAGES:
+            setattr(self, stage, self._timed(stage, getattr(self, stage)))
+
+    def _timed(self, stage, method):
+        def wrapper(*args, **kwargs):
+            start_time = time.time()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.stage_timings[stage] = self.stage_timings.get(stage, 0) + time.time() - start_time
+
+        return wrapper
+
+
+def run_profile(profile_name, dump_path=None, max_workers=1, latency=0, repeat=1, stream=False,
+                max_repetitions=JuniperSnmpService.DEFAULT_MAX_REPETITIONS):
+    """
+    Run autoload for the profile, the best run is reported
+    :param profile_name:
+    :param dump_path: recorded dump, synthesized from the profile if not set
+    :param max_workers: concurrent fetch workers
+    :param latency: simulated latency per SNMP request, sec
+    :param repeat: number of runs
+    :param stream: consume autoload details by top level resource instead of building them at once
+    :param max_repetitions: GETBULK max-repetitions
+    :rtype: dict
+    """
+    dump = load_dump(dump_path) if dump_path else build_dump(profile_name)
+    logger = logging.getLogger('autoload_benchmark')
+
+    best = None
+    for _ in range(repeat):
+        agent = FakeSnmpAgent(dump, SnmpStats(), latency)
+        start_time = time.time()
+        autoload = BenchmarkAutoload(create_snmp_service(agent, logger, max_repetitions), 'Juniper JunOS Router',
+                                     'CS_Router', profile_name, logger,
+                                     snmp_session_factory=lambda: create_snmp_service(agent, logger, max_repetitions),
+                                     max_workers=max_workers)
+        if stream:
+            resources = attributes = 0
+            for details in autoload.iter_discover(SUPPORTED_OS):
+                resources += len(details.resources)
+                attributes += len(details.attributes)
+        else:
+            details = autoload.discover(SUPPORTED_OS)
+            resources, attributes = len(details.resources), len(details.attributes)
+        wall_time = time.time() - start_time
+        if best is None or wall_time < best['wall_time']:
+            best = {'wall_time': round(wall_time, 6),
+                    'stages': {stage: round(value, 6) for stage, value in autoload.stage_timings.iteritems()},
+                    'snmp': agent.stats.to_dict(),
+                    'resources': resources,
+                    'attributes': attributes}
+
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on Mac OS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best['peak_memory_kb'] = max_rss // 1024 if sys.platform == 'darwin' else max_rss
+    best['interfaces'] = len(dump.get('IF-MIB::ifDescr', []))
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Juniper autoload benchmark')
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES),
+                        help='Device profile, all profiles by default')
+    parser.add_argument('--dump', help='Recorded SNMP dump (JSON) to replay instead of the synthesized profile')
+    parser.add_argument('--max-workers', type=int, default=1, help='Concurrent fetch workers')
+    parser.add_argument('--latency', type=float, default=0, help='Simulated latency per SNMP request, ms')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per profile, the best run is reported')
+    parser.add_argument('--max-repetitions', type=int, default=JuniperSnmpService.DEFAULT_MAX_REPETITIONS,
+                        help='GETBULK max-repetitions')
+    parser.add_argument('--stream', action='store_true', help='Use streaming autoload details')
+    parser.add_argument('--output', help='Write JSON results to the file instead of stdout')
+    args = parser.parse_args(argv)
+
+    profiles = args.profile or sorted(PROFILES)
+    if args.dump:
+        profiles = profiles[:1]
+    results = {'python': platform.python_version(),
+               'max_workers': args.max_workers,
+               'latency_ms': args.latency,
+               'max_repetitions': args.max_repetitions,
+               'stream': args.stream,
+               'profiles': {}}
+    for profile_name in profiles:
+        # Fresh process per profile, so peak memory of one profile does not hide the other
+        pool = Pool(1)
+        try:
+            results['profiles'][profile_name] = pool.apply(
+                run_profile, (profile_name, args.dump, args.max_workers, args.latency / 1000.0, args.repeat,
+                              args.stream, args.max_repetitions))
+        finally:
+            pool.close()
+            pool.join()
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+SNMP table dumps used by the autoload benchmark
+
+A dump is a dict {'MIB::name': [[suffix, {'suffix': suffix, column: value}], ...]}, the same rows QualiSnmp.walk
+returns for a table or a column. Scalars are stored as a single row with suffix '0'.
+Dumps are synthesized from the device profiles below, a dump recorded from a real device in the same format can be
+replayed with --dump.
+"""
+
+import json
+
+PROFILES = {
+    'ex_small': {'model': 'EX4300-48T', 'product': 'jnxProductNameEX4300', 'chassis': 1, 'fpcs': 1, 'pics': 2,
+                 'ports': 26, 'units': 1, 'lags': 2, 'lag_members': 2, 'lldp': 8, 'ipv4': 4},
+    'qfx_medium': {'model': 'QFX5100-48S-6Q', 'product': 'jnxProductNameQFX5100', 'chassis': 1, 'fpcs': 2,
+                   'pics': 2, 'ports': 27, 'units': 3, 'lags': 8, 'lag_members': 4, 'lldp': 48, 'ipv4': 64},
+    'mx_large': {'model': 'MX960', 'product': 'jnxProductNameMX960', 'chassis': 2, 'fpcs': 8, 'pics': 4,
+                 'ports': 10, 'units': 3, 'lags': 32, 'lag_members': 4, 'lldp': 256, 'ipv4': 1024},
+}
+
+FILTERED_INTERFACES = [('fxp0', 'ethernetCsmacd'), ('lo0', 'softwareLoopback'), ('lsi', 'other'),
+                       ('irb', 'propVirtual'), ('vme', 'propVirtual'), ('gr-0/0/0', 'tunnel')]
+
+
+class _DumpBuilder(object):
+    def __init__(self):
+        self.dump = {}
+
+    def add(self, mib, name, suffix, values):
+        """
+        :param mib:
+        :param name: table or column name
+        :param suffix: row index
+        :param values: dict {column: value}
+        """
+        row = dict(values, suffix=suffix)
+        self.dump.setdefault('{0}::{1}'.format(mib, name), []).append([suffix, row])
+
+    def add_column(self, mib, column, suffix, value):
+        self.add(mib, column, suffix, {column: value})
+
+    def add_scalar(self, mib, name, value):
+        self.add_column(mib, name, '0', value)
+
+    def add_content(self, index, container, model, content_type, descr, chassis_id):
+        for column, value in [('jnxContentsContainerIndex', container), ('jnxContentsModel', model),
+                              ('jnxContentsType', 'JUNIPER-CHASSIS-DEFINES-MIB::{0}'.format(content_type)),
+                              ('jnxContentsDescr', descr), ('jnxContentsSerialNo', 'SN{0}'.format(index)),
+                              ('jnxContentsRevision', 'REV 01'), ('jnxContentsChassisId', "'{0}'".format(chassis_id))]:
+            self.add_column('JUNIPER-MIB', column, index, value)
+
+    def add_interface(self, if_index, name, if_type, fpc=0, pic=0, port=0, unit=0):
+        suffix = str(if_index)
+        for column, value in [('ifDescr', name), ('ifType', "'{0}'".format(if_type)), ('ifAlias', ''),
+                              ('ifPhysAddress', '0x2c6bf5{0:06x}'.format(if_index)), ('ifMtu', '1514'),
+                              ('ifHighSpeed', '10000')]:
+            self.add_column('IF-MIB', column, suffix, value)
+        for column, value in [('ifChassisFpc', fpc), ('ifChassisPic', pic), ('ifChassisPort', port),
+                              ('ifChassisLogicalUnit', unit)]:
+            self.add_column('JUNIPER-IF-MIB', column, suffix, str(value))
+        if if_type == 'ethernetCsmacd' and not unit:
+            self.add_column('EtherLike-MIB', 'dot3StatsDuplexStatus', suffix, "'fullDuplex'")
+
+
+def build_dump(profile_name):
+    """
+    Synthesize SNMP dump for the device profile
+    :param profile_name: one of PROFILES
+    :rtype: dict
+    """
+    profile = PROFILES[profile_name]
+    builder = _DumpBuilder()
+    builder.add_scalar('SNMPv2-MIB', 'sysDescr', 'Juniper Networks, Inc. {0} internet router, kernel JUNOS 17.4R2.4, '
+                                                 'Build date: 2018-10-20 02:50:18 UTC'.format(profile['model'].lower()))
+    builder.add_scalar('SNMPv2-MIB', 'sysObjectID', 'JUNIPER-CHASSIS-DEFINES-MIB::{0}'.format(profile['product']))
+    builder.add_scalar('SNMPv2-MIB', 'sysContact', 'noc@example.com')
+    builder.add_scalar('SNMPv2-MIB', 'sysName', profile_name)
+    builder.add_scalar('SNMPv2-MIB', 'sysLocation', 'lab')
+    builder.add_scalar('SNMPv2-MIB', 'sysUpTime', '123456789')
+    builder.add_scalar('JUNIPER-MIB', 'jnxBoxDescr', 'Juniper {0}'.format(profile['model']))
+
+    fpc_number = 0
+    fpc_locations = []
+    for chassis in range(1, profile['chassis'] + 1):
+        chassis_id = 'lcc{0}'.format(chassis - 1) if profile['chassis'] > 1 else 'singleChassis'
+        builder.add_content('1.{0}.0.0'.format(chassis), '1', profile['model'], profile['product'],
+                            'midplane', chassis_id)
+        for power in range(1, 3):
+            builder.add_content('2.{0}.0.0'.format((chassis - 1) * 2 + power), '2', 'PWR-AC', 'jnxPowerSupply',
+                                'PEM {0}'.format(power - 1), chassis_id)
+        for fpc in range(profile['fpcs']):
+            fpc_number += 1
+            builder.add_content('7.{0}.0.0'.format(fpc_number), '7', 'MPC7E-MRATE', 'jnxFPC',
+                                'FPC: MPC7E @ {0}/*/*'.format(fpc_number - 1), chassis_id)
+            for pic in range(1, profile['pics'] + 1):
+                builder.add_content('8.{0}.{1}.0'.format(fpc_number, pic), '8', '', 'jnxPic',
+                                    'PIC: 10x10GE SFPP @ {0}/{1}/*'.format(fpc_number - 1, pic - 1), chassis_id)
+                fpc_locations.append((fpc_number, pic))
+
+    if_index = 500
+    physical_ports = []
+    for name, if_type in FILTERED_INTERFACES:
+        if_index += 1
+        builder.add_interface(if_index, name, if_type)
+    for fpc, pic in fpc_locations:
+        for port in range(1, profile['ports'] + 1):
+            if_index += 1
+            name = 'xe-{0}/{1}/{2}'.format(fpc - 1, pic - 1, port - 1)
+            builder.add_interface(if_index, name, 'ethernetCsmacd', fpc, pic, port)
+            units = []
+            for unit in range(profile['units']):
+                if_index += 1
+                builder.add_interface(if_index, '{0}.{1}'.format(name, unit), 'propVirtual', fpc, pic, port,
+                                      unit + 1)
+                units.append(if_index)
+            physical_ports.append((if_index - profile['units'], units))
+
+    lag_members = profile['lags'] * profile['lag_members']
+    members = iter(physical_ports[-lag_members:])
+    for lag in range(profile['lags']):
+        if_index += 1
+        builder.add_interface(if_index, 'ae{0}'.format(lag), 'ieee8023adLag')
+        if_index += 1
+        builder.add_interface(if_index, 'ae{0}.0'.format(lag), 'propVirtual', unit=1)
+        for _ in range(profile['lag_members']):
+            physical_index, units = next(members)
+            builder.add_column('IEEE8023-LAG-MIB', 'dot3adAggPortAttachedAggID', str(units[0]), str(if_index))
+
+    for number, (physical_index, units) in enumerate(physical_ports[:profile['lldp']]):
+        suffix = '0.{0}.{1}'.format(physical_index, number + 1)
+        builder.add_column('LLDP-MIB', 'lldpRemPortId', suffix, 'xe-0/0/{0}'.format(number))
+        builder.add_column('LLDP-MIB', 'lldpRemPortDesc', suffix, 'xe-0/0/{0}'.format(number))
+        builder.add_column('LLDP-MIB', 'lldpRemSysDesc', suffix, 'Juniper Networks, Inc. qfx5100-48s-6q')
+
+    for number, (physical_index, units) in enumerate(physical_ports[:profile['ipv4']]):
+        address = '10.{0}.{1}.1'.format(number // 256, number % 256)
+        builder.add('IP-MIB', 'ipAddrTable', address, {'ipAdEntAddr': address, 'ipAdEntIfIndex': str(units[0]),
+                                                        'ipAdEntNetMask': '255.255.255.0'})
+        octets = '.'.join(['254', '128'] + ['0'] * 10 + ['0', '0', str(number // 256), str(number % 256)])
+        builder.add('IPV6-MIB', 'ipv6AddrEntry', '{0}.{1}'.format(units[0], octets),
+                    {'ipv6AddrPfxLength': '64', 'ipv6AddrType': "'stateless'"})
+
+    return builder.dump
+
+
+def load_dump(path):
+    """
+    Load dump recorded in JSON
+    :param path:
+    :rtype: dict
+    """
+    with open(path) as dump_file:
+        return json.load(dump_file)
+
+
+def save_dump(path, dump):
+    with open(path, 'w') as dump_file:
+        json.dump(dump, dump_file, indent=1, sort_keys=True)
+
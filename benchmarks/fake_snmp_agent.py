@@ -0,0 +1,177 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+In-process SNMP agent which serves an autoload dump to QualiSnmp sessions
+
+The dump rows are placed under the real OIDs of their MIB columns, GETBULK and GET requests are answered page by
+page the way an agent does, so JuniperSnmpService sends the same number of PDUs it sends to a device.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_right
+
+from pysnmp.entity.rfc3413.oneliner import cmdgen
+from pysnmp.proto.rfc1902 import ObjectName
+from pysnmp.proto.rfc1905 import endOfMibView, noSuchInstance
+from pysnmp.smi import builder, view
+
+import cloudshell.snmp.quali_snmp
+from cloudshell.snmp.quali_snmp import QualiSnmp
+
+QUALI_MIBS_PATH = os.path.join(os.path.dirname(os.path.abspath(cloudshell.snmp.quali_snmp.__file__)), 'mibs')
+JUNIPER_MIBS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cloudshell', 'networking',
+                                                 'juniper', 'mibs'))
+
+
+class DumpValue(str):
+    """
+    Value recorded in the dump, the dump keeps values the way QualiSnmp prints them
+    """
+
+    def prettyPrint(self):
+        return str(self)
+
+
+class SnmpStats(object):
+    """
+    SNMP request PDUs received from all sessions of one autoload
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.bulk_requests = 0
+        self.get_requests = 0
+        self.var_binds = 0
+
+    def add(self, var_binds, bulk):
+        with self._lock:
+            self.var_binds += var_binds
+            if bulk:
+                self.bulk_requests += 1
+            else:
+                self.get_requests += 1
+
+    def to_dict(self):
+        return {'requests': self.bulk_requests + self.get_requests, 'bulk_requests': self.bulk_requests,
+                'get_requests': self.get_requests, 'var_binds': self.var_binds}
+
+
+class FakeSnmpAgent(object):
+    """
+    Sorted OID tree built from the dump, shared by all sessions
+    """
+
+    def __init__(self, dump, stats=None, latency=0):
+        """
+        :param dump: dict {'MIB::name': [[suffix, {'suffix': suffix, column: value}], ...]}
+        :param stats: request counters
+        :type stats: SnmpStats
+        :param latency: simulated latency per request PDU, sec
+        """
+        self.stats = stats or SnmpStats()
+        self._latency = latency
+        self.mib_viewer = create_mib_viewer(set(name.split('::')[0] for name in dump))
+        mib_builder = self.mib_viewer.mibBuilder
+        values = {}
+        for name, rows in dump.iteritems():
+            mib = name.split('::')[0]
+            for suffix, row in rows:
+                suffix = tuple(int(number) for number in str(suffix).split('.'))
+                for column, value in row.iteritems():
+                    if column == 'suffix':
+                        continue
+                    mib_node, = mib_builder.importSymbols(mib, column)
+                    values[mib_node.getName() + suffix] = DumpValue(value)
+        self._oids = sorted(values)
+        self._values = [values[oid] for oid in self._oids]
+
+    def _request(self, var_binds, bulk):
+        self.stats.add(var_binds, bulk)
+        if self._latency:
+            time.sleep(self._latency)
+
+    def get_next(self, oid, max_repetitions):
+        """
+        :param oid: start OID tuple
+        :param max_repetitions:
+        :return: list of var bind rows
+        """
+        position = bisect_right(self._oids, oid)
+        rows = [[(ObjectName(name), value)] for name, value in
+                zip(self._oids[position:position + max_repetitions],
+                    self._values[position:position + max_repetitions])]
+        if len(rows) < max_repetitions:
+            rows.append([(ObjectName(rows[-1][0][0] if rows else oid), endOfMibView)])
+        self._request(len(rows), True)
+        return rows
+
+    def get(self, oids):
+        """
+        :param oids: list of OID tuples
+        :return: var binds
+        """
+        var_binds = []
+        for oid in oids:
+            position = bisect_right(self._oids, oid) - 1
+            found = position >= 0 and self._oids[position] == oid
+            var_binds.append((ObjectName(oid), self._values[position] if found else noSuchInstance))
+        self._request(len(var_binds), False)
+        return var_binds
+
+
+class FakeCommandGenerator(object):
+    """
+    Oneliner CommandGenerator replacement which sends requests to the fake agent
+    """
+
+    def __init__(self, agent, mib_viewer):
+        """
+        :type agent: FakeSnmpAgent
+        :param mib_viewer: MIB view of the session, used to resolve the requested names
+        """
+        self._agent = agent
+        self._mib_viewer = mib_viewer
+
+    def _resolve(self, object_identity):
+        return tuple(object_identity.resolveWithMib(self._mib_viewer).getOid())
+
+    def bulkCmd(self, auth_data, transport_target, non_repeaters, max_repetitions, *object_identities, **kwargs):
+        return None, 0, 0, self._agent.get_next(self._resolve(object_identities[0]), max_repetitions)
+
+    def getCmd(self, auth_data, transport_target, *object_identities, **kwargs):
+        return None, 0, 0, self._agent.get([self._resolve(object_identity) for object_identity in object_identities])
+
+
+class FakeQualiSnmp(QualiSnmp):
+    """
+    QualiSnmp session of the fake agent, MIBs are loaded and resolved by the real pysnmp MIB stack
+    """
+
+    def __init__(self, agent, logger):
+        """
+        :type agent: FakeSnmpAgent
+        :param logger:
+        """
+        self._agent = agent
+        QualiSnmp.__init__(self, None, logger)
+        self.cmd_gen = FakeCommandGenerator(agent, self.mib_viewer)
+
+    def initialize_snmp(self, snmp_parameters):
+        self.target = 'fake-agent'
+        self.security = 'fake-security'
+
+
+def create_mib_viewer(mibs):
+    """
+    :param mibs: MIB modules to load
+    :rtype: pysnmp.smi.view.MibViewController
+    """
+    mib_builder = cmdgen.CommandGenerator().snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+    # the same MIB sources as QualiSnmp uses
+    mib_builder.setMibSources(builder.DirMibSource(QUALI_MIBS_PATH), builder.DirMibSource(JUNIPER_MIBS_PATH))
+    # SNMPv2-MIB and the other modules of the snmp engine are loaded already
+    mib_builder.loadModules(*[mib for mib in mibs if mib not in mib_builder.mibSymbols])
+    return view.MibViewController(mib_builder)
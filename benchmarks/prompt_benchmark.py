@@ -0,0 +1,153 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Compare prompt matching of the cli expect loop with JuniperPromptDetector on multi-megabyte outputs.
+
+The expect loop of cloudshell-cli searches the prompt regex (re.DOTALL) in the whole output received so far after
+every read, the detector searches only the tail of the output. The output is a synthesized "show configuration"
+with "[edit]" lines, as echoed by "load set terminal" errors, and ends with the prompt of the mode. Only the prompt
+matching is timed, reads are replayed from memory.
+
+    python benchmarks/prompt_benchmark.py --output benchmarks/results/prompt_benchmark.json
+    python benchmarks/prompt_benchmark.py --size 8 --chunk-size 65536 --mode config
+
+Run from the repository root with the package installed (or PYTHONPATH=.).
+"""
+
+import argparse
+import json
+import platform
+import re
+import time
+
+from cloudshell.networking.juniper.cli.junipr_command_modes import ConfigCommandMode, DefaultCommandMode, \
+    JuniperPromptDetector
+
+# ConfigCommandMode.PROMPT before the prompt was limited to the prompt line
+PREVIOUS_CONFIG_PROMPT = r'\[edit\]\n.*#\s*$'
+
+MODES = {
+    'default': (DefaultCommandMode.PROMPT, 'root@switch> '),
+    'config': (ConfigCommandMode.PROMPT, '\n[edit]\nroot@switch# '),
+}
+
+CONFIGURATION_BLOCK = '''interfaces {{
+    ge-0/0/{0} {{
+        description "access port {0}, rack {1}";
+        unit 0 {{
+            family ethernet-switching {{
+                port-mode trunk;
+                vlan {{
+                    members [ v{0} v{1} ];
+                }}
+            }}
+        }}
+    }}
+}}
+'''
+
+
+def build_output(size, edit_every):
+    """
+    :param size: output size, bytes
+    :param edit_every: "[edit]" line after this number of configuration blocks
+    :rtype: str
+    """
+    blocks = []
+    length = 0
+    index = 0
+    while length < size:
+        block = CONFIGURATION_BLOCK.format(index % 48, index % 4094)
+        if edit_every and index % edit_every == 0:
+            block += '  [edit]\n'
+        blocks.append(block)
+        length += len(block)
+        index += 1
+    return ''.join(blocks)
+
+
+def expect_loop(prompt, chunks):
+    """
+    Search the prompt in the whole received output after every read, as the cli expect loop does
+    :return: matching time, sec
+    """
+    output = ''
+    elapsed = 0
+    for index, chunk in enumerate(chunks):
+        output += chunk
+        start_time = time.time()
+        matched = re.search(prompt, output, re.DOTALL)
+        elapsed += time.time() - start_time
+        if matched:
+            return check_last_read(index, chunks, elapsed)
+    raise Exception('Prompt is not matched')
+
+
+def check_last_read(index, chunks, elapsed):
+    if index != len(chunks) - 1:
+        raise Exception('Prompt is matched in the middle of the output, read {0} of {1}'.format(index, len(chunks)))
+    return elapsed
+
+
+def tail_detector(prompt, chunks):
+    """
+    Feed every read to the detector
+    :return: matching time, sec
+    """
+    detector = JuniperPromptDetector(prompt)
+    start_time = time.time()
+    for index, chunk in enumerate(chunks):
+        if detector.feed(chunk):
+            return check_last_read(index, chunks, time.time() - start_time)
+    raise Exception('Prompt is not matched')
+
+
+def run(mode, size_mb, chunk_size, edit_every, repeat):
+    """
+    :return: dict of the best matching times of the strategies, sec
+    """
+    prompt, prompt_output = MODES[mode]
+    output = build_output(int(size_mb * 1024 * 1024), edit_every) + prompt_output
+    chunks = [output[start:start + chunk_size] for start in range(0, len(output), chunk_size)]
+    strategies = [('expect_loop', expect_loop, prompt), ('tail_detector', tail_detector, prompt)]
+    if mode == 'config':
+        strategies.insert(0, ('expect_loop_previous_prompt', expect_loop, PREVIOUS_CONFIG_PROMPT))
+    result = {'output_bytes': len(output), 'reads': len(chunks)}
+    for name, strategy, strategy_prompt in strategies:
+        result[name] = round(min(strategy(strategy_prompt, chunks) for _ in range(repeat)), 6)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Juniper prompt matching benchmark')
+    parser.add_argument('--mode', action='append', choices=sorted(MODES), help='Command mode, all modes by default')
+    parser.add_argument('--size', action='append', type=float, help='Output size, MB, 1, 2 and 4 by default')
+    parser.add_argument('--chunk-size', type=int, default=4096, help='Size of one read, bytes')
+    parser.add_argument('--edit-every', type=int, default=500,
+                        help='"[edit]" line after this number of configuration blocks, 0 disables')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case, the best run is reported')
+    parser.add_argument('--output', help='Write JSON results to the file instead of stdout')
+    args = parser.parse_args(argv)
+
+    results = {'python': platform.python_version(),
+               'chunk_size': args.chunk_size,
+               'edit_every': args.edit_every,
+               'window': JuniperPromptDetector.WINDOW,
+               'modes': {}}
+    for mode in args.mode or sorted(MODES):
+        results['modes'][mode] = {}
+        for size_mb in args.size or [1, 2, 4]:
+            results['modes'][mode]['{0}MB'.format(size_mb)] = run(mode, size_mb, args.chunk_size, args.edit_every,
+                                                                 args.repeat)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
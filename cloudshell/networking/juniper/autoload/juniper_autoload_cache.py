@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import marshal
+import os
+import re
+
+
+class JuniperAutoloadCache(object):
+    """
+    Snapshot of the snmp tables collected by autoload, stored per resource in a local cache folder
+    Tables are plain dicts of strings and numbers, stored with marshal, loading a snapshot never executes code
+    """
+    VERSION = 2
+    UPTIME_INDICATOR = 'sysUpTime'
+    DEVICE_INDICATORS = ['jnxBoxDescr']
+
+    def __init__(self, cache_folder, resource_name, logger):
+        """
+        :param cache_folder: local folder, should be writable only by the shell user
+        :param resource_name:
+        :param logger:
+        """
+        self._cache_folder = cache_folder
+        self._resource_name = resource_name
+        self._logger = logger
+
+    @property
+    def file_path(self):
+        file_name = re.sub(r'[^\w.-]', '_', self._resource_name)
+        return os.path.join(self._cache_folder, '{0}.autoload'.format(file_name))
+
+    def load(self):
+        """
+        Load snapshot
+        :return: dict {'indicators': {name: value}, 'tables': {name: table}} or None
+        """
+        if not os.path.isfile(self.file_path):
+            return None
+        try:
+            with open(self.file_path, 'rb') as cache_file:
+                snapshot = marshal.load(cache_file)
+        except Exception as e:
+            self._logger.error('Cannot load autoload cache {0}, {1}'.format(self.file_path, e))
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get('version') != self.VERSION:
+            self._logger.debug('Autoload cache {0} has a different format, ignored'.format(self.file_path))
+            return None
+        return snapshot
+
+    def save(self, indicators, tables):
+        """
+        Save snapshot
+        :param indicators: dict {indicator_name: value}
+        :param tables: dict {table_name: table}
+        :return:
+        """
+        try:
+            if not os.path.isdir(self._cache_folder):
+                os.makedirs(self._cache_folder)
+            temp_path = '{0}.tmp'.format(self.file_path)
+            with open(temp_path, 'wb') as cache_file:
+                marshal.dump({'version': self.VERSION, 'indicators': indicators, 'tables': tables}, cache_file)
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+            os.rename(temp_path, self.file_path)
+        except Exception as e:
+            self._logger.error('Cannot save autoload cache {0}, {1}'.format(self.file_path, e))
+
+    def _is_same_device_state(self, cached_indicators, indicators):
+        """
+        The device was not rebooted and not replaced since the snapshot was taken
+        """
+        try:
+            if int(indicators[self.UPTIME_INDICATOR]) < int(cached_indicators[self.UPTIME_INDICATOR]):
+                return False
+        except (KeyError, TypeError, ValueError):
+            return False
+        for name in self.DEVICE_INDICATORS:
+            if cached_indicators.get(name) != indicators.get(name):
+                return False
+        return True
+
+    def get_unchanged_tables(self, indicators, table_indicators):
+        """
+        Cached tables which change indicator has the same value as on the device
+        :param indicators: current values, dict {indicator_name: value}
+        :param table_indicators: dict {table_name: indicator_name}
+        :return: dict {table_name: table}
+        """
+        snapshot = self.load()
+        if not snapshot:
+            return {}
+        cached_indicators = snapshot['indicators']
+        if not self._is_same_device_state(cached_indicators, indicators):
+            self._logger.debug('Device state changed, autoload cache is not used')
+            return {}
+
+        tables = {}
+        for table_name, table in snapshot['tables'].iteritems():
+            indicator = table_indicators.get(table_name)
+            if indicator and indicators.get(indicator) and cached_indicators.get(indicator) == indicators[indicator]:
+                tables[table_name] = table
+        self._logger.debug('Tables loaded from autoload cache: {0}'.format(', '.join(sorted(tables))))
+        return tables
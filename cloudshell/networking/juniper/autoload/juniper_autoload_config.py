@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+
+class JuniperAutoloadConfig(object):
+    """
+    Optional autoload attributes of the resource
+    """
+    SNMP_MAX_REPETITIONS = 'SNMP Max Repetitions'
+    AUTOLOAD_MAX_WORKERS = 'Autoload Max Workers'
+    AUTOLOAD_CACHE_FOLDER = 'Autoload Cache Folder'
+    FILTER_PORT_NAMES = 'Autoload Filter Port Names'
+    FILTER_PORT_TYPES = 'Autoload Filter Port Types'
+    AUTOLOAD_RAW_OIDS = 'Autoload Raw OIDs'
+    AUTOLOAD_PROFILING = 'Autoload Profiling'
+    SNMP_RETRIES = 'SNMP Retries'
+    SNMP_BACKOFF = 'SNMP Backoff'
+    AUTOLOAD_RETRIES = 'Autoload Retries'
+    SNMP_MAX_OUTSTANDING = 'SNMP Max Outstanding Requests'
+
+    DEFAULT_MAX_WORKERS = 1
+    DEFAULT_AUTOLOAD_RETRIES = 1
+    DEFAULT_MAX_OUTSTANDING = 1
+
+    def __init__(self, resource_config):
+        """
+        :param resource_config:
+        :type resource_config: cloudshell.devices.standards.networking.configuration_attributes_structure.GenericNetworkingResource
+        """
+        self._resource_config = resource_config
+
+    def _get_attribute(self, attribute_name):
+        attributes = getattr(self._resource_config, 'attributes', None)
+        if not isinstance(attributes, dict):
+            return None
+        namespace_prefix = getattr(self._resource_config, 'namespace_prefix', '')
+        if not isinstance(namespace_prefix, basestring):
+            namespace_prefix = ''
+        return attributes.get('{0}{1}'.format(namespace_prefix, attribute_name), attributes.get(attribute_name))
+
+    def _get_list_attribute(self, attribute_name):
+        value = self._get_attribute(attribute_name)
+        if not isinstance(value, basestring):
+            return []
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    def _get_bool_attribute(self, attribute_name):
+        value = self._get_attribute(attribute_name)
+        if isinstance(value, basestring):
+            return value.strip().lower() == 'true'
+        return value is True
+
+    def _get_int_attribute(self, attribute_name):
+        value = self._get_attribute(attribute_name)
+        try:
+            return int(float(value)) if value else None
+        except (TypeError, ValueError):
+            return None
+
+    def _get_float_attribute(self, attribute_name):
+        value = self._get_attribute(attribute_name)
+        try:
+            return float(value) if value not in (None, '') else None
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def snmp_max_repetitions(self):
+        """
+        :rtype: int
+        """
+        return self._get_int_attribute(self.SNMP_MAX_REPETITIONS)
+
+    @property
+    def autoload_max_workers(self):
+        """
+        Number of concurrent snmp sessions used to fetch autoload tables
+        Concurrent fetch is disabled by default, each worker opens one more snmp session to the device
+        :rtype: int
+        """
+        max_workers = self._get_int_attribute(self.AUTOLOAD_MAX_WORKERS)
+        if max_workers is None:
+            return self.DEFAULT_MAX_WORKERS
+        return max_workers
+
+    @property
+    def autoload_cache_folder(self):
+        """
+        Local folder for autoload snapshots, autoload cache is disabled if empty
+        :rtype: str
+        """
+        return self._get_attribute(self.AUTOLOAD_CACHE_FOLDER) or None
+
+    @property
+    def filter_port_names(self):
+        """
+        Additional port name prefixes skipped by autoload, comma separated
+        :rtype: list
+        """
+        return self._get_list_attribute(self.FILTER_PORT_NAMES)
+
+    @property
+    def filter_port_types(self):
+        """
+        Additional port types (ifType) skipped by autoload, comma separated
+        :rtype: list
+        """
+        return self._get_list_attribute(self.FILTER_PORT_TYPES)
+
+    @property
+    def autoload_raw_oids(self):
+        """
+        Walk autoload columns by numeric OID without MIB lookup of the responses
+        :rtype: bool
+        """
+        return self._get_bool_attribute(self.AUTOLOAD_RAW_OIDS)
+
+    @property
+    def autoload_profiling(self):
+        """
+        Count snmp requests and time autoload stages, the summary is logged at the end of autoload
+        :rtype: bool
+        """
+        return self._get_bool_attribute(self.AUTOLOAD_PROFILING)
+
+    @property
+    def snmp_retries(self):
+        """
+        Number of retries of a timed out GETBULK page, the service default is used if empty
+        :rtype: int
+        """
+        return self._get_int_attribute(self.SNMP_RETRIES)
+
+    @property
+    def snmp_backoff(self):
+        """
+        Base back-off delay between retries of a timed out page, sec, the service default is used if empty
+        :rtype: float
+        """
+        return self._get_float_attribute(self.SNMP_BACKOFF)
+
+    @property
+    def autoload_retries(self):
+        """
+        Number of discover retries after a walk interrupted by timeouts, retry resumes the interrupted walks
+        :rtype: int
+        """
+        autoload_retries = self._get_int_attribute(self.AUTOLOAD_RETRIES)
+        if autoload_retries is None:
+            return self.DEFAULT_AUTOLOAD_RETRIES
+        return max(autoload_retries, 0)
+
+    @property
+    def snmp_max_outstanding(self):
+        """
+        Number of GETBULK requests in flight, autoload tables are walked concurrently over one snmp session if more
+        than one, pipelining is disabled by default
+        :rtype: int
+        """
+        max_outstanding = self._get_int_attribute(self.SNMP_MAX_OUTSTANDING)
+        if max_outstanding is None:
+            return self.DEFAULT_MAX_OUTSTANDING
+        return max(max_outstanding, 1)
@@ -0,0 +1,47 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from cloudshell.devices.autoload.autoload_builder import AutoloadDetailsBuilder
+from cloudshell.shell.core.driver_context import AutoLoadAttribute, AutoLoadDetails, AutoLoadResource
+
+
+class JuniperAutoloadDetailsStream(AutoloadDetailsBuilder):
+    """
+    Build autoload details in chunks, the root attributes first, then every top level resource with its sub resources
+    """
+
+    def __init__(self, autoload_data, release_resources=True):
+        """
+        :param autoload_data: root resource
+        :type autoload_data: cloudshell.devices.standards.networking.autoload_structure.GenericResource
+        :param release_resources: detach top level resources from the root, so each subtree is released after
+            its chunk is consumed
+        """
+        AutoloadDetailsBuilder.__init__(self, autoload_data)
+        self._release_resources = release_resources
+
+    def iter_autoload_details(self):
+        """
+        :return: generator of AutoLoadDetails
+        """
+        self._autoload_details = AutoLoadDetails([], [AutoLoadAttribute(relative_address='',
+                                                                        attribute_name=attribute_name,
+                                                                        attribute_value=attribute_value)
+                                                      for attribute_name, attribute_value in
+                                                      self.autoload_data.attributes.iteritems()])
+        yield self._autoload_details
+
+        resources = self._validate_build_resource_structure(self.autoload_data.resources)
+        if self._release_resources:
+            self.autoload_data.resources = {}
+        for relative_path in sorted(resources):
+            resource = resources.pop(relative_path) if self._release_resources else resources[relative_path]
+            self._autoload_details = AutoLoadDetails([AutoLoadResource(model=resource.cloudshell_model_name,
+                                                                       name=resource.name,
+                                                                       relative_address=relative_path,
+                                                                       unique_identifier=resource.unique_identifier)],
+                                                     [])
+            self._build_autoload_details(autoload_data=resource, relative_path=relative_path)
+            del resource
+            yield self._autoload_details
+        self._autoload_details = AutoLoadDetails([], [])
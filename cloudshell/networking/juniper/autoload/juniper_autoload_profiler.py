@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class JuniperAutoloadProfiler(object):
+    """
+    Count snmp handler calls, request PDUs, responses and bytes per MIB column and time autoload stages
+    Counters are shared by all snmp sessions of one autoload
+    """
+    COUNTERS = ['calls', 'requests', 'responses', 'bytes', 'time']
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._stages = OrderedDict()
+
+    def wrap(self, snmp_handler):
+        """
+        :param snmp_handler: snmp session used by autoload
+        :rtype: ProfiledSnmpHandler
+        """
+        return ProfiledSnmpHandler(snmp_handler, self)
+
+    def add_call(self, oid, requests, responses, response_bytes, call_time):
+        """
+        :param oid: 'MIB::column' or numeric OID
+        :param requests: number of request PDUs sent by the call
+        :param responses: number of returned values
+        :param response_bytes: size of returned values
+        :param call_time: sec
+        """
+        with self._lock:
+            counters = self._requests.get(oid)
+            if counters is None:
+                counters = self._requests[oid] = dict.fromkeys(self.COUNTERS, 0)
+            counters['calls'] += 1
+            counters['requests'] += requests
+            counters['responses'] += responses
+            counters['bytes'] += response_bytes
+            counters['time'] += call_time
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time autoload stage
+        :param name:
+        """
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stages[name] = self._stages.get(name, 0) + time.time() - start_time
+
+    def to_dict(self):
+        """
+        :return: dict {'snmp': {oid: counters}, 'stages': {stage: sec}, 'total': counters}
+        """
+        with self._lock:
+            requests = {oid: dict(counters) for oid, counters in self._requests.iteritems()}
+            stages = OrderedDict(self._stages)
+        total = dict.fromkeys(self.COUNTERS, 0)
+        for counters in requests.itervalues():
+            for name in self.COUNTERS:
+                total[name] += counters[name]
+        return {'snmp': requests, 'stages': stages, 'total': total}
+
+    def format_summary(self):
+        """
+        :return: summary table, snmp counters sorted by time
+        :rtype: str
+        """
+        data = self.to_dict()
+        lines = ['{0:50} {1:>6} {2:>9} {3:>10} {4:>10} {5:>10}'.format('OID', 'calls', 'requests', 'responses', 'bytes',
+                                                                        'time, sec')]
+        rows = sorted(data['snmp'].iteritems(), key=lambda item: item[1]['time'], reverse=True)
+        rows.append(('TOTAL', data['total']))
+        for oid, counters in rows:
+            lines.append('{0:50} {1:>6} {2:>9} {3:>10} {4:>10} {5:>10.3f}'.format(
+                oid, counters['calls'], counters['requests'], counters['responses'], counters['bytes'],
+                counters['time']))
+        lines.append('{0:50} {1:>10}'.format('Stage', 'time, sec'))
+        for stage, stage_time in data['stages'].iteritems():
+            lines.append('{0:50} {1:>10.3f}'.format(stage, stage_time))
+        return '\n'.join(lines)
+
+
+class ProfiledSnmpHandler(object):
+    """
+    Snmp handler proxy which reports calls to the profiler
+    Request PDUs are read from the request counter of JuniperSnmpService, a call of other handlers is counted
+    as one request
+    """
+
+    def __init__(self, snmp_handler, profiler):
+        """
+        :param snmp_handler:
+        :param profiler:
+        :type profiler: JuniperAutoloadProfiler
+        """
+        self._snmp_handler = snmp_handler
+        self._profiler = profiler
+
+    def __getattr__(self, item):
+        return getattr(self._snmp_handler, item)
+
+    @staticmethod
+    def _get_size(value):
+        return len(value) if isinstance(value, basestring) else len(str(value))
+
+    def _get_request_count(self):
+        request_count = getattr(self._snmp_handler, 'request_count', None)
+        return request_count if isinstance(request_count, (int, long)) else None
+
+    def _profile(self, oid, request, get_values):
+        start_time = time.time()
+        start_request_count = self._get_request_count()
+        responses = response_bytes = 0
+        try:
+            result = request()
+            values = get_values(result)
+            responses = len(values)
+            response_bytes = sum(self._get_size(value) for value in values)
+            return result
+        finally:
+            request_count = self._get_request_count()
+            if start_request_count is None or request_count is None:
+                requests = 1
+            else:
+                requests = request_count - start_request_count
+            self._profiler.add_call(oid, requests, responses, response_bytes, time.time() - start_time)
+
+    def walk(self, oid, *indexes):
+        """
+        :param oid: (MIB, OID name)
+        """
+        return self._profile('{0}::{1}'.format(*oid), lambda: self._snmp_handler.walk(oid, *indexes),
+                             lambda result: [value for row in result.itervalues()
+                                             for name, value in row.iteritems() if name != 'suffix'])
+
+    def walk_oid(self, oid):
+        """
+        :param oid: numeric OID
+        """
+        return self._profile(oid, lambda: self._snmp_handler.walk_oid(oid), lambda result: result.values())
+
+    def prefetch(self, oids):
+        """
+        Pipelined walks are counted together, the next walks of the prefetched OIDs send no requests
+        :param oids: list of (MIB, OID name) or numeric OIDs
+        """
+        return self._profile('prefetch', lambda: self._snmp_handler.prefetch(oids), lambda result: [])
+
+    def get_property(self, mib, name, *args, **kwargs):
+        """
+        :param mib:
+        :param name: OID name
+        """
+        return self._profile('{0}::{1}'.format(mib, name),
+                             lambda: self._snmp_handler.get_property(mib, name, *args, **kwargs),
+                             lambda result: [result] if result else [])
@@ -0,0 +1,6944 @@
+# Generated from JUNIPER-CHASSIS-DEFINES-MIB by juniper_product_table.py, do not edit
+# OIDs are relative to jnxProducts (1.3.6.1.4.1.2636.1) and sorted for binary search
+
+PRODUCT_OIDS = (
+    '1',
+    '1.1',
+    '1.1.1',
+    '1.1.1.1',
+    '1.1.1.10',
+    '1.1.1.100',
+    '1.1.1.101',
+    '1.1.1.102',
+    '1.1.1.103',
+    '1.1.1.104',
+    '1.1.1.105',
+    '1.1.1.106',
+    '1.1.1.107',
+    '1.1.1.108',
+    '1.1.1.109',
+    '1.1.1.11',
+    '1.1.1.110',
+    '1.1.1.112',
+    '1.1.1.113',
+    '1.1.1.114',
+    '1.1.1.115',
+    '1.1.1.116',
+    '1.1.1.117',
+    '1.1.1.118',
+    '1.1.1.119',
+    '1.1.1.120',
+    '1.1.1.121',
+    '1.1.1.122',
+    '1.1.1.123',
+    '1.1.1.124',
+    '1.1.1.125',
+    '1.1.1.126',
+    '1.1.1.127',
+    '1.1.1.128',
+    '1.1.1.129',
+    '1.1.1.13',
+    '1.1.1.130',
+    '1.1.1.131',
+    '1.1.1.132',
+    '1.1.1.133',
+    '1.1.1.134',
+    '1.1.1.135',
+    '1.1.1.136',
+    '1.1.1.137',
+    '1.1.1.139',
+    '1.1.1.14',
+    '1.1.1.140',
+    '1.1.1.141',
+    '1.1.1.142',
+    '1.1.1.143',
+    '1.1.1.15',
+    '1.1.1.16',
+    '1.1.1.17',
+    '1.1.1.18',
+    '1.1.1.19',
+    '1.1.1.2',
+    '1.1.1.20',
+    '1.1.1.21',
+    '1.1.1.22',
+    '1.1.1.23',
+    '1.1.1.24',
+    '1.1.1.25',
+    '1.1.1.26',
+    '1.1.1.27',
+    '1.1.1.28',
+    '1.1.1.29',
+    '1.1.1.3',
+    '1.1.1.30',
+    '1.1.1.31',
+    '1.1.1.32',
+    '1.1.1.33',
+    '1.1.1.34',
+    '1.1.1.35',
+    '1.1.1.36',
+    '1.1.1.37',
+    '1.1.1.38',
+    '1.1.1.39',
+    '1.1.1.4',
+    '1.1.1.40',
+    '1.1.1.41',
+    '1.1.1.42',
+    '1.1.1.43',
+    '1.1.1.44',
+    '1.1.1.45',
+    '1.1.1.46',
+    '1.1.1.47',
+    '1.1.1.48',
+    '1.1.1.49',
+    '1.1.1.5',
+    '1.1.1.50',
+    '1.1.1.51',
+    '1.1.1.52',
+    '1.1.1.53',
+    '1.1.1.54',
+    '1.1.1.55',
+    '1.1.1.56',
+    '1.1.1.57',
+    '1.1.1.58',
+    '1.1.1.59',
+    '1.1.1.6',
+    '1.1.1.60',
+    '1.1.1.61',
+    '1.1.1.62',
+    '1.1.1.63',
+    '1.1.1.64',
+    '1.1.1.65',
+    '1.1.1.66',
+    '1.1.1.67',
+    '1.1.1.68',
+    '1.1.1.69',
+    '1.1.1.7',
+    '1.1.1.70',
+    '1.1.1.71',
+    '1.1.1.72',
+    '1.1.1.73',
+    '1.1.1.74',
+    '1.1.1.75',
+    '1.1.1.76',
+    '1.1.1.77',
+    '1.1.1.78',
+    '1.1.1.79',
+    '1.1.1.8',
+    '1.1.1.80',
+    '1.1.1.81',
+    '1.1.1.82',
+    '1.1.1.83',
+    '1.1.1.84',
+    '1.1.1.85',
+    '1.1.1.86',
+    '1.1.1.87',
+    '1.1.1.88',
+    '1.1.1.89',
+    '1.1.1.9',
+    '1.1.1.90',
+    '1.1.1.91',
+    '1.1.1.92',
+    '1.1.1.93',
+    '1.1.1.94',
+    '1.1.1.95',
+    '1.1.1.96',
+    '1.1.1.97',
+    '1.1.1.98',
+    '1.1.1.99',
+    '1.1.2',
+    '1.1.2.1',
+    '1.1.2.10',
+    '1.1.2.100',
+    '1.1.2.101',
+    '1.1.2.102',
+    '1.1.2.103',
+    '1.1.2.104',
+    '1.1.2.105',
+    '1.1.2.106',
+    '1.1.2.107',
+    '1.1.2.108',
+    '1.1.2.109',
+    '1.1.2.11',
+    '1.1.2.110',
+    '1.1.2.111',
+    '1.1.2.112',
+    '1.1.2.113',
+    '1.1.2.114',
+    '1.1.2.115',
+    '1.1.2.116',
+    '1.1.2.117',
+    '1.1.2.118',
+    '1.1.2.119',
+    '1.1.2.120',
+    '1.1.2.121',
+    '1.1.2.122',
+    '1.1.2.123',
+    '1.1.2.124',
+    '1.1.2.125',
+    '1.1.2.126',
+    '1.1.2.127',
+    '1.1.2.128',
+    '1.1.2.129',
+    '1.1.2.13',
+    '1.1.2.130',
+    '1.1.2.131',
+    '1.1.2.132',
+    '1.1.2.133',
+    '1.1.2.134',
+    '1.1.2.135',
+    '1.1.2.136',
+    '1.1.2.137',
+    '1.1.2.139',
+    '1.1.2.14',
+    '1.1.2.140',
+    '1.1.2.141',
+    '1.1.2.142',
+    '1.1.2.143',
+    '1.1.2.15',
+    '1.1.2.16',
+    '1.1.2.17',
+    '1.1.2.18',
+    '1.1.2.19',
+    '1.1.2.2',
+    '1.1.2.20',
+    '1.1.2.21',
+    '1.1.2.22',
+    '1.1.2.23',
+    '1.1.2.24',
+    '1.1.2.25',
+    '1.1.2.26',
+    '1.1.2.27',
+    '1.1.2.28',
+    '1.1.2.29',
+    '1.1.2.3',
+    '1.1.2.30',
+    '1.1.2.31',
+    '1.1.2.32',
+    '1.1.2.33',
+    '1.1.2.34',
+    '1.1.2.35',
+    '1.1.2.36',
+    '1.1.2.37',
+    '1.1.2.38',
+    '1.1.2.39',
+    '1.1.2.4',
+    '1.1.2.40',
+    '1.1.2.41',
+    '1.1.2.42',
+    '1.1.2.43',
+    '1.1.2.44',
+    '1.1.2.45',
+    '1.1.2.46',
+    '1.1.2.47',
+    '1.1.2.48',
+    '1.1.2.49',
+    '1.1.2.5',
+    '1.1.2.50',
+    '1.1.2.51',
+    '1.1.2.52',
+    '1.1.2.53',
+    '1.1.2.54',
+    '1.1.2.55',
+    '1.1.2.56',
+    '1.1.2.57',
+    '1.1.2.58',
+    '1.1.2.59',
+    '1.1.2.6',
+    '1.1.2.60',
+    '1.1.2.61',
+    '1.1.2.62',
+    '1.1.2.63',
+    '1.1.2.64',
+    '1.1.2.65',
+    '1.1.2.66',
+    '1.1.2.67',
+    '1.1.2.68',
+    '1.1.2.69',
+    '1.1.2.7',
+    '1.1.2.70',
+    '1.1.2.71',
+    '1.1.2.72',
+    '1.1.2.73',
+    '1.1.2.74',
+    '1.1.2.75',
+    '1.1.2.76',
+    '1.1.2.77',
+    '1.1.2.78',
+    '1.1.2.79',
+    '1.1.2.8',
+    '1.1.2.80',
+    '1.1.2.81',
+    '1.1.2.82',
+    '1.1.2.83',
+    '1.1.2.84',
+    '1.1.2.85',
+    '1.1.2.86',
+    '1.1.2.87',
+    '1.1.2.88',
+    '1.1.2.89',
+    '1.1.2.9',
+    '1.1.2.90',
+    '1.1.2.91',
+    '1.1.2.92',
+    '1.1.2.93',
+    '1.1.2.94',
+    '1.1.2.95',
+    '1.1.2.96',
+    '1.1.2.97',
+    '1.1.2.98',
+    '1.1.2.99',
+    '1.1.3',
+    '1.1.3.1',
+    '1.1.3.10',
+    '1.1.3.100',
+    '1.1.3.102',
+    '1.1.3.103',
+    '1.1.3.104',
+    '1.1.3.105',
+    '1.1.3.106',
+    '1.1.3.107',
+    '1.1.3.108',
+    '1.1.3.109',
+    '1.1.3.11',
+    '1.1.3.110',
+    '1.1.3.112',
+    '1.1.3.113',
+    '1.1.3.114',
+    '1.1.3.115',
+    '1.1.3.116',
+    '1.1.3.117',
+    '1.1.3.118',
+    '1.1.3.119',
+    '1.1.3.120',
+    '1.1.3.121',
+    '1.1.3.122',
+    '1.1.3.123',
+    '1.1.3.124',
+    '1.1.3.125',
+    '1.1.3.126',
+    '1.1.3.127',
+    '1.1.3.128',
+    '1.1.3.130',
+    '1.1.3.131',
+    '1.1.3.132',
+    '1.1.3.138',
+    '1.1.3.139',
+    '1.1.3.140',
+    '1.1.3.141',
+    '1.1.3.16',
+    '1.1.3.17',
+    '1.1.3.18',
+    '1.1.3.2',
+    '1.1.3.21',
+    '1.1.3.25',
+    '1.1.3.26',
+    '1.1.3.27',
+    '1.1.3.28',
+    '1.1.3.29',
+    '1.1.3.3',
+    '1.1.3.30',
+    '1.1.3.31',
+    '1.1.3.32',
+    '1.1.3.33',
+    '1.1.3.34',
+    '1.1.3.35',
+    '1.1.3.37',
+    '1.1.3.38',
+    '1.1.3.4',
+    '1.1.3.42',
+    '1.1.3.43',
+    '1.1.3.44',
+    '1.1.3.45',
+    '1.1.3.46',
+    '1.1.3.47',
+    '1.1.3.48',
+    '1.1.3.49',
+    '1.1.3.5',
+    '1.1.3.50',
+    '1.1.3.51',
+    '1.1.3.52',
+    '1.1.3.53',
+    '1.1.3.54',
+    '1.1.3.55',
+    '1.1.3.56',
+    '1.1.3.57',
+    '1.1.3.59',
+    '1.1.3.6',
+    '1.1.3.60',
+    '1.1.3.61',
+    '1.1.3.62',
+    '1.1.3.63',
+    '1.1.3.66',
+    '1.1.3.67',
+    '1.1.3.68',
+    '1.1.3.69',
+    '1.1.3.7',
+    '1.1.3.70',
+    '1.1.3.71',
+    '1.1.3.72',
+    '1.1.3.73',
+    '1.1.3.74',
+    '1.1.3.75',
+    '1.1.3.76',
+    '1.1.3.77',
+    '1.1.3.78',
+    '1.1.3.79',
+    '1.1.3.8',
+    '1.1.3.80',
+    '1.1.3.81',
+    '1.1.3.82',
+    '1.1.3.83',
+    '1.1.3.84',
+    '1.1.3.85',
+    '1.1.3.87',
+    '1.1.3.88',
+    '1.1.3.89',
+    '1.1.3.9',
+    '1.1.3.90',
+    '1.1.3.91',
+    '1.1.3.92',
+    '1.1.3.93',
+    '1.1.3.95',
+    '1.1.3.97',
+    '1.1.3.98',
+    '1.1.3.99',
+    '1.1.4',
+    '1.1.4.1',
+    '1.1.4.10',
+    '1.1.4.100',
+    '1.1.4.102',
+    '1.1.4.103',
+    '1.1.4.104',
+    '1.1.4.105',
+    '1.1.4.106',
+    '1.1.4.107',
+    '1.1.4.109',
+    '1.1.4.109.1',
+    '1.1.4.11',
+    '1.1.4.112',
+    '1.1.4.112.1',
+    '1.1.4.112.2',
+    '1.1.4.113',
+    '1.1.4.113.1',
+    '1.1.4.114',
+    '1.1.4.114.1',
+    '1.1.4.115',
+    '1.1.4.115.1',
+    '1.1.4.116',
+    '1.1.4.116.1',
+    '1.1.4.117',
+    '1.1.4.117.1',
+    '1.1.4.118',
+    '1.1.4.118.1',
+    '1.1.4.119',
+    '1.1.4.119.1',
+    '1.1.4.120',
+    '1.1.4.120.1',
+    '1.1.4.121',
+    '1.1.4.121.1',
+    '1.1.4.122',
+    '1.1.4.122.1',
+    '1.1.4.123',
+    '1.1.4.123.1',
+    '1.1.4.124',
+    '1.1.4.124.1',
+    '1.1.4.126',
+    '1.1.4.126.1',
+    '1.1.4.127',
+    '1.1.4.127.1',
+    '1.1.4.128',
+    '1.1.4.130',
+    '1.1.4.130.1',
+    '1.1.4.131',
+    '1.1.4.131.1',
+    '1.1.4.131.2',
+    '1.1.4.131.3',
+    '1.1.4.131.4',
+    '1.1.4.132',
+    '1.1.4.132.1',
+    '1.1.4.132.2',
+    '1.1.4.132.3',
+    '1.1.4.132.4',
+    '1.1.4.132.5',
+    '1.1.4.132.6',
+    '1.1.4.138',
+    '1.1.4.138.1',
+    '1.1.4.138.2',
+    '1.1.4.138.3',
+    '1.1.4.138.4',
+    '1.1.4.138.5',
+    '1.1.4.138.6',
+    '1.1.4.138.7',
+    '1.1.4.139',
+    '1.1.4.140',
+    '1.1.4.141',
+    '1.1.4.16',
+    '1.1.4.17',
+    '1.1.4.18',
+    '1.1.4.2',
+    '1.1.4.21',
+    '1.1.4.25',
+    '1.1.4.26',
+    '1.1.4.27',
+    '1.1.4.28',
+    '1.1.4.29',
+    '1.1.4.3',
+    '1.1.4.30',
+    '1.1.4.30.1',
+    '1.1.4.30.2',
+    '1.1.4.30.3',
+    '1.1.4.30.4',
+    '1.1.4.31',
+    '1.1.4.31.1',
+    '1.1.4.31.2',
+    '1.1.4.31.3',
+    '1.1.4.31.4',
+    '1.1.4.31.5',
+    '1.1.4.31.6',
+    '1.1.4.31.7',
+    '1.1.4.32',
+    '1.1.4.33',
+    '1.1.4.34',
+    '1.1.4.35',
+    '1.1.4.37',
+    '1.1.4.38',
+    '1.1.4.4',
+    '1.1.4.42',
+    '1.1.4.43',
+    '1.1.4.43.1',
+    '1.1.4.43.2',
+    '1.1.4.43.3',
+    '1.1.4.43.4',
+    '1.1.4.43.5',
+    '1.1.4.43.6',
+    '1.1.4.43.7',
+    '1.1.4.44',
+    '1.1.4.44.1',
+    '1.1.4.44.2',
+    '1.1.4.45',
+    '1.1.4.45.1',
+    '1.1.4.45.2',
+    '1.1.4.46',
+    '1.1.4.47',
+    '1.1.4.48',
+    '1.1.4.49',
+    '1.1.4.5',
+    '1.1.4.50',
+    '1.1.4.51',
+    '1.1.4.52',
+    '1.1.4.53',
+    '1.1.4.54',
+    '1.1.4.54.1',
+    '1.1.4.54.2',
+    '1.1.4.54.3',
+    '1.1.4.54.4',
+    '1.1.4.54.5',
+    '1.1.4.55',
+    '1.1.4.56',
+    '1.1.4.57',
+    '1.1.4.57.1',
+    '1.1.4.57.2',
+    '1.1.4.57.3',
+    '1.1.4.57.4',
+    '1.1.4.59',
+    '1.1.4.59.1',
+    '1.1.4.6',
+    '1.1.4.60',
+    '1.1.4.60.1',
+    '1.1.4.60.2',
+    '1.1.4.60.3',
+    '1.1.4.61',
+    '1.1.4.61.1',
+    '1.1.4.61.2',
+    '1.1.4.61.3',
+    '1.1.4.61.4',
+    '1.1.4.61.5',
+    '1.1.4.61.6',
+    '1.1.4.61.7',
+    '1.1.4.61.8',
+    '1.1.4.63',
+    '1.1.4.63.1',
+    '1.1.4.63.2',
+    '1.1.4.63.3',
+    '1.1.4.63.4',
+    '1.1.4.63.5',
+    '1.1.4.63.6',
+    '1.1.4.63.7',
+    '1.1.4.63.8',
+    '1.1.4.66',
+    '1.1.4.67',
+    '1.1.4.68',
+    '1.1.4.69',
+    '1.1.4.7',
+    '1.1.4.70',
+    '1.1.4.71',
+    '1.1.4.71.1',
+    '1.1.4.71.2',
+    '1.1.4.72',
+    '1.1.4.72.1',
+    '1.1.4.73',
+    '1.1.4.73.1',
+    '1.1.4.73.2',
+    '1.1.4.74',
+    '1.1.4.75',
+    '1.1.4.76',
+    '1.1.4.76.1',
+    '1.1.4.76.2',
+    '1.1.4.76.3',
+    '1.1.4.76.4',
+    '1.1.4.76.5',
+    '1.1.4.76.6',
+    '1.1.4.77',
+    '1.1.4.78',
+    '1.1.4.79',
+    '1.1.4.8',
+    '1.1.4.80',
+    '1.1.4.81',
+    '1.1.4.82',
+    '1.1.4.82.1',
+    '1.1.4.82.10',
+    '1.1.4.82.11',
+    '1.1.4.82.12',
+    '1.1.4.82.13',
+    '1.1.4.82.14',
+    '1.1.4.82.15',
+    '1.1.4.82.16',
+    '1.1.4.82.17',
+    '1.1.4.82.18',
+    '1.1.4.82.2',
+    '1.1.4.82.3',
+    '1.1.4.82.4',
+    '1.1.4.82.5',
+    '1.1.4.82.6',
+    '1.1.4.82.7',
+    '1.1.4.82.8',
+    '1.1.4.82.9',
+    '1.1.4.83',
+    '1.1.4.84',
+    '1.1.4.84.1',
+    '1.1.4.84.2',
+    '1.1.4.85',
+    '1.1.4.87',
+    '1.1.4.87.11',
+    '1.1.4.87.12',
+    '1.1.4.88',
+    '1.1.4.88.1',
+    '1.1.4.89',
+    '1.1.4.89.1',
+    '1.1.4.9',
+    '1.1.4.90',
+    '1.1.4.90.1',
+    '1.1.4.91',
+    '1.1.4.91.1',
+    '1.1.4.91.2',
+    '1.1.4.92',
+    '1.1.4.92.1',
+    '1.1.4.92.2',
+    '1.1.4.93',
+    '1.1.4.95',
+    '1.1.4.97',
+    '1.1.4.97.1',
+    '1.1.4.98',
+    '1.1.4.99',
+    '1.2',
+    '1.2.1',
+    '1.2.1.1',
+    '1.2.1.10',
+    '1.2.1.100',
+    '1.2.1.101',
+    '1.2.1.102',
+    '1.2.1.103',
+    '1.2.1.104',
+    '1.2.1.105',
+    '1.2.1.106',
+    '1.2.1.107',
+    '1.2.1.108',
+    '1.2.1.109',
+    '1.2.1.11',
+    '1.2.1.110',
+    '1.2.1.113',
+    '1.2.1.114',
+    '1.2.1.115',
+    '1.2.1.116',
+    '1.2.1.117',
+    '1.2.1.118',
+    '1.2.1.119',
+    '1.2.1.120',
+    '1.2.1.121',
+    '1.2.1.122',
+    '1.2.1.123',
+    '1.2.1.124',
+    '1.2.1.125',
+    '1.2.1.126',
+    '1.2.1.127',
+    '1.2.1.128',
+    '1.2.1.129',
+    '1.2.1.13',
+    '1.2.1.130',
+    '1.2.1.131',
+    '1.2.1.131.1',
+    '1.2.1.131.2',
+    '1.2.1.132',
+    '1.2.1.132.1',
+    '1.2.1.132.2',
+    '1.2.1.133',
+    '1.2.1.134',
+    '1.2.1.135',
+    '1.2.1.136',
+    '1.2.1.137',
+    '1.2.1.139',
+    '1.2.1.14',
+    '1.2.1.140',
+    '1.2.1.141',
+    '1.2.1.142',
+    '1.2.1.143',
+    '1.2.1.15',
+    '1.2.1.16',
+    '1.2.1.17',
+    '1.2.1.18',
+    '1.2.1.19',
+    '1.2.1.2',
+    '1.2.1.20',
+    '1.2.1.21',
+    '1.2.1.22',
+    '1.2.1.23',
+    '1.2.1.24',
+    '1.2.1.25',
+    '1.2.1.26',
+    '1.2.1.27',
+    '1.2.1.28',
+    '1.2.1.29',
+    '1.2.1.3',
+    '1.2.1.30',
+    '1.2.1.31',
+    '1.2.1.31.1',
+    '1.2.1.31.2',
+    '1.2.1.32',
+    '1.2.1.33',
+    '1.2.1.34',
+    '1.2.1.35',
+    '1.2.1.36',
+    '1.2.1.37',
+    '1.2.1.38',
+    '1.2.1.39',
+    '1.2.1.4',
+    '1.2.1.40',
+    '1.2.1.41',
+    '1.2.1.42',
+    '1.2.1.43',
+    '1.2.1.44',
+    '1.2.1.44.1',
+    '1.2.1.44.2',
+    '1.2.1.45',
+    '1.2.1.46',
+    '1.2.1.47',
+    '1.2.1.48',
+    '1.2.1.49',
+    '1.2.1.5',
+    '1.2.1.50',
+    '1.2.1.51',
+    '1.2.1.52',
+    '1.2.1.53',
+    '1.2.1.54',
+    '1.2.1.54.1',
+    '1.2.1.54.2',
+    '1.2.1.55',
+    '1.2.1.56',
+    '1.2.1.57',
+    '1.2.1.58',
+    '1.2.1.59',
+    '1.2.1.59.1',
+    '1.2.1.59.2',
+    '1.2.1.6',
+    '1.2.1.60',
+    '1.2.1.61',
+    '1.2.1.62',
+    '1.2.1.63',
+    '1.2.1.63.1',
+    '1.2.1.63.2',
+    '1.2.1.64',
+    '1.2.1.65',
+    '1.2.1.66',
+    '1.2.1.67',
+    '1.2.1.68',
+    '1.2.1.69',
+    '1.2.1.7',
+    '1.2.1.70',
+    '1.2.1.71',
+    '1.2.1.71.1',
+    '1.2.1.71.2',
+    '1.2.1.72',
+    '1.2.1.73',
+    '1.2.1.74',
+    '1.2.1.75',
+    '1.2.1.76',
+    '1.2.1.76.1',
+    '1.2.1.76.2',
+    '1.2.1.77',
+    '1.2.1.78',
+    '1.2.1.79',
+    '1.2.1.8',
+    '1.2.1.80',
+    '1.2.1.81',
+    '1.2.1.82',
+    '1.2.1.83',
+    '1.2.1.84',
+    '1.2.1.85',
+    '1.2.1.86',
+    '1.2.1.87',
+    '1.2.1.88',
+    '1.2.1.89',
+    '1.2.1.9',
+    '1.2.1.90',
+    '1.2.1.91',
+    '1.2.1.92',
+    '1.2.1.92.1',
+    '1.2.1.92.2',
+    '1.2.1.93',
+    '1.2.1.94',
+    '1.2.1.95',
+    '1.2.1.96',
+    '1.2.1.97',
+    '1.2.1.98',
+    '1.2.1.99',
+    '1.2.2',
+    '1.2.2.1',
+    '1.2.2.1.1',
+    '1.2.2.1.2',
+    '1.2.2.1.3',
+    '1.2.2.1.4',
+    '1.2.2.1.5',
+    '1.2.2.1.6',
+    '1.2.2.1.7',
+    '1.2.2.10',
+    '1.2.2.10.1',
+    '1.2.2.10.2',
+    '1.2.2.10.3',
+    '1.2.2.10.4',
+    '1.2.2.10.5',
+    '1.2.2.100',
+    '1.2.2.100.1',
+    '1.2.2.100.2',
+    '1.2.2.100.3',
+    '1.2.2.100.4',
+    '1.2.2.100.5',
+    '1.2.2.100.6',
+    '1.2.2.101',
+    '1.2.2.101.1',
+    '1.2.2.101.2',
+    '1.2.2.101.3',
+    '1.2.2.101.4',
+    '1.2.2.102',
+    '1.2.2.102.1',
+    '1.2.2.102.2',
+    '1.2.2.102.3',
+    '1.2.2.102.4',
+    '1.2.2.102.5',
+    '1.2.2.102.6',
+    '1.2.2.103',
+    '1.2.2.103.1',
+    '1.2.2.103.2',
+    '1.2.2.103.3',
+    '1.2.2.103.4',
+    '1.2.2.103.5',
+    '1.2.2.103.6',
+    '1.2.2.104',
+    '1.2.2.104.1',
+    '1.2.2.104.2',
+    '1.2.2.104.3',
+    '1.2.2.104.4',
+    '1.2.2.104.5',
+    '1.2.2.104.6',
+    '1.2.2.105',
+    '1.2.2.105.1',
+    '1.2.2.105.2',
+    '1.2.2.105.3',
+    '1.2.2.105.4',
+    '1.2.2.105.5',
+    '1.2.2.105.6',
+    '1.2.2.106',
+    '1.2.2.106.1',
+    '1.2.2.106.2',
+    '1.2.2.106.3',
+    '1.2.2.106.4',
+    '1.2.2.106.5',
+    '1.2.2.106.6',
+    '1.2.2.107',
+    '1.2.2.107.1',
+    '1.2.2.107.2',
+    '1.2.2.107.3',
+    '1.2.2.107.4',
+    '1.2.2.107.5',
+    '1.2.2.107.6',
+    '1.2.2.108',
+    '1.2.2.108.1',
+    '1.2.2.108.2',
+    '1.2.2.108.3',
+    '1.2.2.108.4',
+    '1.2.2.108.5',
+    '1.2.2.109',
+    '1.2.2.109.1',
+    '1.2.2.109.2',
+    '1.2.2.109.3',
+    '1.2.2.109.4',
+    '1.2.2.11',
+    '1.2.2.11.1',
+    '1.2.2.11.2',
+    '1.2.2.11.3',
+    '1.2.2.11.4',
+    '1.2.2.11.5',
+    '1.2.2.11.6',
+    '1.2.2.110',
+    '1.2.2.110.1',
+    '1.2.2.110.2',
+    '1.2.2.110.3',
+    '1.2.2.110.4',
+    '1.2.2.110.5',
+    '1.2.2.110.6',
+    '1.2.2.110.7',
+    '1.2.2.113',
+    '1.2.2.113.1',
+    '1.2.2.113.2',
+    '1.2.2.113.3',
+    '1.2.2.113.4',
+    '1.2.2.114',
+    '1.2.2.114.1',
+    '1.2.2.114.2',
+    '1.2.2.114.3',
+    '1.2.2.114.4',
+    '1.2.2.115',
+    '1.2.2.115.1',
+    '1.2.2.115.2',
+    '1.2.2.115.3',
+    '1.2.2.115.4',
+    '1.2.2.116',
+    '1.2.2.116.1',
+    '1.2.2.116.2',
+    '1.2.2.116.3',
+    '1.2.2.116.4',
+    '1.2.2.117',
+    '1.2.2.117.1',
+    '1.2.2.117.2',
+    '1.2.2.117.3',
+    '1.2.2.117.4',
+    '1.2.2.118',
+    '1.2.2.118.1',
+    '1.2.2.118.2',
+    '1.2.2.118.3',
+    '1.2.2.118.4',
+    '1.2.2.118.5',
+    '1.2.2.119',
+    '1.2.2.119.1',
+    '1.2.2.119.2',
+    '1.2.2.119.3',
+    '1.2.2.119.4',
+    '1.2.2.120',
+    '1.2.2.120.1',
+    '1.2.2.120.2',
+    '1.2.2.120.3',
+    '1.2.2.120.4',
+    '1.2.2.121',
+    '1.2.2.121.1',
+    '1.2.2.121.2',
+    '1.2.2.121.3',
+    '1.2.2.121.4',
+    '1.2.2.122',
+    '1.2.2.122.1',
+    '1.2.2.122.2',
+    '1.2.2.122.3',
+    '1.2.2.122.4',
+    '1.2.2.123',
+    '1.2.2.123.1',
+    '1.2.2.123.2',
+    '1.2.2.123.3',
+    '1.2.2.123.4',
+    '1.2.2.124',
+    '1.2.2.124.1',
+    '1.2.2.124.2',
+    '1.2.2.124.3',
+    '1.2.2.124.4',
+    '1.2.2.125',
+    '1.2.2.125.1',
+    '1.2.2.125.2',
+    '1.2.2.125.3',
+    '1.2.2.126',
+    '1.2.2.126.1',
+    '1.2.2.126.2',
+    '1.2.2.126.3',
+    '1.2.2.126.4',
+    '1.2.2.126.5',
+    '1.2.2.127',
+    '1.2.2.127.1',
+    '1.2.2.127.2',
+    '1.2.2.127.3',
+    '1.2.2.127.4',
+    '1.2.2.127.5',
+    '1.2.2.128',
+    '1.2.2.128.1',
+    '1.2.2.128.2',
+    '1.2.2.128.3',
+    '1.2.2.128.4',
+    '1.2.2.129',
+    '1.2.2.129.1',
+    '1.2.2.129.2',
+    '1.2.2.129.3',
+    '1.2.2.129.4',
+    '1.2.2.13',
+    '1.2.2.13.1',
+    '1.2.2.13.2',
+    '1.2.2.13.3',
+    '1.2.2.130',
+    '1.2.2.130.1',
+    '1.2.2.130.2',
+    '1.2.2.130.3',
+    '1.2.2.130.4',
+    '1.2.2.130.5',
+    '1.2.2.131',
+    '1.2.2.131.1',
+    '1.2.2.131.1.1',
+    '1.2.2.131.1.2',
+    '1.2.2.132',
+    '1.2.2.132.1',
+    '1.2.2.132.1.1',
+    '1.2.2.132.1.2',
+    '1.2.2.133',
+    '1.2.2.133.1',
+    '1.2.2.133.2',
+    '1.2.2.133.3',
+    '1.2.2.133.4',
+    '1.2.2.134',
+    '1.2.2.134.1',
+    '1.2.2.134.2',
+    '1.2.2.134.3',
+    '1.2.2.134.4',
+    '1.2.2.135',
+    '1.2.2.135.1',
+    '1.2.2.135.2',
+    '1.2.2.135.3',
+    '1.2.2.135.4',
+    '1.2.2.136',
+    '1.2.2.136.1',
+    '1.2.2.136.2',
+    '1.2.2.136.3',
+    '1.2.2.136.4',
+    '1.2.2.137',
+    '1.2.2.137.1',
+    '1.2.2.137.2',
+    '1.2.2.137.3',
+    '1.2.2.137.4',
+    '1.2.2.139',
+    '1.2.2.139.1',
+    '1.2.2.139.2',
+    '1.2.2.139.3',
+    '1.2.2.139.4',
+    '1.2.2.139.5',
+    '1.2.2.14',
+    '1.2.2.14.1',
+    '1.2.2.14.2',
+    '1.2.2.14.3',
+    '1.2.2.140',
+    '1.2.2.140.1',
+    '1.2.2.140.2',
+    '1.2.2.140.3',
+    '1.2.2.140.4',
+    '1.2.2.140.5',
+    '1.2.2.141',
+    '1.2.2.141.1',
+    '1.2.2.141.2',
+    '1.2.2.141.3',
+    '1.2.2.141.4',
+    '1.2.2.141.5',
+    '1.2.2.142',
+    '1.2.2.142.1',
+    '1.2.2.142.2',
+    '1.2.2.142.3',
+    '1.2.2.142.4',
+    '1.2.2.143',
+    '1.2.2.143.1',
+    '1.2.2.143.2',
+    '1.2.2.143.3',
+    '1.2.2.143.4',
+    '1.2.2.15',
+    '1.2.2.15.1',
+    '1.2.2.15.2',
+    '1.2.2.15.3',
+    '1.2.2.16',
+    '1.2.2.16.1',
+    '1.2.2.16.2',
+    '1.2.2.16.3',
+    '1.2.2.16.4',
+    '1.2.2.17',
+    '1.2.2.17.1',
+    '1.2.2.17.2',
+    '1.2.2.17.3',
+    '1.2.2.17.4',
+    '1.2.2.17.5',
+    '1.2.2.17.6',
+    '1.2.2.17.7',
+    '1.2.2.17.8',
+    '1.2.2.17.9',
+    '1.2.2.18',
+    '1.2.2.18.1',
+    '1.2.2.18.2',
+    '1.2.2.18.3',
+    '1.2.2.18.4',
+    '1.2.2.18.5',
+    '1.2.2.18.6',
+    '1.2.2.18.7',
+    '1.2.2.19',
+    '1.2.2.19.1',
+    '1.2.2.19.2',
+    '1.2.2.19.3',
+    '1.2.2.19.4',
+    '1.2.2.2',
+    '1.2.2.2.1',
+    '1.2.2.2.2',
+    '1.2.2.2.3',
+    '1.2.2.2.4',
+    '1.2.2.2.5',
+    '1.2.2.2.6',
+    '1.2.2.20',
+    '1.2.2.20.1',
+    '1.2.2.20.2',
+    '1.2.2.20.3',
+    '1.2.2.20.4',
+    '1.2.2.21',
+    '1.2.2.21.1',
+    '1.2.2.21.2',
+    '1.2.2.21.3',
+    '1.2.2.21.4',
+    '1.2.2.21.5',
+    '1.2.2.21.6',
+    '1.2.2.22',
+    '1.2.2.22.1',
+    '1.2.2.22.2',
+    '1.2.2.23',
+    '1.2.2.23.1',
+    '1.2.2.23.2',
+    '1.2.2.23.3',
+    '1.2.2.23.4',
+    '1.2.2.24',
+    '1.2.2.24.1',
+    '1.2.2.24.2',
+    '1.2.2.24.3',
+    '1.2.2.24.4',
+    '1.2.2.25',
+    '1.2.2.25.1',
+    '1.2.2.25.2',
+    '1.2.2.25.3',
+    '1.2.2.25.4',
+    '1.2.2.25.5',
+    '1.2.2.25.6',
+    '1.2.2.26',
+    '1.2.2.26.1',
+    '1.2.2.26.2',
+    '1.2.2.26.3',
+    '1.2.2.26.4',
+    '1.2.2.26.5',
+    '1.2.2.26.6',
+    '1.2.2.27',
+    '1.2.2.27.1',
+    '1.2.2.27.10',
+    '1.2.2.27.11',
+    '1.2.2.27.2',
+    '1.2.2.27.3',
+    '1.2.2.27.4',
+    '1.2.2.27.5',
+    '1.2.2.27.6',
+    '1.2.2.27.7',
+    '1.2.2.27.8',
+    '1.2.2.27.9',
+    '1.2.2.28',
+    '1.2.2.28.1',
+    '1.2.2.28.2',
+    '1.2.2.28.3',
+    '1.2.2.28.4',
+    '1.2.2.28.5',
+    '1.2.2.28.6',
+    '1.2.2.29',
+    '1.2.2.29.1',
+    '1.2.2.29.2',
+    '1.2.2.29.3',
+    '1.2.2.29.4',
+    '1.2.2.29.5',
+    '1.2.2.29.6',
+    '1.2.2.3',
+    '1.2.2.3.1',
+    '1.2.2.3.2',
+    '1.2.2.3.3',
+    '1.2.2.3.4',
+    '1.2.2.3.5',
+    '1.2.2.3.6',
+    '1.2.2.3.7',
+    '1.2.2.3.8',
+    '1.2.2.3.9',
+    '1.2.2.30',
+    '1.2.2.30.1',
+    '1.2.2.30.1.1',
+    '1.2.2.30.1.2',
+    '1.2.2.30.1.3',
+    '1.2.2.31',
+    '1.2.2.31.1',
+    '1.2.2.31.1.1',
+    '1.2.2.31.1.2',
+    '1.2.2.32',
+    '1.2.2.32.1',
+    '1.2.2.32.1.1',
+    '1.2.2.32.1.2',
+    '1.2.2.32.1.3',
+    '1.2.2.32.3',
+    '1.2.2.32.4',
+    '1.2.2.32.5',
+    '1.2.2.32.5.1',
+    '1.2.2.32.6',
+    '1.2.2.33',
+    '1.2.2.33.1',
+    '1.2.2.33.1.1',
+    '1.2.2.33.1.2',
+    '1.2.2.33.1.3',
+    '1.2.2.33.2',
+    '1.2.2.33.3',
+    '1.2.2.33.4',
+    '1.2.2.33.5',
+    '1.2.2.33.5.1',
+    '1.2.2.33.5.2',
+    '1.2.2.33.6',
+    '1.2.2.34',
+    '1.2.2.34.1',
+    '1.2.2.34.2',
+    '1.2.2.34.3',
+    '1.2.2.34.4',
+    '1.2.2.34.5',
+    '1.2.2.34.6',
+    '1.2.2.35',
+    '1.2.2.35.1',
+    '1.2.2.35.2',
+    '1.2.2.35.3',
+    '1.2.2.35.4',
+    '1.2.2.35.5',
+    '1.2.2.35.6',
+    '1.2.2.36',
+    '1.2.2.36.1',
+    '1.2.2.36.2',
+    '1.2.2.36.3',
+    '1.2.2.36.4',
+    '1.2.2.37',
+    '1.2.2.37.1',
+    '1.2.2.37.10',
+    '1.2.2.37.2',
+    '1.2.2.37.3',
+    '1.2.2.37.4',
+    '1.2.2.37.5',
+    '1.2.2.37.6',
+    '1.2.2.37.7',
+    '1.2.2.37.8',
+    '1.2.2.37.9',
+    '1.2.2.38',
+    '1.2.2.38.1',
+    '1.2.2.38.2',
+    '1.2.2.39',
+    '1.2.2.39.1',
+    '1.2.2.39.2',
+    '1.2.2.39.3',
+    '1.2.2.39.4',
+    '1.2.2.4',
+    '1.2.2.4.1',
+    '1.2.2.4.2',
+    '1.2.2.4.3',
+    '1.2.2.4.4',
+    '1.2.2.4.5',
+    '1.2.2.40',
+    '1.2.2.40.1',
+    '1.2.2.40.2',
+    '1.2.2.40.3',
+    '1.2.2.40.4',
+    '1.2.2.41',
+    '1.2.2.41.1',
+    '1.2.2.41.2',
+    '1.2.2.41.3',
+    '1.2.2.41.4',
+    '1.2.2.42',
+    '1.2.2.42.1',
+    '1.2.2.42.2',
+    '1.2.2.42.3',
+    '1.2.2.42.4',
+    '1.2.2.43',
+    '1.2.2.43.1',
+    '1.2.2.43.1.1',
+    '1.2.2.43.1.2',
+    '1.2.2.43.1.3',
+    '1.2.2.44',
+    '1.2.2.44.1',
+    '1.2.2.44.1.1',
+    '1.2.2.44.1.2',
+    '1.2.2.44.1.3',
+    '1.2.2.46',
+    '1.2.2.46.1',
+    '1.2.2.46.2',
+    '1.2.2.46.3',
+    '1.2.2.46.4',
+    '1.2.2.46.5',
+    '1.2.2.46.6',
+    '1.2.2.47',
+    '1.2.2.47.1',
+    '1.2.2.47.2',
+    '1.2.2.47.3',
+    '1.2.2.47.4',
+    '1.2.2.47.5',
+    '1.2.2.47.6',
+    '1.2.2.48',
+    '1.2.2.48.1',
+    '1.2.2.48.2',
+    '1.2.2.48.3',
+    '1.2.2.48.4',
+    '1.2.2.48.5',
+    '1.2.2.48.6',
+    '1.2.2.49',
+    '1.2.2.49.1',
+    '1.2.2.49.2',
+    '1.2.2.49.3',
+    '1.2.2.49.4',
+    '1.2.2.49.5',
+    '1.2.2.49.6',
+    '1.2.2.5',
+    '1.2.2.5.1',
+    '1.2.2.5.2',
+    '1.2.2.5.3',
+    '1.2.2.5.4',
+    '1.2.2.5.5',
+    '1.2.2.50',
+    '1.2.2.50.1',
+    '1.2.2.50.2',
+    '1.2.2.50.3',
+    '1.2.2.50.4',
+    '1.2.2.50.5',
+    '1.2.2.50.6',
+    '1.2.2.51',
+    '1.2.2.51.1',
+    '1.2.2.51.2',
+    '1.2.2.51.3',
+    '1.2.2.51.4',
+    '1.2.2.51.5',
+    '1.2.2.51.6',
+    '1.2.2.52',
+    '1.2.2.52.1',
+    '1.2.2.52.2',
+    '1.2.2.52.3',
+    '1.2.2.52.4',
+    '1.2.2.52.5',
+    '1.2.2.52.6',
+    '1.2.2.53',
+    '1.2.2.53.1',
+    '1.2.2.53.2',
+    '1.2.2.53.3',
+    '1.2.2.53.4',
+    '1.2.2.53.5',
+    '1.2.2.53.6',
+    '1.2.2.54',
+    '1.2.2.54.1',
+    '1.2.2.54.1.1',
+    '1.2.2.54.1.2',
+    '1.2.2.55',
+    '1.2.2.55.1',
+    '1.2.2.55.1.1',
+    '1.2.2.55.1.2',
+    '1.2.2.55.1.3',
+    '1.2.2.55.3',
+    '1.2.2.55.4',
+    '1.2.2.55.5',
+    '1.2.2.55.5.1',
+    '1.2.2.55.6',
+    '1.2.2.56',
+    '1.2.2.56.1',
+    '1.2.2.56.1.1',
+    '1.2.2.56.1.2',
+    '1.2.2.56.1.3',
+    '1.2.2.56.2',
+    '1.2.2.56.3',
+    '1.2.2.56.4',
+    '1.2.2.56.5',
+    '1.2.2.56.5.1',
+    '1.2.2.56.5.2',
+    '1.2.2.56.6',
+    '1.2.2.57',
+    '1.2.2.57.1',
+    '1.2.2.57.2',
+    '1.2.2.57.3',
+    '1.2.2.57.4',
+    '1.2.2.57.5',
+    '1.2.2.58',
+    '1.2.2.58.1',
+    '1.2.2.58.2',
+    '1.2.2.58.3',
+    '1.2.2.58.4',
+    '1.2.2.59',
+    '1.2.2.59.1',
+    '1.2.2.59.2',
+    '1.2.2.59.3',
+    '1.2.2.59.4',
+    '1.2.2.6',
+    '1.2.2.6.1',
+    '1.2.2.6.10',
+    '1.2.2.6.11',
+    '1.2.2.6.2',
+    '1.2.2.6.3',
+    '1.2.2.6.4',
+    '1.2.2.6.5',
+    '1.2.2.6.6',
+    '1.2.2.6.7',
+    '1.2.2.6.8',
+    '1.2.2.6.9',
+    '1.2.2.60',
+    '1.2.2.60.1',
+    '1.2.2.60.2',
+    '1.2.2.60.3',
+    '1.2.2.60.4',
+    '1.2.2.60.5',
+    '1.2.2.60.6',
+    '1.2.2.61',
+    '1.2.2.61.1',
+    '1.2.2.61.2',
+    '1.2.2.61.3',
+    '1.2.2.61.4',
+    '1.2.2.61.5',
+    '1.2.2.62',
+    '1.2.2.62.1',
+    '1.2.2.62.2',
+    '1.2.2.62.3',
+    '1.2.2.62.4',
+    '1.2.2.62.5',
+    '1.2.2.63',
+    '1.2.2.63.1',
+    '1.2.2.63.1.1',
+    '1.2.2.63.1.2',
+    '1.2.2.64',
+    '1.2.2.64.1',
+    '1.2.2.64.2',
+    '1.2.2.64.3',
+    '1.2.2.64.4',
+    '1.2.2.65',
+    '1.2.2.65.1',
+    '1.2.2.65.2',
+    '1.2.2.65.3',
+    '1.2.2.65.4',
+    '1.2.2.66',
+    '1.2.2.66.1',
+    '1.2.2.66.2',
+    '1.2.2.66.3',
+    '1.2.2.66.4',
+    '1.2.2.66.5',
+    '1.2.2.67',
+    '1.2.2.67.1',
+    '1.2.2.67.2',
+    '1.2.2.67.3',
+    '1.2.2.67.4',
+    '1.2.2.67.5',
+    '1.2.2.68',
+    '1.2.2.68.1',
+    '1.2.2.68.2',
+    '1.2.2.68.3',
+    '1.2.2.68.4',
+    '1.2.2.68.5',
+    '1.2.2.69',
+    '1.2.2.69.1',
+    '1.2.2.69.10',
+    '1.2.2.69.11',
+    '1.2.2.69.2',
+    '1.2.2.69.3',
+    '1.2.2.69.4',
+    '1.2.2.69.5',
+    '1.2.2.69.6',
+    '1.2.2.69.7',
+    '1.2.2.69.8',
+    '1.2.2.69.9',
+    '1.2.2.7',
+    '1.2.2.7.1',
+    '1.2.2.7.10',
+    '1.2.2.7.11',
+    '1.2.2.7.2',
+    '1.2.2.7.3',
+    '1.2.2.7.4',
+    '1.2.2.7.5',
+    '1.2.2.7.6',
+    '1.2.2.7.7',
+    '1.2.2.7.8',
+    '1.2.2.7.9',
+    '1.2.2.70',
+    '1.2.2.70.1',
+    '1.2.2.70.10',
+    '1.2.2.70.11',
+    '1.2.2.70.2',
+    '1.2.2.70.3',
+    '1.2.2.70.4',
+    '1.2.2.70.5',
+    '1.2.2.70.6',
+    '1.2.2.70.7',
+    '1.2.2.70.8',
+    '1.2.2.70.9',
+    '1.2.2.71',
+    '1.2.2.71.1',
+    '1.2.2.71.1.1',
+    '1.2.2.71.1.2',
+    '1.2.2.71.1.3',
+    '1.2.2.72',
+    '1.2.2.72.1',
+    '1.2.2.72.2',
+    '1.2.2.72.3',
+    '1.2.2.72.4',
+    '1.2.2.72.5',
+    '1.2.2.72.6',
+    '1.2.2.73',
+    '1.2.2.73.1',
+    '1.2.2.73.2',
+    '1.2.2.73.3',
+    '1.2.2.73.4',
+    '1.2.2.73.5',
+    '1.2.2.74',
+    '1.2.2.74.1',
+    '1.2.2.74.1.1',
+    '1.2.2.74.1.2',
+    '1.2.2.74.3',
+    '1.2.2.74.4',
+    '1.2.2.74.5',
+    '1.2.2.74.5.1',
+    '1.2.2.74.6',
+    '1.2.2.75',
+    '1.2.2.75.1',
+    '1.2.2.75.2',
+    '1.2.2.75.3',
+    '1.2.2.75.4',
+    '1.2.2.75.5',
+    '1.2.2.76',
+    '1.2.2.76.1',
+    '1.2.2.76.1.1',
+    '1.2.2.76.1.2',
+    '1.2.2.77',
+    '1.2.2.77.1',
+    '1.2.2.77.2',
+    '1.2.2.77.3',
+    '1.2.2.77.4',
+    '1.2.2.77.5',
+    '1.2.2.77.6',
+    '1.2.2.78',
+    '1.2.2.78.1',
+    '1.2.2.78.2',
+    '1.2.2.78.3',
+    '1.2.2.78.4',
+    '1.2.2.78.5',
+    '1.2.2.78.6',
+    '1.2.2.79',
+    '1.2.2.79.1',
+    '1.2.2.79.2',
+    '1.2.2.79.3',
+    '1.2.2.79.4',
+    '1.2.2.79.5',
+    '1.2.2.79.6',
+    '1.2.2.8',
+    '1.2.2.8.1',
+    '1.2.2.8.2',
+    '1.2.2.8.3',
+    '1.2.2.8.4',
+    '1.2.2.8.5',
+    '1.2.2.8.6',
+    '1.2.2.8.7',
+    '1.2.2.8.8',
+    '1.2.2.8.9',
+    '1.2.2.80',
+    '1.2.2.80.1',
+    '1.2.2.80.2',
+    '1.2.2.80.3',
+    '1.2.2.80.4',
+    '1.2.2.80.5',
+    '1.2.2.80.6',
+    '1.2.2.81',
+    '1.2.2.81.1',
+    '1.2.2.81.2',
+    '1.2.2.81.3',
+    '1.2.2.81.4',
+    '1.2.2.81.5',
+    '1.2.2.81.6',
+    '1.2.2.82',
+    '1.2.2.82.1',
+    '1.2.2.82.2',
+    '1.2.2.82.3',
+    '1.2.2.82.4',
+    '1.2.2.82.5',
+    '1.2.2.82.6',
+    '1.2.2.82.7',
+    '1.2.2.83',
+    '1.2.2.83.1',
+    '1.2.2.83.10',
+    '1.2.2.83.11',
+    '1.2.2.83.2',
+    '1.2.2.83.3',
+    '1.2.2.83.4',
+    '1.2.2.83.5',
+    '1.2.2.83.6',
+    '1.2.2.83.7',
+    '1.2.2.83.8',
+    '1.2.2.83.9',
+    '1.2.2.86',
+    '1.2.2.86.1',
+    '1.2.2.86.2',
+    '1.2.2.86.3',
+    '1.2.2.86.4',
+    '1.2.2.87',
+    '1.2.2.87.1',
+    '1.2.2.87.2',
+    '1.2.2.87.3',
+    '1.2.2.87.4',
+    '1.2.2.87.5',
+    '1.2.2.88',
+    '1.2.2.88.1',
+    '1.2.2.88.2',
+    '1.2.2.88.3',
+    '1.2.2.88.4',
+    '1.2.2.88.5',
+    '1.2.2.89',
+    '1.2.2.89.1',
+    '1.2.2.89.2',
+    '1.2.2.89.3',
+    '1.2.2.89.4',
+    '1.2.2.89.5',
+    '1.2.2.9',
+    '1.2.2.9.1',
+    '1.2.2.9.2',
+    '1.2.2.9.3',
+    '1.2.2.9.4',
+    '1.2.2.9.5',
+    '1.2.2.9.6',
+    '1.2.2.9.7',
+    '1.2.2.9.8',
+    '1.2.2.90',
+    '1.2.2.90.1',
+    '1.2.2.90.2',
+    '1.2.2.90.3',
+    '1.2.2.90.4',
+    '1.2.2.90.5',
+    '1.2.2.91',
+    '1.2.2.91.1',
+    '1.2.2.91.2',
+    '1.2.2.91.3',
+    '1.2.2.91.4',
+    '1.2.2.91.5',
+    '1.2.2.92',
+    '1.2.2.92.1',
+    '1.2.2.92.1.1',
+    '1.2.2.92.1.2',
+    '1.2.2.92.1.3',
+    '1.2.2.93',
+    '1.2.2.93.1',
+    '1.2.2.93.10',
+    '1.2.2.93.2',
+    '1.2.2.93.3',
+    '1.2.2.93.4',
+    '1.2.2.93.5',
+    '1.2.2.93.6',
+    '1.2.2.93.7',
+    '1.2.2.93.8',
+    '1.2.2.93.9',
+    '1.2.2.94',
+    '1.2.2.94.1',
+    '1.2.2.94.2',
+    '1.2.2.94.3',
+    '1.2.2.94.4',
+    '1.2.2.95',
+    '1.2.2.95.1',
+    '1.2.2.95.2',
+    '1.2.2.95.3',
+    '1.2.2.95.4',
+    '1.2.2.96',
+    '1.2.2.96.1',
+    '1.2.2.96.2',
+    '1.2.2.96.3',
+    '1.2.2.96.4',
+    '1.2.2.97',
+    '1.2.2.97.1',
+    '1.2.2.97.2',
+    '1.2.2.97.3',
+    '1.2.2.97.4',
+    '1.2.2.97.5',
+    '1.2.2.97.6',
+    '1.2.2.98',
+    '1.2.2.98.1',
+    '1.2.2.98.2',
+    '1.2.2.98.3',
+    '1.2.2.98.4',
+    '1.2.2.98.5',
+    '1.2.2.98.6',
+    '1.2.2.98.7',
+    '1.2.2.98.8',
+    '1.2.2.99',
+    '1.2.2.99.1',
+    '1.2.2.99.10',
+    '1.2.2.99.2',
+    '1.2.2.99.3',
+    '1.2.2.99.4',
+    '1.2.2.99.5',
+    '1.2.2.99.6',
+    '1.2.2.99.7',
+    '1.2.2.99.8',
+    '1.2.2.99.9',
+    '1.2.3',
+    '1.2.3.1',
+    '1.2.3.1.1',
+    '1.2.3.10',
+    '1.2.3.10.1',
+    '1.2.3.101',
+    '1.2.3.101.1',
+    '1.2.3.102',
+    '1.2.3.102.1',
+    '1.2.3.102.2',
+    '1.2.3.103',
+    '1.2.3.103.1',
+    '1.2.3.103.2',
+    '1.2.3.104',
+    '1.2.3.104.1',
+    '1.2.3.104.2',
+    '1.2.3.105',
+    '1.2.3.105.1',
+    '1.2.3.106',
+    '1.2.3.106.1',
+    '1.2.3.107',
+    '1.2.3.107.1',
+    '1.2.3.108',
+    '1.2.3.108.1',
+    '1.2.3.108.2',
+    '1.2.3.109',
+    '1.2.3.109.1',
+    '1.2.3.11',
+    '1.2.3.11.1',
+    '1.2.3.113',
+    '1.2.3.113.1',
+    '1.2.3.113.2',
+    '1.2.3.114',
+    '1.2.3.114.1',
+    '1.2.3.114.2',
+    '1.2.3.115',
+    '1.2.3.115.1',
+    '1.2.3.115.2',
+    '1.2.3.116',
+    '1.2.3.116.1',
+    '1.2.3.116.2',
+    '1.2.3.117',
+    '1.2.3.117.1',
+    '1.2.3.117.2',
+    '1.2.3.118',
+    '1.2.3.118.1',
+    '1.2.3.118.2',
+    '1.2.3.119',
+    '1.2.3.119.1',
+    '1.2.3.119.2',
+    '1.2.3.120',
+    '1.2.3.120.1',
+    '1.2.3.120.2',
+    '1.2.3.121',
+    '1.2.3.121.1',
+    '1.2.3.121.2',
+    '1.2.3.122',
+    '1.2.3.122.1',
+    '1.2.3.122.2',
+    '1.2.3.123',
+    '1.2.3.123.1',
+    '1.2.3.123.2',
+    '1.2.3.124',
+    '1.2.3.124.1',
+    '1.2.3.124.2',
+    '1.2.3.125',
+    '1.2.3.125.1',
+    '1.2.3.126',
+    '1.2.3.126.1',
+    '1.2.3.127',
+    '1.2.3.127.1',
+    '1.2.3.128',
+    '1.2.3.128.1',
+    '1.2.3.129',
+    '1.2.3.129.1',
+    '1.2.3.13',
+    '1.2.3.13.1',
+    '1.2.3.130',
+    '1.2.3.130.1',
+    '1.2.3.131',
+    '1.2.3.131.1',
+    '1.2.3.132',
+    '1.2.3.132.1',
+    '1.2.3.133',
+    '1.2.3.133.1',
+    '1.2.3.134',
+    '1.2.3.134.1',
+    '1.2.3.135',
+    '1.2.3.135.1',
+    '1.2.3.136',
+    '1.2.3.136.1',
+    '1.2.3.137',
+    '1.2.3.137.1',
+    '1.2.3.139',
+    '1.2.3.139.1',
+    '1.2.3.139.2',
+    '1.2.3.14',
+    '1.2.3.14.1',
+    '1.2.3.140',
+    '1.2.3.140.1',
+    '1.2.3.141',
+    '1.2.3.141.1',
+    '1.2.3.141.2',
+    '1.2.3.142',
+    '1.2.3.143',
+    '1.2.3.143.1',
+    '1.2.3.15',
+    '1.2.3.15.1',
+    '1.2.3.16',
+    '1.2.3.16.1',
+    '1.2.3.17',
+    '1.2.3.17.1',
+    '1.2.3.18',
+    '1.2.3.18.1',
+    '1.2.3.19',
+    '1.2.3.19.1',
+    '1.2.3.2',
+    '1.2.3.2.1',
+    '1.2.3.20',
+    '1.2.3.20.1',
+    '1.2.3.21',
+    '1.2.3.21.1',
+    '1.2.3.21.2',
+    '1.2.3.22',
+    '1.2.3.22.1',
+    '1.2.3.23',
+    '1.2.3.23.1',
+    '1.2.3.24',
+    '1.2.3.24.1',
+    '1.2.3.25',
+    '1.2.3.25.1',
+    '1.2.3.25.2',
+    '1.2.3.26',
+    '1.2.3.26.1',
+    '1.2.3.27',
+    '1.2.3.27.1',
+    '1.2.3.28',
+    '1.2.3.28.1',
+    '1.2.3.29',
+    '1.2.3.29.1',
+    '1.2.3.29.2',
+    '1.2.3.3',
+    '1.2.3.3.1',
+    '1.2.3.30',
+    '1.2.3.30.1',
+    '1.2.3.31',
+    '1.2.3.31.1',
+    '1.2.3.32',
+    '1.2.3.32.1',
+    '1.2.3.33',
+    '1.2.3.33.1',
+    '1.2.3.34',
+    '1.2.3.34.1',
+    '1.2.3.35',
+    '1.2.3.35.1',
+    '1.2.3.36',
+    '1.2.3.36.1',
+    '1.2.3.37',
+    '1.2.3.37.1',
+    '1.2.3.38',
+    '1.2.3.38.1',
+    '1.2.3.39',
+    '1.2.3.39.1',
+    '1.2.3.4',
+    '1.2.3.4.1',
+    '1.2.3.40',
+    '1.2.3.40.1',
+    '1.2.3.41',
+    '1.2.3.41.1',
+    '1.2.3.42',
+    '1.2.3.42.1',
+    '1.2.3.43',
+    '1.2.3.43.1',
+    '1.2.3.44',
+    '1.2.3.44.1',
+    '1.2.3.46',
+    '1.2.3.46.1',
+    '1.2.3.46.2',
+    '1.2.3.47',
+    '1.2.3.47.1',
+    '1.2.3.47.2',
+    '1.2.3.48',
+    '1.2.3.48.1',
+    '1.2.3.48.2',
+    '1.2.3.49',
+    '1.2.3.49.1',
+    '1.2.3.5',
+    '1.2.3.5.1',
+    '1.2.3.50',
+    '1.2.3.50.1',
+    '1.2.3.51',
+    '1.2.3.51.1',
+    '1.2.3.52',
+    '1.2.3.52.1',
+    '1.2.3.53',
+    '1.2.3.53.1',
+    '1.2.3.54',
+    '1.2.3.54.1',
+    '1.2.3.55',
+    '1.2.3.55.1',
+    '1.2.3.56',
+    '1.2.3.56.1',
+    '1.2.3.57',
+    '1.2.3.57.1',
+    '1.2.3.57.2',
+    '1.2.3.58',
+    '1.2.3.58.1',
+    '1.2.3.59',
+    '1.2.3.59.1',
+    '1.2.3.6',
+    '1.2.3.6.1',
+    '1.2.3.60',
+    '1.2.3.60.1',
+    '1.2.3.61',
+    '1.2.3.61.1',
+    '1.2.3.62',
+    '1.2.3.62.1',
+    '1.2.3.63',
+    '1.2.3.63.1',
+    '1.2.3.64',
+    '1.2.3.64.1',
+    '1.2.3.65',
+    '1.2.3.65.1',
+    '1.2.3.66',
+    '1.2.3.66.1',
+    '1.2.3.67',
+    '1.2.3.67.1',
+    '1.2.3.68',
+    '1.2.3.68.1',
+    '1.2.3.69',
+    '1.2.3.69.1',
+    '1.2.3.7',
+    '1.2.3.7.1',
+    '1.2.3.70',
+    '1.2.3.70.1',
+    '1.2.3.71',
+    '1.2.3.71.1',
+    '1.2.3.72',
+    '1.2.3.72.1',
+    '1.2.3.73',
+    '1.2.3.73.1',
+    '1.2.3.74',
+    '1.2.3.74.1',
+    '1.2.3.75',
+    '1.2.3.75.1',
+    '1.2.3.76',
+    '1.2.3.76.1',
+    '1.2.3.77',
+    '1.2.3.77.1',
+    '1.2.3.78',
+    '1.2.3.78.1',
+    '1.2.3.79',
+    '1.2.3.79.1',
+    '1.2.3.8',
+    '1.2.3.8.1',
+    '1.2.3.80',
+    '1.2.3.80.1',
+    '1.2.3.81',
+    '1.2.3.81.1',
+    '1.2.3.82',
+    '1.2.3.82.1',
+    '1.2.3.83',
+    '1.2.3.83.1',
+    '1.2.3.86',
+    '1.2.3.86.1',
+    '1.2.3.87',
+    '1.2.3.87.1',
+    '1.2.3.87.2',
+    '1.2.3.88',
+    '1.2.3.88.1',
+    '1.2.3.88.2',
+    '1.2.3.89',
+    '1.2.3.89.1',
+    '1.2.3.89.2',
+    '1.2.3.9',
+    '1.2.3.9.1',
+    '1.2.3.9.2',
+    '1.2.3.90',
+    '1.2.3.90.1',
+    '1.2.3.90.2',
+    '1.2.3.91',
+    '1.2.3.91.1',
+    '1.2.3.92',
+    '1.2.3.92.1',
+    '1.2.3.93',
+    '1.2.3.93.1',
+    '1.2.3.93.2',
+    '1.2.3.95',
+    '1.2.3.95.1',
+    '1.2.3.96',
+    '1.2.3.96.1',
+    '1.2.3.97',
+    '1.2.3.97.1',
+    '1.2.3.97.2',
+    '1.2.3.98',
+    '1.2.3.98.1',
+    '1.2.3.99',
+    '1.2.3.99.1',
+    '1.2.3.99.2',
+    '1.2.4',
+    '1.2.4.1',
+    '1.2.4.1.1',
+    '1.3',
+    '1.3.1',
+    '1.3.1.1',
+    '1.3.1.10',
+    '1.3.1.101',
+    '1.3.1.102',
+    '1.3.1.103',
+    '1.3.1.104',
+    '1.3.1.105',
+    '1.3.1.106',
+    '1.3.1.107',
+    '1.3.1.108',
+    '1.3.1.11',
+    '1.3.1.110',
+    '1.3.1.113',
+    '1.3.1.114',
+    '1.3.1.115',
+    '1.3.1.116',
+    '1.3.1.117',
+    '1.3.1.118',
+    '1.3.1.119',
+    '1.3.1.120',
+    '1.3.1.121',
+    '1.3.1.122',
+    '1.3.1.123',
+    '1.3.1.124',
+    '1.3.1.128',
+    '1.3.1.129',
+    '1.3.1.13',
+    '1.3.1.133',
+    '1.3.1.134',
+    '1.3.1.135',
+    '1.3.1.136',
+    '1.3.1.137',
+    '1.3.1.14',
+    '1.3.1.142',
+    '1.3.1.143',
+    '1.3.1.15',
+    '1.3.1.16',
+    '1.3.1.17',
+    '1.3.1.18',
+    '1.3.1.19',
+    '1.3.1.2',
+    '1.3.1.20',
+    '1.3.1.21',
+    '1.3.1.22',
+    '1.3.1.23',
+    '1.3.1.24',
+    '1.3.1.25',
+    '1.3.1.26',
+    '1.3.1.27',
+    '1.3.1.28',
+    '1.3.1.29',
+    '1.3.1.3',
+    '1.3.1.32',
+    '1.3.1.33',
+    '1.3.1.34',
+    '1.3.1.35',
+    '1.3.1.36',
+    '1.3.1.37',
+    '1.3.1.38',
+    '1.3.1.39',
+    '1.3.1.4',
+    '1.3.1.40',
+    '1.3.1.41',
+    '1.3.1.42',
+    '1.3.1.46',
+    '1.3.1.47',
+    '1.3.1.48',
+    '1.3.1.49',
+    '1.3.1.5',
+    '1.3.1.50',
+    '1.3.1.51',
+    '1.3.1.52',
+    '1.3.1.53',
+    '1.3.1.55',
+    '1.3.1.56',
+    '1.3.1.57',
+    '1.3.1.58',
+    '1.3.1.59',
+    '1.3.1.6',
+    '1.3.1.60',
+    '1.3.1.64',
+    '1.3.1.65',
+    '1.3.1.66',
+    '1.3.1.67',
+    '1.3.1.68',
+    '1.3.1.69',
+    '1.3.1.7',
+    '1.3.1.70',
+    '1.3.1.72',
+    '1.3.1.74',
+    '1.3.1.77',
+    '1.3.1.78',
+    '1.3.1.79',
+    '1.3.1.8',
+    '1.3.1.80',
+    '1.3.1.81',
+    '1.3.1.83',
+    '1.3.1.86',
+    '1.3.1.87',
+    '1.3.1.88',
+    '1.3.1.89',
+    '1.3.1.9',
+    '1.3.1.90',
+    '1.3.1.93',
+    '1.3.1.93.1',
+    '1.3.1.93.2',
+    '1.3.1.93.3',
+    '1.3.1.93.4',
+    '1.3.1.94',
+    '1.3.1.95',
+    '1.3.1.96',
+    '1.3.1.97',
+    '1.3.1.98',
+    '1.3.1.99',
+    '1.3.1.99.1',
+    '1.3.1.99.2',
+    '1.3.1.99.3',
+    '1.3.2',
+    '1.3.2.1',
+    '1.3.2.1.1',
+    '1.3.2.1.2',
+    '1.3.2.1.2.1',
+    '1.3.2.1.2.2',
+    '1.3.2.1.3',
+    '1.3.2.1.3.1',
+    '1.3.2.1.3.2',
+    '1.3.2.1.4',
+    '1.3.2.1.4.1',
+    '1.3.2.1.4.2',
+    '1.3.2.1.5',
+    '1.3.2.1.5.1',
+    '1.3.2.1.5.2',
+    '1.3.2.1.6',
+    '1.3.2.1.7',
+    '1.3.2.10',
+    '1.3.2.10.1',
+    '1.3.2.10.2',
+    '1.3.2.10.3',
+    '1.3.2.10.4',
+    '1.3.2.10.4.1',
+    '1.3.2.10.5',
+    '1.3.2.101',
+    '1.3.2.101.1',
+    '1.3.2.101.2',
+    '1.3.2.101.3',
+    '1.3.2.11',
+    '1.3.2.11.1',
+    '1.3.2.11.2',
+    '1.3.2.11.3',
+    '1.3.2.11.4',
+    '1.3.2.11.4.1',
+    '1.3.2.11.5',
+    '1.3.2.11.6',
+    '1.3.2.110',
+    '1.3.2.110.1',
+    '1.3.2.110.2',
+    '1.3.2.110.3',
+    '1.3.2.110.4',
+    '1.3.2.113',
+    '1.3.2.113.1',
+    '1.3.2.113.2',
+    '1.3.2.113.3',
+    '1.3.2.113.4',
+    '1.3.2.113.4.1',
+    '1.3.2.114',
+    '1.3.2.114.1',
+    '1.3.2.114.2',
+    '1.3.2.114.3',
+    '1.3.2.114.4',
+    '1.3.2.114.4.1',
+    '1.3.2.115',
+    '1.3.2.115.1',
+    '1.3.2.115.2',
+    '1.3.2.115.3',
+    '1.3.2.115.4',
+    '1.3.2.115.4.1',
+    '1.3.2.115.4.2',
+    '1.3.2.116',
+    '1.3.2.116.1',
+    '1.3.2.116.2',
+    '1.3.2.116.3',
+    '1.3.2.116.4',
+    '1.3.2.116.4.1',
+    '1.3.2.116.4.2',
+    '1.3.2.117',
+    '1.3.2.117.1',
+    '1.3.2.117.2',
+    '1.3.2.117.3',
+    '1.3.2.117.4',
+    '1.3.2.117.4.1',
+    '1.3.2.117.4.2',
+    '1.3.2.118',
+    '1.3.2.118.1',
+    '1.3.2.118.2',
+    '1.3.2.118.3',
+    '1.3.2.118.4',
+    '1.3.2.118.4.1',
+    '1.3.2.118.4.2',
+    '1.3.2.118.5',
+    '1.3.2.119',
+    '1.3.2.119.1',
+    '1.3.2.119.2',
+    '1.3.2.119.3',
+    '1.3.2.119.4',
+    '1.3.2.119.4.1',
+    '1.3.2.12',
+    '1.3.2.12.1',
+    '1.3.2.12.2',
+    '1.3.2.12.3',
+    '1.3.2.12.3.1',
+    '1.3.2.12.3.2',
+    '1.3.2.12.3.3',
+    '1.3.2.12.4',
+    '1.3.2.12.5',
+    '1.3.2.12.6',
+    '1.3.2.12.7',
+    '1.3.2.12.8',
+    '1.3.2.120',
+    '1.3.2.120.1',
+    '1.3.2.120.2',
+    '1.3.2.120.3',
+    '1.3.2.120.4',
+    '1.3.2.120.4.1',
+    '1.3.2.121',
+    '1.3.2.121.1',
+    '1.3.2.121.2',
+    '1.3.2.121.3',
+    '1.3.2.121.4',
+    '1.3.2.121.4.1',
+    '1.3.2.122',
+    '1.3.2.122.1',
+    '1.3.2.122.2',
+    '1.3.2.122.3',
+    '1.3.2.122.4',
+    '1.3.2.122.4.1',
+    '1.3.2.123',
+    '1.3.2.123.1',
+    '1.3.2.123.2',
+    '1.3.2.123.3',
+    '1.3.2.123.4',
+    '1.3.2.123.4.1',
+    '1.3.2.124',
+    '1.3.2.124.1',
+    '1.3.2.124.2',
+    '1.3.2.124.3',
+    '1.3.2.124.4',
+    '1.3.2.124.4.1',
+    '1.3.2.129',
+    '1.3.2.129.1',
+    '1.3.2.129.2',
+    '1.3.2.129.3',
+    '1.3.2.129.4',
+    '1.3.2.13',
+    '1.3.2.13.1',
+    '1.3.2.13.2',
+    '1.3.2.13.3',
+    '1.3.2.131',
+    '1.3.2.131.1',
+    '1.3.2.131.1.1',
+    '1.3.2.131.1.2',
+    '1.3.2.132',
+    '1.3.2.132.1',
+    '1.3.2.132.1.1',
+    '1.3.2.132.1.2',
+    '1.3.2.133',
+    '1.3.2.133.1',
+    '1.3.2.133.2',
+    '1.3.2.133.3',
+    '1.3.2.133.4',
+    '1.3.2.134',
+    '1.3.2.134.1',
+    '1.3.2.134.2',
+    '1.3.2.134.3',
+    '1.3.2.134.4',
+    '1.3.2.135',
+    '1.3.2.135.1',
+    '1.3.2.135.2',
+    '1.3.2.135.3',
+    '1.3.2.135.4',
+    '1.3.2.136',
+    '1.3.2.136.1',
+    '1.3.2.136.2',
+    '1.3.2.136.3',
+    '1.3.2.136.4',
+    '1.3.2.137',
+    '1.3.2.137.1',
+    '1.3.2.137.2',
+    '1.3.2.137.3',
+    '1.3.2.137.4',
+    '1.3.2.139',
+    '1.3.2.139.1',
+    '1.3.2.139.2',
+    '1.3.2.139.3',
+    '1.3.2.139.4',
+    '1.3.2.139.5',
+    '1.3.2.14',
+    '1.3.2.14.1',
+    '1.3.2.14.2',
+    '1.3.2.14.3',
+    '1.3.2.140',
+    '1.3.2.140.1',
+    '1.3.2.140.2',
+    '1.3.2.140.3',
+    '1.3.2.140.4',
+    '1.3.2.140.5',
+    '1.3.2.141',
+    '1.3.2.141.1',
+    '1.3.2.141.2',
+    '1.3.2.141.3',
+    '1.3.2.141.4',
+    '1.3.2.141.5',
+    '1.3.2.142',
+    '1.3.2.142.1',
+    '1.3.2.142.2',
+    '1.3.2.142.3',
+    '1.3.2.142.4',
+    '1.3.2.143',
+    '1.3.2.143.1',
+    '1.3.2.143.2',
+    '1.3.2.143.3',
+    '1.3.2.143.4',
+    '1.3.2.15',
+    '1.3.2.15.1',
+    '1.3.2.15.2',
+    '1.3.2.15.3',
+    '1.3.2.16',
+    '1.3.2.16.1',
+    '1.3.2.16.2',
+    '1.3.2.16.3',
+    '1.3.2.16.4',
+    '1.3.2.16.4.1',
+    '1.3.2.17',
+    '1.3.2.17.1',
+    '1.3.2.17.2',
+    '1.3.2.17.3',
+    '1.3.2.17.4',
+    '1.3.2.17.5',
+    '1.3.2.17.6',
+    '1.3.2.17.7',
+    '1.3.2.17.8',
+    '1.3.2.17.9',
+    '1.3.2.18',
+    '1.3.2.18.1',
+    '1.3.2.19',
+    '1.3.2.19.1',
+    '1.3.2.19.2',
+    '1.3.2.19.3',
+    '1.3.2.19.4',
+    '1.3.2.2',
+    '1.3.2.2.1',
+    '1.3.2.2.2',
+    '1.3.2.2.3',
+    '1.3.2.2.4',
+    '1.3.2.2.4.1',
+    '1.3.2.2.4.2',
+    '1.3.2.2.5',
+    '1.3.2.2.6',
+    '1.3.2.20',
+    '1.3.2.20.1',
+    '1.3.2.20.2',
+    '1.3.2.20.3',
+    '1.3.2.20.4',
+    '1.3.2.22',
+    '1.3.2.22.1',
+    '1.3.2.22.2',
+    '1.3.2.23',
+    '1.3.2.23.1',
+    '1.3.2.23.2',
+    '1.3.2.23.3',
+    '1.3.2.23.4',
+    '1.3.2.24',
+    '1.3.2.24.1',
+    '1.3.2.24.2',
+    '1.3.2.24.3',
+    '1.3.2.24.4',
+    '1.3.2.27',
+    '1.3.2.27.1',
+    '1.3.2.27.10',
+    '1.3.2.27.2',
+    '1.3.2.27.3',
+    '1.3.2.27.4',
+    '1.3.2.27.5',
+    '1.3.2.27.6',
+    '1.3.2.27.7',
+    '1.3.2.27.8',
+    '1.3.2.27.9',
+    '1.3.2.3',
+    '1.3.2.3.1',
+    '1.3.2.3.2',
+    '1.3.2.3.3',
+    '1.3.2.3.4',
+    '1.3.2.3.5',
+    '1.3.2.3.6',
+    '1.3.2.3.7',
+    '1.3.2.3.8',
+    '1.3.2.3.9',
+    '1.3.2.30',
+    '1.3.2.30.1',
+    '1.3.2.30.1.1',
+    '1.3.2.30.1.2',
+    '1.3.2.30.1.3',
+    '1.3.2.31',
+    '1.3.2.31.1',
+    '1.3.2.31.1.1',
+    '1.3.2.31.1.2',
+    '1.3.2.36',
+    '1.3.2.36.1',
+    '1.3.2.36.2',
+    '1.3.2.36.3',
+    '1.3.2.36.4',
+    '1.3.2.37',
+    '1.3.2.37.1',
+    '1.3.2.37.10',
+    '1.3.2.37.2',
+    '1.3.2.37.3',
+    '1.3.2.37.4',
+    '1.3.2.37.5',
+    '1.3.2.37.6',
+    '1.3.2.37.7',
+    '1.3.2.37.8',
+    '1.3.2.37.9',
+    '1.3.2.38',
+    '1.3.2.38.1',
+    '1.3.2.38.1.1',
+    '1.3.2.38.2',
+    '1.3.2.38.3',
+    '1.3.2.39',
+    '1.3.2.39.1',
+    '1.3.2.39.2',
+    '1.3.2.39.3',
+    '1.3.2.39.4',
+    '1.3.2.4',
+    '1.3.2.4.1',
+    '1.3.2.4.2',
+    '1.3.2.4.3',
+    '1.3.2.4.4',
+    '1.3.2.4.4.1',
+    '1.3.2.4.4.2',
+    '1.3.2.4.5',
+    '1.3.2.40',
+    '1.3.2.40.1',
+    '1.3.2.40.2',
+    '1.3.2.40.3',
+    '1.3.2.40.4',
+    '1.3.2.41',
+    '1.3.2.41.1',
+    '1.3.2.41.2',
+    '1.3.2.41.3',
+    '1.3.2.41.4',
+    '1.3.2.43',
+    '1.3.2.43.1',
+    '1.3.2.43.1.1',
+    '1.3.2.43.1.2',
+    '1.3.2.43.1.3',
+    '1.3.2.44',
+    '1.3.2.44.1',
+    '1.3.2.44.1.1',
+    '1.3.2.44.1.2',
+    '1.3.2.44.1.3',
+    '1.3.2.5',
+    '1.3.2.5.1',
+    '1.3.2.5.2',
+    '1.3.2.5.3',
+    '1.3.2.5.4',
+    '1.3.2.5.4.1',
+    '1.3.2.5.4.2',
+    '1.3.2.5.5',
+    '1.3.2.54',
+    '1.3.2.54.1',
+    '1.3.2.54.1.1',
+    '1.3.2.54.1.2',
+    '1.3.2.57',
+    '1.3.2.57.1',
+    '1.3.2.57.2',
+    '1.3.2.57.3',
+    '1.3.2.57.4',
+    '1.3.2.57.5',
+    '1.3.2.57.6',
+    '1.3.2.58',
+    '1.3.2.58.1',
+    '1.3.2.58.2',
+    '1.3.2.58.3',
+    '1.3.2.58.4',
+    '1.3.2.59',
+    '1.3.2.59.1',
+    '1.3.2.59.2',
+    '1.3.2.59.3',
+    '1.3.2.59.4',
+    '1.3.2.6',
+    '1.3.2.6.1',
+    '1.3.2.6.10',
+    '1.3.2.6.2',
+    '1.3.2.6.3',
+    '1.3.2.6.4',
+    '1.3.2.6.5',
+    '1.3.2.6.6',
+    '1.3.2.6.7',
+    '1.3.2.6.8',
+    '1.3.2.6.9',
+    '1.3.2.63',
+    '1.3.2.63.1',
+    '1.3.2.63.1.1',
+    '1.3.2.63.1.2',
+    '1.3.2.64',
+    '1.3.2.64.1',
+    '1.3.2.64.2',
+    '1.3.2.64.3',
+    '1.3.2.64.4',
+    '1.3.2.65',
+    '1.3.2.65.1',
+    '1.3.2.65.2',
+    '1.3.2.65.3',
+    '1.3.2.65.4',
+    '1.3.2.69',
+    '1.3.2.69.1',
+    '1.3.2.69.10',
+    '1.3.2.69.11',
+    '1.3.2.69.2',
+    '1.3.2.69.3',
+    '1.3.2.69.4',
+    '1.3.2.69.5',
+    '1.3.2.69.6',
+    '1.3.2.69.7',
+    '1.3.2.69.8',
+    '1.3.2.69.9',
+    '1.3.2.7',
+    '1.3.2.7.1',
+    '1.3.2.7.10',
+    '1.3.2.7.2',
+    '1.3.2.7.3',
+    '1.3.2.7.4',
+    '1.3.2.7.5',
+    '1.3.2.7.6',
+    '1.3.2.7.7',
+    '1.3.2.7.8',
+    '1.3.2.7.9',
+    '1.3.2.70',
+    '1.3.2.70.1',
+    '1.3.2.70.10',
+    '1.3.2.70.11',
+    '1.3.2.70.2',
+    '1.3.2.70.3',
+    '1.3.2.70.4',
+    '1.3.2.70.5',
+    '1.3.2.70.6',
+    '1.3.2.70.7',
+    '1.3.2.70.8',
+    '1.3.2.70.9',
+    '1.3.2.71',
+    '1.3.2.71.1',
+    '1.3.2.71.1.1',
+    '1.3.2.71.1.2',
+    '1.3.2.71.1.3',
+    '1.3.2.76',
+    '1.3.2.76.1',
+    '1.3.2.76.1.1',
+    '1.3.2.76.1.2',
+    '1.3.2.76.1.3',
+    '1.3.2.8',
+    '1.3.2.8.1',
+    '1.3.2.8.2',
+    '1.3.2.8.3',
+    '1.3.2.8.4',
+    '1.3.2.8.5',
+    '1.3.2.8.6',
+    '1.3.2.8.7',
+    '1.3.2.8.8',
+    '1.3.2.8.9',
+    '1.3.2.83',
+    '1.3.2.83.1',
+    '1.3.2.83.2',
+    '1.3.2.83.3',
+    '1.3.2.83.4',
+    '1.3.2.86',
+    '1.3.2.86.1',
+    '1.3.2.86.2',
+    '1.3.2.86.3',
+    '1.3.2.86.4',
+    '1.3.2.87',
+    '1.3.2.87.1',
+    '1.3.2.87.2',
+    '1.3.2.87.3',
+    '1.3.2.87.4',
+    '1.3.2.87.4.1',
+    '1.3.2.87.4.2',
+    '1.3.2.87.5',
+    '1.3.2.88',
+    '1.3.2.88.1',
+    '1.3.2.88.2',
+    '1.3.2.88.3',
+    '1.3.2.88.4',
+    '1.3.2.88.5',
+    '1.3.2.88.6',
+    '1.3.2.89',
+    '1.3.2.89.1',
+    '1.3.2.89.2',
+    '1.3.2.89.3',
+    '1.3.2.89.4',
+    '1.3.2.89.5',
+    '1.3.2.89.6',
+    '1.3.2.9',
+    '1.3.2.9.1',
+    '1.3.2.9.2',
+    '1.3.2.9.3',
+    '1.3.2.9.4',
+    '1.3.2.9.5',
+    '1.3.2.9.6',
+    '1.3.2.9.7',
+    '1.3.2.9.8',
+    '1.3.2.90',
+    '1.3.2.90.1',
+    '1.3.2.90.2',
+    '1.3.2.90.3',
+    '1.3.2.90.4',
+    '1.3.2.90.5',
+    '1.3.2.90.6',
+    '1.3.2.92',
+    '1.3.2.92.1',
+    '1.3.2.92.1.1',
+    '1.3.2.92.1.2',
+    '1.3.2.92.1.3',
+    '1.3.2.93',
+    '1.3.2.93.1',
+    '1.3.2.93.10',
+    '1.3.2.93.2',
+    '1.3.2.93.3',
+    '1.3.2.93.4',
+    '1.3.2.93.5',
+    '1.3.2.93.6',
+    '1.3.2.93.7',
+    '1.3.2.93.8',
+    '1.3.2.93.9',
+    '1.3.2.94',
+    '1.3.2.94.1',
+    '1.3.2.94.2',
+    '1.3.2.94.3',
+    '1.3.2.94.4',
+    '1.3.2.96',
+    '1.3.2.96.1',
+    '1.3.2.96.2',
+    '1.3.2.96.3',
+    '1.3.2.96.4',
+    '1.3.2.97',
+    '1.3.2.97.1',
+    '1.3.2.97.2',
+    '1.3.2.97.3',
+    '1.3.2.97.4',
+    '1.3.2.97.5',
+    '1.3.2.97.6',
+    '1.3.2.97.7',
+    '1.3.2.98',
+    '1.3.2.98.1',
+    '1.3.2.98.2',
+    '1.3.2.98.3',
+    '1.3.2.98.4',
+    '1.3.2.98.5',
+    '1.3.2.98.6',
+    '1.3.2.98.7',
+    '1.3.2.98.8',
+    '1.3.2.99',
+    '1.3.2.99.1',
+    '1.3.2.99.10',
+    '1.3.2.99.2',
+    '1.3.2.99.3',
+    '1.3.2.99.4',
+    '1.3.2.99.5',
+    '1.3.2.99.6',
+    '1.3.2.99.7',
+    '1.3.2.99.8',
+    '1.3.2.99.9',
+    '1.3.3',
+    '1.3.3.1',
+    '1.3.3.1.2',
+    '1.3.3.1.2.1',
+    '1.3.3.1.3',
+    '1.3.3.1.3.1',
+    '1.3.3.1.3.10',
+    '1.3.3.1.3.11',
+    '1.3.3.1.3.12',
+    '1.3.3.1.3.13',
+    '1.3.3.1.3.14',
+    '1.3.3.1.3.15',
+    '1.3.3.1.3.16',
+    '1.3.3.1.3.17',
+    '1.3.3.1.3.18',
+    '1.3.3.1.3.19',
+    '1.3.3.1.3.2',
+    '1.3.3.1.3.20',
+    '1.3.3.1.3.21',
+    '1.3.3.1.3.22',
+    '1.3.3.1.3.24',
+    '1.3.3.1.3.25',
+    '1.3.3.1.3.26',
+    '1.3.3.1.3.27',
+    '1.3.3.1.3.28',
+    '1.3.3.1.3.3',
+    '1.3.3.1.3.30',
+    '1.3.3.1.3.32',
+    '1.3.3.1.3.33',
+    '1.3.3.1.3.34',
+    '1.3.3.1.3.35',
+    '1.3.3.1.3.36',
+    '1.3.3.1.3.37',
+    '1.3.3.1.3.38',
+    '1.3.3.1.3.39',
+    '1.3.3.1.3.4',
+    '1.3.3.1.3.40',
+    '1.3.3.1.3.41',
+    '1.3.3.1.3.42',
+    '1.3.3.1.3.43',
+    '1.3.3.1.3.44',
+    '1.3.3.1.3.5',
+    '1.3.3.1.3.6',
+    '1.3.3.1.3.7',
+    '1.3.3.1.3.8',
+    '1.3.3.1.3.9',
+    '1.3.3.10',
+    '1.3.3.10.2',
+    '1.3.3.12',
+    '1.3.3.12.1',
+    '1.3.3.12.1.1',
+    '1.3.3.12.1.10',
+    '1.3.3.12.1.100',
+    '1.3.3.12.1.101',
+    '1.3.3.12.1.102',
+    '1.3.3.12.1.103',
+    '1.3.3.12.1.104',
+    '1.3.3.12.1.105',
+    '1.3.3.12.1.106',
+    '1.3.3.12.1.108',
+    '1.3.3.12.1.109',
+    '1.3.3.12.1.11',
+    '1.3.3.12.1.111',
+    '1.3.3.12.1.112',
+    '1.3.3.12.1.113',
+    '1.3.3.12.1.114',
+    '1.3.3.12.1.115',
+    '1.3.3.12.1.116',
+    '1.3.3.12.1.117',
+    '1.3.3.12.1.118',
+    '1.3.3.12.1.119',
+    '1.3.3.12.1.12',
+    '1.3.3.12.1.120',
+    '1.3.3.12.1.121',
+    '1.3.3.12.1.122',
+    '1.3.3.12.1.123',
+    '1.3.3.12.1.124',
+    '1.3.3.12.1.125',
+    '1.3.3.12.1.126',
+    '1.3.3.12.1.127',
+    '1.3.3.12.1.128',
+    '1.3.3.12.1.129',
+    '1.3.3.12.1.13',
+    '1.3.3.12.1.130',
+    '1.3.3.12.1.131',
+    '1.3.3.12.1.132',
+    '1.3.3.12.1.133',
+    '1.3.3.12.1.134',
+    '1.3.3.12.1.135',
+    '1.3.3.12.1.136',
+    '1.3.3.12.1.137',
+    '1.3.3.12.1.138',
+    '1.3.3.12.1.139',
+    '1.3.3.12.1.14',
+    '1.3.3.12.1.140',
+    '1.3.3.12.1.141',
+    '1.3.3.12.1.142',
+    '1.3.3.12.1.143',
+    '1.3.3.12.1.144',
+    '1.3.3.12.1.145',
+    '1.3.3.12.1.146',
+    '1.3.3.12.1.147',
+    '1.3.3.12.1.148',
+    '1.3.3.12.1.149',
+    '1.3.3.12.1.15',
+    '1.3.3.12.1.150',
+    '1.3.3.12.1.151',
+    '1.3.3.12.1.152',
+    '1.3.3.12.1.153',
+    '1.3.3.12.1.154',
+    '1.3.3.12.1.155',
+    '1.3.3.12.1.156',
+    '1.3.3.12.1.157',
+    '1.3.3.12.1.158',
+    '1.3.3.12.1.159',
+    '1.3.3.12.1.16',
+    '1.3.3.12.1.160',
+    '1.3.3.12.1.161',
+    '1.3.3.12.1.162',
+    '1.3.3.12.1.163',
+    '1.3.3.12.1.164',
+    '1.3.3.12.1.165',
+    '1.3.3.12.1.166',
+    '1.3.3.12.1.167',
+    '1.3.3.12.1.168',
+    '1.3.3.12.1.169',
+    '1.3.3.12.1.17',
+    '1.3.3.12.1.170',
+    '1.3.3.12.1.171',
+    '1.3.3.12.1.172',
+    '1.3.3.12.1.173',
+    '1.3.3.12.1.174',
+    '1.3.3.12.1.175',
+    '1.3.3.12.1.176',
+    '1.3.3.12.1.177',
+    '1.3.3.12.1.178',
+    '1.3.3.12.1.179',
+    '1.3.3.12.1.18',
+    '1.3.3.12.1.180',
+    '1.3.3.12.1.181',
+    '1.3.3.12.1.182',
+    '1.3.3.12.1.183',
+    '1.3.3.12.1.184',
+    '1.3.3.12.1.185',
+    '1.3.3.12.1.186',
+    '1.3.3.12.1.187',
+    '1.3.3.12.1.188',
+    '1.3.3.12.1.189',
+    '1.3.3.12.1.19',
+    '1.3.3.12.1.190',
+    '1.3.3.12.1.191',
+    '1.3.3.12.1.192',
+    '1.3.3.12.1.193',
+    '1.3.3.12.1.194',
+    '1.3.3.12.1.195',
+    '1.3.3.12.1.196',
+    '1.3.3.12.1.197',
+    '1.3.3.12.1.198',
+    '1.3.3.12.1.199',
+    '1.3.3.12.1.2',
+    '1.3.3.12.1.20',
+    '1.3.3.12.1.200',
+    '1.3.3.12.1.201',
+    '1.3.3.12.1.202',
+    '1.3.3.12.1.203',
+    '1.3.3.12.1.204',
+    '1.3.3.12.1.205',
+    '1.3.3.12.1.206',
+    '1.3.3.12.1.207',
+    '1.3.3.12.1.208',
+    '1.3.3.12.1.209',
+    '1.3.3.12.1.21',
+    '1.3.3.12.1.210',
+    '1.3.3.12.1.211',
+    '1.3.3.12.1.212',
+    '1.3.3.12.1.213',
+    '1.3.3.12.1.214',
+    '1.3.3.12.1.215',
+    '1.3.3.12.1.216',
+    '1.3.3.12.1.217',
+    '1.3.3.12.1.218',
+    '1.3.3.12.1.219',
+    '1.3.3.12.1.22',
+    '1.3.3.12.1.220',
+    '1.3.3.12.1.221',
+    '1.3.3.12.1.222',
+    '1.3.3.12.1.223',
+    '1.3.3.12.1.224',
+    '1.3.3.12.1.225',
+    '1.3.3.12.1.226',
+    '1.3.3.12.1.227',
+    '1.3.3.12.1.228',
+    '1.3.3.12.1.229',
+    '1.3.3.12.1.23',
+    '1.3.3.12.1.230',
+    '1.3.3.12.1.231',
+    '1.3.3.12.1.232',
+    '1.3.3.12.1.233',
+    '1.3.3.12.1.234',
+    '1.3.3.12.1.235',
+    '1.3.3.12.1.236',
+    '1.3.3.12.1.237',
+    '1.3.3.12.1.238',
+    '1.3.3.12.1.239',
+    '1.3.3.12.1.24',
+    '1.3.3.12.1.240',
+    '1.3.3.12.1.241',
+    '1.3.3.12.1.242',
+    '1.3.3.12.1.243',
+    '1.3.3.12.1.244',
+    '1.3.3.12.1.245',
+    '1.3.3.12.1.246',
+    '1.3.3.12.1.247',
+    '1.3.3.12.1.248',
+    '1.3.3.12.1.249',
+    '1.3.3.12.1.25',
+    '1.3.3.12.1.250',
+    '1.3.3.12.1.251',
+    '1.3.3.12.1.252',
+    '1.3.3.12.1.253',
+    '1.3.3.12.1.254',
+    '1.3.3.12.1.255',
+    '1.3.3.12.1.256',
+    '1.3.3.12.1.257',
+    '1.3.3.12.1.258',
+    '1.3.3.12.1.259',
+    '1.3.3.12.1.26',
+    '1.3.3.12.1.260',
+    '1.3.3.12.1.261',
+    '1.3.3.12.1.262',
+    '1.3.3.12.1.263',
+    '1.3.3.12.1.264',
+    '1.3.3.12.1.265',
+    '1.3.3.12.1.266',
+    '1.3.3.12.1.267',
+    '1.3.3.12.1.268',
+    '1.3.3.12.1.269',
+    '1.3.3.12.1.27',
+    '1.3.3.12.1.270',
+    '1.3.3.12.1.271',
+    '1.3.3.12.1.272',
+    '1.3.3.12.1.273',
+    '1.3.3.12.1.274',
+    '1.3.3.12.1.275',
+    '1.3.3.12.1.276',
+    '1.3.3.12.1.277',
+    '1.3.3.12.1.278',
+    '1.3.3.12.1.279',
+    '1.3.3.12.1.28',
+    '1.3.3.12.1.280',
+    '1.3.3.12.1.281',
+    '1.3.3.12.1.282',
+    '1.3.3.12.1.283',
+    '1.3.3.12.1.284',
+    '1.3.3.12.1.285',
+    '1.3.3.12.1.286',
+    '1.3.3.12.1.287',
+    '1.3.3.12.1.288',
+    '1.3.3.12.1.289',
+    '1.3.3.12.1.29',
+    '1.3.3.12.1.290',
+    '1.3.3.12.1.291',
+    '1.3.3.12.1.292',
+    '1.3.3.12.1.293',
+    '1.3.3.12.1.294',
+    '1.3.3.12.1.295',
+    '1.3.3.12.1.296',
+    '1.3.3.12.1.297',
+    '1.3.3.12.1.298',
+    '1.3.3.12.1.299',
+    '1.3.3.12.1.3',
+    '1.3.3.12.1.30',
+    '1.3.3.12.1.300',
+    '1.3.3.12.1.301',
+    '1.3.3.12.1.302',
+    '1.3.3.12.1.303',
+    '1.3.3.12.1.304',
+    '1.3.3.12.1.305',
+    '1.3.3.12.1.306',
+    '1.3.3.12.1.307',
+    '1.3.3.12.1.308',
+    '1.3.3.12.1.309',
+    '1.3.3.12.1.31',
+    '1.3.3.12.1.310',
+    '1.3.3.12.1.311',
+    '1.3.3.12.1.312',
+    '1.3.3.12.1.313',
+    '1.3.3.12.1.314',
+    '1.3.3.12.1.315',
+    '1.3.3.12.1.316',
+    '1.3.3.12.1.317',
+    '1.3.3.12.1.318',
+    '1.3.3.12.1.319',
+    '1.3.3.12.1.32',
+    '1.3.3.12.1.320',
+    '1.3.3.12.1.321',
+    '1.3.3.12.1.322',
+    '1.3.3.12.1.323',
+    '1.3.3.12.1.324',
+    '1.3.3.12.1.325',
+    '1.3.3.12.1.326',
+    '1.3.3.12.1.327',
+    '1.3.3.12.1.328',
+    '1.3.3.12.1.329',
+    '1.3.3.12.1.33',
+    '1.3.3.12.1.330',
+    '1.3.3.12.1.331',
+    '1.3.3.12.1.332',
+    '1.3.3.12.1.333',
+    '1.3.3.12.1.334',
+    '1.3.3.12.1.335',
+    '1.3.3.12.1.336',
+    '1.3.3.12.1.337',
+    '1.3.3.12.1.338',
+    '1.3.3.12.1.339',
+    '1.3.3.12.1.34',
+    '1.3.3.12.1.341',
+    '1.3.3.12.1.342',
+    '1.3.3.12.1.343',
+    '1.3.3.12.1.344',
+    '1.3.3.12.1.345',
+    '1.3.3.12.1.346',
+    '1.3.3.12.1.347',
+    '1.3.3.12.1.348',
+    '1.3.3.12.1.349',
+    '1.3.3.12.1.35',
+    '1.3.3.12.1.350',
+    '1.3.3.12.1.351',
+    '1.3.3.12.1.352',
+    '1.3.3.12.1.353',
+    '1.3.3.12.1.354',
+    '1.3.3.12.1.355',
+    '1.3.3.12.1.356',
+    '1.3.3.12.1.357',
+    '1.3.3.12.1.358',
+    '1.3.3.12.1.359',
+    '1.3.3.12.1.36',
+    '1.3.3.12.1.360',
+    '1.3.3.12.1.361',
+    '1.3.3.12.1.362',
+    '1.3.3.12.1.363',
+    '1.3.3.12.1.364',
+    '1.3.3.12.1.365',
+    '1.3.3.12.1.366',
+    '1.3.3.12.1.367',
+    '1.3.3.12.1.368',
+    '1.3.3.12.1.369',
+    '1.3.3.12.1.37',
+    '1.3.3.12.1.370',
+    '1.3.3.12.1.371',
+    '1.3.3.12.1.372',
+    '1.3.3.12.1.373',
+    '1.3.3.12.1.374',
+    '1.3.3.12.1.375',
+    '1.3.3.12.1.376',
+    '1.3.3.12.1.377',
+    '1.3.3.12.1.378',
+    '1.3.3.12.1.379',
+    '1.3.3.12.1.38',
+    '1.3.3.12.1.380',
+    '1.3.3.12.1.381',
+    '1.3.3.12.1.382',
+    '1.3.3.12.1.383',
+    '1.3.3.12.1.384',
+    '1.3.3.12.1.385',
+    '1.3.3.12.1.386',
+    '1.3.3.12.1.387',
+    '1.3.3.12.1.388',
+    '1.3.3.12.1.389',
+    '1.3.3.12.1.39',
+    '1.3.3.12.1.390',
+    '1.3.3.12.1.391',
+    '1.3.3.12.1.392',
+    '1.3.3.12.1.393',
+    '1.3.3.12.1.394',
+    '1.3.3.12.1.395',
+    '1.3.3.12.1.396',
+    '1.3.3.12.1.397',
+    '1.3.3.12.1.398',
+    '1.3.3.12.1.399',
+    '1.3.3.12.1.4',
+    '1.3.3.12.1.40',
+    '1.3.3.12.1.400',
+    '1.3.3.12.1.401',
+    '1.3.3.12.1.402',
+    '1.3.3.12.1.403',
+    '1.3.3.12.1.404',
+    '1.3.3.12.1.405',
+    '1.3.3.12.1.406',
+    '1.3.3.12.1.407',
+    '1.3.3.12.1.408',
+    '1.3.3.12.1.409',
+    '1.3.3.12.1.41',
+    '1.3.3.12.1.410',
+    '1.3.3.12.1.411',
+    '1.3.3.12.1.412',
+    '1.3.3.12.1.413',
+    '1.3.3.12.1.414',
+    '1.3.3.12.1.415',
+    '1.3.3.12.1.416',
+    '1.3.3.12.1.417',
+    '1.3.3.12.1.418',
+    '1.3.3.12.1.419',
+    '1.3.3.12.1.42',
+    '1.3.3.12.1.420',
+    '1.3.3.12.1.421',
+    '1.3.3.12.1.422',
+    '1.3.3.12.1.423',
+    '1.3.3.12.1.424',
+    '1.3.3.12.1.425',
+    '1.3.3.12.1.426',
+    '1.3.3.12.1.43',
+    '1.3.3.12.1.431',
+    '1.3.3.12.1.432',
+    '1.3.3.12.1.433',
+    '1.3.3.12.1.434',
+    '1.3.3.12.1.435',
+    '1.3.3.12.1.436',
+    '1.3.3.12.1.437',
+    '1.3.3.12.1.438',
+    '1.3.3.12.1.439',
+    '1.3.3.12.1.44',
+    '1.3.3.12.1.440',
+    '1.3.3.12.1.441',
+    '1.3.3.12.1.442',
+    '1.3.3.12.1.443',
+    '1.3.3.12.1.444',
+    '1.3.3.12.1.445',
+    '1.3.3.12.1.446',
+    '1.3.3.12.1.447',
+    '1.3.3.12.1.448',
+    '1.3.3.12.1.449',
+    '1.3.3.12.1.45',
+    '1.3.3.12.1.450',
+    '1.3.3.12.1.451',
+    '1.3.3.12.1.452',
+    '1.3.3.12.1.453',
+    '1.3.3.12.1.454',
+    '1.3.3.12.1.455',
+    '1.3.3.12.1.456',
+    '1.3.3.12.1.457',
+    '1.3.3.12.1.458',
+    '1.3.3.12.1.459',
+    '1.3.3.12.1.46',
+    '1.3.3.12.1.460',
+    '1.3.3.12.1.461',
+    '1.3.3.12.1.462',
+    '1.3.3.12.1.463',
+    '1.3.3.12.1.48',
+    '1.3.3.12.1.49',
+    '1.3.3.12.1.5',
+    '1.3.3.12.1.50',
+    '1.3.3.12.1.51',
+    '1.3.3.12.1.52',
+    '1.3.3.12.1.53',
+    '1.3.3.12.1.54',
+    '1.3.3.12.1.55',
+    '1.3.3.12.1.56',
+    '1.3.3.12.1.57',
+    '1.3.3.12.1.58',
+    '1.3.3.12.1.59',
+    '1.3.3.12.1.6',
+    '1.3.3.12.1.60',
+    '1.3.3.12.1.61',
+    '1.3.3.12.1.62',
+    '1.3.3.12.1.63',
+    '1.3.3.12.1.64',
+    '1.3.3.12.1.65',
+    '1.3.3.12.1.66',
+    '1.3.3.12.1.67',
+    '1.3.3.12.1.68',
+    '1.3.3.12.1.69',
+    '1.3.3.12.1.7',
+    '1.3.3.12.1.70',
+    '1.3.3.12.1.71',
+    '1.3.3.12.1.72',
+    '1.3.3.12.1.73',
+    '1.3.3.12.1.74',
+    '1.3.3.12.1.75',
+    '1.3.3.12.1.76',
+    '1.3.3.12.1.77',
+    '1.3.3.12.1.78',
+    '1.3.3.12.1.79',
+    '1.3.3.12.1.8',
+    '1.3.3.12.1.80',
+    '1.3.3.12.1.81',
+    '1.3.3.12.1.82',
+    '1.3.3.12.1.83',
+    '1.3.3.12.1.84',
+    '1.3.3.12.1.85',
+    '1.3.3.12.1.86',
+    '1.3.3.12.1.87',
+    '1.3.3.12.1.88',
+    '1.3.3.12.1.89',
+    '1.3.3.12.1.9',
+    '1.3.3.12.1.90',
+    '1.3.3.12.1.91',
+    '1.3.3.12.1.92',
+    '1.3.3.12.1.93',
+    '1.3.3.12.1.94',
+    '1.3.3.12.1.95',
+    '1.3.3.12.1.96',
+    '1.3.3.12.1.97',
+    '1.3.3.12.1.98',
+    '1.3.3.12.1.99',
+    '1.3.3.12.2',
+    '1.3.3.2',
+    '1.3.3.2.1',
+    '1.3.3.2.1.1',
+    '1.3.3.2.2',
+    '1.3.3.2.2.1',
+    '1.3.3.2.2.10',
+    '1.3.3.2.2.11',
+    '1.3.3.2.2.12',
+    '1.3.3.2.2.13',
+    '1.3.3.2.2.14',
+    '1.3.3.2.2.15',
+    '1.3.3.2.2.16',
+    '1.3.3.2.2.17',
+    '1.3.3.2.2.18',
+    '1.3.3.2.2.19',
+    '1.3.3.2.2.2',
+    '1.3.3.2.2.20',
+    '1.3.3.2.2.21',
+    '1.3.3.2.2.22',
+    '1.3.3.2.2.24',
+    '1.3.3.2.2.25',
+    '1.3.3.2.2.26',
+    '1.3.3.2.2.27',
+    '1.3.3.2.2.28',
+    '1.3.3.2.2.3',
+    '1.3.3.2.2.30',
+    '1.3.3.2.2.31',
+    '1.3.3.2.2.32',
+    '1.3.3.2.2.34',
+    '1.3.3.2.2.35',
+    '1.3.3.2.2.36',
+    '1.3.3.2.2.37',
+    '1.3.3.2.2.38',
+    '1.3.3.2.2.39',
+    '1.3.3.2.2.4',
+    '1.3.3.2.2.40',
+    '1.3.3.2.2.41',
+    '1.3.3.2.2.42',
+    '1.3.3.2.2.43',
+    '1.3.3.2.2.44',
+    '1.3.3.2.2.45',
+    '1.3.3.2.2.46',
+    '1.3.3.2.2.47',
+    '1.3.3.2.2.5',
+    '1.3.3.2.2.6',
+    '1.3.3.2.2.7',
+    '1.3.3.2.2.8',
+    '1.3.3.2.2.9',
+    '1.3.3.3',
+    '1.3.3.3.2',
+    '1.3.3.3.2.1',
+    '1.3.3.3.2.2',
+    '1.3.3.3.3',
+    '1.3.3.3.3.1',
+    '1.3.3.3.3.2',
+    '1.3.3.3.4',
+    '1.3.3.3.4.1',
+    '1.3.3.3.4.2',
+    '1.3.3.3.4.3',
+    '1.3.3.3.5',
+    '1.3.3.3.5.1',
+    '1.3.3.3.5.10',
+    '1.3.3.3.5.11',
+    '1.3.3.3.5.12',
+    '1.3.3.3.5.13',
+    '1.3.3.3.5.14',
+    '1.3.3.3.5.15',
+    '1.3.3.3.5.16',
+    '1.3.3.3.5.17',
+    '1.3.3.3.5.18',
+    '1.3.3.3.5.19',
+    '1.3.3.3.5.2',
+    '1.3.3.3.5.20',
+    '1.3.3.3.5.23',
+    '1.3.3.3.5.24',
+    '1.3.3.3.5.25',
+    '1.3.3.3.5.26',
+    '1.3.3.3.5.27',
+    '1.3.3.3.5.28',
+    '1.3.3.3.5.29',
+    '1.3.3.3.5.3',
+    '1.3.3.3.5.30',
+    '1.3.3.3.5.31',
+    '1.3.3.3.5.32',
+    '1.3.3.3.5.33',
+    '1.3.3.3.5.4',
+    '1.3.3.3.5.5',
+    '1.3.3.3.5.6',
+    '1.3.3.3.5.7',
+    '1.3.3.3.5.8',
+    '1.3.3.3.5.9',
+    '1.3.3.3.6',
+    '1.3.3.3.6.1',
+    '1.3.3.3.6.10',
+    '1.3.3.3.6.11',
+    '1.3.3.3.6.12',
+    '1.3.3.3.6.2',
+    '1.3.3.3.6.3',
+    '1.3.3.3.6.4',
+    '1.3.3.3.6.5',
+    '1.3.3.3.6.6',
+    '1.3.3.3.6.7',
+    '1.3.3.3.6.9',
+    '1.3.3.4',
+    '1.3.3.4.1',
+    '1.3.3.4.1.1',
+    '1.3.3.4.1.10',
+    '1.3.3.4.1.11',
+    '1.3.3.4.1.12',
+    '1.3.3.4.1.13',
+    '1.3.3.4.1.14',
+    '1.3.3.4.1.15',
+    '1.3.3.4.1.16',
+    '1.3.3.4.1.17',
+    '1.3.3.4.1.18',
+    '1.3.3.4.1.19',
+    '1.3.3.4.1.2',
+    '1.3.3.4.1.20',
+    '1.3.3.4.1.21',
+    '1.3.3.4.1.22',
+    '1.3.3.4.1.23',
+    '1.3.3.4.1.24',
+    '1.3.3.4.1.25',
+    '1.3.3.4.1.26',
+    '1.3.3.4.1.28',
+    '1.3.3.4.1.29',
+    '1.3.3.4.1.3',
+    '1.3.3.4.1.30',
+    '1.3.3.4.1.31',
+    '1.3.3.4.1.32',
+    '1.3.3.4.1.34',
+    '1.3.3.4.1.36',
+    '1.3.3.4.1.37',
+    '1.3.3.4.1.38',
+    '1.3.3.4.1.39',
+    '1.3.3.4.1.4',
+    '1.3.3.4.1.40',
+    '1.3.3.4.1.41',
+    '1.3.3.4.1.42',
+    '1.3.3.4.1.43',
+    '1.3.3.4.1.44',
+    '1.3.3.4.1.45',
+    '1.3.3.4.1.46',
+    '1.3.3.4.1.47',
+    '1.3.3.4.1.48',
+    '1.3.3.4.1.5',
+    '1.3.3.4.1.6',
+    '1.3.3.4.1.7',
+    '1.3.3.4.1.8',
+    '1.3.3.4.1.9',
+    '1.3.3.5',
+    '1.3.3.5.1',
+    '1.3.3.5.1.1',
+    '1.3.3.5.1.10',
+    '1.3.3.5.1.11',
+    '1.3.3.5.1.12',
+    '1.3.3.5.1.14',
+    '1.3.3.5.1.16',
+    '1.3.3.5.1.17',
+    '1.3.3.5.1.18',
+    '1.3.3.5.1.19',
+    '1.3.3.5.1.2',
+    '1.3.3.5.1.20',
+    '1.3.3.5.1.21',
+    '1.3.3.5.1.22',
+    '1.3.3.5.1.23',
+    '1.3.3.5.1.24',
+    '1.3.3.5.1.25',
+    '1.3.3.5.1.26',
+    '1.3.3.5.1.28',
+    '1.3.3.5.1.29',
+    '1.3.3.5.1.3',
+    '1.3.3.5.1.30',
+    '1.3.3.5.1.31',
+    '1.3.3.5.1.32',
+    '1.3.3.5.1.34',
+    '1.3.3.5.1.36',
+    '1.3.3.5.1.37',
+    '1.3.3.5.1.38',
+    '1.3.3.5.1.39',
+    '1.3.3.5.1.4',
+    '1.3.3.5.1.40',
+    '1.3.3.5.1.41',
+    '1.3.3.5.1.42',
+    '1.3.3.5.1.43',
+    '1.3.3.5.1.44',
+    '1.3.3.5.1.45',
+    '1.3.3.5.1.46',
+    '1.3.3.5.1.47',
+    '1.3.3.5.1.48',
+    '1.3.3.5.1.5',
+    '1.3.3.5.1.6',
+    '1.3.3.5.1.7',
+    '1.3.3.5.1.8',
+    '1.3.3.5.1.9',
+    '1.3.3.6',
+    '1.3.3.6.1',
+    '1.3.3.6.2',
+    '1.3.3.6.3',
+    '1.3.3.6.3.1',
+    '1.3.3.6.3.2',
+    '1.3.3.6.3.3',
+    '1.3.3.6.3.4',
+    '1.3.3.6.3.5',
+    '1.3.3.6.3.6',
+    '1.3.3.6.3.7',
+    '1.3.3.6.3.8',
+    '1.3.3.6.4',
+    '1.3.3.6.4.1',
+    '1.3.3.6.4.2',
+    '1.3.3.6.4.3',
+    '1.3.3.6.4.4',
+    '1.3.3.6.4.5',
+    '1.3.3.6.4.6',
+    '1.3.3.6.4.7',
+    '1.3.3.7',
+    '1.3.3.7.1',
+    '1.3.3.7.2',
+    '1.3.3.7.2.1',
+    '1.3.3.7.2.3',
+    '1.3.3.7.2.4',
+    '1.3.3.7.2.5',
+    '1.3.3.7.2.6',
+    '1.3.3.7.2.7',
+    '1.3.3.7.2.8',
+    '1.3.3.7.3',
+    '1.3.3.7.3.1',
+    '1.3.3.7.3.2',
+    '1.3.3.7.3.3',
+    '1.3.3.7.3.4',
+    '1.3.3.7.3.5',
+    '1.3.3.7.3.6',
+    '1.3.3.7.3.7',
+    '1.3.3.7.3.8',
+    '1.3.3.7.4',
+    '1.3.3.7.4.1',
+    '1.3.3.7.4.2',
+    '1.3.3.7.4.3',
+    '1.3.3.7.4.4',
+    '1.3.3.7.4.5',
+    '1.3.3.7.4.6',
+    '1.3.3.7.4.7',
+    '1.3.3.8',
+    '1.3.3.8.2',
+    '1.3.3.8.2.1',
+    '1.3.3.8.2.2',
+    '1.3.3.8.3',
+    '1.3.3.8.3.1',
+    '1.3.3.8.3.2',
+    '1.3.3.8.4',
+    '1.3.3.8.5',
+    '1.3.3.8.5.1',
+    '1.3.3.8.5.10',
+    '1.3.3.8.5.11',
+    '1.3.3.8.5.12',
+    '1.3.3.8.5.13',
+    '1.3.3.8.5.14',
+    '1.3.3.8.5.15',
+    '1.3.3.8.5.16',
+    '1.3.3.8.5.17',
+    '1.3.3.8.5.18',
+    '1.3.3.8.5.19',
+    '1.3.3.8.5.2',
+    '1.3.3.8.5.20',
+    '1.3.3.8.5.23',
+    '1.3.3.8.5.24',
+    '1.3.3.8.5.25',
+    '1.3.3.8.5.26',
+    '1.3.3.8.5.27',
+    '1.3.3.8.5.28',
+    '1.3.3.8.5.29',
+    '1.3.3.8.5.3',
+    '1.3.3.8.5.30',
+    '1.3.3.8.5.31',
+    '1.3.3.8.5.32',
+    '1.3.3.8.5.33',
+    '1.3.3.8.5.34',
+    '1.3.3.8.5.35',
+    '1.3.3.8.5.36',
+    '1.3.3.8.5.37',
+    '1.3.3.8.5.38',
+    '1.3.3.8.5.39',
+    '1.3.3.8.5.4',
+    '1.3.3.8.5.40',
+    '1.3.3.8.5.5',
+    '1.3.3.8.5.6',
+    '1.3.3.8.5.7',
+    '1.3.3.8.5.8',
+    '1.3.3.8.5.9',
+    '1.3.3.8.6',
+    '1.3.3.8.6.1',
+    '1.3.3.8.6.10',
+    '1.3.3.8.6.11',
+    '1.3.3.8.6.12',
+    '1.3.3.8.6.2',
+    '1.3.3.8.6.3',
+    '1.3.3.8.6.4',
+    '1.3.3.8.6.5',
+    '1.3.3.8.6.6',
+    '1.3.3.8.6.7',
+    '1.3.3.8.6.9',
+    '1.3.4',
+    '1.3.4.1',
+    '1.4',
+    '1.4.1',
+    '1.4.1.1',
+    '1.4.1.1.1',
+    '1.4.1.1.2',
+    '1.4.1.1.3',
+    '1.4.1.1.4',
+    '1.4.1.1.5',
+)
+
+PRODUCT_NAMES = (
+    'jnxClassification',
+    'jnxClassGeneral',
+    'jnxProductLine',
+    'jnxProductLineM40',
+    'jnxProductLineM7i',
+    'jnxProductLineQFX3100',
+    'jnxProductLineLN2800',
+    'jnxProductLineEX9214',
+    'jnxProductLineEX9208',
+    'jnxProductLineEX9204',
+    'jnxProductLineSRX5400',
+    'jnxProductLineIBM4274S54J54S',
+    'jnxProductLineDELLJSRX5400',
+    'jnxProductLineVMX',
+    'jnxProductLineEX4600',
+    'jnxProductLineM10i',
+    'jnxProductLineVRR',
+    'jnxProductLineOCPAcc',
+    'jnxProductLineACX1000',
+    'jnxProductLineACX2000',
+    'jnxProductLineACX1100',
+    'jnxProductLineACX2100',
+    'jnxProductLineACX2200',
+    'jnxProductLineACX4000',
+    'jnxProductLineACX500AC',
+    'jnxProductLineACX500DC',
+    'jnxProductLineACX500OAC',
+    'jnxProductLineACX500ODC',
+    'jnxProductLineACX500OPOEAC',
+    'jnxProductLineACX500OPOEDC',
+    'jnxProductLineSatelliteDevice',
+    'jnxProductLineACX5048',
+    'jnxProductLineACX5096',
+    'jnxProductLineLN1000CC',
+    'jnxProductLineVSRX',
+    'jnxProductLineJ2300',
+    'jnxProductLinePTX1000',
+    'jnxProductLineEX3400',
+    'jnxProductLineEX2300',
+    'jnxProductLineSRX300',
+    'jnxProductLineSRX320',
+    'jnxProductLineSRX340',
+    'jnxProductLineSRX345',
+    'jnxProductLineSRX1500',
+    'jnxProductLineMX10002',
+    'jnxProductLineJ4300',
+    'jnxProductLineSRX4600',
+    'jnxProductLineSRX4800',
+    'jnxProductLineSRX4100',
+    'jnxProductLineSRX4200',
+    'jnxProductLineJ6300',
+    'jnxProductLineIRM',
+    'jnxProductLineTX',
+    'jnxProductLineM120',
+    'jnxProductLineJ4350',
+    'jnxProductLineM20',
+    'jnxProductLineJ6350',
+    'jnxProductLineMX960',
+    'jnxProductLineJ4320',
+    'jnxProductLineJ2320',
+    'jnxProductLineJ2350',
+    'jnxProductLineMX480',
+    'jnxProductLineSRX5800',
+    'jnxProductLineT1600',
+    'jnxProductLineSRX5600',
+    'jnxProductLineMX240',
+    'jnxProductLineM160',
+    'jnxProductLineEX3200',
+    'jnxProductLineEX4200',
+    'jnxProductLineEX8208',
+    'jnxProductLineEX8216',
+    'jnxProductLineSRX3600',
+    'jnxProductLineSRX3400',
+    'jnxProductLineSRX210',
+    'jnxProductLineTXP',
+    'jnxProductLineJCS',
+    'jnxProductLineSRX240',
+    'jnxProductLineM10',
+    'jnxProductLineSRX650',
+    'jnxProductLineSRX100',
+    'jnxProductLineLN1000V',
+    'jnxProductLineEX2200',
+    'jnxProductLineEX4500',
+    'jnxProductLineFXSeries',
+    'jnxProductLineIBM4274M02J02M',
+    'jnxProductLineIBM4274M06J06M',
+    'jnxProductLineIBM4274M11J11M',
+    'jnxProductLineSRX1400',
+    'jnxProductLineM5',
+    'jnxProductLineIBM4274S58J58S',
+    'jnxProductLineIBM4274S56J56S',
+    'jnxProductLineIBM4274S36J36S',
+    'jnxProductLineIBM4274S34J34S',
+    'jnxProductLineIBM427348EJ48E',
+    'jnxProductLineIBM4274E08J08E',
+    'jnxProductLineIBM4274E16J16E',
+    'jnxProductLineMX80',
+    'jnxProductLineSRX220',
+    'jnxProductLineEXXRE',
+    'jnxProductLineT640',
+    'jnxProductLineQFXInterconnect',
+    'jnxProductLineQFXNode',
+    'jnxProductLineQFXJVRE',
+    'jnxProductLineEX4300',
+    'jnxProductLineSRX110',
+    'jnxProductLineSRX120',
+    'jnxProductLineMAG8600',
+    'jnxProductLineMAG6611',
+    'jnxProductLineMAG6610',
+    'jnxProductLinePTX5000',
+    'jnxProductLineT320',
+    'jnxProductLinePTX9000',
+    'jnxProductLineIBM0719J45E',
+    'jnxProductLineIBMJ08F',
+    'jnxProductLineIBMJ52F',
+    'jnxProductLineEX6210',
+    'jnxProductLineDellJFX3500',
+    'jnxProductLineEX3300',
+    'jnxProductLineDELLJSRX3600',
+    'jnxProductLineDELLJSRX3400',
+    'jnxProductLineDELLJSRX1400',
+    'jnxProductLineM40e',
+    'jnxProductLineDELLJSRX5800',
+    'jnxProductLineDELLJSRX5600',
+    'jnxProductLineQFXSwitch',
+    'jnxProductLineT4000',
+    'jnxProductLineQFX3000',
+    'jnxProductLineQFX5000',
+    'jnxProductLineSRX550',
+    'jnxProductLineACX',
+    'jnxProductLineMX40',
+    'jnxProductLineMX10',
+    'jnxProductLineM320',
+    'jnxProductLineMX5',
+    'jnxProductLineQFXMInterconnect',
+    'jnxProductLineEX4550',
+    'jnxProductLineMX2020',
+    'jnxProductLineVseries',
+    'jnxProductLineLN2600',
+    'jnxProductLineFireflyPerimeter',
+    'jnxProductLineMX104',
+    'jnxProductLinePTX3000',
+    'jnxProductLineMX2010',
+    'jnxProductName',
+    'jnxProductNameM40',
+    'jnxProductNameM7i',
+    'jnxProductNameQFX3100',
+    'jnxProductNameLN2800',
+    'jnxProductNameEX9214',
+    'jnxProductNameEX9208',
+    'jnxProductNameEX9204',
+    'jnxProductNameSRX5400',
+    'jnxProductNameIBM4274S54J54S',
+    'jnxProductNameDELLJSRX5400',
+    'jnxProductNameVMX',
+    'jnxProductNameEX4600',
+    'jnxProductNameM10i',
+    'jnxProductNameVRR',
+    'jnxProductNameMX10440G',
+    'jnxProductNameOCPAcc',
+    'jnxProductNameACX1000',
+    'jnxProductNameACX2000',
+    'jnxProductNameACX1100',
+    'jnxProductNameACX2100',
+    'jnxProductNameACX2200',
+    'jnxProductNameACX4000',
+    'jnxProductNameACX500AC',
+    'jnxProductNameACX500DC',
+    'jnxProductNameACX500OAC',
+    'jnxProductNameACX500ODC',
+    'jnxProductNameACX500OPOEAC',
+    'jnxProductNameACX500OPOEDC',
+    'jnxProductNameSatelliteDevice',
+    'jnxProductNameACX5048',
+    'jnxProductNameACX5096',
+    'jnxProductNameLN1000CC',
+    'jnxProductNameVSRX',
+    'jnxProductNameJ2300',
+    'jnxProductNamePTX1000',
+    'jnxProductNameEX3400',
+    'jnxProductNameEX2300',
+    'jnxProductNameSRX300',
+    'jnxProductNameSRX320',
+    'jnxProductNameSRX340',
+    'jnxProductNameSRX345',
+    'jnxProductNameSRX1500',
+    'jnxProductNameMX10002',
+    'jnxProductNameJ4300',
+    'jnxProductNameSRX4600',
+    'jnxProductNameSRX4800',
+    'jnxProductNameSRX4100',
+    'jnxProductNameSRX4200',
+    'jnxProductNameJ6300',
+    'jnxProductNameIRM',
+    'jnxProductNameTX',
+    'jnxProductNameM120',
+    'jnxProductNameJ4350',
+    'jnxProductNameM20',
+    'jnxProductNameJ6350',
+    'jnxProductNameMX960',
+    'jnxProductNameJ4320',
+    'jnxProductNameJ2320',
+    'jnxProductNameJ2350',
+    'jnxProductNameMX480',
+    'jnxProductNameSRX5800',
+    'jnxProductNameT1600',
+    'jnxProductNameSRX5600',
+    'jnxProductNameMX240',
+    'jnxProductNameM160',
+    'jnxProductNameEX3200',
+    'jnxProductNameEX4200',
+    'jnxProductNameEX8208',
+    'jnxProductNameEX8216',
+    'jnxProductNameSRX3600',
+    'jnxProductNameSRX3400',
+    'jnxProductNameSRX210',
+    'jnxProductNameTXP',
+    'jnxProductNameJCS',
+    'jnxProductNameSRX240',
+    'jnxProductNameM10',
+    'jnxProductNameSRX650',
+    'jnxProductNameSRX100',
+    'jnxProductNameLN1000V',
+    'jnxProductNameEX2200',
+    'jnxProductNameEX4500',
+    'jnxProductNameFXSeries',
+    'jnxProductNameIBM4274M02J02M',
+    'jnxProductNameIBM4274M06J06M',
+    'jnxProductNameIBM4274M11J11M',
+    'jnxProductNameSRX1400',
+    'jnxProductNameM5',
+    'jnxProductNameIBM4274S58J58S',
+    'jnxProductNameIBM4274S56J56S',
+    'jnxProductNameIBM4274S36J36S',
+    'jnxProductNameIBM4274S34J34S',
+    'jnxProductNameIBM427348EJ48E',
+    'jnxProductNameIBM4274E08J08E',
+    'jnxProductNameIBM4274E16J16E',
+    'jnxProductNameMX80',
+    'jnxProductNameSRX220',
+    'jnxProductNameEXXRE',
+    'jnxProductNameT640',
+    'jnxProductNameQFXInterconnect',
+    'jnxProductNameQFXNode',
+    'jnxProductNameQFXJVRE',
+    'jnxProductNameEX4300',
+    'jnxProductNameSRX110',
+    'jnxProductNameSRX120',
+    'jnxProductNameMAG8600',
+    'jnxProductNameMAG6611',
+    'jnxProductNameMAG6610',
+    'jnxProductNamePTX5000',
+    'jnxProductNameT320',
+    'jnxProductNamePTX9000',
+    'jnxProductNameIBM0719J45E',
+    'jnxProductNameIBMJ08F',
+    'jnxProductNameIBMJ52F',
+    'jnxProductNameEX6210',
+    'jnxProductNameDellJFX3500',
+    'jnxProductNameEX3300',
+    'jnxProductNameDELLJSRX3600',
+    'jnxProductNameDELLJSRX3400',
+    'jnxProductNameDELLJSRX1400',
+    'jnxProductNameM40e',
+    'jnxProductNameDELLJSRX5800',
+    'jnxProductNameDELLJSRX5600',
+    'jnxProductNameQFXSwitch',
+    'jnxProductNameT4000',
+    'jnxProductNameQFX3000',
+    'jnxProductNameQFX5000',
+    'jnxProductNameSRX550',
+    'jnxProductNameACX',
+    'jnxProductNameMX40',
+    'jnxProductNameMX10',
+    'jnxProductNameM320',
+    'jnxProductNameMX5',
+    'jnxProductNameQFXMInterconnect',
+    'jnxProductNameEX4550',
+    'jnxProductNameMX2020',
+    'jnxProductNameVseries',
+    'jnxProductNameLN2600',
+    'jnxProductNameFireflyPerimeter',
+    'jnxProductNameMX104',
+    'jnxProductNamePTX3000',
+    'jnxProductNameMX2010',
+    'jnxProductModel',
+    'jnxProductModelM40',
+    'jnxProductModelM7i',
+    'jnxProductModelQFX3100',
+    'jnxProductModelEX9214',
+    'jnxProductModelEX9208',
+    'jnxProductModelEX9204',
+    'jnxProductModelSRX5400',
+    'jnxProductModelIBM4274S54J54S',
+    'jnxProductModelDELLJSRX5400',
+    'jnxProductModelVMX',
+    'jnxProductModelEX4600',
+    'jnxProductModelM10i',
+    'jnxProductModelVRR',
+    'jnxProductModelOCPAcc',
+    'jnxProductModelACX1000',
+    'jnxProductModelACX2000',
+    'jnxProductModelACX1100',
+    'jnxProductModelACX2100',
+    'jnxProductModelACX2200',
+    'jnxProductModelACX4000',
+    'jnxProductModelACX500AC',
+    'jnxProductModelACX500DC',
+    'jnxProductModelACX500OAC',
+    'jnxProductModelACX500ODC',
+    'jnxProductModelACX500OPOEAC',
+    'jnxProductModelACX500OPOEDC',
+    'jnxProductModelSatelliteDevice',
+    'jnxProductModelACX5048',
+    'jnxProductModelACX5096',
+    'jnxProductModelLN1000CC',
+    'jnxProductModelPTX1000',
+    'jnxProductModelEX3400',
+    'jnxProductModelEX2300',
+    'jnxProductNFX',
+    'jnxProductModelMX10002',
+    'jnxProductModelSRX4600',
+    'jnxProductModelSRX4800',
+    'jnxProductModelIRM',
+    'jnxProductModelTX',
+    'jnxProductModelM120',
+    'jnxProductModelM20',
+    'jnxProductModelMX960',
+    'jnxProductModelMX480',
+    'jnxProductModelSRX5800',
+    'jnxProductModelT1600',
+    'jnxProductModelSRX5600',
+    'jnxProductModelMX240',
+    'jnxProductModelM160',
+    'jnxProductModelEX3200',
+    'jnxProductModelEX4200',
+    'jnxProductModelEX8208',
+    'jnxProductModelEX8216',
+    'jnxProductModelSRX3600',
+    'jnxProductModelSRX3400',
+    'jnxProductModelTXP',
+    'jnxProductModelJCS',
+    'jnxProductModelM10',
+    'jnxProductModelLN1000V',
+    'jnxProductModelEX2200',
+    'jnxProductModelEX4500',
+    'jnxProductModelFXSeries',
+    'jnxProductModelIBM4274M02J02M',
+    'jnxProductModelIBM4274M06J06M',
+    'jnxProductModelIBM4274M11J11M',
+    'jnxProductModelSRX1400',
+    'jnxProductModelM5',
+    'jnxProductModelIBM4274S58J58S',
+    'jnxProductModelIBM4274S56J56S',
+    'jnxProductModelIBM4274S36J36S',
+    'jnxProductModelIBM4274S34J34S',
+    'jnxProductModelIBM427348EJ48E',
+    'jnxProductModelIBM4274E08J08E',
+    'jnxProductModelIBM4274E16J16E',
+    'jnxProductModelMX80',
+    'jnxProductModelEXXRE',
+    'jnxProductModelT640',
+    'jnxProductModelQFXInterconnect',
+    'jnxProductModelQFXNode',
+    'jnxProductModelQFXJVRE',
+    'jnxProductModelEX4300',
+    'jnxProductModelMAG8600',
+    'jnxProductModelMAG6611',
+    'jnxProductModelMAG6610',
+    'jnxProductModelPTX5000',
+    'jnxProductModelT320',
+    'jnxProductModelPTX9000',
+    'jnxProductModelIBM0719J45E',
+    'jnxProductModelIBMJ08F',
+    'jnxProductModelIBMJ52F',
+    'jnxProductModelEX6210',
+    'jnxProductModelDellJFX3500',
+    'jnxProductModelEX3300',
+    'jnxProductModelDELLJSRX3600',
+    'jnxProductModelDELLJSRX3400',
+    'jnxProductModelDELLJSRX1400',
+    'jnxProductModelM40e',
+    'jnxProductModelDELLJSRX5800',
+    'jnxProductModelDELLJSRX5600',
+    'jnxProductModelQFXSwitch',
+    'jnxProductModelT4000',
+    'jnxProductModelQFX3000',
+    'jnxProductModelQFX5000',
+    'jnxProductModelACX',
+    'jnxProductModelMX40',
+    'jnxProductModelMX10',
+    'jnxProductModelM320',
+    'jnxProductModelMX5',
+    'jnxProductModelQFXMInterconnect',
+    'jnxProductModelEX4550',
+    'jnxProductModelMX2020',
+    'jnxProductModelLN2600',
+    'jnxProductModelMX104',
+    'jnxProductModelPTX3000',
+    'jnxProductModelMX2010',
+    'jnxProductVariation',
+    'jnxProductVariationM40',
+    'jnxProductVariationM7i',
+    'jnxProductVariationQFX3100',
+    'jnxProductVariationEX9214',
+    'jnxProductVariationEX9208',
+    'jnxProductVariationEX9204',
+    'jnxProductVariationSRX5400',
+    'jnxProductVariationIBM4274S54J54S',
+    'jnxProductVariationDELLJSRX5400',
+    'jnxProductVariationEX4600',
+    'jnxProductEX4600',
+    'jnxProductVariationM10i',
+    'jnxProductVariationOCPAcc',
+    'jnxProductOCP48S',
+    'jnxProductOCP48T',
+    'jnxProductVariationACX1000',
+    'jnxProductACX1000',
+    'jnxProductVariationACX2000',
+    'jnxProductACX2000',
+    'jnxProductVariationACX1100',
+    'jnxProductACX1100',
+    'jnxProductVariationACX2100',
+    'jnxProductACX2100',
+    'jnxProductVariationACX2200',
+    'jnxProductACX2200',
+    'jnxProductVariationACX4000',
+    'jnxProductACX4000',
+    'jnxProductVariationACX500AC',
+    'jnxProductACX500AC',
+    'jnxProductVariationACX500DC',
+    'jnxProductACX500DC',
+    'jnxProductVariationACX500OAC',
+    'jnxProductACX500OAC',
+    'jnxProductVariationACX500ODC',
+    'jnxProductACX500ODC',
+    'jnxProductVariationACX500OPOEAC',
+    'jnxProductACX500OPOEAC',
+    'jnxProductVariationACX500OPOEDC',
+    'jnxProductACX500OPOEDC',
+    'jnxProductVariationACX5048',
+    'jnxProductACX5048',
+    'jnxProductVariationACX5096',
+    'jnxProductACX5096',
+    'jnxProductVariationLN1000CC',
+    'jnxProductVariationPTX1000',
+    'jnxProductPTX1000',
+    'jnxProductVariationEX3400',
+    'jnxProductEX3400port24T',
+    'jnxProductEX3400port48T',
+    'jnxProductEX3400port24P',
+    'jnxProductEX3400port48P',
+    'jnxProductVariationEX2300',
+    'jnxProductEX2300port24T',
+    'jnxProductEX2300port48T',
+    'jnxProductEX2300port24P',
+    'jnxProductEX2300port48P',
+    'jnxProductEX2300Cport12T',
+    'jnxProductEX2300Cport12P',
+    'jnxProductVariationNFX',
+    'jnxProductNFX250ATTS1',
+    'jnxProductNFX250ATTS2',
+    'jnxProductNFX240ATTS1',
+    'jnxProductNFX250S1',
+    'jnxProductNFX250S2',
+    'jnxProductNFX240S1',
+    'jnxProductNFX240S2',
+    'jnxProductVariationMX10002',
+    'jnxProductVariationSRX4600',
+    'jnxProductVariationSRX4800',
+    'jnxProductVariationIRM',
+    'jnxProductVariationTX',
+    'jnxProductVariationM120',
+    'jnxProductVariationM20',
+    'jnxProductVariationMX960',
+    'jnxProductVariationMX480',
+    'jnxProductVariationSRX5800',
+    'jnxProductVariationT1600',
+    'jnxProductVariationSRX5600',
+    'jnxProductVariationMX240',
+    'jnxProductVariationM160',
+    'jnxProductVariationEX3200',
+    'jnxProductEX3200port24T',
+    'jnxProductEX3200port24P',
+    'jnxProductEX3200port48T',
+    'jnxProductEX3200port48P',
+    'jnxProductVariationEX4200',
+    'jnxProductEX4200port24T',
+    'jnxProductEX4200port24P',
+    'jnxProductEX4200port48T',
+    'jnxProductEX4200port48P',
+    'jnxProductEX4200port24F',
+    'jnxProductEX4200port24PX',
+    'jnxProductEX4200port48PX',
+    'jnxProductVariationEX8208',
+    'jnxProductVariationEX8216',
+    'jnxProductVariationSRX3600',
+    'jnxProductVariationSRX3400',
+    'jnxProductVariationTXP',
+    'jnxProductVariationJCS',
+    'jnxProductVariationM10',
+    'jnxProductVariationLN1000V',
+    'jnxProductVariationEX2200',
+    'jnxProductEX2200port24T',
+    'jnxProductEX2200port24P',
+    'jnxProductEX2200port48T',
+    'jnxProductEX2200port48P',
+    'jnxProductEX2200Cport12T',
+    'jnxProductEX2200Cport12P',
+    'jnxProductEX2200port24TDC',
+    'jnxProductVariationEX4500',
+    'jnxProductEX4500port40F',
+    'jnxProductEX4500port20F',
+    'jnxProductVariationFXSeries',
+    'jnxProductFX1600port',
+    'jnxProductFX2160port',
+    'jnxProductVariationIBM4274M02J02M',
+    'jnxProductVariationIBM4274M06J06M',
+    'jnxProductVariationIBM4274M11J11M',
+    'jnxProductVariationSRX1400',
+    'jnxProductVariationM5',
+    'jnxProductVariationIBM4274S58J58S',
+    'jnxProductVariationIBM4274S56J56S',
+    'jnxProductVariationIBM4274S36J36S',
+    'jnxProductVariationIBM4274S34J34S',
+    'jnxProductVariationIBM427348EJ48E',
+    'jnxProductIBM427348EJ48Eport24T',
+    'jnxProductIBM427348EJ48Eport24P',
+    'jnxProductIBM427348EJ48Eport48T',
+    'jnxProductIBM427348EJ48Eport48P',
+    'jnxProductIBM427348EJ48Eport24F',
+    'jnxProductVariationIBM4274E08J08E',
+    'jnxProductVariationIBM4274E16J16E',
+    'jnxProductVariationMX80',
+    'jnxProductMX80',
+    'jnxProductMX80_48T',
+    'jnxProductMX80_T',
+    'jnxProductMX80_P',
+    'jnxProductVariationEXXRE',
+    'jnxProductEXXRE',
+    'jnxProductVariationT640',
+    'jnxProductVariationQFXInterconnect',
+    'jnxProductQFX3008',
+    'jnxProductQFXC083008',
+    'jnxProductQFX3008I',
+    'jnxProductVariationQFXNode',
+    'jnxProductQFX3500',
+    'jnxProductQFX5500',
+    'jnxProductQFX360016Q',
+    'jnxProductQFX350048T4Q',
+    'jnxProductQFX510024QF',
+    'jnxProductQFX510048S6QF',
+    'jnxProductQFX510096S6QF',
+    'jnxProductQFX510048C6QF',
+    'jnxProductVariationEX4300',
+    'jnxProductEX4300port24T',
+    'jnxProductEX4300port48T',
+    'jnxProductEX4300port48TBF',
+    'jnxProductEX4300port48TDC',
+    'jnxProductEX4300port48TDCBF',
+    'jnxProductEX4300port24P',
+    'jnxProductEX4300port48P',
+    'jnxProductEX4300port32F',
+    'jnxProductVariationMAG8600',
+    'jnxProductVariationMAG6611',
+    'jnxProductVariationMAG6610',
+    'jnxProductVariationPTX5000',
+    'jnxProductVariationT320',
+    'jnxProductVariationPTX9000',
+    'jnxProductVariationIBM0719J45E',
+    'jnxProductIBM0719J45Eport40F',
+    'jnxProductIBM0719J45Eport20F',
+    'jnxProductVariationIBMJ08F',
+    'jnxProductIBM2413F08J08F',
+    'jnxProductVariationIBMJ52F',
+    'jnxProductIBM2409F52J52F',
+    'jnxProductIBM8729HC1J52F',
+    'jnxProductVariationEX6210',
+    'jnxProductVariationDellJFX3500',
+    'jnxProductVariationEX3300',
+    'jnxProductEX3300port24T',
+    'jnxProductEX3300port24P',
+    'jnxProductEX3300port48T',
+    'jnxProductEX3300port48P',
+    'jnxProductEX3300port24TDC',
+    'jnxProductEX3300port48TBF',
+    'jnxProductVariationDELLJSRX3600',
+    'jnxProductVariationDELLJSRX3400',
+    'jnxProductVariationDELLJSRX1400',
+    'jnxProductVariationM40e',
+    'jnxProductVariationDELLJSRX5800',
+    'jnxProductVariationDELLJSRX5600',
+    'jnxProductVariationQFXSwitch',
+    'jnxProductQFX3500s',
+    'jnxProductQFX1000236Q',
+    'jnxProductQFX1000272Q',
+    'jnxProductQFX10004',
+    'jnxProductQFX10008',
+    'jnxProductQFX10016',
+    'jnxProductQFX520032C32Q',
+    'jnxProductQFX520032C64Q',
+    'jnxProductQFX511048S4Q',
+    'jnxProductQFX511032Q',
+    'jnxProductQFX360016QS',
+    'jnxProductQFX350048T4QS',
+    'jnxProductQFX510024Q',
+    'jnxProductQFX510048S6Q',
+    'jnxProductQFX510096S8Q',
+    'jnxProductQFX510048C6Q',
+    'jnxProductQFX510024QHP',
+    'jnxProductQFX510048T6Q',
+    'jnxProductVariationT4000',
+    'jnxProductVariationQFX3000',
+    'jnxProductQFX3000_G',
+    'jnxProductQFX3000_M',
+    'jnxProductVariationQFX5000',
+    'jnxProductVariationACX',
+    'jnxProductACX500IDC',
+    'jnxProductACX500IAC',
+    'jnxProductVariationMX40',
+    'jnxProductMX40',
+    'jnxProductVariationMX10',
+    'jnxProductMX10',
+    'jnxProductVariationM320',
+    'jnxProductVariationMX5',
+    'jnxProductMX5',
+    'jnxProductVariationQFXMInterconnect',
+    'jnxProductQFX3600I',
+    'jnxProductQFX510024QI',
+    'jnxProductVariationEX4550',
+    'jnxProductEX4550port32F',
+    'jnxProductEX4550port32T',
+    'jnxProductVariationMX2020',
+    'jnxProductVariationLN2600',
+    'jnxProductVariationMX104',
+    'jnxProductMX104',
+    'jnxProductVariationPTX3000',
+    'jnxProductVariationMX2010',
+    'jnxClassContainers',
+    'jnxChassis',
+    'jnxChassisM40',
+    'jnxChassisM7i',
+    'jnxChassisQFX3100',
+    'jnxChassisLN2800',
+    'jnxChassisEX9214',
+    'jnxChassisEX9208',
+    'jnxChassisEX9204',
+    'jnxChassisSRX5400',
+    'jnxChassisIBM4274S54J54S',
+    'jnxChassisDELLJSRX5400',
+    'jnxChassisVMX',
+    'jnxChassisEX4600',
+    'jnxChassisM10i',
+    'jnxChassisVRR',
+    'jnxChassisACX1000',
+    'jnxChassisACX2000',
+    'jnxChassisACX1100',
+    'jnxChassisACX2100',
+    'jnxChassisACX2200',
+    'jnxChassisACX4000',
+    'jnxChassisACX500AC',
+    'jnxChassisACX500DC',
+    'jnxChassisACX500OAC',
+    'jnxChassisACX500ODC',
+    'jnxChassisACX500OPOEAC',
+    'jnxChassisACX500OPOEDC',
+    'jnxChassisSatelliteDevice',
+    'jnxChassisACX5048',
+    'jnxChassisACX5096',
+    'jnxChassisLN1000CC',
+    'jnxChassisVSRX',
+    'jnxChassisJ2300',
+    'jnxChassisPTX1000',
+    'jnxChassisEX3400',
+    'jnxEX3400RE0',
+    'jnxEX3400RE1',
+    'jnxChassisEX2300',
+    'jnxEX2300RE0',
+    'jnxEX2300RE1',
+    'jnxChassisSRX300',
+    'jnxChassisSRX320',
+    'jnxChassisSRX340',
+    'jnxChassisSRX345',
+    'jnxChassisSRX1500',
+    'jnxChassisMX10002',
+    'jnxChassisJ4300',
+    'jnxChassisSRX4600',
+    'jnxChassisSRX4800',
+    'jnxChassisSRX4100',
+    'jnxChassisSRX4200',
+    'jnxChassisJ6300',
+    'jnxChassisIRM',
+    'jnxChassisTX',
+    'jnxChassisM120',
+    'jnxChassisJ4350',
+    'jnxChassisM20',
+    'jnxChassisJ6350',
+    'jnxChassisMX960',
+    'jnxChassisJ4320',
+    'jnxChassisJ2320',
+    'jnxChassisJ2350',
+    'jnxChassisMX480',
+    'jnxChassisSRX5800',
+    'jnxChassisT1600',
+    'jnxChassisSRX5600',
+    'jnxChassisMX240',
+    'jnxChassisM160',
+    'jnxChassisEX3200',
+    'jnxChassisEX4200',
+    'jnxEX4200RE0',
+    'jnxEX4200RE1',
+    'jnxChassisEX8208',
+    'jnxChassisEX8216',
+    'jnxChassisSRX3600',
+    'jnxChassisSRX3400',
+    'jnxChassisSRX210',
+    'jnxChassisTXP',
+    'jnxChassisJCS',
+    'jnxChassisSRX240',
+    'jnxChassisM10',
+    'jnxChassisSRX650',
+    'jnxChassisSRX100',
+    'jnxChassisLN1000V',
+    'jnxChassisEX2200',
+    'jnxChassisEX4500',
+    'jnxEX4500RE0',
+    'jnxEX4500RE1',
+    'jnxChassisFXChassis',
+    'jnxChassisIBM4274M02J02M',
+    'jnxChassisIBM4274M06J06M',
+    'jnxChassisIBM4274M11J11M',
+    'jnxChassisSRX1400',
+    'jnxChassisM5',
+    'jnxChassisIBM4274S58J58S',
+    'jnxChassisIBM4274S56J56S',
+    'jnxChassisIBM4274S36J36S',
+    'jnxChassisIBM4274S34J34S',
+    'jnxChassisIBM427348EJ48E',
+    'jnxIBM427348EJ48ERE0',
+    'jnxIBM427348EJ48ERE1',
+    'jnxChassisIBM4274E08J08E',
+    'jnxChassisIBM4274E16J16E',
+    'jnxChassisMX80',
+    'jnxChassisSRX220',
+    'jnxChassisEXXRE',
+    'jnxEXXRERE0',
+    'jnxEXXRERE1',
+    'jnxChassisT640',
+    'jnxChassisQFXInterconnect',
+    'jnxChassisQFXNode',
+    'jnxChassisQFXJVRE',
+    'jnxChassisEX4300',
+    'jnxEX4300RE0',
+    'jnxEX4300RE1',
+    'jnxChassisSRX110',
+    'jnxChassisSRX120',
+    'jnxChassisMAG8600',
+    'jnxChassisMAG6611',
+    'jnxChassisMAG6610',
+    'jnxChassisPTX5000',
+    'jnxChassisT320',
+    'jnxChassisPTX9000',
+    'jnxChassisIBM0719J45E',
+    'jnxIBM0719J45ERE0',
+    'jnxIBM0719J45ERE1',
+    'jnxChassisIBMJ08F',
+    'jnxChassisIBMJ52F',
+    'jnxChassisEX6210',
+    'jnxChassisDellJFX3500',
+    'jnxChassisEX3300',
+    'jnxEX3300RE0',
+    'jnxEX3300RE1',
+    'jnxChassisDELLJSRX3600',
+    'jnxChassisDELLJSRX3400',
+    'jnxChassisDELLJSRX1400',
+    'jnxChassisM40e',
+    'jnxChassisDELLJSRX5800',
+    'jnxChassisDELLJSRX5600',
+    'jnxChassisQFXSwitch',
+    'jnxChassisT4000',
+    'jnxChassisQFX3000',
+    'jnxChassisQFX5000',
+    'jnxChassisSRX550',
+    'jnxChassisACX',
+    'jnxChassisMX40',
+    'jnxChassisMX10',
+    'jnxChassisM320',
+    'jnxChassisMX5',
+    'jnxChassisQFXMInterconnect',
+    'jnxChassisEX4550',
+    'jnxEX4550RE0',
+    'jnxEX4550RE1',
+    'jnxChassisMX2020',
+    'jnxChassisVseries',
+    'jnxChassisLN2600',
+    'jnxChassisFireflyPerimeter',
+    'jnxChassisMX104',
+    'jnxChassisPTX3000',
+    'jnxChassisMX2010',
+    'jnxSlot',
+    'jnxSlotM40',
+    'jnxSlotFPC',
+    'jnxSlotSCB',
+    'jnxSlotHostCtlr',
+    'jnxSlotPowerSupply',
+    'jnxSlotCoolingImpeller',
+    'jnxSlotCoolingFan',
+    'jnxSlotRoutingEngine',
+    'jnxSlotM7i',
+    'jnxM7iSlotFPC',
+    'jnxM7iSlotCFEB',
+    'jnxM7iSlotRE',
+    'jnxM7iSlotPower',
+    'jnxM7iSlotFan',
+    'jnxSlotQFX3100',
+    'jnxQFX3100SlotCPU',
+    'jnxQFX3100SlotMemory',
+    'jnxQFX3100SlotPower',
+    'jnxQFX3100SlotFan',
+    'jnxQFX3100SlotHardDisk',
+    'jnxQFX3100SlotNIC',
+    'jnxSlotLN2800',
+    'jnxLN2800SlotFPC',
+    'jnxLN2800SlotRE',
+    'jnxLN2800SlotPower',
+    'jnxLN2800SlotFan',
+    'jnxSlotEX9214',
+    'jnxEX9214SlotFPC',
+    'jnxEX9214SlotHM',
+    'jnxEX9214SlotPower',
+    'jnxEX9214SlotFan',
+    'jnxEX9214SlotCB',
+    'jnxEX9214SlotFPB',
+    'jnxSlotEX9208',
+    'jnxEX9208SlotFPC',
+    'jnxEX9208SlotHM',
+    'jnxEX9208SlotPower',
+    'jnxEX9208SlotFan',
+    'jnxEX9208SlotCB',
+    'jnxEX9208SlotFPB',
+    'jnxSlotEX9204',
+    'jnxEX9204SlotFPC',
+    'jnxEX9204SlotHM',
+    'jnxEX9204SlotPower',
+    'jnxEX9204SlotFan',
+    'jnxEX9204SlotCB',
+    'jnxEX9204SlotFPB',
+    'jnxSlotSRX5400',
+    'jnxSRX5400SlotFPC',
+    'jnxSRX5400SlotHM',
+    'jnxSRX5400SlotPower',
+    'jnxSRX5400SlotFan',
+    'jnxSRX5400SlotCB',
+    'jnxSRX5400SlotFPB',
+    'jnxSlotIBM4274S54J54S',
+    'jnxIBM4274S54J54SSlotFPC',
+    'jnxIBM4274S54J54SSlotHM',
+    'jnxIBM4274S54J54SSlotPower',
+    'jnxIBM4274S54J54SSlotFan',
+    'jnxIBM4274S54J54SSlotCB',
+    'jnxIBM4274S54J54SSlotFPB',
+    'jnxSlotDELLJSRX5400',
+    'jnxDELLJSRX5400SlotFPC',
+    'jnxDELLJSRX5400SlotHM',
+    'jnxDELLJSRX5400SlotPower',
+    'jnxDELLJSRX5400SlotFan',
+    'jnxDELLJSRX5400SlotCB',
+    'jnxDELLJSRX5400SlotFPB',
+    'jnxSlotVMX',
+    'jnxVMXSlotFPC',
+    'jnxVMxSlotPower',
+    'jnxVMXSlotFan',
+    'jnxVMXSlotCB',
+    'jnxVMXSlotHM',
+    'jnxSlotEX4600',
+    'jnxEX4600SlotFPC',
+    'jnxEX4600HM',
+    'jnxEX4600SlotPower',
+    'jnxEX4600SlotFan',
+    'jnxSlotM10i',
+    'jnxM10iSlotFPC',
+    'jnxM10iSlotCFEB',
+    'jnxM10iSlotRE',
+    'jnxM10iSlotPower',
+    'jnxM10iSlotFan',
+    'jnxM10iSlotHCM',
+    'jnxSlotVRR',
+    'jnxVRRSlotFPC',
+    'jnxVRRSlotRE',
+    'jnxVRRSlotPower',
+    'jnxVRRSlotFan',
+    'jnxVRRSlotHM',
+    'jnxVRRSlotCB',
+    'jnxVRRSlotFPB',
+    'jnxSlotACX1000',
+    'jnxACX1000SlotFPC',
+    'jnxACX1000SlotFEB',
+    'jnxACX1000SlotRE',
+    'jnxACX1000SlotPower',
+    'jnxSlotACX2000',
+    'jnxACX2000SlotFPC',
+    'jnxACX2000SlotFEB',
+    'jnxACX2000SlotRE',
+    'jnxACX2000SlotPower',
+    'jnxSlotACX1100',
+    'jnxACX1100SlotFPC',
+    'jnxACX1100SlotFEB',
+    'jnxACX1100SlotRE',
+    'jnxACX1100SlotPower',
+    'jnxSlotACX2100',
+    'jnxACX2100SlotFPC',
+    'jnxACX2100SlotFEB',
+    'jnxACX2100SlotRE',
+    'jnxACX2100SlotPower',
+    'jnxSlotACX2200',
+    'jnxACX2200SlotFPC',
+    'jnxACX2200SlotFEB',
+    'jnxACX2200SlotRE',
+    'jnxACX2200SlotPower',
+    'jnxSlotACX4000',
+    'jnxACX4000SlotFPC',
+    'jnxACX4000SlotFEB',
+    'jnxACX4000SlotRE',
+    'jnxACX4000SlotPower',
+    'jnxACX4000SlotFan',
+    'jnxSlotACX500AC',
+    'jnxACX500ACSlotFPC',
+    'jnxACX500ACSlotFEB',
+    'jnxACX500ACSlotRE',
+    'jnxACX500ACSlotPower',
+    'jnxSlotACX500DC',
+    'jnxACX500DCSlotFPC',
+    'jnxACX500DCSlotFEB',
+    'jnxACX500DCSlotRE',
+    'jnxACX500DCSlotPower',
+    'jnxSlotACX500OAC',
+    'jnxACX500OACSlotFPC',
+    'jnxACX500OACSlotFEB',
+    'jnxACX500OACSlotRE',
+    'jnxACX500OACSlotPower',
+    'jnxSlotACX500ODC',
+    'jnxACX500ODCSlotFPC',
+    'jnxACX500ODCSlotFEB',
+    'jnxACX500ODCSlotRE',
+    'jnxACX500ODCSlotPower',
+    'jnxSlotACX500OPOEAC',
+    'jnxACX500OPOEACSlotFPC',
+    'jnxACX500OPOEACSlotFEB',
+    'jnxACX500OPOEACSlotRE',
+    'jnxACX500OPOEACSlotPower',
+    'jnxSlotACX500OPOEDC',
+    'jnxACX500OPOEDCSlotFPC',
+    'jnxACX500OPOEDCSlotFEB',
+    'jnxACX500OPOEDCSlotRE',
+    'jnxACX500OPOEDCSlotPower',
+    'jnxSlotSatelliteDevice',
+    'jnxSatelliteDeviceSlotFPC',
+    'jnxSatelliteDeviceSlotPower',
+    'jnxSatelliteDeviceSlotFan',
+    'jnxSlotACX5048',
+    'jnxACX5048SlotFPC',
+    'jnxACX5048SlotHM',
+    'jnxACX5048SlotPower',
+    'jnxACX5048SlotFan',
+    'jnxACX5048SlotFPB',
+    'jnxSlotACX5096',
+    'jnxACX5096SlotFPC',
+    'jnxACX5096SlotHM',
+    'jnxACX5096SlotPower',
+    'jnxACX5096SlotFan',
+    'jnxACX5096SlotFPB',
+    'jnxSlotLN1000CC',
+    'jnxLN1000CCSlotFPC',
+    'jnxLN1000CCSlotRE',
+    'jnxLN1000CCSlotPower',
+    'jnxLN1000CCSlotFan',
+    'jnxSlotVSRX',
+    'jnxVSRXSlotFPC',
+    'jnxVSRXSlotRE',
+    'jnxVSRXSlotPower',
+    'jnxVSRXSlotFan',
+    'jnxSlotJ2300',
+    'jnxJ2300SlotFPC',
+    'jnxJ2300SlotRE',
+    'jnxJ2300SlotFan',
+    'jnxSlotPTX1000',
+    'jnxPTX1000SlotFPC',
+    'jnxPTX1000SlotHM',
+    'jnxPTX1000SlotPower',
+    'jnxPTX1000SlotFan',
+    'jnxPTX1000SlotFPB',
+    'jnxSlotEX3400',
+    'jnxEX3400SlotFPC',
+    'jnxEX3400SlotPower',
+    'jnxEX3400SlotFan',
+    'jnxSlotEX2300',
+    'jnxEX2300SlotFPC',
+    'jnxEX2300SlotPower',
+    'jnxEX2300SlotFan',
+    'jnxSlotSRX300',
+    'jnxSRX300SlotFPC',
+    'jnxSRX300SlotRE',
+    'jnxSRX300SlotPower',
+    'jnxSRX300SlotFan',
+    'jnxSlotSRX320',
+    'jnxSRX320SlotFPC',
+    'jnxSRX320SlotRE',
+    'jnxSRX320SlotPower',
+    'jnxSRX320SlotFan',
+    'jnxSlotSRX340',
+    'jnxSRX340SlotFPC',
+    'jnxSRX340SlotRE',
+    'jnxSRX340SlotPower',
+    'jnxSRX340SlotFan',
+    'jnxSlotSRX345',
+    'jnxSRX345SlotFPC',
+    'jnxSRX345SlotRE',
+    'jnxSRX345SlotPower',
+    'jnxSRX345SlotFan',
+    'jnxSlotSRX1500',
+    'jnxSRX1500SlotFPC',
+    'jnxSRX1500SlotRE',
+    'jnxSRX1500SlotPower',
+    'jnxSRX1500SlotFan',
+    'jnxSlotMX10002',
+    'jnxMX10002SlotHM',
+    'jnxMX10002SlotFPC',
+    'jnxMX10002SlotFan',
+    'jnxMX10002SlotSPMB',
+    'jnxMX10002SlotPSM',
+    'jnxSlotJ4300',
+    'jnxJ4300SlotFPC',
+    'jnxJ4300SlotRE',
+    'jnxJ4300SlotFan',
+    'jnxSlotSRX4600',
+    'jnxSRX4600SlotHM',
+    'jnxSRX4600SlotFPC',
+    'jnxSRX4600SlotFan',
+    'jnxSRX4600SlotSPMB',
+    'jnxSRX4600SlotPSM',
+    'jnxSlotSRX4800',
+    'jnxSRX4800SlotHM',
+    'jnxSRX4800SlotFPC',
+    'jnxSRX4800SlotFan',
+    'jnxSRX4800SlotSPMB',
+    'jnxSRX4800SlotPSM',
+    'jnxSlotSRX4100',
+    'jnxSRX4100SlotFPC',
+    'jnxSRX4100SlotRE',
+    'jnxSRX4100SlotPower',
+    'jnxSRX4100SlotFan',
+    'jnxSlotSRX4200',
+    'jnxSRX4200SlotFPC',
+    'jnxSRX4200SlotRE',
+    'jnxSRX4200SlotPower',
+    'jnxSRX4200SlotFan',
+    'jnxSlotJ6300',
+    'jnxJ6300SlotFPC',
+    'jnxJ6300SlotRE',
+    'jnxJ6300SlotFan',
+    'jnxSlotIRM',
+    'jnxIRMSlotFPC',
+    'jnxIRMSlotCFEB',
+    'jnxIRMSlotRE',
+    'jnxIRMSlotPower',
+    'jnxSlotTX',
+    'jnxTXSlotSIB',
+    'jnxTXSlotHM',
+    'jnxTXSlotPower',
+    'jnxTXSlotFan',
+    'jnxTXSlotCB',
+    'jnxTXSlotFPB',
+    'jnxTXSlotCIP',
+    'jnxTXSlotSPMB',
+    'jnxTXSlotLCC',
+    'jnxSlotM120',
+    'jnxM120SlotFPC',
+    'jnxM120SlotFEB',
+    'jnxM120SlotHM',
+    'jnxM120SlotPower',
+    'jnxM120SlotFan',
+    'jnxM120SlotCB',
+    'jnxM120SlotFPB',
+    'jnxSlotJ4350',
+    'jnxJ4350SlotFPC',
+    'jnxJ4350SlotRE',
+    'jnxJ4350SlotPower',
+    'jnxJ4350SlotFan',
+    'jnxSlotM20',
+    'jnxM20SlotFPC',
+    'jnxM20SlotSSB',
+    'jnxM20SlotRE',
+    'jnxM20SlotPower',
+    'jnxM20SlotFan',
+    'jnxM20SlotFrontPanel',
+    'jnxSlotJ6350',
+    'jnxJ6350SlotFPC',
+    'jnxJ6350SlotRE',
+    'jnxJ6350SlotPower',
+    'jnxJ6350SlotFan',
+    'jnxSlotMX960',
+    'jnxMX960SlotFPC',
+    'jnxMX960SlotHM',
+    'jnxMX960SlotPower',
+    'jnxMX960SlotFan',
+    'jnxMX960SlotCB',
+    'jnxMX960SlotFPB',
+    'jnxSlotJ4320',
+    'jnxJ4320SlotFPC',
+    'jnxJ4320SlotRE',
+    'jnxSlotJ2320',
+    'jnxJ2320SlotFPC',
+    'jnxJ2320SlotRE',
+    'jnxJ2320SlotPower',
+    'jnxJ2320SlotFan',
+    'jnxSlotJ2350',
+    'jnxJ2350SlotFPC',
+    'jnxJ2350SlotRE',
+    'jnxJ2350SlotPower',
+    'jnxJ2350SlotFan',
+    'jnxSlotMX480',
+    'jnxMX480SlotFPC',
+    'jnxMX480SlotHM',
+    'jnxMX480SlotPower',
+    'jnxMX480SlotFan',
+    'jnxMX480SlotCB',
+    'jnxMX480SlotFPB',
+    'jnxSlotSRX5800',
+    'jnxSRX5800SlotFPC',
+    'jnxSRX5800SlotHM',
+    'jnxSRX5800SlotPower',
+    'jnxSRX5800SlotFan',
+    'jnxSRX5800SlotCB',
+    'jnxSRX5800SlotFPB',
+    'jnxSlotT1600',
+    'jnxT1600SlotFPC',
+    'jnxT1600SlotSPMB',
+    'jnxT1600SlotPSD',
+    'jnxT1600SlotSIB',
+    'jnxT1600SlotHM',
+    'jnxT1600SlotSCG',
+    'jnxT1600SlotPower',
+    'jnxT1600SlotFan',
+    'jnxT1600SlotCB',
+    'jnxT1600SlotFPB',
+    'jnxT1600SlotCIP',
+    'jnxSlotSRX5600',
+    'jnxSRX5600SlotFPC',
+    'jnxSRX5600SlotHM',
+    'jnxSRX5600SlotPower',
+    'jnxSRX5600SlotFan',
+    'jnxSRX5600SlotCB',
+    'jnxSRX5600SlotFPB',
+    'jnxSlotMX240',
+    'jnxMX240SlotFPC',
+    'jnxMX240SlotHM',
+    'jnxMX240SlotPower',
+    'jnxMX240SlotFan',
+    'jnxMX240SlotCB',
+    'jnxMX240SlotFPB',
+    'jnxSlotM160',
+    'jnxM160SlotFPC',
+    'jnxM160SlotSFM',
+    'jnxM160SlotHM',
+    'jnxM160SlotPCG',
+    'jnxM160SlotPower',
+    'jnxM160SlotFan',
+    'jnxM160SlotMCS',
+    'jnxM160SlotFPM',
+    'jnxM160SlotCIP',
+    'jnxSlotEX3200',
+    'jnxEX3200SlotFPC',
+    'jnxEX3200SlotPower',
+    'jnxEX3200SlotFan',
+    'jnxEX3200SlotRE',
+    'jnxSlotEX4200',
+    'jnxEX4200SlotFPC',
+    'jnxEX4200SlotPower',
+    'jnxEX4200SlotFan',
+    'jnxSlotEX8208',
+    'jnxEX8208SlotFPC',
+    'jnxEX8208Slot48S',
+    'jnxEX8208Slot48T',
+    'jnxEX8208Slot8XS',
+    'jnxEX8208HM',
+    'jnxEX8208SlotPower',
+    'jnxEX8208SlotFan',
+    'jnxEX8208SlotFT',
+    'jnxEX8208SlotCBD',
+    'jnxSlotEX8216',
+    'jnxEX8216SlotFPC',
+    'jnxEX8216Slot48S',
+    'jnxEX8216Slot48T',
+    'jnxEX8216Slot8XS',
+    'jnxEX8216SIB',
+    'jnxEX8216HM',
+    'jnxEX8216SlotPower',
+    'jnxEX8216SlotFan',
+    'jnxEX8216SlotFT',
+    'jnxEX8216SlotRFT',
+    'jnxEX8216SlotCBD',
+    'jnxSlotSRX3600',
+    'jnxSRX3600SlotFPC',
+    'jnxSRX3600SlotHM',
+    'jnxSRX3600SlotPower',
+    'jnxSRX3600SlotFan',
+    'jnxSRX3600SlotCB',
+    'jnxSRX3600SlotFPB',
+    'jnxSlotSRX3400',
+    'jnxSRX3400SlotFPC',
+    'jnxSRX3400SlotHM',
+    'jnxSRX3400SlotPower',
+    'jnxSRX3400SlotFan',
+    'jnxSRX3400SlotCB',
+    'jnxSRX3400SlotFPB',
+    'jnxSlotSRX210',
+    'jnxSRX210SlotFPC',
+    'jnxSRX210SlotRE',
+    'jnxSRX210SlotPower',
+    'jnxSRX210SlotFan',
+    'jnxSlotTXP',
+    'jnxTXPSlotSIB',
+    'jnxTXPSlotSFC',
+    'jnxTXPSlotHM',
+    'jnxTXPSlotPower',
+    'jnxTXPSlotFan',
+    'jnxTXPSlotCB',
+    'jnxTXPSlotFPB',
+    'jnxTXPSlotCIP',
+    'jnxTXPSlotSPMB',
+    'jnxTXPSlotLCC',
+    'jnxSlotJCS',
+    'jnxJCSSlotHM',
+    'jnxJCSSlotFPC',
+    'jnxSlotSRX240',
+    'jnxSRX240SlotFPC',
+    'jnxSRX240SlotRE',
+    'jnxSRX240SlotPower',
+    'jnxSRX240SlotFan',
+    'jnxSlotM10',
+    'jnxM10SlotFPC',
+    'jnxM10SlotFEB',
+    'jnxM10SlotRE',
+    'jnxM10SlotPower',
+    'jnxM10SlotFan',
+    'jnxSlotSRX650',
+    'jnxSRX650SlotFPC',
+    'jnxSRX650SlotRE',
+    'jnxSRX650SlotPower',
+    'jnxSRX650SlotFan',
+    'jnxSlotSRX100',
+    'jnxSRX100SlotFPC',
+    'jnxSRX100SlotRE',
+    'jnxSRX100SlotPower',
+    'jnxSRX100SlotFan',
+    'jnxSlotLN1000V',
+    'jnxLN1000VSlotFPC',
+    'jnxLN1000VSlotRE',
+    'jnxLN1000VSlotPower',
+    'jnxLN1000VSlotFan',
+    'jnxSlotEX2200',
+    'jnxEX2200SlotFPC',
+    'jnxEX2200SlotPower',
+    'jnxEX2200SlotFan',
+    'jnxEX2200SlotRE',
+    'jnxSlotEX4500',
+    'jnxEX4500SlotFPC',
+    'jnxEX4500SlotPower',
+    'jnxEX4500SlotFan',
+    'jnxEX4500SlotRE',
+    'jnxSlotIBM4274M02J02M',
+    'jnxIBM4274M02J02MSlotFPC',
+    'jnxIBM4274M02J02MSlotHM',
+    'jnxIBM4274M02J02MSlotPower',
+    'jnxIBM4274M02J02MSlotFan',
+    'jnxIBM4274M02J02MSlotCB',
+    'jnxIBM4274M02J02MSlotFPB',
+    'jnxSlotIBM4274M06J06M',
+    'jnxIBM4274M06J06MSlotFPC',
+    'jnxIBM4274M06J06MSlotHM',
+    'jnxIBM4274M06J06MSlotPower',
+    'jnxIBM4274M06J06MSlotFan',
+    'jnxIBM4274M06J06MSlotCB',
+    'jnxIBM4274M06J06MSlotFPB',
+    'jnxSlotIBM4274M11J11M',
+    'jnxIBM4274M11J11MSlotFPC',
+    'jnxIBM4274M11J11MSlotHM',
+    'jnxIBM4274M11J11MSlotPower',
+    'jnxIBM4274M11J11MSlotFan',
+    'jnxIBM4274M11J11MSlotCB',
+    'jnxIBM4274M11J11MSlotFPB',
+    'jnxSlotSRX1400',
+    'jnxSRX1400SlotFPC',
+    'jnxSRX1400SlotHM',
+    'jnxSRX1400SlotPower',
+    'jnxSRX1400SlotFan',
+    'jnxSRX1400SlotCB',
+    'jnxSRX1400SlotFPB',
+    'jnxSlotM5',
+    'jnxM5SlotFPC',
+    'jnxM5SlotFEB',
+    'jnxM5SlotRE',
+    'jnxM5SlotPower',
+    'jnxM5SlotFan',
+    'jnxSlotIBM4274S58J58S',
+    'jnxIBM4274S58J58SSlotFPC',
+    'jnxIBM4274S58J58SSlotHM',
+    'jnxIBM4274S58J58SSlotPower',
+    'jnxIBM4274S58J58SSlotFan',
+    'jnxIBM4274S58J58SSlotCB',
+    'jnxIBM4274S58J58SSlotFPB',
+    'jnxSlotIBM4274S56J56S',
+    'jnxIBM4274S56J56SSlotFPC',
+    'jnxIBM4274S56J56SSlotHM',
+    'jnxIBM4274S56J56SSlotPower',
+    'jnxIBM4274S56J56SSlotFan',
+    'jnxIBM4274S56J56SSlotCB',
+    'jnxIBM4274S56J56SSlotFPB',
+    'jnxSlotIBM4274S36J36S',
+    'jnxIBM4274S36J36SSlotFPC',
+    'jnxIBM4274S36J36SSlotHM',
+    'jnxIBM4274S36J36SSlotPower',
+    'jnxIBM4274S36J36SSlotFan',
+    'jnxIBM4274S36J36SSlotCB',
+    'jnxIBM4274S36J36SSlotFPB',
+    'jnxSlotIBM4274S34J34S',
+    'jnxIBM4274S34J34SSlotFPC',
+    'jnxIBM4274S34J34SSlotHM',
+    'jnxIBM4274S34J34SSlotPower',
+    'jnxIBM4274S34J34SSlotFan',
+    'jnxIBM4274S34J34SSlotCB',
+    'jnxIBM4274S34J34SSlotFPB',
+    'jnxSlotIBM427348EJ48E',
+    'jnxIBM427348EJ48ESlotFPC',
+    'jnxIBM427348EJ48ESlotPower',
+    'jnxIBM427348EJ48ESlotFan',
+    'jnxSlotIBM4274E08J08E',
+    'jnxIBM4274E08J08ESlotFPC',
+    'jnxIBM4274E08J08ESlot48S',
+    'jnxIBM4274E08J08ESlot48T',
+    'jnxIBM4274E08J08ESlot8XS',
+    'jnxIBM4274E08J08EHM',
+    'jnxIBM4274E08J08ESlotPower',
+    'jnxIBM4274E08J08ESlotFan',
+    'jnxIBM4274E08J08ESlotFT',
+    'jnxIBM4274E08J08ESlotCBD',
+    'jnxSlotIBM4274E16J16E',
+    'jnxIBM4274E16J16ESlotFPC',
+    'jnxIBM4274E16J16ESlot48S',
+    'jnxIBM4274E16J16ESlot48T',
+    'jnxIBM4274E16J16ESlot8XS',
+    'jnxIBM4274E16J16ESIB',
+    'jnxIBM4274E16J16EHM',
+    'jnxIBM4274E16J16ESlotPower',
+    'jnxIBM4274E16J16ESlotFan',
+    'jnxIBM4274E16J16ESlotFT',
+    'jnxIBM4274E16J16ESlotRFT',
+    'jnxIBM4274E16J16ESlotCBD',
+    'jnxSlotMX80',
+    'jnxMX80SlotFPC',
+    'jnxMX80SlotCFEB',
+    'jnxMX80SlotRE',
+    'jnxMX80SlotPower',
+    'jnxMX80SlotFan',
+    'jnxSlotSRX220',
+    'jnxSRX220SlotFPC',
+    'jnxSRX220SlotRE',
+    'jnxSRX220SlotPower',
+    'jnxSRX220SlotFan',
+    'jnxSlotEXXRE',
+    'jnxEXXRESlotPower',
+    'jnxEXXRESlotFan',
+    'jnxEXXRESlotHM',
+    'jnxEXXRESlotLCC',
+    'jnxSlotT640',
+    'jnxT640SlotFPC',
+    'jnxT640SlotSPMB',
+    'jnxT640SlotPSD',
+    'jnxT640SlotSIB',
+    'jnxT640SlotHM',
+    'jnxT640SlotSCG',
+    'jnxT640SlotPower',
+    'jnxT640SlotFan',
+    'jnxT640SlotCB',
+    'jnxT640SlotFPB',
+    'jnxT640SlotCIP',
+    'jnxSlotQFXInterconnect',
+    'jnxQFXInterconnectSlotFPC',
+    'jnxQFXInterconnectSlotHM',
+    'jnxQFXInterconnectSlotPower',
+    'jnxQFXInterconnectSlotFan',
+    'jnxQFXInterconnectSlotCBD',
+    'jnxQFXInterconnectSlotFPB',
+    'jnxSlotQFXNode',
+    'jnxQFXNodeSlotFPC',
+    'jnxQFXNodeSlotHM',
+    'jnxQFXNodeSlotPower',
+    'jnxQFXNodeSlotFan',
+    'jnxQFXNodeSlotFPB',
+    'jnxSlotQFXJVRE',
+    'jnxQFXJVRESlotFPC',
+    'jnxQFXJVRESlotHM',
+    'jnxQFXJVRESlotPower',
+    'jnxQFXJVRESlotFan',
+    'jnxQFXJVRESlotFPB',
+    'jnxSlotEX4300',
+    'jnxEX4300SlotFPC',
+    'jnxEX4300SlotPower',
+    'jnxEX4300SlotFan',
+    'jnxSlotSRX110',
+    'jnxSRX110SlotFPC',
+    'jnxSRX110SlotRE',
+    'jnxSRX110SlotPower',
+    'jnxSRX110SlotFan',
+    'jnxSlotSRX120',
+    'jnxSRX120SlotFPC',
+    'jnxSRX120SlotRE',
+    'jnxSRX120SlotPower',
+    'jnxSRX120SlotFan',
+    'jnxSlotMAG8600',
+    'jnxMAG8600SlotFPC',
+    'jnxMAG8600SlotRE',
+    'jnxMAG8600SlotPower',
+    'jnxMAG8600SlotFan',
+    'jnxMAG8600SlotCB',
+    'jnxSlotMAG6611',
+    'jnxMAG6611SlotFPC',
+    'jnxMAG6611SlotRE',
+    'jnxMAG6611SlotPower',
+    'jnxMAG6611SlotFan',
+    'jnxMAG6611SlotCB',
+    'jnxSlotMAG6610',
+    'jnxMAG6610SlotFPC',
+    'jnxMAG6610SlotRE',
+    'jnxMAG6610SlotPower',
+    'jnxMAG6610SlotFan',
+    'jnxMAG6610SlotCB',
+    'jnxSlotPTX5000',
+    'jnxPTX5000SlotSIB',
+    'jnxPTX5000SlotCCG',
+    'jnxPTX5000SlotPIC',
+    'jnxPTX5000SlotHM',
+    'jnxPTX5000SlotFPC',
+    'jnxPTX5000SlotFan',
+    'jnxPTX5000SlotCB',
+    'jnxPTX5000SlotFPB',
+    'jnxPTX5000SlotSPMB',
+    'jnxPTX5000SlotPDU',
+    'jnxPTX5000SlotPSM',
+    'jnxSlotT320',
+    'jnxT320SlotFPC',
+    'jnxT320SlotSPMB',
+    'jnxT320SlotPSD',
+    'jnxT320SlotSIB',
+    'jnxT320SlotHM',
+    'jnxT320SlotSCG',
+    'jnxT320SlotPower',
+    'jnxT320SlotFan',
+    'jnxT320SlotCB',
+    'jnxT320SlotFPB',
+    'jnxT320SlotCIP',
+    'jnxSlotPTX9000',
+    'jnxPTX9000SlotSIB',
+    'jnxPTX9000SlotCCG',
+    'jnxPTX9000SlotPIC',
+    'jnxPTX9000SlotHM',
+    'jnxPTX9000SlotFPC',
+    'jnxPTX9000SlotFan',
+    'jnxPTX9000SlotCB',
+    'jnxPTX9000SlotFPB',
+    'jnxPTX9000SlotSPMB',
+    'jnxPTX9000SlotPDU',
+    'jnxPTX9000SlotPSM',
+    'jnxSlotIBM0719J45E',
+    'jnxIBM0719J45ESlotFPC',
+    'jnxIBM0719J45ESlotPower',
+    'jnxIBM0719J45ESlotFan',
+    'jnxIBM0719J45ESlotRE',
+    'jnxSlotIBMJ08F',
+    'jnxIBMJ08FSlotFPC',
+    'jnxIBMJ08FSlotHM',
+    'jnxIBMJ08FSlotPower',
+    'jnxIBMJ08FSlotFan',
+    'jnxIBMJ08FSlotCBD',
+    'jnxIBMJ08FSlotFPB',
+    'jnxSlotIBMJ52F',
+    'jnxIBMJ52FSlotFPC',
+    'jnxIBMJ52FSlotHM',
+    'jnxIBMJ52FSlotPower',
+    'jnxIBMJ52FSlotFan',
+    'jnxIBMJ52FSlotFPB',
+    'jnxSlotEX6210',
+    'jnxEX6210SlotFPC',
+    'jnxEX6210Slot48P',
+    'jnxEX6210Slot48T',
+    'jnxEX6210HM',
+    'jnxEX6210SlotPower',
+    'jnxEX6210SlotFan',
+    'jnxEX6210SlotFT',
+    'jnxEX6210SlotCBD',
+    'jnxSlotDellJFX3500',
+    'jnxDellJFX3500SlotFPC',
+    'jnxDellJFX3500SlotHM',
+    'jnxDellJFX3500SlotPower',
+    'jnxDellJFX3500SlotFan',
+    'jnxDellJFX3500SlotFPB',
+    'jnxSlotEX3300',
+    'jnxEX3300SlotFPC',
+    'jnxEX3300SlotPower',
+    'jnxEX3300SlotFan',
+    'jnxSlotDELLJSRX3600',
+    'jnxDELLJSRX3600SlotFPC',
+    'jnxDELLJSRX3600SlotHM',
+    'jnxDELLJSRX3600SlotPower',
+    'jnxDELLJSRX3600SlotFan',
+    'jnxDELLJSRX3600SlotCB',
+    'jnxDELLJSRX3600SlotFPB',
+    'jnxSlotDELLJSRX3400',
+    'jnxDELLJSRX3400SlotFPC',
+    'jnxDELLJSRX3400SlotHM',
+    'jnxDELLJSRX3400SlotPower',
+    'jnxDELLJSRX3400SlotFan',
+    'jnxDELLJSRX3400SlotCB',
+    'jnxDELLJSRX3400SlotFPB',
+    'jnxSlotDELLJSRX1400',
+    'jnxDELLJSRX1400SlotFPC',
+    'jnxDELLJSRX1400SlotHM',
+    'jnxDELLJSRX1400SlotPower',
+    'jnxDELLJSRX1400SlotFan',
+    'jnxDELLJSRX1400SlotCB',
+    'jnxDELLJSRX1400SlotFPB',
+    'jnxSlotM40e',
+    'jnxM40eSlotFPC',
+    'jnxM40eSlotSFM',
+    'jnxM40eSlotHM',
+    'jnxM40eSlotPCG',
+    'jnxM40eSlotPower',
+    'jnxM40eSlotFan',
+    'jnxM40eSlotMCS',
+    'jnxM40eSlotFPM',
+    'jnxM40eSlotCIP',
+    'jnxSlotDELLJSRX5800',
+    'jnxDELLJSRX5800SlotFPC',
+    'jnxDELLJSRX5800SlotHM',
+    'jnxDELLJSRX5800SlotPower',
+    'jnxDELLJSRX5800SlotFan',
+    'jnxDELLJSRX5800SlotCB',
+    'jnxDELLJSRX5800SlotFPB',
+    'jnxSlotDELLJSRX5600',
+    'jnxDELLJSRX5600SlotFPC',
+    'jnxDELLJSRX5600SlotHM',
+    'jnxDELLJSRX5600SlotPower',
+    'jnxDELLJSRX5600SlotFan',
+    'jnxDELLJSRX5600SlotCB',
+    'jnxDELLJSRX5600SlotFPB',
+    'jnxSlotQFXSwitch',
+    'jnxQFXSwitchSlotFPC',
+    'jnxQFXSwitchSlotHM',
+    'jnxQFXSwitchSlotPower',
+    'jnxQFXSwitchSlotFan',
+    'jnxQFXSwitchSlotFPB',
+    'jnxQFXSwitchSlotCBD',
+    'jnxQFXSwitchSlotSIB',
+    'jnxSlotT4000',
+    'jnxT4000SlotFPC',
+    'jnxT4000SlotSPMB',
+    'jnxT4000SlotPSD',
+    'jnxT4000SlotSIB',
+    'jnxT4000SlotHM',
+    'jnxT4000SlotSCG',
+    'jnxT4000SlotPower',
+    'jnxT4000SlotFan',
+    'jnxT4000SlotCB',
+    'jnxT4000SlotFPB',
+    'jnxT4000SlotCIP',
+    'jnxSlotSRX550',
+    'jnxSRX550SlotFPC',
+    'jnxSRX550SlotRE',
+    'jnxSRX550SlotPower',
+    'jnxSRX550SlotFan',
+    'jnxSlotACX',
+    'jnxACXSlotFPC',
+    'jnxACXSlotFEB',
+    'jnxACXSlotRE',
+    'jnxACXSlotPower',
+    'jnxACXSlotFan',
+    'jnxSlotMX40',
+    'jnxMX40SlotFPC',
+    'jnxMX40SlotCFEB',
+    'jnxMX40SlotRE',
+    'jnxMX40SlotPower',
+    'jnxMX40SlotFan',
+    'jnxSlotMX10',
+    'jnxMX10SlotFPC',
+    'jnxMX10SlotCFEB',
+    'jnxMX10SlotRE',
+    'jnxMX10SlotPower',
+    'jnxMX10SlotFan',
+    'jnxSlotM320',
+    'jnxM320SlotFPC',
+    'jnxM320SlotSIB',
+    'jnxM320SlotHM',
+    'jnxM320SlotPower',
+    'jnxM320SlotFan',
+    'jnxM320SlotCB',
+    'jnxM320SlotFPB',
+    'jnxM320SlotCIP',
+    'jnxSlotMX5',
+    'jnxMX5SlotFPC',
+    'jnxMX5SlotCFEB',
+    'jnxMX5SlotRE',
+    'jnxMX5SlotPower',
+    'jnxMX5SlotFan',
+    'jnxSlotQFXMInterconnect',
+    'jnxQFXMInterconnectSlotFPC',
+    'jnxQFXMInterconnectSlotHM',
+    'jnxQFXMInterconnectSlotPower',
+    'jnxQFXMInterconnectSlotFan',
+    'jnxQFXMInterconnectSlotFPB',
+    'jnxSlotEX4550',
+    'jnxEX4550SlotFPC',
+    'jnxEX4550SlotPower',
+    'jnxEX4550SlotFan',
+    'jnxEX4550SlotRE',
+    'jnxSlotMX2020',
+    'jnxMX2020SlotSFB',
+    'jnxMX2020SlotADC',
+    'jnxMX2020SlotHM',
+    'jnxMX2020SlotFPC',
+    'jnxMX2020SlotFan',
+    'jnxMX2020SlotCB',
+    'jnxMX2020SlotFPB',
+    'jnxMX2020SlotSPMB',
+    'jnxMX2020SlotPDM',
+    'jnxMX2020SlotPSM',
+    'jnxSlotVseries',
+    'jnxVseriesSlotFPC',
+    'jnxVseriesSlotRE',
+    'jnxVseriesSlotPower',
+    'jnxVseriesSlotFan',
+    'jnxSlotLN2600',
+    'jnxLN2600SlotFPC',
+    'jnxLN2600SlotRE',
+    'jnxLN2600SlotPower',
+    'jnxLN2600SlotFan',
+    'jnxSlotFireflyPerimeter',
+    'jnxFireflyPerimeterSlotFPC',
+    'jnxFireflyPerimeterSlotRE',
+    'jnxFireflyPerimeterSlotPower',
+    'jnxFireflyPerimeterSlotFan',
+    'jnxSlotMX104',
+    'jnxMX104SlotFPC',
+    'jnxMX104SlotAFEB',
+    'jnxMX104SlotRE',
+    'jnxMX104SlotPower',
+    'jnxMX104SlotFan',
+    'jnxMX104SlotFPM',
+    'jnxSlotPTX3000',
+    'jnxPTX3000SlotSIB',
+    'jnxPTX3000SlotHM',
+    'jnxPTX3000SlotFPC',
+    'jnxPTX3000SlotFan',
+    'jnxPTX3000SlotCB',
+    'jnxPTX3000SlotFPB',
+    'jnxPTX3000SlotPSM',
+    'jnxPTX3000SlotPIC',
+    'jnxSlotMX2010',
+    'jnxMX2010SlotSFB',
+    'jnxMX2010SlotADC',
+    'jnxMX2010SlotHM',
+    'jnxMX2010SlotFPC',
+    'jnxMX2010SlotFan',
+    'jnxMX2010SlotCB',
+    'jnxMX2010SlotFPB',
+    'jnxMX2010SlotSPMB',
+    'jnxMX2010SlotPDM',
+    'jnxMX2010SlotPSM',
+    'jnxMediaCardSpace',
+    'jnxMediaCardSpaceM40',
+    'jnxMediaCardSpacePIC',
+    'jnxMediaCardSpaceM7i',
+    'jnxM7iMediaCardSpacePIC',
+    'jnxMediaCardSpaceLN2800',
+    'jnxLN2800MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX9214',
+    'jnxEX9214MediaCardSpacePIC',
+    'jnxEX9214MediaCardSpaceMIC',
+    'jnxMediaCardSpaceEX9208',
+    'jnxEX9208MediaCardSpacePIC',
+    'jnxEX9208MediaCardSpaceMIC',
+    'jnxMediaCardSpaceEX9204',
+    'jnxEX9204MediaCardSpacePIC',
+    'jnxEX9204MediaCardSpaceMIC',
+    'jnxMediaCardSpaceSRX5400',
+    'jnxSRX5400MediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274S54J54S',
+    'jnxIBM4274S54J54SMediaCardSpacePIC',
+    'jnxMediaCardSpaceDELLJSRX5400',
+    'jnxDELLJSRX5400MediaCardSpacePIC',
+    'jnxMediaCardSpaceVMX',
+    'jnxVMXMediaCardSpacePIC',
+    'jnxVMXMediaCardSpaceMIC',
+    'jnxMediaCardSpaceEX4600',
+    'jnxEX4600MediaCardSpacePIC',
+    'jnxMediaCardSpaceM10i',
+    'jnxM10iMediaCardSpacePIC',
+    'jnxMediaCardSpaceACX1000',
+    'jnxACX1000MediaCardSpacePIC',
+    'jnxACX1000MediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX2000',
+    'jnxACX2000MediaCardSpacePIC',
+    'jnxACX2000MediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX1100',
+    'jnxACX1100MediaCardSpacePIC',
+    'jnxACX1100MediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX2100',
+    'jnxACX2100MediaCardSpacePIC',
+    'jnxACX2100MediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX2200',
+    'jnxACX2200MediaCardSpacePIC',
+    'jnxACX2200MediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX4000',
+    'jnxACX4000MediaCardSpacePIC',
+    'jnxACX4000MediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX500AC',
+    'jnxACX500ACMediaCardSpacePIC',
+    'jnxACX500ACMediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX500DC',
+    'jnxACX500DCMediaCardSpacePIC',
+    'jnxACX500DCMediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX500OAC',
+    'jnxACX500OACMediaCardSpacePIC',
+    'jnxACX500OACMediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX500ODC',
+    'jnxACX500ODCMediaCardSpacePIC',
+    'jnxACX500ODCMediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX500OPOEAC',
+    'jnxACX500OPOEACMediaCardSpacePIC',
+    'jnxACX500OPOEACMediaCardSpaceMIC',
+    'jnxMediaCardSpaceACX500OPOEDC',
+    'jnxACX500OPOEDCMediaCardSpacePIC',
+    'jnxACX500OPOEDCMediaCardSpaceMIC',
+    'jnxMediaCardSpaceSatelliteDevice',
+    'jnxSatelliteDeviceMediaCardSpacePIC',
+    'jnxMediaCardSpaceACX5048',
+    'jnxACX5048MediaCardSpacePIC',
+    'jnxMediaCardSpaceACX5096',
+    'jnxACX5096MediaCardSpacePIC',
+    'jnxMediaCardSpaceLN1000CC',
+    'jnxLN1000CCMediaCardSpacePIC',
+    'jnxMediaCardSpaceVSRX',
+    'jnxVSRXMediaCardSpacePIC',
+    'jnxMediaCardSpaceJ2300',
+    'jnxJ2300MediaCardSpacePIC',
+    'jnxMediaCardSpacePTX1000',
+    'jnxPTX1000MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX3400',
+    'jnxEX3400MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX2300',
+    'jnxEX2300MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX300',
+    'jnxSRX300MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX320',
+    'jnxSRX320MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX340',
+    'jnxSRX340MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX345',
+    'jnxSRX345MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX1500',
+    'jnxSRX1500MediaCardSpacePIC',
+    'jnxMediaCardSpaceMX10002',
+    'jnxMX10002MediaCardSpacePIC',
+    'jnxMX10002MediaCardSpaceMIC',
+    'jnxMediaCardSpaceJ4300',
+    'jnxJ4300MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX4600',
+    'jnxSRX4600MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX4800',
+    'jnxSRX4800MediaCardSpacePIC',
+    'jnxSRX4800MediaCardSpaceMIC',
+    'jnxMediaCardSpaceSRX4100',
+    'jnxMediaCardSpaceSRX4200',
+    'jnxSRX4100MediaCardSpacePIC',
+    'jnxMediaCardSpaceJ6300',
+    'jnxJ6300MediaCardSpacePIC',
+    'jnxMediaCardSpaceIRM',
+    'jnxIRMMediaCardSpacePIC',
+    'jnxMediaCardSpaceTX',
+    'jnxTXMediaCardSpacePIC',
+    'jnxMediaCardSpaceM120',
+    'jnxM120MediaCardSpacePIC',
+    'jnxMediaCardSpaceJ4350',
+    'jnxJ4350MediaCardSpacePIC',
+    'jnxMediaCardSpaceM20',
+    'jnxM20MediaCardSpacePIC',
+    'jnxMediaCardSpaceJ6350',
+    'jnxJ6350MediaCardSpacePIC',
+    'jnxMediaCardSpaceMX960',
+    'jnxMX960MediaCardSpacePIC',
+    'jnxMX960MediaCardSpaceMIC',
+    'jnxMediaCardSpaceJ4320',
+    'jnxJ4320MediaCardSpacePIC',
+    'jnxMediaCardSpaceJ2320',
+    'jnxJ2320MediaCardSpacePIC',
+    'jnxMediaCardSpaceJ2350',
+    'jnxJ2350MediaCardSpacePIC',
+    'jnxMediaCardSpaceMX480',
+    'jnxMX480MediaCardSpacePIC',
+    'jnxMX480MediaCardSpaceMIC',
+    'jnxMediaCardSpaceSRX5800',
+    'jnxSRX5800MediaCardSpacePIC',
+    'jnxMediaCardSpaceT1600',
+    'jnxT1600MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX5600',
+    'jnxSRX5600MediaCardSpacePIC',
+    'jnxMediaCardSpaceMX240',
+    'jnxMX240MediaCardSpacePIC',
+    'jnxMX240MediaCardSpaceMIC',
+    'jnxMediaCardSpaceM160',
+    'jnxM160MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX3200',
+    'jnxEX3200MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX4200',
+    'jnxEX4200MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX8208',
+    'jnxEX8208MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX8216',
+    'jnxEX8216MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX3600',
+    'jnxSRX3600MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX3400',
+    'jnxSRX3400MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX210',
+    'jnxSRX210MediaCardSpacePIC',
+    'jnxMediaCardSpaceTXP',
+    'jnxTXPMediaCardSpacePIC',
+    'jnxMediaCardSpaceJCS',
+    'jnxJCSMediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX240',
+    'jnxSRX240MediaCardSpacePIC',
+    'jnxMediaCardSpaceM10',
+    'jnxM10MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX650',
+    'jnxSRX650MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX100',
+    'jnxSRX100MediaCardSpacePIC',
+    'jnxMediaCardSpaceLN1000V',
+    'jnxLN1000VMediaCardSpacePIC',
+    'jnxMediaCardSpaceEX2200',
+    'jnxEX2200MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX4500',
+    'jnxEX4500MediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274M02J02M',
+    'jnxIBM4274M02J02MMediaCardSpacePIC',
+    'jnxIBM4274M02J02MMediaCardSpaceMIC',
+    'jnxMediaCardSpaceIBM4274M06J06M',
+    'jnxIBM4274M06J06MMediaCardSpacePIC',
+    'jnxIBM4274M06J06MMediaCardSpaceMIC',
+    'jnxMediaCardSpaceIBM4274M11J11M',
+    'jnxIBM4274M11J11MMediaCardSpacePIC',
+    'jnxIBM4274M11J11MMediaCardSpaceMIC',
+    'jnxMediaCardSpaceSRX1400',
+    'jnxSRX1400MediaCardSpacePIC',
+    'jnxMediaCardSpaceM5',
+    'jnxM5MediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274S58J58S',
+    'jnxIBM4274S58J58SMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274S56J56S',
+    'jnxIBM4274S56J56SMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274S36J36S',
+    'jnxIBM4274S36J36SMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274S34J34S',
+    'jnxIBM4274S34J34SMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM427348EJ48E',
+    'jnxIBM427348EJ48EMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274E08J08E',
+    'jnxIBM4274E08J08EMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM4274E16J16E',
+    'jnxIBM4274E16J16EMediaCardSpacePIC',
+    'jnxMediaCardSpaceMX80',
+    'jnxMX80MediaCardSpacePIC',
+    'jnxMX80MediaCardSpaceMIC',
+    'jnxMediaCardSpaceSRX220',
+    'jnxSRX220MediaCardSpacePIC',
+    'jnxMediaCardSpaceEXXRE',
+    'jnxEXXREMediaCardSpacePIC',
+    'jnxMediaCardSpaceT640',
+    'jnxT640MediaCardSpacePIC',
+    'jnxMediaCardSpaceQFXInterconnect',
+    'jnxQFXInterconnectMediaCardSpacePIC',
+    'jnxMediaCardSpaceQFXNode',
+    'jnxQFXNodeMediaCardSpacePIC',
+    'jnxMediaCardSpaceQFXJVRE',
+    'jnxQFXJVREMediaCardSpacePIC',
+    'jnxMediaCardSpaceEX4300',
+    'jnxEX4300MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX110',
+    'jnxSRX110MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX120',
+    'jnxSRX120MediaCardSpacePIC',
+    'jnxMediaCardSpaceMAG8600',
+    'jnxMAG8600MediaCardSpacePIC',
+    'jnxMediaCardSpaceMAG6611',
+    'jnxMAG6611MediaCardSpacePIC',
+    'jnxMediaCardSpaceMAG6610',
+    'jnxMAG6610MediaCardSpacePIC',
+    'jnxMediaCardSpacePTX5000',
+    'jnxPTX5000MediaCardSpacePIC',
+    'jnxMediaCardSpaceT320',
+    'jnxT320MediaCardSpacePIC',
+    'jnxMediaCardSpacePTX9000',
+    'jnxPTX9000MediaCardSpacePIC',
+    'jnxMediaCardSpaceIBM0719J45E',
+    'jnxIBM0719J45EMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBMJ08F',
+    'jnxIBMJ08FMediaCardSpacePIC',
+    'jnxMediaCardSpaceIBMJ52F',
+    'jnxIBMJ52FMediaCardSpacePIC',
+    'jnxMediaCardSpaceEX6210',
+    'jnxEX6210MediaCardSpacePIC',
+    'jnxMediaCardSpaceDellJFX3500',
+    'jnxDellJFX3500MediaCardSpacePIC',
+    'jnxMediaCardSpaceEX3300',
+    'jnxEX3300MediaCardSpacePIC',
+    'jnxMediaCardSpaceDELLJSRX3600',
+    'jnxDELLJSRX3600MediaCardSpacePIC',
+    'jnxMediaCardSpaceDELLJSRX3400',
+    'jnxDELLJSRX3400MediaCardSpacePIC',
+    'jnxMediaCardSpaceDELLJSRX1400',
+    'jnxDELLJSRX1400MediaCardSpacePIC',
+    'jnxMediaCardSpaceM40e',
+    'jnxM40eMediaCardSpacePIC',
+    'jnxMediaCardSpaceDELLJSRX5800',
+    'jnxDELLJSRX5800MediaCardSpacePIC',
+    'jnxMediaCardSpaceDELLJSRX5600',
+    'jnxDELLJSRX5600MediaCardSpacePIC',
+    'jnxMediaCardSpaceQFXSwitch',
+    'jnxQFXSwitchMediaCardSpacePIC',
+    'jnxMediaCardSpaceT4000',
+    'jnxT4000MediaCardSpacePIC',
+    'jnxMediaCardSpaceSRX550',
+    'jnxSRX550MediaCardSpacePIC',
+    'jnxMediaCardSpaceACX',
+    'jnxACXMediaCardSpacePIC',
+    'jnxACXMediaCardSpaceMIC',
+    'jnxMediaCardSpaceMX40',
+    'jnxMX40MediaCardSpacePIC',
+    'jnxMX40MediaCardSpaceMIC',
+    'jnxMediaCardSpaceMX10',
+    'jnxMX10MediaCardSpacePIC',
+    'jnxMX10MediaCardSpaceMIC',
+    'jnxMediaCardSpaceM320',
+    'jnxM320MediaCardSpacePIC',
+    'jnxM320MediaCardSpaceMIC',
+    'jnxMediaCardSpaceMX5',
+    'jnxMX5MediaCardSpacePIC',
+    'jnxMX5MediaCardSpaceMIC',
+    'jnxMediaCardSpaceQFXMInterconnect',
+    'jnxQFXMInterconnectMediaCardSpacePIC',
+    'jnxMediaCardSpaceEX4550',
+    'jnxEX4550MediaCardSpacePIC',
+    'jnxMediaCardSpaceMX2020',
+    'jnxMX2020MediaCardSpacePIC',
+    'jnxMX2020MediaCardSpaceMIC',
+    'jnxMediaCardSpaceLN2600',
+    'jnxLN2600MediaCardSpacePIC',
+    'jnxMediaCardSpaceFireflyPerimeter',
+    'jnxFireflyPerimeterMediaCardSpacePIC',
+    'jnxMediaCardSpaceMX104',
+    'jnxMX104MediaCardSpacePIC',
+    'jnxMX104MediaCardSpaceMIC',
+    'jnxMediaCardSpacePTX3000',
+    'jnxPTX3000MediaCardSpacePIC',
+    'jnxMediaCardSpaceMX2010',
+    'jnxMX2010MediaCardSpacePIC',
+    'jnxMX2010MediaCardSpaceMIC',
+    'jnxSubSpace',
+    'jnxSubSpaceM160',
+    'jnxM160SubSpaceSFM',
+    'jnxClassContents',
+    'jnxBackplane',
+    'jnxBackplaneM40',
+    'jnxMidplaneM7i',
+    'jnxMidplaneLN2800',
+    'jnxMidplaneEX9214',
+    'jnxMidplaneEX9208',
+    'jnxMidplaneEX9204',
+    'jnxMidplaneSRX5400',
+    'jnxMidplaneIBM4274S54J54S',
+    'jnxMidplaneDELLJSRX5400',
+    'jnxMidplaneVMX',
+    'jnxMidplaneM10i',
+    'jnxMidplaneVRR',
+    'jnxMidplaneACX1000',
+    'jnxMidplaneACX2000',
+    'jnxMidplaneACX1100',
+    'jnxMidplaneACX2100',
+    'jnxMidplaneACX2200',
+    'jnxMidplaneACX4000',
+    'jnxMidplaneACX500AC',
+    'jnxMidplaneACX500DC',
+    'jnxMidplaneACX500OAC',
+    'jnxMidplaneACX500ODC',
+    'jnxMidplaneACX500OPOEAC',
+    'jnxMidplaneACX500OPOEDC',
+    'jnxMidplaneLN1000CC',
+    'jnxMidplaneVSRX',
+    'jnxMidplaneJ2300',
+    'jnxMidplaneSRX300',
+    'jnxMidplaneSRX320',
+    'jnxMidplaneSRX340',
+    'jnxMidplaneSRX345',
+    'jnxMidplaneSRX1500',
+    'jnxMidplaneJ4300',
+    'jnxMidplaneSRX4100',
+    'jnxMidplaneSRX4200',
+    'jnxMidplaneJ6300',
+    'jnxMidplaneIRM',
+    'jnxMidplaneTX',
+    'jnxMidplaneM120',
+    'jnxMidplaneJ4350',
+    'jnxBackplaneM20',
+    'jnxMidplaneJ6350',
+    'jnxMidplaneMX960',
+    'jnxMidplaneJ4320',
+    'jnxMidplaneJ2320',
+    'jnxMidplaneJ2350',
+    'jnxMidplaneMX480',
+    'jnxMidplaneSRX5800',
+    'jnxMidplaneT1600',
+    'jnxMidplaneSRX5600',
+    'jnxMidplaneMX240',
+    'jnxMidplaneM160',
+    'jnxBackplaneEX8208',
+    'jnxMidplaneEX8216',
+    'jnxMidplaneSRX3600',
+    'jnxMidplaneSRX3400',
+    'jnxMidplaneSRX210',
+    'jnxMidplaneTXP',
+    'jnxMidplaneJCS',
+    'jnxMidplaneSRX240',
+    'jnxMidplaneM10',
+    'jnxMidplaneSRX650',
+    'jnxMidplaneSRX100',
+    'jnxMidplaneLN1000V',
+    'jnxMidplaneIBM4274M02J02M',
+    'jnxMidplaneIBM4274M06J06M',
+    'jnxMidplaneIBM4274M11J11M',
+    'jnxMidplaneSRX1400',
+    'jnxMidplaneM5',
+    'jnxMidplaneIBM4274S58J58S',
+    'jnxMidplaneIBM4274S56J56S',
+    'jnxMidplaneIBM4274S36J36S',
+    'jnxMidplaneIBM4274S34J34S',
+    'jnxBackplaneIBM4274E08J08E',
+    'jnxMidplaneIBM4274E16J16E',
+    'jnxMidplaneMX80',
+    'jnxMidplaneSRX220',
+    'jnxBackplaneEXXRE',
+    'jnxMidplaneT640',
+    'jnxMidplaneQFXInterconnect',
+    'jnxMidplaneSRX110',
+    'jnxMidplaneSRX120',
+    'jnxMidplaneMAG8600',
+    'jnxMidplaneMAG6611',
+    'jnxMidplaneMAG6610',
+    'jnxMidplanePTX5000',
+    'jnxMidplaneT320',
+    'jnxMidplanePTX9000',
+    'jnxMidplaneIBMJ08F',
+    'jnxBackplaneEX6210',
+    'jnxMidplaneDELLJSRX3600',
+    'jnxMidplaneDELLJSRX3400',
+    'jnxMidplaneDELLJSRX1400',
+    'jnxMidplaneM40e',
+    'jnxMidplaneDELLJSRX5800',
+    'jnxMidplaneDELLJSRX5600',
+    'jnxMidplaneT4000',
+    'jnxMidplaneSRX550',
+    'jnxMidplaneACX',
+    'jnxMidplaneMX40',
+    'jnxMidplaneMX10',
+    'jnxMidplaneM320',
+    'jnxMidplaneMX5',
+    'jnxBackplaneMX2020',
+    'jnxBackplaneLowerMX2020',
+    'jnxBackplaneUpperMX2020',
+    'jnxBackplaneLowerPowerMX2020',
+    'jnxBackplaneUpperPowerMX2020',
+    'jnxMidplaneVseries',
+    'jnxMidplaneLN2600',
+    'jnxMidplaneFireflyPerimeter',
+    'jnxMidplaneMX104',
+    'jnxMidplanePTX3000',
+    'jnxBackplaneMX2010',
+    'jnxBackplaneLowerMX2010',
+    'jnxBackplaneUpperMX2010',
+    'jnxBackplanePowerMX2010',
+    'jnxModule',
+    'jnxModuleM40',
+    'jnxModuleSCB',
+    'jnxModuleFPC',
+    'jnxCommonFPC',
+    'jnxOc48FPC',
+    'jnxModuleHostCtlr',
+    'jnxHostCtlrMaxi',
+    'jnxHostCtlrMini',
+    'jnxModulePowerSupply',
+    'jnxPowerSupplyAC',
+    'jnxPowerSupplyDC',
+    'jnxModuleCooling',
+    'jnxCoolingImpeller',
+    'jnxCoolingFan',
+    'jnxModuleFrontPanelDisplay',
+    'jnxModuleRoutingEngine',
+    'jnxModuleM7i',
+    'jnxM7iFPC',
+    'jnxM7iCFEB',
+    'jnxM7iRE',
+    'jnxM7iPower',
+    'jnxM7iPowerAC',
+    'jnxM7iFan',
+    'jnxModuleLN2800',
+    'jnxLN2800FPC',
+    'jnxLN2800RE',
+    'jnxLN2800Power',
+    'jnxModuleM10i',
+    'jnxM10iFPC',
+    'jnxM10iCFEB',
+    'jnxM10iRE',
+    'jnxM10iPower',
+    'jnxM10iPowerAC',
+    'jnxM10iFan',
+    'jnxM10iHCM',
+    'jnxModuleVRR',
+    'jnxVRRFPC',
+    'jnxVRRRE',
+    'jnxVRRPower',
+    'jnxVRRFan',
+    'jnxModuleACX1000',
+    'jnxACX1000FPC',
+    'jnxACX1000FEB',
+    'jnxACX1000RE',
+    'jnxACX1000Power',
+    'jnxACX1000PowerDC',
+    'jnxModuleACX2000',
+    'jnxACX2000FPC',
+    'jnxACX2000FEB',
+    'jnxACX2000RE',
+    'jnxACX2000Power',
+    'jnxACX2000PowerDC',
+    'jnxModuleACX1100',
+    'jnxACX1100FPC',
+    'jnxACX1100FEB',
+    'jnxACX1100RE',
+    'jnxACX1100Power',
+    'jnxACX1100PowerDC',
+    'jnxACX1100PowerAC',
+    'jnxModuleACX2100',
+    'jnxACX2100FPC',
+    'jnxACX2100FEB',
+    'jnxACX2100RE',
+    'jnxACX2100Power',
+    'jnxACX2100PowerDC',
+    'jnxACX2100PowerAC',
+    'jnxModuleACX2200',
+    'jnxACX2200FPC',
+    'jnxACX2200FEB',
+    'jnxACX2200RE',
+    'jnxACX2200Power',
+    'jnxACX2200PowerDC',
+    'jnxACX2200PowerAC',
+    'jnxModuleACX4000',
+    'jnxACX4000FPC',
+    'jnxACX4000FEB',
+    'jnxACX4000RE',
+    'jnxACX4000Power',
+    'jnxACX4000PowerDC',
+    'jnxACX4000PowerAC',
+    'jnxACX4000Fan',
+    'jnxModuleACX500AC',
+    'jnxACX500ACFPC',
+    'jnxACX500ACFEB',
+    'jnxACX500ACRE',
+    'jnxACX500ACPower',
+    'jnxACX500ACPowerAC',
+    'jnxModuleGeneric',
+    'jnxFPC',
+    'jnxCBD',
+    'jnxHM',
+    'jnxPCMCIACard',
+    'jnxUSBHub',
+    'jnxRCompactFlash',
+    'jnxPower',
+    'jnxFan',
+    'jnxFPB',
+    'jnxCIP',
+    'jnxSIB',
+    'jnxModuleACX500DC',
+    'jnxACX500DCFPC',
+    'jnxACX500DCFEB',
+    'jnxACX500DCRE',
+    'jnxACX500DCPower',
+    'jnxACX500DCPowerDC',
+    'jnxModuleACX500OAC',
+    'jnxACX500OACFPC',
+    'jnxACX500OACFEB',
+    'jnxACX500OACRE',
+    'jnxACX500OACPower',
+    'jnxACX500OACPowerAC',
+    'jnxModuleACX500ODC',
+    'jnxACX500ODCFPC',
+    'jnxACX500ODCFEB',
+    'jnxACX500ODCRE',
+    'jnxACX500ODCPower',
+    'jnxACX500ODCPowerDC',
+    'jnxModuleACX500OPOEAC',
+    'jnxACX500OPOEACFPC',
+    'jnxACX500OPOEACFEB',
+    'jnxACX500OPOEACRE',
+    'jnxACX500OPOEACPower',
+    'jnxACX500OPOEACPowerAC',
+    'jnxModuleACX500OPOEDC',
+    'jnxACX500OPOEDCFPC',
+    'jnxACX500OPOEDCFEB',
+    'jnxACX500OPOEDCRE',
+    'jnxACX500OPOEDCPower',
+    'jnxACX500OPOEDCPowerDC',
+    'jnxModuleVSRX',
+    'jnxVSRXFPC',
+    'jnxVSRXRE',
+    'jnxVSRXPower',
+    'jnxVSRXFan',
+    'jnxModuleJ2300',
+    'jnxJ2300FPC',
+    'jnxJ2300RE',
+    'jnxJ2300Fan',
+    'jnxModuleEX3400',
+    'jnxEX3400FPC',
+    'jnxEX3400Power',
+    'jnxEX3400Fan',
+    'jnxModuleEX2300',
+    'jnxEX2300FPC',
+    'jnxEX2300Power',
+    'jnxEX2300Fan',
+    'jnxModuleSRX300',
+    'jnxSRX300FPC',
+    'jnxSRX300RE',
+    'jnxSRX300Power',
+    'jnxSRX300Fan',
+    'jnxModuleSRX320',
+    'jnxSRX320FPC',
+    'jnxSRX320RE',
+    'jnxSRX320Power',
+    'jnxSRX320Fan',
+    'jnxModuleSRX340',
+    'jnxSRX340FPC',
+    'jnxSRX340RE',
+    'jnxSRX340Power',
+    'jnxSRX340Fan',
+    'jnxModuleSRX345',
+    'jnxSRX345FPC',
+    'jnxSRX345RE',
+    'jnxSRX345Power',
+    'jnxSRX345Fan',
+    'jnxModuleSRX1500',
+    'jnxSRX1500FPC',
+    'jnxSRX1500RE',
+    'jnxSRX1500Power',
+    'jnxSRX1500Fan',
+    'jnxModuleMX10002',
+    'jnxMX10002HM',
+    'jnxMX10002FPC',
+    'jnxMX10002Fan',
+    'jnxMX10002SPMB',
+    'jnxMX10002PSM',
+    'jnxModuleJ4300',
+    'jnxJ4300FPC',
+    'jnxJ4300RE',
+    'jnxJ4300Fan',
+    'jnxModuleSRX4600',
+    'jnxSRX4600HM',
+    'jnxSRX4600FPC',
+    'jnxSRX4600Fan',
+    'jnxSRX4600SPMB',
+    'jnxSRX4600PSM',
+    'jnxModuleSRX4800',
+    'jnxSRX4800HM',
+    'jnxSRX4800FPC',
+    'jnxSRX4800Fan',
+    'jnxSRX4800SPMB',
+    'jnxSRX4800PSM',
+    'jnxModuleSRX4100',
+    'jnxSRX4100FPC',
+    'jnxSRX4100RE',
+    'jnxSRX4100Power',
+    'jnxSRX4100Fan',
+    'jnxModuleSRX4200',
+    'jnxSRX4200FPC',
+    'jnxSRX4200RE',
+    'jnxSRX4200Power',
+    'jnxSRX4200Fan',
+    'jnxModuleJ6300',
+    'jnxJ6300FPC',
+    'jnxJ6300RE',
+    'jnxJ6300Fan',
+    'jnxModuleIRM',
+    'jnxIRMFPC',
+    'jnxIRMCFEB',
+    'jnxIRMRE',
+    'jnxIRMPower',
+    'jnxIRMPowerDC',
+    'jnxModuleTX',
+    'jnxTXSIB',
+    'jnxTXHM',
+    'jnxTXPower',
+    'jnxTXFan',
+    'jnxTXCB',
+    'jnxTXFPB',
+    'jnxTXCIP',
+    'jnxTXSPMB',
+    'jnxTXLCC',
+    'jnxModuleM120',
+    'jnxM120FEB',
+    'jnxModuleJ4350',
+    'jnxJ4350FPC',
+    'jnxJ4350RE',
+    'jnxJ4350Power',
+    'jnxJ4350Fan',
+    'jnxModuleM20',
+    'jnxM20FPC',
+    'jnxM20SSB',
+    'jnxM20RE',
+    'jnxM20Power',
+    'jnxM20PowerAC',
+    'jnxM20PowerDC',
+    'jnxM20Fan',
+    'jnxM20FrontPanel',
+    'jnxModuleJ6350',
+    'jnxJ6350FPC',
+    'jnxJ6350RE',
+    'jnxJ6350Power',
+    'jnxJ6350Fan',
+    'jnxModuleJ4320',
+    'jnxJ4320FPC',
+    'jnxJ4320RE',
+    'jnxModuleJ2320',
+    'jnxJ2320FPC',
+    'jnxJ2320RE',
+    'jnxJ2320Power',
+    'jnxJ2320Fan',
+    'jnxModuleJ2350',
+    'jnxJ2350FPC',
+    'jnxJ2350RE',
+    'jnxJ2350Power',
+    'jnxJ2350Fan',
+    'jnxModuleT1600',
+    'jnxT1600FPC',
+    'jnxT1600SPMB',
+    'jnxT1600SIB',
+    'jnxT1600HM',
+    'jnxT1600SCG',
+    'jnxT1600Power',
+    'jnxT1600Fan',
+    'jnxT1600CB',
+    'jnxT1600FPB',
+    'jnxT1600CIP',
+    'jnxModuleM160',
+    'jnxM160FPC',
+    'jnxM160SFM',
+    'jnxM160HM',
+    'jnxM160PCG',
+    'jnxM160Power',
+    'jnxM160Fan',
+    'jnxM160MCS',
+    'jnxM160FPM',
+    'jnxM160CIP',
+    'jnxModuleEX3200',
+    'jnxEX3200FPC',
+    'jnxEX3200Power',
+    'jnxEX3200Fan',
+    'jnxEX3200RE',
+    'jnxModuleEX4200',
+    'jnxEX4200FPC',
+    'jnxEX4200Power',
+    'jnxEX4200Fan',
+    'jnxModuleSRX210',
+    'jnxSRX210FPC',
+    'jnxSRX210RE',
+    'jnxSRX210Power',
+    'jnxSRX210Fan',
+    'jnxModuleTXP',
+    'jnxTXPSIB',
+    'jnxTXPSFC',
+    'jnxTXPHM',
+    'jnxTXPPower',
+    'jnxTXPFan',
+    'jnxTXPCB',
+    'jnxTXPFPB',
+    'jnxTXPCIP',
+    'jnxTXPSPMB',
+    'jnxTXPLCC',
+    'jnxModuleJCS',
+    'jnxJCSHM',
+    'jnxJCSBBD',
+    'jnxJCSFPC',
+    'jnxJCSPIC',
+    'jnxModuleSRX240',
+    'jnxSRX240FPC',
+    'jnxSRX240RE',
+    'jnxSRX240Power',
+    'jnxSRX240Fan',
+    'jnxModuleM10',
+    'jnxM10FPC',
+    'jnxM10FEB',
+    'jnxM10RE',
+    'jnxM10Power',
+    'jnxM10PowerAC',
+    'jnxM10PowerDC',
+    'jnxM10Fan',
+    'jnxModuleSRX650',
+    'jnxSRX650FPC',
+    'jnxSRX650RE',
+    'jnxSRX650Power',
+    'jnxSRX650Fan',
+    'jnxModuleSRX100',
+    'jnxSRX100FPC',
+    'jnxSRX100RE',
+    'jnxSRX100Power',
+    'jnxSRX100Fan',
+    'jnxModuleEX2200',
+    'jnxEX2200FPC',
+    'jnxEX2200Power',
+    'jnxEX2200Fan',
+    'jnxEX2200RE',
+    'jnxModuleEX4500',
+    'jnxEX4500FPC',
+    'jnxEX4500Power',
+    'jnxEX4500Fan',
+    'jnxEX4500RE',
+    'jnxModuleM5',
+    'jnxM5FPC',
+    'jnxM5FEB',
+    'jnxM5RE',
+    'jnxM5Power',
+    'jnxM5PowerAC',
+    'jnxM5PowerDC',
+    'jnxM5Fan',
+    'jnxModuleIBM427348EJ48E',
+    'jnxIBM427348EJ48EFPC',
+    'jnxIBM427348EJ48EPower',
+    'jnxIBM427348EJ48EFan',
+    'jnxModuleMX80',
+    'jnxMX80FPC',
+    'jnxMX80CFEB',
+    'jnxMX80RE',
+    'jnxMX80Power',
+    'jnxMX80PowerAC',
+    'jnxMX80Fan',
+    'jnxModuleSRX220',
+    'jnxSRX220FPC',
+    'jnxSRX220RE',
+    'jnxSRX220Power',
+    'jnxSRX220Fan',
+    'jnxModuleEXXRE',
+    'jnxEXXREPower',
+    'jnxEXXREFan',
+    'jnxEXXREHM',
+    'jnxEXXRELCC',
+    'jnxModuleT640',
+    'jnxT640FPC',
+    'jnxT640SPMB',
+    'jnxT640SIB',
+    'jnxT640HM',
+    'jnxT640SCG',
+    'jnxT640Power',
+    'jnxT640Fan',
+    'jnxT640CB',
+    'jnxT640FPB',
+    'jnxT640CIP',
+    'jnxModuleEX4300',
+    'jnxEX4300FPC',
+    'jnxEX4300Power',
+    'jnxEX4300Fan',
+    'jnxModuleSRX110',
+    'jnxSRX110FPC',
+    'jnxSRX110RE',
+    'jnxSRX110Power',
+    'jnxSRX110Fan',
+    'jnxModuleSRX120',
+    'jnxSRX120FPC',
+    'jnxSRX120RE',
+    'jnxSRX120Power',
+    'jnxSRX120Fan',
+    'jnxModulePTX5000',
+    'jnxPTX5000SIB',
+    'jnxPTX5000CCG',
+    'jnxPTX5000PIC',
+    'jnxPTX5000HM',
+    'jnxPTX5000FPC',
+    'jnxPTX5000Fan',
+    'jnxPTX5000CB',
+    'jnxPTX5000FPB',
+    'jnxPTX5000SPMB',
+    'jnxPTX5000PDU',
+    'jnxPTX5000PSM',
+    'jnxModuleT320',
+    'jnxT320FPC',
+    'jnxT320SPMB',
+    'jnxT320SIB',
+    'jnxT320HM',
+    'jnxT320SCG',
+    'jnxT320Power',
+    'jnxT320Fan',
+    'jnxT320CB',
+    'jnxT320FPB',
+    'jnxT320CIP',
+    'jnxModulePTX9000',
+    'jnxPTX9000SIB',
+    'jnxPTX9000CCG',
+    'jnxPTX9000PIC',
+    'jnxPTX9000HM',
+    'jnxPTX9000FPC',
+    'jnxPTX9000Fan',
+    'jnxPTX9000CB',
+    'jnxPTX9000FPB',
+    'jnxPTX9000SPMB',
+    'jnxPTX9000PDU',
+    'jnxPTX9000PSM',
+    'jnxModuleIBM0719J45E',
+    'jnxIBM0719J45EFPC',
+    'jnxIBM0719J45EPower',
+    'jnxIBM0719J45EFan',
+    'jnxIBM0719J45ERE',
+    'jnxModuleEX3300',
+    'jnxEX3300FPC',
+    'jnxEX3300Power',
+    'jnxEX3300Fan',
+    'jnxEX3300RE',
+    'jnxModuleM40e',
+    'jnxM40eFPC',
+    'jnxM40eSFM',
+    'jnxM40eHM',
+    'jnxM40ePCG',
+    'jnxM40ePower',
+    'jnxM40eFan',
+    'jnxM40eMCS',
+    'jnxM40eFPM',
+    'jnxM40eCIP',
+    'jnxModuleT4000',
+    'jnxT4000SIB',
+    'jnxT4000SCG',
+    'jnxT4000CB',
+    'jnxT4000SPMB',
+    'jnxModuleSRX550',
+    'jnxSRX550FPC',
+    'jnxSRX550RE',
+    'jnxSRX550Power',
+    'jnxSRX550Fan',
+    'jnxModuleACX',
+    'jnxACXFPC',
+    'jnxACXFEB',
+    'jnxACXRE',
+    'jnxACXPower',
+    'jnxACXPowerDC',
+    'jnxACXPowerAC',
+    'jnxACXFan',
+    'jnxModuleMX40',
+    'jnxMX40FPC',
+    'jnxMX40CFEB',
+    'jnxMX40RE',
+    'jnxMX40Power',
+    'jnxMX40PowerAC',
+    'jnxMX40Fan',
+    'jnxModuleMX10',
+    'jnxMX10FPC',
+    'jnxMX10CFEB',
+    'jnxMX10RE',
+    'jnxMX10Power',
+    'jnxMX10PowerAC',
+    'jnxMX10Fan',
+    'jnxModuleM320',
+    'jnxM320FPC',
+    'jnxM320SIB',
+    'jnxM320HM',
+    'jnxM320Power',
+    'jnxM320Fan',
+    'jnxM320CB',
+    'jnxM320FPB',
+    'jnxM320CIP',
+    'jnxModuleMX5',
+    'jnxMX5FPC',
+    'jnxMX5CFEB',
+    'jnxMX5RE',
+    'jnxMX5Power',
+    'jnxMX5PowerAC',
+    'jnxMX5Fan',
+    'jnxModuleEX4550',
+    'jnxEX4550FPC',
+    'jnxEX4550Power',
+    'jnxEX4550Fan',
+    'jnxEX4550RE',
+    'jnxModuleMX2020',
+    'jnxMX2020SFB',
+    'jnxMX2020ADC',
+    'jnxMX2020HM',
+    'jnxMX2020FPC',
+    'jnxMX2020Fan',
+    'jnxMX2020CB',
+    'jnxMX2020FPB',
+    'jnxMX2020SPMB',
+    'jnxMX2020PDM',
+    'jnxMX2020PSM',
+    'jnxModuleVseries',
+    'jnxVseriesFPC',
+    'jnxVseriesRE',
+    'jnxVseriesPower',
+    'jnxVseriesFan',
+    'jnxModuleFireflyPerimeter',
+    'jnxFireflyPerimeterFPC',
+    'jnxFireflyPerimeterRE',
+    'jnxFireflyPerimeterPower',
+    'jnxFireflyPerimeterFan',
+    'jnxModuleMX104',
+    'jnxMX104FPC',
+    'jnxMX104FEB',
+    'jnxMX104RE',
+    'jnxMX104Power',
+    'jnxMX104PowerAC',
+    'jnxMX104Fan',
+    'jnxMX104FPM',
+    'jnxModulePTX3000',
+    'jnxPTX3000SIB',
+    'jnxPTX3000HM',
+    'jnxPTX3000FPC',
+    'jnxPTX3000Fan',
+    'jnxPTX3000CB',
+    'jnxPTX3000FPB',
+    'jnxPTX3000PSM',
+    'jnxPTX3000PIC',
+    'jnxModuleMX2010',
+    'jnxMX2010SFB',
+    'jnxMX2010ADC',
+    'jnxMX2010HM',
+    'jnxMX2010FPC',
+    'jnxMX2010Fan',
+    'jnxMX2010CB',
+    'jnxMX2010FPB',
+    'jnxMX2010SPMB',
+    'jnxMX2010PDM',
+    'jnxMX2010PSM',
+    'jnxSubmodule',
+    'jnxSubmoduleM40',
+    'jnxM40PIC0',
+    'jnxM40SonetOc48',
+    'jnxM40PIC',
+    'jnxM40QuadSonetOc3',
+    'jnxM40QuadEther',
+    'jnxM40QuadE1',
+    'jnxM40QuadT1',
+    'jnxM40SonetOc48Sr',
+    'jnxM40QuadChT3',
+    'jnxM40SonetOc48Lr',
+    'jnxM40QuadAtmE3',
+    'jnxM40QuadAtmT3',
+    'jnxM40GigEtherBundle',
+    'jnxM40Multilink128',
+    'jnxM40SonetOc12',
+    'jnxM40Multilink32',
+    'jnxM40Multilink4',
+    'jnxM40ChStm1',
+    'jnxM40DenseEther12',
+    'jnxM40DecaChE1',
+    'jnxM40ChDs3toDs0',
+    'jnxM40DualChDs3toDs0',
+    'jnxM40DenseEther8',
+    'jnxM40GigEther',
+    'jnxM40Crypto800',
+    'jnxM40LsMultilink128',
+    'jnxM40LsMultilink32',
+    'jnxM40LsMultilink4',
+    'jnxM40AtmIIOc12',
+    'jnxM40DualAtmIIOc3',
+    'jnxM40DualQChDS3',
+    'jnxM40QuadQChT3',
+    'jnxM40QChOc12',
+    'jnxM40QuadT3',
+    'jnxM40QChStm1',
+    'jnxM40DualQChStm1',
+    'jnxM40DecaQChE1',
+    'jnxM40DualEIA530',
+    'jnxM40DecaQChT1',
+    'jnxM40QuadE3',
+    'jnxM40DualAtmOc3',
+    'jnxM40AtmOc12',
+    'jnxM40Tunnel',
+    'jnxM40ChOc12toDs3',
+    'jnxSubmoduleM7i',
+    'jnxM7iPIC',
+    'jnxSubmoduleGeneric',
+    'jnxPic',
+    'jnxPicType3TenGigEther',
+    'jnxPicDualAtmIIOc3',
+    'jnxPicJseriesDualSerial',
+    'jnxPicJseriesT3',
+    'jnxPicType2AtmIIOc48',
+    'jnxPicSonetOc768Sr',
+    'jnxPicQuadSonetOc192XFP',
+    'jnxPicType4Tunnel',
+    'jnxPicQChoc3',
+    'jnxPicType3DWDMTenGigEther',
+    'jnxPicType4QuadOC192',
+    'jnxPicDualAtmOc3',
+    'jnxPicType1Load',
+    'jnxPicType2Load',
+    'jnxPicType3Load',
+    'jnxPicType4Load',
+    'jnxPicGgsnControlV1',
+    'jnxPicGgsnDataV1',
+    'jnxPicMonitoring3',
+    'jnxPicGgsnPhoenix',
+    'jnxPicAdaptiveServicesFips',
+    'jnxPicDualChDs3',
+    'jnxPicMonitoring3V1',
+    'jnxPicGgsnPhoenixV1',
+    'jnxPicJseriesE3',
+    'jnxPicLinkServicesII',
+    'jnxPicDecaQChT1',
+    'jnxPicType3IQ21X10GE',
+    'jnxPicType2IQ28X1GE',
+    'jnxPicType1IQ24X1GE',
+    'jnxPic10GEUplink',
+    'jnxPicType2IQ21X10GE',
+    'jnxPicDualE3',
+    'jnxPicType1MultiServices',
+    'jnxPicType2MultiServices',
+    'jnxPicType3MultiServices',
+    'jnxPicSonetOc192Uplink',
+    'jnxPicXDpc10X1GE',
+    'jnxPicXQDpc10X1GE',
+    'jnxPicXDpc1X10GE',
+    'jnxPicXQDpc1X10GE',
+    'jnxPicType3SonetOc192Xfp',
+    'jnxPicType3IQ28X1GE',
+    'jnxPicDualEia530',
+    'jnxPicType2Sonetoc48Sr2',
+    'jnxPicType2Sonetoc12Sr2',
+    'jnxPicType2Sonetoc3Sr2',
+    'jnxPicStoli4X10GE',
+    'jnxPicType1Sonet4Xoc3',
+    'jnxPicType1Sonet2Xoc3',
+    'jnxPicType1Sonet1Xoc12',
+    'jnxPicGgsnStargateType2',
+    'jnxPicUQDpc10X1GE',
+    'jnxPicUQDpc1X10GE',
+    'jnxPicDualQChStm1',
+    'jnxPicNPC',
+    'jnxPicIOC16xGETP',
+    'jnxPicIOC16xGESFP',
+    'jnxPicIOC2x10GEXFP',
+    'jnxPicIOC8xGETP4xGESFP',
+    'jnxPicSPCRMIx1',
+    'jnxPicType3EnhancedLoad',
+    'jnxPicCE4xCHOC3SFP',
+    'jnxPicCE12xT1E1',
+    'jnxPicXDpc10X1GERJ45',
+    'jnxPicDualQChDs3',
+    'jnxPicQ2ChOc12',
+    'jnxPicQ2Oc12',
+    'jnxPicQ2ChOc3',
+    'jnxPicQ2Oc3',
+    'jnxPicQ2ChDs3',
+    'jnxPicQ2Ds3',
+    'jnxPicQ21xChOc48',
+    'jnxPicQ24xChOc12',
+    'jnxPicQ210xChE1T1',
+    'jnxPicOlivet',
+    'jnxPicType2DualQHGE',
+    'jnxPicType1IQ2E4X1GE',
+    'jnxPicType2IQ2E8X1GE',
+    'jnxPicType3IQ2E8X1GE',
+    'jnxPicType3IQ2E1X10GE',
+    'jnxPicASPCTYPE1',
+    'jnxPicASPCTYPE2',
+    'jnxPicASPCTYPE3',
+    'jnxPicFIOC16X1GETP',
+    'jnxPicFIOC16X1GESFP',
+    'jnxPicFIOC4X10GEXFP',
+    'jnxPicDualSonetOc3',
+    'jnxPicMIC20XGESFP',
+    'jnxPicMIC2X10GEXFP',
+    'jnxPicMIC40XGERJ45',
+    'jnxPicMIC4X10GEXFP',
+    'jnxPicMICLoad',
+    'jnxPicMICH10XGESFP',
+    'jnxPicMICH1X10GEXFP',
+    'jnxPicMICH10XGERJ45',
+    'jnxPicMICH2X10GEXFP',
+    'jnxPicMICHLoad',
+    'jnxPicDualDs3',
+    'jnxPicOtn1X10GE',
+    'jnxPicStoli10X10GE',
+    'jnxPicStoli100GE',
+    'jnxPicType3Q24xChOc12',
+    'jnxPicStoli100GESlot1',
+    'jnxPicUplinkSFPplus1G4',
+    'jnxPicUplinkSFPplus10G2',
+    'jnxPicUplinkXFP2port',
+    'jnxPicUplinkSFP4port',
+    'jnxPicUplinkSFPplus4port',
+    'jnxPicChDs3toDs0',
+    'jnxPicType1Tunnel',
+    'jnxPicXDpcCombo10X1GE',
+    'jnxPicXQDpcCombo10X1GE',
+    'jnxPicTAZ4X10GEXFP',
+    'jnxPicTAZ48XGERJ45',
+    'jnxPicStoli1X40GECFP',
+    'jnxPicOtnOc192',
+    'jnxPICStoli100GESNAP12',
+    'jnxPicEX820048S',
+    'jnxPicEX820048T',
+    'jnxPicEX82008XS',
+    'jnxPicGgsnControl',
+    'jnxPicMIC4X10GESFPPLUS',
+    'jnxPicEX4500UplinkSFPPlus4Port',
+    'jnxPicSoho48X10GE',
+    'jnxPicM2LoopBack',
+    'jnxPicCtpGluon4xT1E1',
+    'jnxPicCtpGluon4xSerial',
+    'jnxPicSng24x10GE',
+    'jnxPicSng2x100GE',
+    'jnxPicSngLoad',
+    'jnxPicSysio6XGERJ456XGESFP',
+    'jnxPicGgsnData',
+    'jnxPicSysio6XGERJ453XGESFP3X10GESFPPlus',
+    'jnxPicDualWideSPCNPC',
+    'jnxPicDualWideNPCSPC',
+    'jnxPicTAZ12XGERJ45',
+    'jnxPicType1MultiServicesFIPS',
+    'jnxPicType2MultiServicesFIPS',
+    'jnxPicType3MultiServicesFIPS',
+    'jnxPicEX4500UplinkXFP4Port',
+    'jnxPicEX4500M2Optical',
+    'jnxPicEX4500M2Legacy',
+    'jnxPicType3TenPortGigEther',
+    'jnxPicEX820036XS',
+    'jnxPicEX820040XS',
+    'jnxPicEX820048PL',
+    'jnxPicEX82002XS40P',
+    'jnxPicType1ASPCXLP',
+    'jnxPicType2ASPCXLP',
+    'jnxPicType3ASPCXLP',
+    'jnxPicSPCXLPx1',
+    'jnxPicStoli40GE',
+    'jnxPicHyp1X100GECFP',
+    'jnxPicType3SonetOc192Lr',
+    'jnxPicHyp1X40GECFP',
+    'jnxPicHypX100GECXP',
+    'jnxPicHyp10X10GESFPP',
+    'jnxPic12x10GE',
+    'jnxPic1x100GE',
+    'jnxPicHyp2X40GEQSFP',
+    'jnxPicHercules24X10GE',
+    'jnxPicCTPGluonSerialMS',
+    'jnxPicAgent00SLC1X10GE',
+    'jnxPicAgent00SLC4X1GE',
+    'jnxPicType3SonetOc192Sr2',
+    'jnxPicQFXSFE16x40GEQSFP',
+    'jnxPicQFXSFI16x40GE',
+    'jnxPicQFXSRI16x40GE',
+    'jnxPicQFX48x10GESFPPlus',
+    'jnxPicQFX4x40GEQSFP',
+    'jnxPicQFX2x80GEQCXP',
+    'jnxPicType3IQECC4XOC48',
+    'jnxPicSng2x40GE',
+    'jnxPicIBM0719J45EUplinkSFPPlus4Port',
+    'jnxPicIBM0719J45EUplinkXFP4Port',
+    'jnxPicType3SonetOc192Vsr',
+    'jnxPicIBM0719J45EM2Optical',
+    'jnxPicIBM0719J45EM2Legacy',
+    'jnxPicIBMJ08FSFE16x40GEQSFP',
+    'jnxPicIBMJ08FSFI16xFabric',
+    'jnxPicIBMJ08FSRI16xFabric',
+    'jnxPicIBMJ52F48x10GESFPPlus',
+    'jnxPicIBMJ52F4x40GEQSFP',
+    'jnxPicDellJFX350048x10GESFPPlus',
+    'jnxPicEX820048TES',
+    'jnxPicEX820048SES',
+    'jnxPicType3QuadSonetOc48',
+    'jnxPicEX82008XSES',
+    'jnxPicEX820040XSES',
+    'jnxPicEX820048TES4X',
+    'jnxPicEX820048SES4X',
+    'jnxPicEX82008XSES4X',
+    'jnxPicEX820040XSES4X',
+    'jnxPicEX620048T',
+    'jnxPicEX620048P',
+    'jnxPicEX62004XS',
+    'jnxPicDellJFX35004x40GEQSFP',
+    'jnxPicType3Tunnel',
+    'jnxPicEX820048TL',
+    'jnxPicEX82002XS40T',
+    'jnxPicType2MSPrism',
+    'jnxPicMicMSPrism',
+    'jnxPicQFX16x10GESFPPlus',
+    'jnxPicIBMJ52F16x10GESFPPlus',
+    'jnxPicDellJFX350016x10GESFPPlus',
+    'jnxPicQFX10xPTunnel',
+    'jnxPicIBMJ52F10xPTunnel',
+    'jnxPic16XT1E1CEMIC',
+    'jnxPicGigEther',
+    'jnxPic8XT1E1CEMIC',
+    'jnxPic8xGERJ452xPOEMIC',
+    'jnxPic2xGESFPMIC',
+    'jnxPic2x10GESFPPLUSMIC',
+    'jnxPic4xGESFPRJ45COMBOMIC',
+    'jnxPicUplinkDualMedia2port',
+    'jnxPicEX3300UplinkSFPPlus4Port',
+    'jnxPicEX4500UplinkSFP4Port',
+    'jnxPicEX4550UplinkEm8XFP',
+    'jnxPicEX4550UplinkEm8XT',
+    'jnxPicDualChDs3toDs0',
+    'jnxPicLsMultilink128',
+    'jnxPicEX4550UplinkEm2QSFP',
+    'jnxPicEX4550VC128G',
+    'jnxPicQFX16x80GCXP',
+    'jnxPicQFX63x10GESFPPlus',
+    'jnxPicQFX16x40GEQSFP',
+    'jnxPic6xGESFPRJ45',
+    'jnxPicMXPISA16xT1E1RJ48',
+    'jnxPic6x40GEQSFPP',
+    'jnxPicACX1xOC124xOC3SFP',
+    'jnxPicACXPISA16xT1E1RJ48',
+    'jnxPicLsMultilink32',
+    'jnxPic8x10GESFPPMIC',
+    'jnxPic1x100GECFPMIC',
+    'jnxPic4x10GESFPPMIC',
+    'jnxPicPTX2x100GOTNPIC',
+    'jnxPicMXXLPDPCPIC',
+    'jnxPicMXXLP8GMIC',
+    'jnxPicMXXLP16GMIC',
+    'jnxPicMXXLP8GFIPSMIC',
+    'jnxPicMXXLP16GFIPSMIC',
+    'jnxPicEX4300QSFP4Port',
+    'jnxPicLsMultilink4',
+    'jnxPicEX4300UplinkSFPPlus4Port',
+    'jnxPicNPIOC2x10GESFPPLUSPIC',
+    'jnxPic4CHDS3E3MICSR',
+    'jnxPic4CHOC31CHOC12MICSR',
+    'jnxPicSNG24x10GELWOPIC',
+    'jnxPic8xGESFPRJ45COMBOMIC',
+    'jnxPic4X10GESFPPLUSMIC',
+    'jnxPic4xGERJ45MIC',
+    'jnxPic24X10GESFPPMIC',
+    'jnxPic24X10GESFPPOTNMIC',
+    'jnxPicType2DenseEther48',
+    'jnxPic2X100GECFP2MIC',
+    'jnxPic12X10GESFPPPIC',
+    'jnxPic12X10GESFPPOTNPIC',
+    'jnxPic2X100GECFP2PIC',
+    'jnxPicWdSf12X10GESFPPPIC',
+    'jnxPicNX10GESFPPOTNDEBUGPIC',
+    'jnxPicWdSf12X10GESFPPOTNPIC',
+    'jnxPic3X40GEQSFPPPIC',
+    'jnxPic1X100GECFP2PIC',
+    'jnxPicQFX48x10GESFP',
+    'jnxPicType2DualGigEther',
+    'jnxPicKFIPCSFPPPIC',
+    'jnxPicKFIPCCFP2PIC',
+    'jnxPicJAVAxUplinkSFFPlusMACSEC4PORT',
+    'jnxPicEX8200M48XSO',
+    'jnxPicEX8200M12LQO',
+    'jnxPicEX8200M2CF',
+    'jnxPicOpusQic4X40G',
+    'jnxPic20XGESfpEHMIC',
+    'jnxPic1XCOC124XCOC3CEHMIC',
+    'jnxPicType2SonetOc48Lr',
+    'jnxPicPISA16XT1E1HMIC',
+    'jnxPic20XGESFPEMIC',
+    'jnxPicUplinkMacsecSFPplus1G4',
+    'jnxPicUplinkMacsecSFPplus10G2',
+    'jnxPicUplinkMacsecSFPplus4port',
+    'jnxPicVMX10X1GEPIC',
+    'jnxPic10XGESFPHALFEHMIC',
+    'jnxPic10XGESFPHALFEMIC',
+    'jnxPic1xOC124xOC3SFP',
+    'jnxPicEX920040x1GbERJ45',
+    'jnxPicType2QuadGigEther',
+    'jnxPicEX920020x1GbESFP',
+    'jnxPicEX92002x40GbEQSFPP',
+    'jnxPic4X100GECXPMIC',
+    'jnxPicQFXEM4Q',
+    'jnxPicQFXEM8S',
+    'jnxPicSRXIOC21X100GECFP',
+    'jnxPicSRXIOC210X10GESFPP',
+    'jnxPicSRXIOC22X40GEQSFP',
+    'jnxPicCHV4X100GCFP2',
+    'jnxPicCHVLOAD',
+    'jnxPicType2QuadSonetOc12',
+    'jnxPicEX4300UplinkSFPPlus8Port',
+    'jnxPicEX4300UplinkQSFP2Port',
+    'jnxPicCHVfake4X100GCFP2',
+    'jnxPicQFX510024Q',
+    'jnxPicWdSf2X10GESFPPOTNPIC',
+    'jnxPicEX920012X10GESFPPPIC',
+    'jnxPicEX92003X40GEQSFPPPIC',
+    'jnxPicEX920020X1GESFPMACSECMIC',
+    'jnxPicEX920020X1GESFPMACSECHALFMIC',
+    'jnxPicEX4300QSFP2Port',
+    'jnxPicType2QuadSonetOc3',
+    'jnxPicCHV4X100GOTNCFP2',
+    'jnxPicCHV48X10G12X40GLWOPIC',
+    'jnxPicQFX24x40GEFQSFP',
+    'jnxPicQFX48x10GEFSFP',
+    'jnxPicQFX6x40GEFQSFP',
+    'jnxPicQFX96X10GEFSFP8X40GEFQSFP',
+    'jnxPicQFX48X10GECSFP6X40GEFQSFP',
+    'jnxPicQFX510048S6Q',
+    'jnxPicQFX510024S4Q',
+    'jnxPicQFX510096S8Q',
+    'jnxPicType1SonetOc192Sr2',
+    'jnxPicQFX510048C6Q',
+    'jnxPicEX460024S4Q',
+    'jnxPicEX4600EM8F',
+    'jnxPic8X100GECFP4MIC',
+    'jnxPic12X40GEQSFPPMIC',
+    'jnxPicMPC8LOADMIC',
+    'jnxPic6XQSFPP',
+    'jnxPic20X10GE',
+    'jnxPicQFX510048C6QF',
+    'jnxPicQFX510048C6QFQSFP',
+    'jnxPicAtmIIOc12',
+    'jnxPicType1SonetOc192Lr1',
+    'jnxPicCHV12X40GLWOPIC',
+    'jnxPicSRXIOC220X1GESFP',
+    'jnxPicSRXIOC210X1GESFP',
+    'jnxPic3xGERJ453xPOEMIC',
+    'jnxPic3xGERJ45MIC',
+    'jnxPic4xGESFPRJ453xPOEMIC',
+    'jnxPic3xGESFP',
+    'jnxPicMultiserviceBuiltin',
+    'jnxPicCHV4X100GCXPPIC',
+    'jnxPicPTXMLC24X10GESFPP',
+    'jnxPicType1SonetOc192Sr',
+    'jnxPicCordoba1X100DwdmMIC',
+    'jnxPicPTXLoadMIC',
+    'jnxPicIOCIII12X10SFPP',
+    'jnxPicIOCIII4X40QSFPP',
+    'jnxPicIOCIII1X100CFP2',
+    'jnxPicIOCIII2X10SFPP',
+    'jnxPicEX920010X10GESFPPMIC',
+    'jnxPicEX920020X10GESFPPMIC',
+    'jnxPicEX92006XQSFPPPIC',
+    'jnxPicPTX15X100GEREV1PIC',
+    'jnxPicType1SonetOc192Vsr',
+    'jnxPicPTX10X100GEREV1PIC',
+    'jnxPicPTX2X100GMETROOTNPIC',
+    'jnxPicQFX510024QAA',
+    'jnxPicQFXPFA4Q',
+    'jnxPicACX5048',
+    'jnxPicACX5096',
+    'jnxPicCordoba5X100DwdmPIC',
+    'jnxPicType2SonetOc48Sr',
+    'jnxPicSHO10X100GEQSFPPIC',
+    'jnxPicVQFX5C24X100GEPIC',
+    'jnxPicPTX1K72X40GEPIC',
+    'jnxPicQFX1000236Q',
+    'jnxPicQFX1000272Q',
+    'jnxPicQFX520032C32Q',
+    'jnxPicQFX520032C64Q',
+    'jnxPicQ511048S4Q2C',
+    'jnxPicQ511032Q4C',
+    'jnxPicType2Tunnel',
+    'jnxPicEX3400QSFP2Port',
+    'jnxPicEX3400UplinkSFPPlus4Port',
+    'jnxPic10GE40GE100GEPIC',
+    'jnxPicEX2300UplinkSFPPlus4Port',
+    'jnxPicEX2300UplinkSFPPlus2Port',
+    'jnxPicSRXSMET1E1RPIC',
+    'jnxPicSRXSMEVDSLANNEXARPIC',
+    'jnxPicSRXSMESERIALRPIC',
+    'jnxPicSRXSME16PORTGEPOERPIC',
+    'jnxPicSRXSME8SFPRPIC',
+    'jnxPicDecaChE1',
+    'jnxPicULC36Q12Q28',
+    'jnxPicULC30Q28',
+    'jnxPicVMXMIC',
+    'jnxPicMIC8OC3OC124OC48',
+    'jnxPicMIC4OC3OC121OC48',
+    'jnxPicMIC8DS3E3',
+    'jnxPicMIC8CHDS3E3',
+    'jnxPicMIC8CHOC34CHOC12',
+    'jnxPicMIC4CHOC32CHOC12',
+    'jnxPicMIC1CHOC48',
+    'jnxPicDenseEther12',
+    'jnxPicMIC12CHE1T1',
+    'jnxPicMIC1OC192HOVCAT',
+    'jnxPicSHO10X100GEQSFPV2PIC',
+    'jnxPicGLD96x10GE24x40GE8x100GEQSFPV2PIC',
+    'jnxPicDenseEtherFX8',
+    'jnxPicGigEtherBundle',
+    'jnxPicAtmOc12',
+    'jnxPicSonetOc48Lr',
+    'jnxPicSonetOc48Sr',
+    'jnxPicMultilink128',
+    'jnxPicMultilink32',
+    'jnxPicMultilink4',
+    'jnxPicPassiveMonitor',
+    'jnxPicDecaQChE1',
+    'jnxPicQChOc12',
+    'jnxPicQuadAtmE3',
+    'jnxPicQuadAtmT3',
+    'jnxPicM7iTunnel',
+    'jnxPicQuadChT3',
+    'jnxPicQuadE1',
+    'jnxPicQuadE3',
+    'jnxPicQuadEther',
+    'jnxPicQuadQChT3',
+    'jnxPicQuadSonetOc3',
+    'jnxPicQuadT1',
+    'jnxPicQuadT3',
+    'jnxPicChStm1',
+    'jnxPicQChStm1',
+    'jnxPicChOc12toDs3',
+    'jnxPicSingleQHGE',
+    'jnxPicSonetOc12',
+    'jnxPicSonetOc48',
+    'jnxPicTunnel',
+    'jnxPicGeneralServices',
+    'jnxPicPassiveMonitorAsp',
+    'jnxPicType1TenGigEther',
+    'jnxPicDualATMIIE3',
+    'jnxPicQuadATMIIE3',
+    'jnxPicQuadATMIIT3',
+    'jnxPicCrypto800',
+    'jnxPicQuadQE3',
+    'jnxPicType1Oc48SFP',
+    'jnxPicType2Oc48SFP',
+    'jnxPicGgsnInspection',
+    'jnxPicType3QuadSonetOc48SFP',
+    'jnxPicType3TenGigEtherXenpak',
+    'jnxPicIntServices',
+    'jnxPicDualFicFE',
+    'jnxPicFicGE',
+    'jnxPicSingleSGE',
+    'jnxPicType2DualAtmIIOc12',
+    'jnxPicDualSGE',
+    'jnxPicQuadSGE',
+    'jnxPicType3SonetOc192Sr1',
+    'jnxPicAdaptiveServicesII',
+    'jnxPicJseriesEthT1Combo',
+    'jnxPicJseriesEthE1Combo',
+    'jnxPicJseriesEthSerCombo',
+    'jnxPicJseriesDualEth',
+    'jnxPicJseriesDualT1',
+    'jnxPicJseriesDualE1',
+    'jnxMic',
+    'jnxSubmoduleM20',
+    'jnxM20PIC0',
+    'jnxM20SonetOc48',
+    'jnxM20PIC',
+    'jnxM20QuadSonetOc3',
+    'jnxM20QuadEther',
+    'jnxM20QuadE1',
+    'jnxM20QuadT1',
+    'jnxM20SonetOc48Sr',
+    'jnxM20QuadChT3',
+    'jnxM20SonetOc48Lr',
+    'jnxM20QuadAtmE3',
+    'jnxM20QuadAtmT3',
+    'jnxM20GigEtherBundle',
+    'jnxM20Multilink128',
+    'jnxM20SonetOc12',
+    'jnxM20Multilink32',
+    'jnxM20Multilink4',
+    'jnxM20ChStm1',
+    'jnxM20DenseEther12',
+    'jnxM20DecaChE1',
+    'jnxM20ChDs3toDs0',
+    'jnxM20DualChDs3toDs0',
+    'jnxM20DenseEther8',
+    'jnxM20GigEther',
+    'jnxM20Crypto800',
+    'jnxM20GgsnControl',
+    'jnxM20GgsnData',
+    'jnxM20LsMultilink128',
+    'jnxM20LsMultilink32',
+    'jnxM20LsMultilink4',
+    'jnxM20AtmIIOc12',
+    'jnxM20DualAtmIIOc3',
+    'jnxM20DualQChDS3',
+    'jnxM20QuadT3',
+    'jnxM20QuadQChT3',
+    'jnxM20QChOc12',
+    'jnxM20QChStm1',
+    'jnxM20DualQChStm1',
+    'jnxM20DecaQChE1',
+    'jnxM20DualEIA530',
+    'jnxM20PassiveMonitor',
+    'jnxM20DecaQChT1',
+    'jnxM20QuadE3',
+    'jnxM20DualAtmOc3',
+    'jnxM20AtmOc12',
+    'jnxM20Tunnel',
+    'jnxM20ChOc12toDs3',
+    'jnxSubmoduleM160',
+    'jnxM160SubSFM',
+    'jnxM160SPP',
+    'jnxM160SPR',
+    'jnxM160SubFPM',
+    'jnxM160FPMCMB',
+    'jnxM160FPMDisplay',
+    'jnxM160PIC0',
+    'jnxM160SonetOc192Sr',
+    'jnxM160SonetOc192Sr2',
+    'jnxM160SonetOc192Lr1',
+    'jnxM160PIC1',
+    'jnxM160QuadSonetOc3',
+    'jnxM160QuadE1',
+    'jnxM160QuadT1',
+    'jnxM160QuadChT3',
+    'jnxM160QuadAtmE3',
+    'jnxM160QuadAtmT3',
+    'jnxM160GigEtherBundle',
+    'jnxM160ChStm1',
+    'jnxM160DecaChE1',
+    'jnxM160ChDs3toDs0',
+    'jnxM160DualChDs3toDs0',
+    'jnxM160SonetOc12',
+    'jnxM160DenseEther8',
+    'jnxM160AtmIIOc12',
+    'jnxM160DualAtmIIOc3',
+    'jnxM160DualQChDS3',
+    'jnxM160QuadQChT3',
+    'jnxM160QChOc12',
+    'jnxM160QChStm1',
+    'jnxM160DualQChStm1',
+    'jnxM160GigEther',
+    'jnxM160DecaQChE1',
+    'jnxM160DualEIA530',
+    'jnxM160PassiveMonitor',
+    'jnxM160DecaQChT1',
+    'jnxM160QuadT3',
+    'jnxM160QuadE3',
+    'jnxM160DualAtmOc3',
+    'jnxM160AtmOc12',
+    'jnxM160ChOc12toDs3',
+    'jnxM160QuadEther',
+    'jnxM160PIC2',
+    'jnxM160SonetOc48Sr',
+    'jnxM160QuadOc3',
+    'jnxM160DualQHGE',
+    'jnxM160DualAtmIIOc12',
+    'jnxM160Tunnel',
+    'jnxM160DualGigEther',
+    'jnxM160QuadSonetOc12',
+    'jnxM160SonetOc48Lr',
+    'jnxM160DenseEther48',
+    'jnxM160QuadGigEther',
+    'jnxM160Crypto800',
+    'jnxSubmoduleM10',
+    'jnxM10PIC',
+    'jnxM10QuadSonetOc3',
+    'jnxM10QuadEther',
+    'jnxM10QuadE1',
+    'jnxM10QuadT1',
+    'jnxM10SonetOc48Sr',
+    'jnxM10QuadChT3',
+    'jnxM10SonetOc48Lr',
+    'jnxM10QuadAtmE3',
+    'jnxM10QuadAtmT3',
+    'jnxM10GigEtherBundle',
+    'jnxM10Multilink128',
+    'jnxM10SonetOc12',
+    'jnxM10Multilink32',
+    'jnxM10Multilink4',
+    'jnxM10ChStm1',
+    'jnxM10DualChDs3',
+    'jnxM10DualDs3',
+    'jnxM10DualSonetOc3',
+    'jnxM10DualE3',
+    'jnxM10DenseEther12',
+    'jnxM10DecaChE1',
+    'jnxM10GigEther',
+    'jnxM10ChDs3toDs0',
+    'jnxM10DualChDs3toDs0',
+    'jnxM10DenseEther8',
+    'jnxM10Crypto800',
+    'jnxM10LsMultilink128',
+    'jnxM10LsMultilink32',
+    'jnxM10LsMultilink4',
+    'jnxM10AtmIIOc12',
+    'jnxM10QuadT3',
+    'jnxM10DualAtmIIOc3',
+    'jnxM10DualQChDs3',
+    'jnxM10QuadQChT3',
+    'jnxM10QChOc12',
+    'jnxM10QChStm1',
+    'jnxM10DualQChStm1',
+    'jnxM10DecaQChE1',
+    'jnxM10DualEIA530',
+    'jnxM10DecaQChT1',
+    'jnxM10QuadE3',
+    'jnxM10DualAtmOc3',
+    'jnxM10AtmOc12',
+    'jnxM10Tunnel',
+    'jnxM10ChOc12toDs3',
+    'jnxSubmoduleM5',
+    'jnxM5PIC',
+    'jnxM5QuadSonetOc3',
+    'jnxM5QuadEther',
+    'jnxM5QuadE1',
+    'jnxM5QuadT1',
+    'jnxM5QuadChT3',
+    'jnxM5QuadAtmE3',
+    'jnxM5QuadAtmT3',
+    'jnxM5GigEtherBundle',
+    'jnxM5Multilink128',
+    'jnxM5SonetOc12',
+    'jnxM5Multilink32',
+    'jnxM5Multilink4',
+    'jnxM5ChStm1',
+    'jnxM5DualChDs3',
+    'jnxM5DualDs3',
+    'jnxM5DualSonetOc3',
+    'jnxM5DualE3',
+    'jnxM5DenseEther12',
+    'jnxM5DecaChE1',
+    'jnxM5GigEther',
+    'jnxM5ChDs3toDs0',
+    'jnxM5DualChDs3toDs0',
+    'jnxM5DenseEther8',
+    'jnxM5Crypto800',
+    'jnxM5LsMultilink128',
+    'jnxM5LsMultilink32',
+    'jnxM5LsMultilink4',
+    'jnxM5AtmIIOc12',
+    'jnxM5QuadT3',
+    'jnxM5DualAtmIIOc3',
+    'jnxM5DualQChDs3',
+    'jnxM5QuadQChT3',
+    'jnxM5QChOc12',
+    'jnxM5QChStm1',
+    'jnxM5DualQChStm1',
+    'jnxM5DecaQChE1',
+    'jnxM5DualEIA530',
+    'jnxM5DecaQChT1',
+    'jnxM5QuadE3',
+    'jnxM5DualAtmOc3',
+    'jnxM5AtmOc12',
+    'jnxM5Tunnel',
+    'jnxM5ChOc12toDs3',
+    'jnxSubmoduleT640',
+    'jnxT640PIC0',
+    'jnxT640PIC1',
+    'jnxT640PIC2',
+    'jnxT640DualGigEther',
+    'jnxT640QuadGigEther',
+    'jnxT640QuadSonetOc12',
+    'jnxT640SonetOc48Sr',
+    'jnxT640SonetOc48Lr',
+    'jnxT640DualAtmIIOc12',
+    'jnxT640QuadOc3',
+    'jnxT640DualQHGE',
+    'jnxT640PIC3',
+    'jnxT640SonetOc192Sr2',
+    'jnxT640Tunnel',
+    'jnxT640QuadSonetOc48',
+    'jnxT640SonetOc192Vsr',
+    'jnxT640SonetOc192Lr',
+    'jnxT640TenGigEther',
+    'jnxT640NX1GigEther',
+    'jnxSubmoduleT320',
+    'jnxT320PIC0',
+    'jnxT320PIC1',
+    'jnxT320DualAtmIIOc3',
+    'jnxT320QuadSonetOc3',
+    'jnxT320DualAtmOc3',
+    'jnxT320AtmOc12',
+    'jnxT320QuadEther',
+    'jnxT320SonetOc12',
+    'jnxT320AtmIIOc12',
+    'jnxT320PIC2',
+    'jnxT320DualGigEther',
+    'jnxT320QuadGigEther',
+    'jnxT320QuadSonetOc12',
+    'jnxT320SonetOc48Sr',
+    'jnxT320SonetOc48Lr',
+    'jnxT320DualAtmIIOc12',
+    'jnxT320QuadOc3',
+    'jnxT320DualQHGE',
+    'jnxT320PIC3',
+    'jnxT320SonetOc192Sr2',
+    'jnxT320Tunnel',
+    'jnxT320QuadSonetOc48',
+    'jnxT320SonetOc192Vsr',
+    'jnxT320SonetOc192Lr',
+    'jnxT320TenGigEther',
+    'jnxT320NX1GigEther',
+    'jnxSubmoduleM40e',
+    'jnxM40eSubSFM',
+    'jnxM40eSPP',
+    'jnxM40eSPR',
+    'jnxM40eSubFPM',
+    'jnxM40eFPMCMB',
+    'jnxM40eFPMDisplay',
+    'jnxM40ePIC0',
+    'jnxM40ePIC1',
+    'jnxM40eQuadSonetOc3',
+    'jnxM40eQuadE1',
+    'jnxM40eQuadT1',
+    'jnxM40eQuadChT3',
+    'jnxM40eQuadAtmE3',
+    'jnxM40eQuadAtmT3',
+    'jnxM40eGigEtherBundle',
+    'jnxM40eChStm1',
+    'jnxM40eDecaChE1',
+    'jnxM40eChDs3toDs0',
+    'jnxM40eDualChDs3toDs0',
+    'jnxM40eSonetOc12',
+    'jnxM40eDenseEther8',
+    'jnxM40eAtmIIOc12',
+    'jnxM40eDualAtmIIOc3',
+    'jnxM40eDualQChDS3',
+    'jnxM40eQuadQChT3',
+    'jnxM40eLsMultilink128',
+    'jnxM40eLsMultilink32',
+    'jnxM40eLsMultilink4',
+    'jnxM40eGigEther',
+    'jnxM40eQChOc12',
+    'jnxM40eQChStm1',
+    'jnxM40eDualQChStm1',
+    'jnxM40eDecaQChE1',
+    'jnxM40eDualEIA530',
+    'jnxM40ePassiveMonitor',
+    'jnxM40eMultilink128',
+    'jnxM40eMultilink32',
+    'jnxM40eMultilink4',
+    'jnxM40eDenseEther12',
+    'jnxM40eQuadT3',
+    'jnxM40eDecaQChT1',
+    'jnxM40eQuadE3',
+    'jnxM40eDualAtmOc3',
+    'jnxM40eAtmOc12',
+    'jnxM40eChOc12toDs3',
+    'jnxM40eQuadEther',
+    'jnxM40ePIC2',
+    'jnxM40eSonetOc48Sr',
+    'jnxM40eQuadOc3',
+    'jnxM40eDualQHGE',
+    'jnxM40eDualAtmIIOc12',
+    'jnxM40eTunnel',
+    'jnxM40eDualGigEther',
+    'jnxM40eQuadSonetOc12',
+    'jnxM40eSonetOc48Lr',
+    'jnxM40eDenseEther48',
+    'jnxM40eQuadGigEther',
+    'jnxM40eCrypto800',
+    'jnxMiscComponent',
+    'jnxTempSensor',
+    'jnxClassStatus',
+    'jnxStatusSource',
+    'jnxStatusSourceM40',
+    'jnxChassisSlotLED',
+    'jnxChassisAlarmLED',
+    'jnxHostCtlrLED',
+    'jnxChassisTempSensor',
+    'jnxRoutingEngineLED',
+)
@@ -0,0 +1,92 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Resolve Juniper product and chassis component OIDs (sysObjectID, jnxContentsType) to JUNIPER-CHASSIS-DEFINES-MIB
+names without loading the MIB.
+
+The lookup table is generated from the MIB, run after the MIB is updated:
+    python -m cloudshell.networking.juniper.autoload.juniper_product_table
+"""
+
+import os
+import re
+from bisect import bisect_left
+
+from cloudshell.networking.juniper.autoload.juniper_product_oids import PRODUCT_NAMES, PRODUCT_OIDS
+
+CHASSIS_DEFINES_MIB = 'JUNIPER-CHASSIS-DEFINES-MIB'
+JUNIPER_PRODUCTS_OID = '1.3.6.1.4.1.2636.1'
+# Nodes snmp resolves product OIDs to, when the chassis defines MIB is not loaded
+OID_PREFIXES = {'JUNIPER-SMI::jnxProducts': JUNIPER_PRODUCTS_OID,
+                'JUNIPER-SMI::juniperMIB': '1.3.6.1.4.1.2636',
+                'SNMPv2-SMI::enterprises': '1.3.6.1.4.1'}
+
+MIB_FILE = os.path.join(os.path.dirname(__file__), '..', 'mibs', '{0}.py'.format(CHASSIS_DEFINES_MIB))
+TABLE_FILE = os.path.join(os.path.dirname(__file__), 'juniper_product_oids.py')
+MIB_IDENTIFIER_PATTERN = re.compile(r'^(?P<name>\w+) = MibIdentifier\(\((?P<oid>[\d, ]+)\)\)', re.MULTILINE)
+
+
+def _to_numeric_oid(oid):
+    """
+    :param oid: '1.3.6.1.4.1.2636.1.1.1.2.21' or 'JUNIPER-SMI::jnxProducts.1.1.1.2.21'
+    :return: numeric OID or None
+    """
+    oid = oid.strip().lstrip('.')
+    if '::' not in oid:
+        return oid
+    node, _, suffix = oid.partition('.')
+    prefix = OID_PREFIXES.get(node)
+    if prefix:
+        return '{0}.{1}'.format(prefix, suffix) if suffix else prefix
+
+
+def get_product_name(oid):
+    """
+    Find JUNIPER-CHASSIS-DEFINES-MIB name of the OID
+    :param oid: numeric OID, OID relative to a known Juniper node or already resolved name
+    :return: name, i.e. 'jnxProductNameMX960', or None
+    """
+    if not oid:
+        return None
+    if oid.startswith(CHASSIS_DEFINES_MIB + '::'):
+        return oid.split('::', 1)[1]
+    numeric_oid = _to_numeric_oid(oid)
+    if not numeric_oid or not numeric_oid.startswith(JUNIPER_PRODUCTS_OID + '.'):
+        return None
+    relative_oid = numeric_oid[len(JUNIPER_PRODUCTS_OID) + 1:]
+    position = bisect_left(PRODUCT_OIDS, relative_oid)
+    if position < len(PRODUCT_OIDS) and PRODUCT_OIDS[position] == relative_oid:
+        return PRODUCT_NAMES[position]
+    return None
+
+
+def generate_product_table(mib_file=MIB_FILE, table_file=TABLE_FILE):
+    """
+    Generate sorted OID table from the chassis defines MIB
+    :param mib_file: pysnmp MIB module
+    :param table_file: generated python module
+    :return: number of products
+    """
+    with open(mib_file) as mib:
+        identifiers = MIB_IDENTIFIER_PATTERN.findall(mib.read())
+    products = {}
+    for name, oid in identifiers:
+        oid = '.'.join(number.strip() for number in oid.split(','))
+        if oid.startswith(JUNIPER_PRODUCTS_OID + '.'):
+            products[oid[len(JUNIPER_PRODUCTS_OID) + 1:]] = name
+    oids = sorted(products)
+    with open(table_file, 'w') as table:
+        table.write('# Generated from {0} by juniper_product_table.py, do not edit\n'.format(CHASSIS_DEFINES_MIB))
+        table.write('# OIDs are relative to jnxProducts ({0}) and sorted for binary search\n\n'.format(
+            JUNIPER_PRODUCTS_OID))
+        table.write('PRODUCT_OIDS = (\n')
+        table.writelines("    '{0}',\n".format(oid) for oid in oids)
+        table.write(')\n\nPRODUCT_NAMES = (\n')
+        table.writelines("    '{0}',\n".format(products[oid]) for oid in oids)
+        table.write(')\n')
+    return len(oids)
+
+
+if __name__ == '__main__':
+    print('{0} products written to {1}'.format(generate_product_table(), TABLE_FILE))
@@ -1,15 +1,33 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import logging
 import os
 import re
+import socket
+import struct
+import threading
+from binascii import hexlify
+from collections import OrderedDict
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 from cloudshell.devices.autoload.autoload_builder import AutoloadDetailsBuilder
 from cloudshell.devices.standards.networking.autoload_structure import *
 
+from cloudshell.networking.juniper.autoload.juniper_autoload_details_stream import JuniperAutoloadDetailsStream
+from cloudshell.networking.juniper.autoload.juniper_product_table import get_product_name
 from cloudshell.networking.juniper.helpers.add_remove_vlan_helper import AddRemoveVlanHelper
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import SnmpWalkTimeout
+from cloudshell.networking.juniper.utils import index_elements_by_attributes, index_objects_by_attributes
 
-from cloudshell.networking.juniper.utils import sort_elements_by_attributes
+
+
+# ipv6 formatting without socket.inet_ntop: groups enclosed in colons, runs of zero groups from the longest one,
+# a single zero group is not compressed
+IPV6_GROUPS_TEMPLATE = ':' + ':'.join(['%x'] * 8) + ':'
+IPV6_ZERO_RUNS = [':' + ':'.join(['0'] * length) + ':' for length in range(8, 1, -1)]
+IPV6_OCTETS = {str(octet): chr(octet) for octet in range(256)}
 
 
 class JuniperGenericPort(object):
@@ -23,80 +41,92 @@ class JuniperGenericPort(object):
     IF_MIB = 'IF-MIB'
     ETHERLIKE_MIB = 'EtherLike-MIB'
 
-    def __init__(self, index, snmp_handler, shell_name, shell_type, resource_name):
+    SNMP_COLUMNS = [(IF_MIB, 'ifDescr'),
+                    (IF_MIB, 'ifType'),
+                    (IF_MIB, 'ifAlias'),
+                    (IF_MIB, 'ifPhysAddress'),
+                    (IF_MIB, 'ifMtu'),
+                    (IF_MIB, 'ifHighSpeed'),
+                    (JUNIPER_IF_MIB, 'ifChassisPort'),
+                    (JUNIPER_IF_MIB, 'ifChassisFpc'),
+                    (JUNIPER_IF_MIB, 'ifChassisPic'),
+                    (JUNIPER_IF_MIB, 'ifChassisLogicalUnit'),
+                    (ETHERLIKE_MIB, 'dot3StatsDuplexStatus')]
+
+    __slots__ = ('index', 'shell_name', 'shell_type', 'is_portchannel', 'port_adjacent', 'ipv4_addresses',
+                 'ipv6_addresses', 'associated_port_names', '_resource_name', '_port_table')
+
+    def __init__(self, index, port_table, shell_name, shell_type, resource_name):
         """
-        Create GenericPort with index and snmp handler
+        Create GenericPort with index, attributes are read from the shared port columns
         :param index:
-        :param snmp_handler:
+        :param port_table: pre-fetched columns {column_name: {index: value}}, see SNMP_COLUMNS
         :return:
         """
+        self.index = index
         self.shell_name = shell_name
         self.shell_type = shell_type
-        self.associated_port_names = []
-        self.index = index
-        self._snmp_handler = snmp_handler
         self._resource_name = resource_name
+        self._port_table = port_table
 
-        self._port_phis_id = None
-        self._port_name = None
-        self._logical_unit = None
-        self._fpc_id = None
-        self._pic_id = None
-        self._type = None
-
-        self.ipv4_addresses = []
-        self.ipv6_addresses = []
+        # Most of the ports never get addresses or members, lists are created on first add
+        self.ipv4_addresses = ()
+        self.ipv6_addresses = ()
+        self.associated_port_names = ()
         self.port_adjacent = None
+        self.is_portchannel = self.port_name[:2] in self.PORTCHANNEL_DESCRIPTIONS
 
-        if self.port_name[:2] in self.PORTCHANNEL_DESCRIPTIONS:
-            self.is_portchannel = True
-        else:
-            self.is_portchannel = False
-
-        self._max_string_length = self.AUTOLOAD_MAX_STRING_LENGTH
-
-    def _get_snmp_attribute(self, mib, snmp_attribute):
-        return self._snmp_handler.get_property(mib, snmp_attribute, self.index)
+    def _get_snmp_attribute(self, snmp_attribute):
+        return self._port_table.get(snmp_attribute, {}).get(self.index, '')
 
     @property
     def port_phis_id(self):
-        if not self._port_phis_id:
-            self._port_phis_id = self._get_snmp_attribute(self.JUNIPER_IF_MIB, 'ifChassisPort')
-        return self._port_phis_id
+        return self._get_snmp_attribute('ifChassisPort')
 
     @property
     def port_description(self):
-        return self._get_snmp_attribute('IF-MIB', 'ifAlias')
+        return self._get_snmp_attribute('ifAlias')
 
     @property
     def logical_unit(self):
-        if not self._logical_unit:
-            self._logical_unit = self._get_snmp_attribute(self.JUNIPER_IF_MIB, 'ifChassisLogicalUnit')
-        return self._logical_unit
+        return self._get_snmp_attribute('ifChassisLogicalUnit')
 
     @property
     def fpc_id(self):
-        if not self._fpc_id:
-            self._fpc_id = self._get_snmp_attribute(self.JUNIPER_IF_MIB, 'ifChassisFpc')
-        return self._fpc_id
+        return self._get_snmp_attribute('ifChassisFpc')
 
     @property
     def pic_id(self):
-        if not self._pic_id:
-            self._pic_id = self._get_snmp_attribute(self.JUNIPER_IF_MIB, 'ifChassisPic')
-        return self._pic_id
+        return self._get_snmp_attribute('ifChassisPic')
 
     @property
     def type(self):
-        if not self._type:
-            self._type = self._get_snmp_attribute(self.IF_MIB, 'ifType').strip('\'')
-        return self._type
+        return self._get_snmp_attribute('ifType').strip('\'')
 
     @property
     def port_name(self):
-        if not self._port_name:
-            self._port_name = self._get_snmp_attribute(self.IF_MIB, 'ifDescr')
-        return self._port_name
+        return self._get_snmp_attribute('ifDescr')
+
+    def add_ipv4_address(self, address):
+        self.add_ipv4_addresses([address])
+
+    def add_ipv4_addresses(self, addresses):
+        if not self.ipv4_addresses:
+            self.ipv4_addresses = []
+        self.ipv4_addresses.extend(addresses)
+
+    def add_ipv6_address(self, address):
+        self.add_ipv6_addresses([address])
+
+    def add_ipv6_addresses(self, addresses):
+        if not self.ipv6_addresses:
+            self.ipv6_addresses = []
+        self.ipv6_addresses.extend(addresses)
+
+    def add_associated_port_name(self, port_name):
+        if not self.associated_port_names:
+            self.associated_port_names = []
+        self.associated_port_names.append(port_name)
 
     def _get_associated_ipv4_address(self):
         return self._validate_attribute_value(','.join(self.ipv4_addresses))
@@ -105,13 +135,13 @@ class JuniperGenericPort(object):
         return self._validate_attribute_value(','.join(self.ipv6_addresses))
 
     def _validate_attribute_value(self, attribute_value):
-        if len(attribute_value) > self._max_string_length:
-            attribute_value = attribute_value[:self._max_string_length] + '...'
+        if len(attribute_value) > self.AUTOLOAD_MAX_STRING_LENGTH:
+            attribute_value = attribute_value[:self.AUTOLOAD_MAX_STRING_LENGTH] + '...'
         return attribute_value
 
     def _get_port_duplex(self):
         duplex = None
-        snmp_result = self._get_snmp_attribute(self.ETHERLIKE_MIB, 'dot3StatsDuplexStatus')
+        snmp_result = self._get_snmp_attribute('dot3StatsDuplexStatus')
         if snmp_result:
             port_duplex = snmp_result.strip('\'')
             if re.search(r'[Ff]ull', port_duplex):
@@ -136,9 +166,9 @@ class JuniperGenericPort(object):
 
         port.port_description = self.port_description
         port.l2_protocol_type = self.type
-        port.mac_address = self._get_snmp_attribute(self.IF_MIB, 'ifPhysAddress')
-        port.mtu = self._get_snmp_attribute(self.IF_MIB, 'ifMtu')
-        port.bandwidth = self._get_snmp_attribute(self.IF_MIB, 'ifHighSpeed')
+        port.mac_address = self._get_snmp_attribute('ifPhysAddress')
+        port.mtu = self._get_snmp_attribute('ifMtu')
+        port.bandwidth = self._get_snmp_attribute('ifHighSpeed')
         port.ipv4_address = self._get_associated_ipv4_address()
         port.ipv6_address = self._get_associated_ipv6_address()
         port.duplex = self._get_port_duplex()
@@ -176,20 +206,131 @@ class JuniperSnmpAutoload(object):
 
     SNMP_ERRORS = [r'No\s+Such\s+Object\s+currently\s+exists']
 
-    def __init__(self, snmp_handler, shell_name, shell_type, resource_name, logger):
+    JUNIPER_VENDOR = 'Juniper'
+    PRODUCT_NAME_PREFIX = 'jnxProductName'
+
+    JUNIPER_MIB = 'JUNIPER-MIB'
+    CONTENT_COLUMNS = ['jnxContentsContainerIndex', 'jnxContentsModel', 'jnxContentsType', 'jnxContentsDescr',
+                       'jnxContentsSerialNo', 'jnxContentsRevision', 'jnxContentsChassisId']
+    # Index and name columns autoload cannot be built without, their walk errors are raised
+    REQUIRED_COLUMNS = frozenset(['jnxContentsContainerIndex', 'ifDescr', 'ifChassisPort'])
+    LLDP_MIB = 'LLDP-MIB'
+    LLDP_COLUMNS = ['lldpRemPortDesc', 'lldpRemSysDesc']
+
+    # Numeric OIDs of the columns walked in raw mode
+    RAW_COLUMN_OIDS = {'jnxContentsContainerIndex': '1.3.6.1.4.1.2636.3.1.8.1.1',
+                       'jnxContentsType': '1.3.6.1.4.1.2636.3.1.8.1.5',
+                       'jnxContentsDescr': '1.3.6.1.4.1.2636.3.1.8.1.6',
+                       'jnxContentsSerialNo': '1.3.6.1.4.1.2636.3.1.8.1.7',
+                       'jnxContentsRevision': '1.3.6.1.4.1.2636.3.1.8.1.8',
+                       'jnxContentsChassisId': '1.3.6.1.4.1.2636.3.1.8.1.11',
+                       'jnxContentsModel': '1.3.6.1.4.1.2636.3.1.8.1.14',
+                       'ifDescr': '1.3.6.1.2.1.2.2.1.2',
+                       'ifType': '1.3.6.1.2.1.2.2.1.3',
+                       'ifMtu': '1.3.6.1.2.1.2.2.1.4',
+                       'ifPhysAddress': '1.3.6.1.2.1.2.2.1.6',
+                       'ifHighSpeed': '1.3.6.1.2.1.31.1.1.1.15',
+                       'ifAlias': '1.3.6.1.2.1.31.1.1.1.18',
+                       'ifChassisFpc': '1.3.6.1.4.1.2636.3.3.2.1.1',
+                       'ifChassisPic': '1.3.6.1.4.1.2636.3.3.2.1.2',
+                       'ifChassisPort': '1.3.6.1.4.1.2636.3.3.2.1.3',
+                       'ifChassisLogicalUnit': '1.3.6.1.4.1.2636.3.3.2.1.5',
+                       'dot3StatsDuplexStatus': '1.3.6.1.2.1.10.7.2.1.19',
+                       'lldpRemPortDesc': '1.0.8802.1.1.2.1.4.1.1.8',
+                       'lldpRemSysDesc': '1.0.8802.1.1.2.1.4.1.1.10'}
+    RAW_ENUMERATED_COLUMNS = frozenset(['ifType', 'dot3StatsDuplexStatus', 'jnxContentsChassisId'])
+    TABLE_OIDS = OrderedDict([('_ipv4_table', ('IP-MIB', 'ipAddrTable')),
+                              ('_ipv6_table', ('IPV6-MIB', 'ipv6AddrEntry')),
+                              ('_lag_table', ('IEEE8023-LAG-MIB', 'dot3adAggPortAttachedAggID')),
+                              ('_lldp_keys', (LLDP_MIB, 'lldpRemPortId'))])
+
+    DISCOVER_STAGES = ['_load_cached_tables', '_fetch_snmp_data', '_build_root', '_build_chassis',
+                       '_build_power_modules', '_build_modules', '_build_sub_modules', '_build_ports',
+                       '_save_cached_tables']
+
+    CACHE_INDICATORS = OrderedDict([('sysUpTime', ('SNMPv2-MIB', 'sysUpTime')),
+                                    ('jnxBoxDescr', ('JUNIPER-MIB', 'jnxBoxDescr')),
+                                    ('jnxContentsLastChange', ('JUNIPER-MIB', 'jnxContentsLastChange')),
+                                    ('ifTableLastChange', ('IF-MIB', 'ifTableLastChange')),
+                                    ('lldpStatsRemTablesLastChangeTime',
+                                     ('LLDP-MIB', 'lldpStatsRemTablesLastChangeTime'))])
+    # Tables without a change indicator (ip addresses, LAG) are always walked
+    CACHED_TABLES = {'_content_table': 'jnxContentsLastChange',
+                     '_port_identity_table': 'ifTableLastChange',
+                     '_lldp_keys': 'lldpStatsRemTablesLastChangeTime',
+                     '_lldp_table': 'lldpStatsRemTablesLastChangeTime'}
+    # ifTableLastChange changes only when interfaces are created or deleted, so only the columns which identify
+    # the interface are cached, description, MTU, speed and duplex are walked every time
+    PORT_IDENTITY_COLUMNS = ['ifDescr', 'ifType', 'ifChassisPort', 'ifChassisFpc', 'ifChassisPic',
+                             'ifChassisLogicalUnit']
+    CACHED_TABLE_COLUMNS = {'_content_table': CONTENT_COLUMNS,
+                            '_port_identity_table': PORT_IDENTITY_COLUMNS,
+                            '_lldp_table': LLDP_COLUMNS}
+
+    def __init__(self, snmp_handler, shell_name, shell_type, resource_name, logger, snmp_session_factory=None,
+                 max_workers=1, autoload_cache=None, filter_port_names=None, filter_port_types=None, raw_oids=False,
+                 profiler=None, prefetch=False):
+        """
+        :param snmp_handler:
+        :param shell_name:
+        :param shell_type:
+        :param resource_name:
+        :param logger:
+        :param snmp_session_factory: callable which returns a new snmp session, used by the concurrent fetch workers
+        :param max_workers: max number of concurrent fetch workers
+        :param autoload_cache: snapshot of the tables collected by the previous autoload
+        :type autoload_cache: cloudshell.networking.juniper.autoload.juniper_autoload_cache.JuniperAutoloadCache
+        :param filter_port_names: additional port name prefixes to skip, extends FILTER_PORTS_BY_DESCRIPTION
+        :param filter_port_types: additional port types to skip, extends FILTER_PORTS_BY_TYPE
+        :param raw_oids: walk the columns by numeric OID and decode only the values, see RAW_COLUMN_OIDS
+        :param profiler: count snmp requests of all sessions and time discover stages
+        :type profiler: cloudshell.networking.juniper.autoload.juniper_autoload_profiler.JuniperAutoloadProfiler
+        :param prefetch: walk all tables with one pipelined prefetch of the snmp handler instead of the concurrent
+            fetch workers, see JuniperAsyncSnmpService
+        """
         self.shell_name = shell_name
         self.shell_type = shell_type
         self._content_indexes = None
+        self._content_table = None
         self._if_indexes = None
+        self._port_table = None
+        self._port_identity_table = None
+        self._failed_columns = set()
+        self._columns = {}
         self._logger = logger
-        self._snmp_handler = snmp_handler
+        self.profiler = profiler
+        self._snmp_handler = profiler.wrap(snmp_handler) if profiler else snmp_handler
+        self._snmp_session_factory = snmp_session_factory
+        self._max_workers = max_workers
+        self._autoload_cache = autoload_cache
+        self._cache_indicators = None
+        self._port_name_filter = self._compile_port_name_filter(
+            self.FILTER_PORTS_BY_DESCRIPTION + list(filter_port_names or []))
+        self._port_type_filter = frozenset(self.FILTER_PORTS_BY_TYPE).union(filter_port_types or [])
+        self._raw_oids = raw_oids
+        self._prefetch = prefetch
+        self._thread_data = threading.local()
         self._resource_name = resource_name
         self._initialize_snmp_handler()
+        self._reset_resources()
+
+        self._ipv4_table = None
+        self._ipv6_table = None
+        self._lag_table = None
+        self._if_duplex_table = None
+        self._autoneg = None
+        self._lldp_keys = None
+        self._lldp_table = None
 
-        self.resource = GenericResource(shell_name=shell_name,
-                                        shell_type=shell_type,
-                                        name=resource_name,
-                                        unique_id=resource_name)
+    def _reset_resources(self):
+        """
+        Drop the resource tree, the fetched snmp tables are kept for the next discover attempt
+        :return:
+        """
+        self.resource = GenericResource(shell_name=self.shell_name,
+                                        shell_type=self.shell_type,
+                                        name=self._resource_name,
+                                        unique_id=self._resource_name)
         self._chassis = {}
         self._modules = {}
         self.sub_modules = {}
@@ -197,13 +338,9 @@ class JuniperSnmpAutoload(object):
         self._logical_generic_ports = {}
         self._physical_generic_ports = {}
         self._generic_physical_ports_by_name = None
+        self._generic_physical_ports_by_base_name = None
         self._generic_logical_ports_by_name = None
-
-        self._ipv4_table = None
-        self._ipv6_table = None
-        self._if_duplex_table = None
-        self._autoneg = None
-        self._lldp_keys = None
+        self._physical_ports_by_logical_index = None
 
     @property
     def logger(self):
@@ -211,41 +348,120 @@ class JuniperSnmpAutoload(object):
 
     @property
     def snmp_handler(self):
-        return self._snmp_handler
+        """
+        Snmp session of the concurrent fetch worker, or the main snmp handler
+        """
+        return getattr(self._thread_data, 'snmp_handler', None) or self._snmp_handler
+
+    def _get_ipv4_table(self):
+        """
+        Group ipv4 addresses by interface in one pass over ipAddrTable
+        :return: dict {if_index: [address]}
+        """
+        ip_addr_table = self.snmp_handler.walk(self.TABLE_OIDS['_ipv4_table'])
+        rows_by_if_index = index_elements_by_attributes(ip_addr_table.itervalues(), 'ipAdEntIfIndex', group=True)
+        return {int(if_index): [row.get('ipAdEntAddr') or row['suffix'] for row in rows]
+                for (if_index,), rows in rows_by_if_index.iteritems() if if_index.isdigit()}
 
     @property
     def ipv4_table(self):
-        if not self._ipv4_table:
-            self._ipv4_table = sort_elements_by_attributes(
-                self._snmp_handler.walk(('IP-MIB', 'ipAddrTable')), 'ipAdEntIfIndex')
+        if self._ipv4_table is None:
+            self._ipv4_table = self._get_ipv4_table()
         return self._ipv4_table
 
+    def _get_ipv6_table(self):
+        """
+        Group ipv6 addresses by interface in one pass over ipv6AddrTable
+        The address is not accessible, the row index is ifIndex followed by 16 address octets
+        :return: dict {if_index: [address]}
+        """
+        ipv6_table = {}
+        for row in self.snmp_handler.walk(self.TABLE_OIDS['_ipv6_table']).itervalues():
+            suffix = row['suffix'].split('.')
+            if len(suffix) != 17 or not suffix[0].isdigit():
+                continue
+            try:
+                address = self._format_ipv6_address(suffix[1:])
+            except KeyError:
+                # not an octet
+                continue
+            ipv6_table.setdefault(int(suffix[0]), []).append(address)
+        return ipv6_table
+
+    @staticmethod
+    def _format_ipv6_address(octets):
+        """
+        Format ipv6 address, the longest run of zero groups is compressed
+        :param octets: list of 16 decimal octets, i.e. ['254', '128', '0', ...]
+        :return: str, i.e. 'fe80::1'
+        """
+        packed_address = ''.join([IPV6_OCTETS[octet] for octet in octets])
+        if hasattr(socket, 'inet_ntop'):
+            return socket.inet_ntop(socket.AF_INET6, packed_address)
+        # socket.inet_ntop is not available on Windows
+        address = IPV6_GROUPS_TEMPLATE % struct.unpack('>8H', packed_address)
+        for zero_run in IPV6_ZERO_RUNS:
+            position = address.find(zero_run)
+            if position >= 0:
+                return '{0}::{1}'.format(address[1:position], address[position + len(zero_run):-1])
+        return address[1:-1]
+
     @property
     def ipv6_table(self):
-        if not self._ipv6_table:
-            self._ipv6_table = sort_elements_by_attributes(
-                self._snmp_handler.walk(('IPV6-MIB', 'ipv6AddrEntry')), 'ipAdEntIfIndex')
+        if self._ipv6_table is None:
+            self._ipv6_table = self._get_ipv6_table()
         return self._ipv6_table
 
+    def _get_lag_table(self):
+        return self.snmp_handler.walk(self.TABLE_OIDS['_lag_table'])
+
+    @property
+    def lag_table(self):
+        if self._lag_table is None:
+            self._lag_table = self._get_lag_table()
+        return self._lag_table
+
     @property
     def generic_physical_ports_by_name(self):
         if not self._generic_physical_ports_by_name:
-            self._generic_physical_ports_by_name = {}
-            for index, generic_port in self._physical_generic_ports.iteritems():
-                self._generic_physical_ports_by_name[generic_port.port_name] = generic_port
+            self._generic_physical_ports_by_name = {
+                port_name: generic_port for (port_name,), generic_port in
+                index_objects_by_attributes(self._physical_generic_ports.itervalues(), 'port_name').iteritems()}
         return self._generic_physical_ports_by_name
 
+    @staticmethod
+    def _get_base_port_name(port_name):
+        """
+        Interface name without logical unit, ge-0/0/1.10 -> ge-0/0/1
+        :param port_name:
+        :rtype: str
+        """
+        return port_name.split('.', 1)[0]
+
+    @property
+    def generic_physical_ports_by_base_name(self):
+        """
+        Physical ports indexed by interface name without logical unit
+        """
+        if not self._generic_physical_ports_by_base_name:
+            self._generic_physical_ports_by_base_name = {}
+            for port_name, generic_port in self.generic_physical_ports_by_name.iteritems():
+                base_name = self._get_base_port_name(port_name)
+                if base_name == port_name or base_name not in self._generic_physical_ports_by_base_name:
+                    self._generic_physical_ports_by_base_name[base_name] = generic_port
+        return self._generic_physical_ports_by_base_name
+
     @property
     def generic_logical_ports_by_name(self):
         if not self._generic_logical_ports_by_name:
-            self._generic_logical_ports_by_name = {}
-            for index, generic_port in self._logical_generic_ports.iteritems():
-                self._generic_logical_ports_by_name[generic_port.port_name] = generic_port
+            self._generic_logical_ports_by_name = {
+                port_name: generic_port for (port_name,), generic_port in
+                index_objects_by_attributes(self._logical_generic_ports.itervalues(), 'port_name').iteritems()}
         return self._generic_logical_ports_by_name
 
     def _build_lldp_keys(self):
         result_dict = {}
-        keys = self.snmp_handler.walk(('LLDP-MIB', 'lldpRemPortId')).keys()
+        keys = self.snmp_handler.walk(self.TABLE_OIDS['_lldp_keys']).keys()
         for key in keys:
             key_splited = str(key).split('.')
             if len(key_splited) == 3:
@@ -256,28 +472,181 @@ class JuniperSnmpAutoload(object):
 
     @property
     def lldp_keys(self):
-        if not self._lldp_keys:
+        if self._lldp_keys is None:
             self._lldp_keys = self._build_lldp_keys()
         return self._lldp_keys
 
-    def _initialize_snmp_handler(self):
+    def _get_lldp_table(self):
+        """
+        Walk remote port and system description columns once for all neighbors
+        :return: dict {column_name: {lldp_key: value}}
+        """
+        return {column: self._get_column(self.LLDP_MIB, column) for column in self.LLDP_COLUMNS}
+
+    @property
+    def lldp_table(self):
+        if self._lldp_table is None:
+            self._lldp_table = self._get_lldp_table()
+        return self._lldp_table
+
+    def _initialize_snmp_handler(self, snmp_handler=None):
         """
         Snmp settings and load specific mibs
+        :param snmp_handler: snmp session to initialize, the main snmp handler by default
         :return:
         """
+        snmp_handler = snmp_handler or self.snmp_handler
         path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mibs'))
-        self.snmp_handler.update_mib_sources(path)
+        snmp_handler.update_mib_sources(path)
         self.logger.info("Loading mibs")
-        self.snmp_handler.load_mib('JUNIPER-MIB')
-        self.snmp_handler.load_mib('JUNIPER-IF-MIB')
-        self.snmp_handler.load_mib('IF-MIB')
-        self.snmp_handler.load_mib('JUNIPER-CHASSIS-DEFINES-MIB')
-        self.snmp_handler.load_mib('IEEE8023-LAG-MIB')
-        self.snmp_handler.load_mib('EtherLike-MIB')
-        self.snmp_handler.load_mib('IP-MIB')
-        self.snmp_handler.load_mib('IPV6-MIB')
-        self.snmp_handler.load_mib('LLDP-MIB')
-        self._snmp_handler.set_snmp_errors(self.SNMP_ERRORS)
+        snmp_handler.load_mib('JUNIPER-MIB')
+        snmp_handler.load_mib('JUNIPER-IF-MIB')
+        snmp_handler.load_mib('IF-MIB')
+        snmp_handler.load_mib('IEEE8023-LAG-MIB')
+        snmp_handler.load_mib('EtherLike-MIB')
+        snmp_handler.load_mib('IP-MIB')
+        snmp_handler.load_mib('IPV6-MIB')
+        snmp_handler.load_mib('LLDP-MIB')
+        snmp_handler.set_snmp_errors(self.SNMP_ERRORS)
+
+    def _run_in_worker_session(self, task):
+        """
+        Run fetch task in the snmp session of the current worker thread
+        :param task:
+        :return: task result
+        """
+        if not getattr(self._thread_data, 'snmp_handler', None):
+            snmp_handler = self._snmp_session_factory()
+            if self.profiler:
+                snmp_handler = self.profiler.wrap(snmp_handler)
+            self._initialize_snmp_handler(snmp_handler)
+            self._thread_data.snmp_handler = snmp_handler
+        return task()
+
+    def _run_fetch_task(self, task):
+        """
+        Run fetch task in the worker session, the error is returned, so the results of the other tasks are kept
+        :param task:
+        :return: tuple (result, error)
+        """
+        try:
+            return self._run_in_worker_session(task), None
+        except Exception as e:
+            return None, e
+
+    def _fetch_snmp_data(self):
+        """
+        Fetch independent snmp tables concurrently, the tree is built from the fetched data afterwards
+        Results of the succeeded tasks are kept when some task fails, so the next attempt fetches only the rest
+        :return:
+        """
+        if self._prefetch:
+            self._prefetch_snmp_data()
+            return
+        if not self._snmp_session_factory or self._max_workers < 2:
+            return
+
+        tasks = [(name, fetch) for name, fetch in [('_ipv4_table', self._get_ipv4_table),
+                                                   ('_ipv6_table', self._get_ipv6_table),
+                                                   ('_lag_table', self._get_lag_table),
+                                                   ('_lldp_keys', self._build_lldp_keys)] if getattr(self, name) is None]
+        if self._content_table is None:
+            tasks.extend((('_content_table', column), partial(self._get_column, self.JUNIPER_MIB, column))
+                         for column in self.CONTENT_COLUMNS)
+        if self._port_table is None:
+            tasks.extend((('_port_table', column), partial(self._get_column, mib, column))
+                         for mib, column in self._get_missing_port_columns())
+        if self._lldp_table is None:
+            tasks.extend((('_lldp_table', column), partial(self._get_column, self.LLDP_MIB, column))
+                         for column in self.LLDP_COLUMNS)
+        if not tasks:
+            return
+
+        self.logger.debug('Fetching snmp data, {0} workers'.format(self._max_workers))
+        pool = ThreadPool(min(self._max_workers, len(tasks)))
+        try:
+            results = pool.map(self._run_fetch_task, [fetch for name, fetch in tasks], chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+        columns = {'_content_table': {}, '_port_table': {}, '_lldp_table': {}}
+        errors = [error for result, error in results if error is not None]
+        for (name, fetch), (result, error) in zip(tasks, results):
+            if error is not None:
+                continue
+            if isinstance(name, tuple):
+                table_name, column = name
+                columns[table_name][column] = result
+            else:
+                setattr(self, name, result)
+        if errors:
+            raise errors[0]
+        if self._content_table is None:
+            self._content_table = self._build_content_table(columns['_content_table'])
+        if self._port_table is None:
+            self._port_table = dict(self._port_identity_table or {}, **columns['_port_table'])
+        if self._lldp_table is None:
+            self._lldp_table = columns['_lldp_table']
+
+    def _prefetch_snmp_data(self):
+        """
+        Walk the tables which are not loaded yet with one pipelined prefetch, the builders receive the prefetched
+        walks. Failed walks are requested again by the builders, so the errors are handled the usual way
+        :return:
+        """
+        columns = []
+        if self._content_table is None:
+            columns.extend((self.JUNIPER_MIB, column) for column in self.CONTENT_COLUMNS)
+        if self._port_table is None:
+            columns.extend(self._get_missing_port_columns())
+        if self._lldp_table is None:
+            columns.extend((self.LLDP_MIB, column) for column in self.LLDP_COLUMNS)
+        oids = [oid for name, oid in self.TABLE_OIDS.iteritems() if getattr(self, name) is None]
+        oids.extend(self.RAW_COLUMN_OIDS[column] if self._raw_oids and column in self.RAW_COLUMN_OIDS else (mib, column)
+                    for mib, column in columns if (mib, column) not in self._columns)
+        if oids:
+            self.logger.debug('Prefetching {0} snmp tables'.format(len(oids)))
+            self.snmp_handler.prefetch(oids)
+
+    def _get_cache_indicators(self):
+        """
+        Cheap values which show that the device or its tables were changed
+        :return: dict {indicator_name: value}
+        """
+        return {name: self.snmp_handler.get_property(mib, attribute, 0)
+                for name, (mib, attribute) in self.CACHE_INDICATORS.iteritems()}
+
+    def _load_cached_tables(self):
+        """
+        Reuse the tables of the previous autoload which were not changed on the device
+        :return:
+        """
+        if not self._autoload_cache:
+            return
+        self._cache_indicators = self._get_cache_indicators()
+        tables = self._autoload_cache.get_unchanged_tables(self._cache_indicators, self.CACHED_TABLES)
+        for name, table in tables.iteritems():
+            setattr(self, name, table)
+
+    def _save_cached_tables(self):
+        """
+        Save collected tables for the next autoload
+        :return:
+        """
+        if not self._autoload_cache or self._cache_indicators is None:
+            return
+        if self._port_table is not None:
+            self._port_identity_table = {column: self._port_table[column] for column in self.PORT_IDENTITY_COLUMNS
+                                         if column in self._port_table}
+        tables = {}
+        for name in self.CACHED_TABLES:
+            failed_columns = self._failed_columns.intersection(self.CACHED_TABLE_COLUMNS.get(name, []))
+            if failed_columns:
+                self.logger.debug('{0} is not cached, failed to walk {1}'.format(name, ', '.join(failed_columns)))
+            elif getattr(self, name) is not None:
+                tables[name] = getattr(self, name)
+        self._autoload_cache.save(self._cache_indicators, tables)
 
     def _build_root(self):
         """
@@ -289,8 +658,12 @@ class JuniperSnmpAutoload(object):
         model = ''
         os_version = ''
         sys_obj_id = self.snmp_handler.get_property('SNMPv2-MIB', 'sysObjectID', 0)
+        product_name = get_product_name(sys_obj_id)
         model_search = re.search('^(?P<vendor>\w+)-\S+jnxProductName(?P<model>\S+)', sys_obj_id)
-        if model_search:
+        if product_name and product_name.startswith(self.PRODUCT_NAME_PREFIX):
+            vendor = self.JUNIPER_VENDOR
+            model = product_name[len(self.PRODUCT_NAME_PREFIX):]
+        elif model_search:
             vendor = model_search.groupdict()['vendor'].capitalize()
             model = model_search.groupdict()['model']
         sys_descr = self.snmp_handler.get_property('SNMPv2-MIB', 'sysDescr', '0')
@@ -305,10 +678,37 @@ class JuniperSnmpAutoload(object):
         self.resource.vendor = vendor
         self.resource.model = model
 
+    def _build_content_table(self, columns):
+        """
+        Join jnxContentsTable columns into rows
+        :param columns: dict {column_name: {index: value}}
+        :return: dict {index: {column_name: value}}
+        """
+        content_table = {}
+        for column, values in columns.iteritems():
+            for index, value in values.iteritems():
+                if index not in content_table:
+                    content_table[index] = dict.fromkeys(self.CONTENT_COLUMNS, '')
+                content_table[index][column] = value
+        return content_table
+
+    def _get_content_table(self):
+        """
+        Walk each jnxContentsTable column once, shared by chassis, power port, module and sub module builders
+        :return: dict {index: {column_name: value}}
+        """
+        return self._build_content_table(
+            {column: self._get_column(self.JUNIPER_MIB, column) for column in self.CONTENT_COLUMNS})
+
+    @property
+    def content_table(self):
+        if self._content_table is None:
+            self._content_table = self._get_content_table()
+        return self._content_table
+
     def _get_content_indexes(self):
-        container_indexes = self.snmp_handler.walk(('JUNIPER-MIB', 'jnxContentsContainerIndex'))
         content_indexes = {}
-        for index, value in container_indexes.iteritems():
+        for index, value in self.content_table.iteritems():
             ct_index = value['jnxContentsContainerIndex']
             if ct_index in content_indexes:
                 content_indexes[ct_index].append(index)
@@ -318,14 +718,86 @@ class JuniperSnmpAutoload(object):
 
     @property
     def content_indexes(self):
-        if not self._content_indexes:
+        if self._content_indexes is None:
             self._content_indexes = self._get_content_indexes()
         return self._content_indexes
 
+    def _get_column(self, mib, column):
+        """
+        Walk single table column
+        Failed walk of an optional attribute column gives an empty column, failures of the index and name columns
+        are raised, see REQUIRED_COLUMNS. Walk interrupted by timeouts is always raised, so it can be resumed
+        Walked columns are kept, the next discover attempt does not walk them again
+        :param mib:
+        :param column:
+        :return: dict {index: value}
+        """
+        if (mib, column) in self._columns:
+            return self._columns[(mib, column)]
+        try:
+            if self._raw_oids and column in self.RAW_COLUMN_OIDS:
+                values = self._get_raw_column(mib, column)
+            else:
+                snmp_data = self.snmp_handler.walk((mib, column))
+                values = {index: value[column].strip(' \t\n\r') for index, value in snmp_data.iteritems()
+                          if column in value}
+        except SnmpWalkTimeout:
+            raise
+        except Exception as e:
+            if column in self.REQUIRED_COLUMNS:
+                raise
+            self.logger.error('Cannot walk {0}::{1}, {2}'.format(mib, column, e))
+            self._failed_columns.add(column)
+            return {}
+        self._columns[(mib, column)] = values
+        return values
+
+    def _get_raw_column(self, mib, column):
+        """
+        Walk single table column by numeric OID, values are converted to the strings the builders use
+        :param mib:
+        :param column:
+        :return: dict {index: value}
+        """
+        snmp_data = self.snmp_handler.walk_oid(self.RAW_COLUMN_OIDS[column])
+        named_values = None
+        if column in self.RAW_ENUMERATED_COLUMNS:
+            named_values = self.snmp_handler.get_named_values(mib, column)
+        if named_values:
+            return {index: named_values.getName(value) or str(value) for index, value in snmp_data.iteritems()}
+        if column == 'ifPhysAddress':
+            return {index: '0x' + hexlify(value) if value else '' for index, value in snmp_data.iteritems()}
+        return {index: value.strip(' \t\n\r') if isinstance(value, str) else str(value)
+                for index, value in snmp_data.iteritems()}
+
+    def _get_port_table(self):
+        """
+        Walk each port column once instead of requesting every attribute for every port
+        :return: dict {column_name: {if_index: value}}
+        """
+        port_table = dict(self._port_identity_table or {})
+        for mib, column in self._get_missing_port_columns():
+            port_table[column] = self._get_column(mib, column)
+        return port_table
+
+    def _get_missing_port_columns(self):
+        """
+        Port columns which are not loaded from the autoload cache
+        :return: list [(mib, column)]
+        """
+        return [(mib, column) for mib, column in JuniperGenericPort.SNMP_COLUMNS
+                if column not in (self._port_identity_table or {})]
+
+    @property
+    def port_table(self):
+        if self._port_table is None:
+            self._port_table = self._get_port_table()
+        return self._port_table
+
     @property
     def if_indexes(self):
         if not self._if_indexes:
-            self._if_indexes = self.snmp_handler.walk(('JUNIPER-IF-MIB', 'ifChassisPort')).keys()
+            self._if_indexes = self.port_table['ifChassisPort'].keys()
         return self._if_indexes
 
     def _build_chassis(self):
@@ -335,12 +807,9 @@ class JuniperSnmpAutoload(object):
         """
         self.logger.debug('Building Chassis')
         element_index = '1'
-        chassis_snmp_attributes = {'jnxContentsModel': 'str', 'jnxContentsType': 'str', 'jnxContentsSerialNo': 'str',
-                                   'jnxContentsChassisId': 'str'}
         if element_index in self.content_indexes:
             for index in self.content_indexes[element_index]:
-                content_data = self.snmp_handler.get_properties('JUNIPER-MIB', index, chassis_snmp_attributes).get(
-                    index)
+                content_data = self.content_table[index]
                 index1, index2, index3, index4 = index.split('.')[:4]
                 chassis_id = index2
 
@@ -362,14 +831,10 @@ class JuniperSnmpAutoload(object):
         :return:
         """
         self.logger.debug("Building PowerPorts")
-        power_modules_snmp_attributes = {"jnxContentsModel": "str", "jnxContentsType": "str", "jnxContentsDescr": "str",
-                                         "jnxContentsSerialNo": "str", "jnxContentsRevision": "str",
-                                         "jnxContentsChassisId": "str"}
         element_index = "2"
         if element_index in self.content_indexes:
             for index in self.content_indexes[element_index]:
-                content_data = self.snmp_handler.get_properties("JUNIPER-MIB", index,
-                                                                power_modules_snmp_attributes).get(index)
+                content_data = self.content_table[index]
                 index1, index2, index3, index4 = index.split(".")[:4]
                 power_port_id = index2
 
@@ -394,16 +859,10 @@ class JuniperSnmpAutoload(object):
         :return:
         """
         self.logger.debug("Building Modules")
-        modules_snmp_attributes = {"jnxContentsModel": "str",
-                                   "jnxContentsType": "str",
-                                   "jnxContentsSerialNo": "str",
-                                   "jnxContentsRevision": "str",
-                                   "jnxContentsChassisId": "str"}
         element_index = "7"
         if element_index in self.content_indexes:
             for index in self.content_indexes[element_index]:
-                content_data = self.snmp_handler.get_properties("JUNIPER-MIB", index,
-                                                                modules_snmp_attributes).get(index)
+                content_data = self.content_table[index]
                 index1, index2, index3, index4 = index.split(".")[:4]
                 module_id = index2
 
@@ -428,16 +887,10 @@ class JuniperSnmpAutoload(object):
         :return:
         """
         self.logger.debug("Building Sub Modules")
-        sub_modules_snmp_attributes = {"jnxContentsModel": "str",
-                                       "jnxContentsType": "str",
-                                       "jnxContentsSerialNo": "str",
-                                       "jnxContentsRevision": "str"}
-
         element_index = "8"
         if element_index in self.content_indexes:
             for index in self.content_indexes[element_index]:
-                content_data = self.snmp_handler.get_properties("JUNIPER-MIB", index,
-                                                                sub_modules_snmp_attributes).get(index)
+                content_data = self.content_table[index]
                 index1, index2, index3, index4 = index.split(".")[:4]
                 parent_id = index2
                 sub_module_id = index3
@@ -458,7 +911,8 @@ class JuniperSnmpAutoload(object):
     def _get_element_model(content_data):
         model_string = content_data.get('jnxContentsModel')
         if not model_string:
-            model_string = content_data.get('jnxContentsType').split('::')[-1]
+            content_type = content_data.get('jnxContentsType')
+            model_string = get_product_name(content_type) or content_type.split('::')[-1]
         return model_string
 
     def _build_generic_ports(self):
@@ -468,18 +922,48 @@ class JuniperSnmpAutoload(object):
         """
         self.logger.debug("Building generic ports")
 
+        port_names = self.port_table.get('ifDescr', {})
+        port_types = self.port_table.get('ifType', {})
         for index in self.if_indexes:
             index = int(index)
+            if self._port_filtered(port_names.get(index, ''), port_types.get(index, '').strip('\'')):
+                continue
             generic_port = JuniperGenericPort(index=index,
-                                              snmp_handler=self.snmp_handler,
+                                              port_table=self.port_table,
                                               shell_name=self.shell_name,
                                               shell_type=self.shell_type,
                                               resource_name=self._resource_name)
-            if not self._port_filtered_by_name(generic_port) and not self._port_filtered_by_type(generic_port):
-                if generic_port.logical_unit == '0':
-                    self._physical_generic_ports[index] = generic_port
-                else:
-                    self._logical_generic_ports[index] = generic_port
+            if generic_port.logical_unit == '0':
+                self._physical_generic_ports[index] = generic_port
+            else:
+                self._logical_generic_ports[index] = generic_port
+
+    @property
+    def physical_ports_by_logical_index(self):
+        """
+        Physical port of every logical port, resolved once per logical port
+        :return: dict {logical if_index: JuniperGenericPort}
+        """
+        if self._physical_ports_by_logical_index is None:
+            self._physical_ports_by_logical_index = {}
+            for index, logical_port in self._logical_generic_ports.iteritems():
+                physical_port = self.get_associated_phisical_port_by_name(logical_port.port_name)
+                if physical_port:
+                    self._physical_ports_by_logical_index[index] = physical_port
+        return self._physical_ports_by_logical_index
+
+    def _associate_ip_addresses(self, ip_table, add_addresses):
+        """
+        Join addresses grouped by interface with the physical ports of the logical interfaces
+        :param ip_table: dict {if_index: [address]}
+        :param add_addresses: callable (physical port, addresses)
+        :return:
+        """
+        physical_ports = self.physical_ports_by_logical_index
+        for if_index, addresses in ip_table.iteritems():
+            physical_port = physical_ports.get(if_index)
+            if physical_port:
+                add_addresses(physical_port, addresses)
 
     def _associate_ipv4_addresses(self):
         """
@@ -487,13 +971,7 @@ class JuniperSnmpAutoload(object):
         :return:
         """
         self.logger.debug("Associate ipv4")
-        for index in self.ipv4_table:
-            if int(index) in self._logical_generic_ports:
-                logical_port = self._logical_generic_ports[int(index)]
-                physical_port = self.get_associated_phisical_port_by_name(logical_port.port_name)
-                ipv4_address = self.ipv4_table[index].get('ipAdEntAddr')
-                if physical_port and ipv4_address:
-                    physical_port.ipv4_addresses.append(ipv4_address)
+        self._associate_ip_addresses(self.ipv4_table, JuniperGenericPort.add_ipv4_addresses)
 
     def _associate_ipv6_addresses(self):
         """
@@ -501,13 +979,7 @@ class JuniperSnmpAutoload(object):
         :return:
         """
         self.logger.debug("Associate ipv6")
-        for index in self.ipv6_table:
-            if int(index) in self._logical_generic_ports:
-                logical_port = self._logical_generic_ports[int(index)]
-                physical_port = self.get_associated_phisical_port_by_name(logical_port.port_name)
-                ipv6_address = self.ipv6_table[index].get('ipAdEntAddr')
-                if ipv6_address:
-                    physical_port.ipv6_addresses.append(ipv6_address)
+        self._associate_ip_addresses(self.ipv6_table, JuniperGenericPort.add_ipv6_addresses)
 
     def _associate_portchannels(self):
         """
@@ -515,7 +987,7 @@ class JuniperSnmpAutoload(object):
         :return:
         """
         self.logger.debug("Associate portchannels")
-        snmp_data = self._snmp_handler.walk(('IEEE8023-LAG-MIB', 'dot3adAggPortAttachedAggID'))
+        snmp_data = self.lag_table
         for port_index in snmp_data:
             port_index = int(port_index)
             if port_index in self._logical_generic_ports:
@@ -528,7 +1000,8 @@ class JuniperSnmpAutoload(object):
                     if associated_phisical_portchannel:
                         associated_phisical_portchannel.is_portchannel = True
                         if associated_phisical_port:
-                            associated_phisical_portchannel.associated_port_names.append(associated_phisical_port.name)
+                            associated_phisical_portchannel.add_associated_port_name(
+                                AddRemoveVlanHelper.convert_port_name(associated_phisical_port.port_name))
 
     def _associate_adjacent(self):
         for index in self.lldp_keys:
@@ -541,41 +1014,59 @@ class JuniperSnmpAutoload(object):
                 self._set_adjacent(index, physical_port)
 
     def _set_adjacent(self, index, port):
-        rem_port_descr = self._snmp_handler.get_property('LLDP-MIB', 'lldpRemPortDesc', self.lldp_keys[index])
-        rem_sys_descr = self._snmp_handler.get_property('LLDP-MIB', 'lldpRemSysDesc', self.lldp_keys[index])
+        if not port:
+            return
+        lldp_key = self.lldp_keys[index]
+        rem_port_descr = self.lldp_table['lldpRemPortDesc'].get(lldp_key, '')
+        rem_sys_descr = self.lldp_table['lldpRemSysDesc'].get(lldp_key, '')
         port.port_adjacent = '{0}, {1}'.format(rem_port_descr, rem_sys_descr)
 
     def get_associated_phisical_port_by_name(self, description):
         """
         Associate physical port by description
-        :param description:
-        :return:
+        :param description: logical port name, i.e. ge-0/0/1.10
+        :return: JuniperGenericPort or None
         """
-        for port_name in self.generic_physical_ports_by_name:
-            if port_name in description:
-                return self.generic_physical_ports_by_name[port_name]
-        return None
+        return self.generic_physical_ports_by_base_name.get(self._get_base_port_name(description))
 
-    def _port_filtered_by_name(self, port):
+    @staticmethod
+    def _compile_port_name_filter(prefixes):
         """
-        Filter ports by description
-        :param port:
-        :return:
+        Build one anchored pattern for all port name prefixes
+        :param prefixes: list of port name prefixes, i.e. ['fxp', 'irb']
+        :return: compiled regex
         """
-        for pattern in self.FILTER_PORTS_BY_DESCRIPTION:
-            if re.search(pattern, port.port_name):
-                return True
-        return False
+        # Longer prefixes first, so the alternation does not stop on a shorter one
+        prefixes = sorted(set(prefix for prefix in prefixes if prefix), key=len, reverse=True)
+        if not prefixes:
+            # empty alternation would match every name, this pattern never matches
+            return re.compile(r'(?!)')
+        return re.compile(r'^(?:{0})'.format('|'.join(re.escape(prefix) for prefix in prefixes)))
+
+    def _port_filtered(self, port_name, port_type):
+        """
+        Filter ports by name prefix and type
+        :param port_name: ifDescr
+        :param port_type: ifType
+        :rtype: bool
+        """
+        return self._port_filtered_by_name(port_name) or self._port_filtered_by_type(port_type)
 
-    def _port_filtered_by_type(self, port):
+    def _port_filtered_by_name(self, port_name):
+        """
+        Filter ports by name prefix
+        :param port_name: ifDescr
+        :rtype: bool
+        """
+        return bool(self._port_name_filter.match(port_name))
+
+    def _port_filtered_by_type(self, port_type):
         """
         Filter ports by type
-        :param port:
-        :return:
+        :param port_type: ifType
+        :rtype: bool
         """
-        if port.type in self.FILTER_PORTS_BY_TYPE:
-            return True
-        return False
+        return port_type in self._port_type_filter
 
     def _build_ports(self):
         """
@@ -638,6 +1129,8 @@ class JuniperSnmpAutoload(object):
         :param autoload_details:
         :return:
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug('-------------------- <RESOURCES> ----------------------')
         for resource in autoload_details.resources:
             self.logger.debug(
@@ -650,21 +1143,46 @@ class JuniperSnmpAutoload(object):
                                                               attribute.attribute_value))
         self.logger.debug('-------------------- </ATTRIBUTES> ---------------------')
 
-    def discover(self, supported_os):
+    def _discover_resources(self, supported_os):
         """
         Call methods in specific order to build resources and attributes
         :return:
         """
-
         if not self._is_valid_device_os(supported_os):
             raise Exception(self.__class__.__name__, 'Unsupported device OS')
 
-        self._build_root()
-        self._build_chassis()
-        self._build_power_modules()
-        self._build_modules()
-        self._build_sub_modules()
-        self._build_ports()
+        self._reset_resources()
+        for stage in self.DISCOVER_STAGES:
+            if self.profiler:
+                with self.profiler.stage(stage):
+                    getattr(self, stage)()
+            else:
+                getattr(self, stage)()
+
+    def _log_profiler_summary(self):
+        if self.profiler:
+            self.logger.info('Autoload profile:\n{0}'.format(self.profiler.format_summary()))
+
+    def discover(self, supported_os):
+        """
+        Build resources and attributes
+        :return: AutoLoadDetails
+        """
+        self._discover_resources(supported_os)
         autoload_details = AutoloadDetailsBuilder(self.resource).autoload_details()
         self._log_autoload_details(autoload_details)
+        self._log_profiler_summary()
         return autoload_details
+
+    def iter_discover(self, supported_os):
+        """
+        Build resources and attributes, yield autoload details by top level resource
+        Emitted resources are detached from self.resource, so a caller which forwards the chunks does not keep
+        the whole tree in memory
+        :return: generator of AutoLoadDetails
+        """
+        self._discover_resources(supported_os)
+        for autoload_details in JuniperAutoloadDetailsStream(self.resource).iter_autoload_details():
+            self._log_autoload_details(autoload_details)
+            yield autoload_details
+        self._log_profiler_summary()
@@ -0,0 +1,218 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import time
+from threading import Condition, Lock
+
+from cloudshell.cli.cli import CLI
+from cloudshell.cli.session_manager_impl import SessionManagerException
+from cloudshell.cli.session_pool import SessionPool
+from cloudshell.cli.session_pool_manager import SessionPoolException
+from cloudshell.networking.juniper.cli.junipr_command_modes import reset_session_state
+
+
+class JuniperSessionPoolManager(SessionPool):
+    """
+    Cli sessions pooled per device
+    Sessions of one device are reused by the consecutive flows while they are healthy and not idle for too long,
+    the number of sessions of one device is limited, sessions of the other devices are not affected
+    """
+    MAX_SESSIONS_PER_DEVICE = 1
+    POOL_TIMEOUT = 100
+    MAX_IDLE_TIME = 300
+    HEALTH_CHECK_INTERVAL = 60
+
+    def __init__(self, max_sessions_per_device=MAX_SESSIONS_PER_DEVICE, pool_timeout=POOL_TIMEOUT,
+                 max_idle_time=MAX_IDLE_TIME, health_check_interval=HEALTH_CHECK_INTERVAL):
+        """
+        :param max_sessions_per_device: max number of sessions of one device
+        :param pool_timeout: max time to wait for a session of the device, sec
+        :param max_idle_time: idle session is closed after, sec
+        :param health_check_interval: session idle longer than this is probed for the prompt before reuse, sec
+        """
+        self._max_sessions_per_device = max_sessions_per_device
+        self._pool_timeout = pool_timeout
+        self._max_idle_time = max_idle_time
+        self._health_check_interval = health_check_interval
+        self._session_condition = Condition()
+        self._session_counts = {}
+        self._idle_sessions = {}
+
+    @staticmethod
+    def _get_key(session):
+        """
+        :param session:
+        :return: device key
+        """
+        return session.host
+
+    def get_session(self, new_sessions, prompt, logger):
+        """
+        Return idle session of the device or create new session
+        :param new_sessions: sessions to connect, in order of preference
+        :param prompt:
+        :param logger:
+        :rtype: cloudshell.cli.session.session.Session
+        """
+        if not isinstance(new_sessions, list):
+            new_sessions = [new_sessions]
+        key = self._get_key(new_sessions[0])
+        deadline = time.time() + self._pool_timeout
+        while True:
+            session, idle_time = self._reserve_session(key, deadline)
+            if session is None:
+                return self._new_session(key, new_sessions, prompt, logger)
+            if self._is_reusable(session, idle_time, new_sessions, prompt, logger):
+                logger.debug('Reuse session of {0}, idle {1:.1f} sec'.format(key, idle_time))
+                session.new_session = False
+                return session
+            self.remove_session(session, logger)
+
+    def return_session(self, session, logger):
+        """
+        Return session back to the pool
+        :param session:
+        :param logger:
+        """
+        logger.debug('Return session to the pool')
+        with self._session_condition:
+            session.new_session = False
+            self._idle_sessions.setdefault(self._get_key(session), []).append((session, time.time()))
+            self._session_condition.notify_all()
+        self.close_idle_sessions(logger)
+
+    def remove_session(self, session, logger):
+        """
+        Disconnect session and remove it from the pool
+        :param session:
+        :param logger:
+        """
+        logger.debug('Removing session')
+        with self._session_condition:
+            self._release_place(self._get_key(session))
+        self._disconnect(session, logger)
+
+    def close_idle_sessions(self, logger):
+        """
+        Disconnect sessions idle longer than max idle time
+        :param logger:
+        """
+        now = time.time()
+        expired_sessions = []
+        with self._session_condition:
+            for key, idle_sessions in self._idle_sessions.iteritems():
+                expired_sessions.extend(session for session, returned_time in idle_sessions
+                                        if now - returned_time > self._max_idle_time)
+                idle_sessions[:] = [(session, returned_time) for session, returned_time in idle_sessions
+                                    if now - returned_time <= self._max_idle_time]
+        for session in expired_sessions:
+            logger.debug('Closing idle session of {0}'.format(self._get_key(session)))
+            self.remove_session(session, logger)
+
+    def _reserve_session(self, key, deadline):
+        """
+        Take idle session of the device, or reserve a place for a new one, wait while the device has no free places
+        :param key: device key
+        :param deadline: time to give up
+        :return: tuple (idle session, idle time), (None, 0) if a new session can be created
+        """
+        with self._session_condition:
+            while True:
+                idle_sessions = self._idle_sessions.get(key)
+                if idle_sessions:
+                    session, returned_time = idle_sessions.pop()
+                    return session, time.time() - returned_time
+                if self._session_counts.get(key, 0) < self._max_sessions_per_device:
+                    self._session_counts[key] = self._session_counts.get(key, 0) + 1
+                    return None, 0
+                timeout = deadline - time.time()
+                if timeout <= 0:
+                    raise SessionPoolException(self.__class__.__name__,
+                                               'Cannot get session of {0} during {1} sec.'.format(key,
+                                                                                                 self._pool_timeout))
+                self._session_condition.wait(timeout)
+
+    def _release_place(self, key):
+        """
+        Free the place of the removed session, called under the lock
+        :param key: device key
+        """
+        self._session_counts[key] = max(self._session_counts.get(key, 0) - 1, 0)
+        self._session_condition.notify_all()
+
+    def _new_session(self, key, new_sessions, prompt, logger):
+        """
+        Connect new session in the reserved place, the place is released if no session can connect
+        :param key: device key
+        :param new_sessions:
+        :param prompt:
+        :param logger:
+        """
+        logger.debug('Creating new session of {0}'.format(key))
+        for session in new_sessions:
+            try:
+                session.connect(prompt, logger)
+                reset_session_state(session)
+                logger.debug('Created new {0} session'.format(session.session_type))
+                session.new_session = True
+                return session
+            except Exception as e:
+                logger.debug(e)
+        with self._session_condition:
+            self._release_place(key)
+        raise SessionManagerException(self.__class__.__name__,
+                                      'Failed to create new session for type {0}, see logs for details'.format(
+                                          ', '.join(session.session_type for session in new_sessions)))
+
+    def _is_reusable(self, session, idle_time, new_sessions, prompt, logger):
+        """
+        Session is reusable if it is active, was opened with the same connection parameters and responds with
+        the prompt after a long idle time
+        :param session:
+        :param idle_time: sec
+        :param new_sessions:
+        :param prompt:
+        :param logger:
+        :rtype: bool
+        """
+        if not session.active() or idle_time > self._max_idle_time or session not in new_sessions:
+            return False
+        if idle_time < self._health_check_interval:
+            return True
+        try:
+            session.probe_for_prompt(prompt, logger)
+        except Exception as e:
+            logger.debug('Session health check failed, {0}'.format(e))
+            return False
+        return True
+
+    @staticmethod
+    def _disconnect(session, logger):
+        try:
+            session.disconnect()
+        except Exception as e:
+            logger.debug('Cannot disconnect session, {0}'.format(e))
+
+
+_session_pool = None
+_session_pool_lock = Lock()
+
+
+def get_session_pool():
+    """
+    Session pool shared by the cli handlers of the process
+    :rtype: JuniperSessionPoolManager
+    """
+    global _session_pool
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = JuniperSessionPoolManager()
+        return _session_pool
+
+
+def create_cli():
+    """
+    CLI which takes sessions from the process-wide pool, pass it to the runners instead of CLI()
+    :rtype: CLI
+    """
+    return CLI(session_pool=get_session_pool())
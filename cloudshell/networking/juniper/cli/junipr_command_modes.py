@@ -1,12 +1,96 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import re
 from collections import OrderedDict
 
 from cloudshell.cli.command_mode import CommandMode
 from cloudshell.shell.core.api_utils import decrypt_password
 
 
+class JuniperSessionState(object):
+    """
+    Cli state of the session, kept on the session between the flows which reuse it
+    """
+    __slots__ = ('screen_length', 'edit_hierarchy')
+
+    def __init__(self):
+        self.screen_length = None
+        self.edit_hierarchy = None
+
+
+def get_session_state(session):
+    """
+    Cli state of the session, created on the first use
+    :param session:
+    :rtype: JuniperSessionState
+    """
+    state = getattr(session, 'juniper_session_state', None)
+    if state is None:
+        state = reset_session_state(session)
+    return state
+
+
+def reset_session_state(session):
+    """
+    Forget the cli state, call it when the session connects again
+    :param session:
+    :rtype: JuniperSessionState
+    """
+    state = JuniperSessionState()
+    session.juniper_session_state = state
+    return state
+
+
+class JuniperPromptDetector(object):
+    """
+    Prompt matching on the tail of the received output
+    The prompts are anchored at the end of the output, so only the last characters are searched instead of the whole
+    output received so far
+    """
+    WINDOW = 512
+
+    def __init__(self, prompt, window=WINDOW):
+        """
+        :param prompt: prompt regex anchored at the end of the output, the prompt has to fit in the window
+        :param window: number of the last received characters searched
+        """
+        self._prompt_re = re.compile(prompt, re.DOTALL)
+        self._window = window
+        self._tail = ''
+
+    @classmethod
+    def for_mode(cls, command_mode, window=WINDOW):
+        """
+        :param command_mode:
+        :type command_mode: CommandMode
+        :param window:
+        :rtype: JuniperPromptDetector
+        """
+        return cls(command_mode.prompt, window)
+
+    def feed(self, data):
+        """
+        Add received data
+        :param data:
+        :return: True if the output ends with the prompt
+        :rtype: bool
+        """
+        self._tail = (self._tail + data)[-self._window:]
+        return self._prompt_re.search(self._tail) is not None
+
+    def search(self, output):
+        """
+        Search the prompt at the end of the whole output
+        :param output:
+        :return: match object or None
+        """
+        return self._prompt_re.search(output, max(len(output) - self._window, 0))
+
+    def reset(self):
+        self._tail = ''
+
+
 class CliCommandMode(CommandMode):
     PROMPT = r'%\s*$'
     ENTER_COMMAND = ''
@@ -51,7 +135,23 @@ class DefaultCommandMode(CommandMode):
                              exit_error_map=self.exit_error_map())
 
     def enter_actions(self, cli_operations):
-        cli_operations.send_command('set cli screen-length 0')
+        """
+        Disable paging, only once per cli session
+        :param cli_operations:
+        :type cli_operations: cloudshell.cli.cli_service_impl.CliServiceImpl
+        """
+        state = get_session_state(cli_operations.session)
+        if state.screen_length != 0:
+            cli_operations.send_command('set cli screen-length 0')
+            state.screen_length = 0
+
+    def step_down(self, cli_service):
+        """
+        Leaving the cli resets its settings
+        :param cli_service:
+        """
+        CommandMode.step_down(self, cli_service)
+        reset_session_state(cli_service.session)
 
     def enter_action_map(self):
         return OrderedDict()
@@ -67,7 +167,7 @@ class DefaultCommandMode(CommandMode):
 
 
 class ConfigCommandMode(CommandMode):
-    PROMPT = r'\[edit\]\n.*#\s*$'
+    PROMPT = r'\[edit\]\n[^\n]*#\s*$'
     ENTER_COMMAND = 'configure'
     EXIT_COMMAND = 'exit'
 
@@ -80,6 +180,28 @@ class ConfigCommandMode(CommandMode):
                              exit_action_map=self.exit_action_map(), enter_error_map=self.enter_error_map(),
                              exit_error_map=self.exit_error_map())
 
+    def step_up(self, cli_service):
+        """
+        Enter configuration mode on the top of the hierarchy
+        :param cli_service:
+        """
+        CommandMode.step_up(self, cli_service)
+        get_session_state(cli_service.session).edit_hierarchy = []
+
+    def step_down(self, cli_service):
+        """
+        Leave configuration mode in one step from any level of the hierarchy
+        :param cli_service:
+        """
+        state = get_session_state(cli_service.session)
+        if state.edit_hierarchy:
+            cli_service.send_command('exit configuration-mode', expected_string=self.parent_node.prompt,
+                                     action_map=self._exit_action_map, error_map=self._exit_error_map)
+            cli_service.command_mode = self.parent_node
+        else:
+            CommandMode.step_down(self, cli_service)
+        state.edit_hierarchy = None
+
     def enter_action_map(self):
         return OrderedDict([(r'[Pp]assword', lambda session, logger: session.send_line(
             decrypt_password(self._api, self.resource_config.enable_password or self.resource_config.password)))])
@@ -105,7 +227,7 @@ CommandMode.RELATIONS_DICT = {
 
 # Not mandatory modes
 class EditSnmpCommandMode(CommandMode):
-    PROMPT = r'\[edit snmp\]\n.*#\s*$'
+    PROMPT = r'\[edit snmp\]\n[^\n]*#\s*$'
     ENTER_COMMAND = 'edit snmp'
     EXIT_COMMAND = 'exit'
 
@@ -113,3 +235,13 @@ class EditSnmpCommandMode(CommandMode):
         CommandMode.__init__(self, EditSnmpCommandMode.PROMPT,
                              EditSnmpCommandMode.ENTER_COMMAND,
                              EditSnmpCommandMode.EXIT_COMMAND)
+
+    def step_up(self, cli_service):
+        CommandMode.step_up(self, cli_service)
+        state = get_session_state(cli_service.session)
+        state.edit_hierarchy = (state.edit_hierarchy or []) + ['snmp']
+
+    def step_down(self, cli_service):
+        CommandMode.step_down(self, cli_service)
+        state = get_session_state(cli_service.session)
+        state.edit_hierarchy = (state.edit_hierarchy or [])[:-1]
@@ -1,21 +1,42 @@
 from cloudshell.cli.command_template.command_template_executor import CommandTemplateExecutor
 import re
+from xml.sax.saxutils import escape
 from cloudshell.networking.juniper.command_templates import add_remove_vlan as command_template
+from cloudshell.networking.juniper.command_templates import netconf_vlan as netconf_template
+from cloudshell.networking.juniper.netconf.juniper_netconf_session import find_text
 from cloudshell.cli.cli_service import CliService
 
 
 class AddRemoveVlanActions(object):
-    def __init__(self, cli_service, logger):
+    def __init__(self, cli_service, logger, batch=None, netconf_session=None):
         """
         Add remove vlan
         :param cli_service: config mode cli_service
         :type cli_service: CliService
         :param logger:
         :type logger: Logger
+        :param batch: configuration statements are collected by the batch if provided, and executed one by one if not
+        :type batch: cloudshell.networking.juniper.command_actions.batch_configuration_actions.BatchConfigurationActions
+        :param netconf_session: vlans and interfaces are read as XML over netconf if provided
+        :type netconf_session: cloudshell.networking.juniper.netconf.juniper_netconf_session.JuniperNetconfSession
         :return:
         """
         self._cli_service = cli_service
         self._logger = logger
+        self._batch = batch
+        self._netconf_session = netconf_session
+
+    def _execute_configuration(self, template, **command_kwargs):
+        """
+        Execute configuration statement, or add it to the batch
+        :param template:
+        :param command_kwargs:
+        :return: output, empty if the statement is batched
+        """
+        if self._batch is not None:
+            self._batch.add(template, **command_kwargs)
+            return ''
+        return CommandTemplateExecutor(self._cli_service, template).execute_command(**command_kwargs)
 
     def get_vlan_ports(self, vlan_name):
         """
@@ -24,6 +45,8 @@ class AddRemoveVlanActions(object):
         :return: List of interfaces
         :rtype: list
         """
+        if self._netconf_session is not None:
+            return self._netconf_get_vlan_ports(vlan_name)
         output = CommandTemplateExecutor(self._cli_service, command_template.SHOW_VLAN_INTERFACES).execute_command(
             vlan_name=vlan_name)
         ports = re.findall(r'[a-zA-Z]+-(?:\d+/)+\d+|ae\d+', re.sub(r'\n|\r', '', output))
@@ -41,8 +64,7 @@ class AddRemoveVlanActions(object):
 
         output = self.create_vlan(vlan_name, vlan_range)
 
-        output += CommandTemplateExecutor(self._cli_service, command_template.CONFIGURE_VLAN_QNQ).execute_command(
-            vlan_name=vlan_name)
+        output += self._execute_configuration(command_template.CONFIGURE_VLAN_QNQ, vlan_name=vlan_name)
         self._logger.debug('Set qnq tag for {0}'.format(vlan_name))
         return output
 
@@ -54,12 +76,11 @@ class AddRemoveVlanActions(object):
         :return:
         """
         if re.match(r'\d+-\d+', vlan_range):
-            output = CommandTemplateExecutor(self._cli_service, command_template.CREATE_VLAN_RANGE).execute_command(
-                vlan_name=vlan_name, vlan_range=vlan_range)
+            output = self._execute_configuration(command_template.CREATE_VLAN_RANGE, vlan_name=vlan_name,
+                                                 vlan_range=vlan_range)
             self._logger.debug('Created vlan range {0}, ids {1}'.format(vlan_name, vlan_range))
         else:
-            output = CommandTemplateExecutor(self._cli_service, command_template.CREATE_VLAN).execute_command(
-                vlan_name=vlan_name, vlan_id=vlan_range)
+            output = self._execute_configuration(command_template.CREATE_VLAN, vlan_name=vlan_name, vlan_id=vlan_range)
             self._logger.debug('Created vlan {0}, id {1}'.format(vlan_name, vlan_range))
         return output
 
@@ -71,8 +92,7 @@ class AddRemoveVlanActions(object):
         """
         output = ''
         if len(self.get_vlan_ports(vlan_name)) == 0:
-            output = CommandTemplateExecutor(self._cli_service, command_template.DELETE_VLAN).execute_command(
-                vlan_name=vlan_name)
+            output = self._execute_configuration(command_template.DELETE_VLAN, vlan_name=vlan_name)
         return output
 
     def assign_member(self, port, vlan_range, mode):
@@ -83,10 +103,8 @@ class AddRemoveVlanActions(object):
         :param mode:
         :return:
         """
-        output = CommandTemplateExecutor(self._cli_service, command_template.ASSIGN_VLAN_MEMBER).execute_command(
-            port=port,
-            vlan_range=vlan_range,
-            mode=mode)
+        output = self._execute_configuration(command_template.ASSIGN_VLAN_MEMBER, port=port, vlan_range=vlan_range,
+                                             mode=mode)
         return output
 
     def delete_member(self, port, vlan_range):
@@ -96,9 +114,7 @@ class AddRemoveVlanActions(object):
         :param vlan_name:
         :return:
         """
-        output = CommandTemplateExecutor(self._cli_service, command_template.DELETE_VLAN_MEMBER).execute_command(
-            port=port,
-            vlan_range=vlan_range)
+        output = self._execute_configuration(command_template.DELETE_VLAN_MEMBER, port=port, vlan_range=vlan_range)
         return output
 
     def get_vlans_for_port(self, port):
@@ -107,6 +123,8 @@ class AddRemoveVlanActions(object):
         :param port:
         :return:
         """
+        if self._netconf_session is not None:
+            return self._netconf_get_vlans_for_port(port)
         output = CommandTemplateExecutor(self._cli_service, command_template.SHOW_INTERFACE).execute_command(
             port_name=port)
         found_list = re.findall(r'vlan\s*\{\s*members\s*\[*\s*((?:[\w\d-]+\s*)+)\s*\]*\s*;\s*\}',
@@ -116,8 +134,7 @@ class AddRemoveVlanActions(object):
         return []
 
     def remove_port_mode_on_interface(self, port):
-        output = CommandTemplateExecutor(self._cli_service,
-                                         command_template.DELETE_PORT_MODE_ON_INTERFACE).execute_command(port_name=port)
+        output = self._execute_configuration(command_template.DELETE_PORT_MODE_ON_INTERFACE, port_name=port)
 
         self._logger.info("Port mode removed for {0}".format(port))
         return output
@@ -139,6 +156,8 @@ class AddRemoveVlanActions(object):
         Get vlans info
         :return:
         """
+        if self._netconf_session is not None:
+            return self._netconf_get_vlans()
         vlan_dict = {}
         out = CommandTemplateExecutor(self._cli_service, command_template.SHOW_VLANS).execute_command()
         pattern = '(?P<vlan_name>.+)\s+{\s+vlan-(id|range)\s+(?P<vlan_id>\d+(-\d+)?);'
@@ -154,9 +173,53 @@ class AddRemoveVlanActions(object):
         :param vlan_name:
         :return:
         """
+        if self._netconf_session is not None:
+            return self._netconf_check_vlan_qnq(vlan_name)
         pattern = r'dot1q-tunneling;'
         out = CommandTemplateExecutor(self._cli_service, command_template.SHOW_SPECIFIC_VLAN).execute_command(vlan_name=vlan_name)
         if re.search(pattern, out, flags=re.MULTILINE | re.IGNORECASE):
             return True
         else:
             return False
+
+    def _netconf_get_vlan_ports(self, vlan_name):
+        """
+        Interfaces assigned on vlan, from get-vlan-information reply
+        :param vlan_name:
+        :rtype: list
+        """
+        interfaces = [element.text or '' for element in self._netconf_session.rpc(
+            netconf_template.GET_VLAN_INFORMATION.format(vlan_name=escape(vlan_name)),
+            netconf_template.VLAN_MEMBER_INTERFACE_TAGS)]
+        ports = re.findall(r'[a-zA-Z]+-(?:\d+/)+\d+|ae\d+', ' '.join(interfaces))
+        return [port.strip() for port in set(ports)]
+
+    def _netconf_get_vlans_for_port(self, port):
+        """
+        Vlan members of the interface configuration
+        :param port:
+        :rtype: list
+        """
+        return [(element.text or '').strip() for element in self._netconf_session.rpc(
+            netconf_template.GET_INTERFACE.format(port_name=escape(port)), netconf_template.VLAN_MEMBERS_TAGS)]
+
+    def _netconf_get_vlans(self):
+        """
+        Vlan ids and ranges of the vlans configuration
+        :rtype: dict
+        """
+        vlan_dict = {}
+        for element in self._netconf_session.rpc(netconf_template.GET_VLANS, netconf_template.VLAN_TAGS):
+            vlan_id = find_text(element, 'vlan-id') or find_text(element, 'vlan-range')
+            if vlan_id:
+                vlan_dict[find_text(element, 'name')] = vlan_id
+        return vlan_dict
+
+    def _netconf_check_vlan_qnq(self, vlan_name):
+        """
+        :param vlan_name:
+        :rtype: bool
+        """
+        elements = self._netconf_session.rpc(netconf_template.GET_SPECIFIC_VLAN.format(vlan_name=escape(vlan_name)),
+                                             netconf_template.QNQ_TAGS)
+        return any(True for _ in elements)
@@ -0,0 +1,109 @@
+import re
+
+from cloudshell.cli.cli_service import CliService
+from cloudshell.cli.command_template.command_template_executor import CommandTemplateExecutor
+from cloudshell.cli.session.session_exceptions import CommandExecutionException
+from cloudshell.networking.juniper.command_templates import batch_configuration as command_template
+
+
+class BatchConfigurationException(CommandExecutionException):
+    def __init__(self, errors):
+        """
+        :param errors: list of (statement, error message), statement is None if the error is not bound to a line
+        """
+        CommandExecutionException.__init__(self, self.__class__.__name__, 'Failed to load configuration, {0}'.format(
+            '; '.join('{0}: {1}'.format(statement, error) if statement else error for statement, error in errors)))
+        self.errors = errors
+
+
+class BatchConfigurationActions(object):
+    """
+    Collect rendered configuration statements and push them in one "load set terminal" block,
+    instead of waiting for the prompt after each statement
+    """
+    BATCH_SIZE = 1000
+    LINE_ERROR_PATTERN = re.compile(r'^\s*terminal:(\d+):(?:\(\d+\))?\s*(.*?)\s*$', re.MULTILINE)
+    LOAD_ERRORS_PATTERN = re.compile(r'load complete \((\d+) errors?\)', re.IGNORECASE)
+    ERROR_PATTERN = re.compile(r'^\s*error:\s*(.*?)\s*$', re.MULTILINE | re.IGNORECASE)
+
+    def __init__(self, cli_service, logger, batch_size=BATCH_SIZE):
+        """
+        :param cli_service: config mode cli_service
+        :type cli_service: CliService
+        :param logger:
+        :type logger: Logger
+        :param batch_size: max number of statements in one load block
+        """
+        self._cli_service = cli_service
+        self._logger = logger
+        self._batch_size = batch_size
+        self._statements = []
+
+    @property
+    def statements(self):
+        """
+        Statements waiting for the load
+        :rtype: list
+        """
+        return list(self._statements)
+
+    def add(self, template, **command_kwargs):
+        """
+        Render the command template and keep the statement for the load
+        :param template:
+        :type template: cloudshell.cli.command_template.command_template.CommandTemplate
+        :param command_kwargs: template arguments
+        :return: statement
+        """
+        statement = template.prepare_command(**command_kwargs)
+        self._statements.append(statement)
+        return statement
+
+    def load(self):
+        """
+        Load collected statements into the candidate configuration, the statements are cleared
+        Load stops at the first block with errors
+        :return: output
+        :raises BatchConfigurationException: errors mapped to the statements which caused them
+        """
+        statements, self._statements = self._statements, []
+        output = ''
+        for start in range(0, len(statements), self._batch_size):
+            block = statements[start:start + self._batch_size]
+            block_output = self._load_block(block)
+            output += block_output
+            errors = self._parse_errors(block, block_output)
+            if errors:
+                raise BatchConfigurationException(errors)
+        return output
+
+    def _load_block(self, statements):
+        """
+        :param statements:
+        :return: output
+        """
+        self._logger.debug('Load {0} statements'.format(len(statements)))
+        output = CommandTemplateExecutor(self._cli_service, command_template.LOAD_SET_TERMINAL,
+                                         expected_string=command_template.LOAD_SET_TERMINAL_PROMPT).execute_command()
+        output += self._cli_service.send_command('\n'.join(statements) + '\n' + command_template.END_OF_INPUT)
+        return output
+
+    def _parse_errors(self, statements, output):
+        """
+        Map "terminal:<line>:(<column>) <error>" messages to the loaded statements
+        :param statements: loaded statements, in order of the terminal lines
+        :param output: load output
+        :return: list of (statement, error message)
+        """
+        errors = []
+        for match in self.LINE_ERROR_PATTERN.finditer(output):
+            index = int(match.group(1)) - 1
+            statement = statements[index] if 0 <= index < len(statements) else None
+            errors.append((statement, match.group(2)))
+        if errors:
+            return errors
+        errors = [(None, error) for error in self.ERROR_PATTERN.findall(output)]
+        load_errors = self.LOAD_ERRORS_PATTERN.search(output)
+        if not errors and load_errors and int(load_errors.group(1)):
+            errors.append((None, load_errors.group(0)))
+        return errors
@@ -0,0 +1,9 @@
+from collections import OrderedDict
+from cloudshell.cli.command_template.command_template import CommandTemplate
+
+ERROR_MAP = OrderedDict([(r'[Ee]rror:', 'Command error')])
+
+LOAD_SET_TERMINAL_PROMPT = r'\[Type \^D at a new line to end input\]'
+END_OF_INPUT = '\x04'
+
+LOAD_SET_TERMINAL = CommandTemplate('load set terminal', error_map=ERROR_MAP)
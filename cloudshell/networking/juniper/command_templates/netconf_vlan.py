@@ -0,0 +1,12 @@
+GET_VLANS = '<get-configuration><configuration><vlans/></configuration></get-configuration>'
+GET_SPECIFIC_VLAN = ('<get-configuration><configuration><vlans><vlan><name>{vlan_name}</name></vlan></vlans>'
+                     '</configuration></get-configuration>')
+GET_INTERFACE = ('<get-configuration><configuration><interfaces><interface><name>{port_name}</name></interface>'
+                 '</interfaces></configuration></get-configuration>')
+GET_VLAN_INFORMATION = '<get-vlan-information><vlan-name>{vlan_name}</vlan-name></get-vlan-information>'
+
+VLAN_TAGS = ('vlan',)
+VLAN_MEMBERS_TAGS = ('members',)
+QNQ_TAGS = ('dot1q-tunneling',)
+# legacy and ELS switches
+VLAN_MEMBER_INTERFACE_TAGS = ('vlan-member-interface', 'l2ng-l2rtb-vlan-member-interface')
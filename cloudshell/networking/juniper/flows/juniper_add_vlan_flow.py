@@ -2,27 +2,34 @@ from cloudshell.cli.session.session_exceptions import CommandExecutionException
 from cloudshell.devices.flows.cli_action_flows import AddVlanFlow
 from cloudshell.networking.juniper.cli.juniper_cli_handler import JuniperCliHandler
 from cloudshell.networking.juniper.command_actions.add_remove_vlan_actions import AddRemoveVlanActions
+from cloudshell.networking.juniper.command_actions.batch_configuration_actions import BatchConfigurationActions
 from cloudshell.networking.juniper.command_actions.commit_rollback_actions import CommitRollbackActions
+from cloudshell.networking.juniper.netconf.juniper_netconf_handler import optional_netconf_session
 from cloudshell.networking.juniper.helpers.add_remove_vlan_helper import AddRemoveVlanHelper, VlanRangeOperations, \
     VlanRange
 
 
 class JuniperAddVlanFlow(AddVlanFlow):
-    def __init__(self, cli_handler, logger):
+    def __init__(self, cli_handler, logger, netconf_handler=None):
         """
         :param cli_handler:
         :type cli_handler: JuniperCliHandler
         :param logger:
+        :param netconf_handler: vlans and interfaces are read over netconf if provided
+        :type netconf_handler: cloudshell.networking.juniper.netconf.juniper_netconf_handler.JuniperNetconfHandler
         :return:
         """
         super(JuniperAddVlanFlow, self).__init__(cli_handler, logger)
         self._cli_handler = cli_handler
+        self._netconf_handler = netconf_handler
 
     def execute_flow(self, vlan_range, port_mode, port_name, qnq, c_tag):
         port = AddRemoveVlanHelper.extract_port_name(port_name)
-        with self._cli_handler.config_mode_service() as cli_service:
+        with self._cli_handler.config_mode_service() as cli_service, \
+                optional_netconf_session(self._netconf_handler) as netconf_session:
             commit_rollback_actions = CommitRollbackActions(cli_service, self._logger)
-            vlan_actions = AddRemoveVlanActions(cli_service, self._logger)
+            batch_actions = BatchConfigurationActions(cli_service, self._logger)
+            vlan_actions = AddRemoveVlanActions(cli_service, self._logger, batch_actions, netconf_session)
             try:
                 existing_ranges = VlanRangeOperations.create_from_dict(vlan_actions.get_vlans())
                 new_range = VlanRange(VlanRange.range_from_string(vlan_range))
@@ -45,6 +52,7 @@ class JuniperAddVlanFlow(AddVlanFlow):
 
                 vlan_actions.clean_port(port)
                 vlan_actions.assign_member(port, vlan_range, port_mode)
+                batch_actions.load()
                 commit_rollback_actions.commit()
                 return 'Success'
             except CommandExecutionException:
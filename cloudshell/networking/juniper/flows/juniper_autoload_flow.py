@@ -1,13 +1,127 @@
+from functools import partial
+
 from cloudshell.devices.flows.snmp_action_flows import AutoloadFlow
+from cloudshell.networking.juniper.autoload.juniper_autoload_cache import JuniperAutoloadCache
+from cloudshell.networking.juniper.autoload.juniper_autoload_config import JuniperAutoloadConfig
+from cloudshell.networking.juniper.autoload.juniper_autoload_profiler import JuniperAutoloadProfiler
 from cloudshell.networking.juniper.autoload.juniper_snmp_autoload import JuniperSnmpAutoload
+from cloudshell.networking.juniper.snmp.juniper_async_snmp_service import JuniperAsyncSnmpService
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import JuniperSnmpService, SnmpWalkTimeout
 
 
 class JuniperSnmpAutoloadFlow(AutoloadFlow):
+    def __init__(self, snmp_handler, logger, profile_handler=None):
+        """
+        :param snmp_handler:
+        :param logger:
+        :param profile_handler: callable which receives the autoload profile dict, called if profiling is enabled
+        """
+        super(JuniperSnmpAutoloadFlow, self).__init__(snmp_handler, logger)
+        self._profile_handler = profile_handler
+        self.autoload_profile = None
+
+    def _create_snmp_service(self, autoload_config, snmp_session=None, walk_progress=None):
+        """
+        Wrap snmp session, create new session if not provided
+        The session pipelines the walks if more than one outstanding request is allowed
+        :param autoload_config:
+        :type autoload_config: JuniperAutoloadConfig
+        :param snmp_session:
+        :param walk_progress: interrupted walks shared by all sessions of the autoload
+        :rtype: JuniperSnmpService
+        """
+        snmp_session = snmp_session or self._snmp_handler.create_snmp_session()
+        if autoload_config.snmp_max_outstanding > 1:
+            return JuniperAsyncSnmpService(snmp_session, self._logger, autoload_config.snmp_max_outstanding,
+                                           max_repetitions=autoload_config.snmp_max_repetitions,
+                                           retries=autoload_config.snmp_retries, backoff=autoload_config.snmp_backoff,
+                                           walk_progress=walk_progress)
+        return JuniperSnmpService(snmp_session, self._logger, autoload_config.snmp_max_repetitions,
+                                  retries=autoload_config.snmp_retries, backoff=autoload_config.snmp_backoff,
+                                  walk_progress=walk_progress)
+
+    def _create_autoload_cache(self, autoload_config, resource_name):
+        """
+        Autoload cache is used only if cache folder is configured
+        :param autoload_config:
+        :type autoload_config: JuniperAutoloadConfig
+        :param resource_name:
+        :rtype: JuniperAutoloadCache
+        """
+        if autoload_config.autoload_cache_folder:
+            return JuniperAutoloadCache(autoload_config.autoload_cache_folder, resource_name, self._logger)
+
+    @staticmethod
+    def _create_profiler(autoload_config):
+        """
+        Autoload is profiled only if enabled in the resource attributes
+        :param autoload_config:
+        :type autoload_config: JuniperAutoloadConfig
+        :rtype: JuniperAutoloadProfiler
+        """
+        if autoload_config.autoload_profiling:
+            return JuniperAutoloadProfiler()
+
+    def _report_profile(self, profiler):
+        """
+        Keep the autoload profile and pass it to the profile handler
+        :param profiler:
+        :type profiler: JuniperAutoloadProfiler
+        """
+        if not profiler:
+            return
+        self.autoload_profile = profiler.to_dict()
+        if self._profile_handler:
+            self._profile_handler(self.autoload_profile)
+
+    def _discover(self, juniper_snmp_autoload, supported_os, autoload_config, walk_progress):
+        """
+        Discover the device, retry after a walk interrupted by timeouts
+        Tables fetched before are kept by the autoload and the interrupted walks resume from the walk progress,
+        so the retry requests only the missing part
+        :param juniper_snmp_autoload:
+        :type juniper_snmp_autoload: JuniperSnmpAutoload
+        :param supported_os:
+        :param autoload_config:
+        :type autoload_config: JuniperAutoloadConfig
+        :param walk_progress: interrupted walks shared by the snmp sessions
+        :return: AutoLoadDetails
+        """
+        retries = autoload_config.autoload_retries
+        attempt = 0
+        while True:
+            try:
+                return juniper_snmp_autoload.discover(supported_os)
+            except SnmpWalkTimeout as e:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                self._logger.warning('Autoload interrupted by snmp timeout, {0}, retry {1} of {2}, '
+                                     '{3} walks are resumed'.format(e, attempt, retries, len(walk_progress)))
+
     def execute_flow(self, supported_os, shell_name, shell_type, resource_name):
+        autoload_config = JuniperAutoloadConfig(self._snmp_handler.resource_config)
+        walk_progress = {}
+        profiler = self._create_profiler(autoload_config)
         with self._snmp_handler.get_snmp_service() as snpm_service:
-            juniper_snmp_autoload = JuniperSnmpAutoload(snpm_service,
+            juniper_snmp_autoload = JuniperSnmpAutoload(self._create_snmp_service(autoload_config, snpm_service,
+                                                                                  walk_progress),
                                                         shell_name,
                                                         shell_type,
                                                         resource_name,
-                                                        self._logger)
-            return juniper_snmp_autoload.discover(supported_os)
+                                                        self._logger,
+                                                        snmp_session_factory=partial(self._create_snmp_service,
+                                                                                     autoload_config,
+                                                                                     walk_progress=walk_progress),
+                                                        max_workers=autoload_config.autoload_max_workers,
+                                                        autoload_cache=self._create_autoload_cache(autoload_config,
+                                                                                                   resource_name),
+                                                        filter_port_names=autoload_config.filter_port_names,
+                                                        filter_port_types=autoload_config.filter_port_types,
+                                                        raw_oids=autoload_config.autoload_raw_oids,
+                                                        profiler=profiler,
+                                                        prefetch=autoload_config.snmp_max_outstanding > 1)
+            try:
+                return self._discover(juniper_snmp_autoload, supported_os, autoload_config, walk_progress)
+            finally:
+                self._report_profile(profiler)
@@ -1,5 +1,6 @@
 import time
 from cloudshell.devices.flows.cli_action_flows import LoadFirmwareFlow
+from cloudshell.networking.juniper.cli.junipr_command_modes import reset_session_state
 from cloudshell.networking.juniper.command_actions.system_actions import SystemActions
 
 
@@ -30,6 +31,7 @@ class JuniperFirmwareFlow(LoadFirmwareFlow):
             except:
                 pass
             self._logger.debug('Waiting session up')
+            reset_session_state(cli_service.session)
             cli_service.reconnect(timeout - waiting_time)
 
     def _wait_session_disconnect(self, cli_service, timeout):
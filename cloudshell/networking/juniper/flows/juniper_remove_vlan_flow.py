@@ -1,26 +1,42 @@
 from cloudshell.cli.session.session_exceptions import CommandExecutionException
 from cloudshell.devices.flows.cli_action_flows import RemoveVlanFlow
 from cloudshell.networking.juniper.command_actions.add_remove_vlan_actions import AddRemoveVlanActions
+from cloudshell.networking.juniper.command_actions.batch_configuration_actions import BatchConfigurationActions
 from cloudshell.networking.juniper.command_actions.commit_rollback_actions import CommitRollbackActions
+from cloudshell.networking.juniper.netconf.juniper_netconf_handler import optional_netconf_session
 from cloudshell.networking.juniper.helpers.add_remove_vlan_helper import AddRemoveVlanHelper, VlanRangeOperations, \
     VlanRange
 
 
 class JuniperRemoveVlanFlow(RemoveVlanFlow):
+    def __init__(self, cli_handler, logger, netconf_handler=None):
+        """
+        :param cli_handler:
+        :param logger:
+        :param netconf_handler: vlans and interfaces are read over netconf if provided
+        :type netconf_handler: cloudshell.networking.juniper.netconf.juniper_netconf_handler.JuniperNetconfHandler
+        """
+        super(JuniperRemoveVlanFlow, self).__init__(cli_handler, logger)
+        self._netconf_handler = netconf_handler
+
     def execute_flow(self, vlan_range, port_name, port_mode, action_map=None, error_map=None):
         port = AddRemoveVlanHelper.extract_port_name(port_name)
-        with self._cli_handler.get_cli_service(self._cli_handler.config_mode) as cli_service:
+        with self._cli_handler.get_cli_service(self._cli_handler.config_mode) as cli_service, \
+                optional_netconf_session(self._netconf_handler) as netconf_session:
             commit_rollback_actions = CommitRollbackActions(cli_service, self._logger)
-            vlan_actions = AddRemoveVlanActions(cli_service, self._logger)
+            batch_actions = BatchConfigurationActions(cli_service, self._logger)
+            vlan_actions = AddRemoveVlanActions(cli_service, self._logger, batch_actions, netconf_session)
             try:
                 existing_ranges = VlanRangeOperations.create_from_dict(vlan_actions.get_vlans())
                 range_instance = VlanRange(VlanRange.range_from_string(vlan_range))
                 range_intersection = VlanRangeOperations.find_intersection([range_instance], existing_ranges)
 
                 vlan_actions.delete_member(port, vlan_range)
+                batch_actions.load()
                 commit_rollback_actions.commit()
                 for _range in range_intersection:
                     vlan_actions.delete_vlan(_range.name)
+                batch_actions.load()
                 commit_rollback_actions.commit()
                 return 'Success'
             except CommandExecutionException:
@@ -0,0 +1,89 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+
+import paramiko
+
+from cloudshell.networking.juniper.netconf.juniper_netconf_session import JuniperNetconfSession
+
+
+class JuniperNetconfHandler(object):
+    """
+    Open NETCONF sessions over ssh to the resource
+    """
+    NETCONF_PORT = 830
+    NETCONF_SUBSYSTEM = 'netconf'
+    TIMEOUT = 30
+
+    def __init__(self, resource_config, logger, api, port=NETCONF_PORT, timeout=TIMEOUT):
+        """
+        :param resource_config:
+        :param logger:
+        :param api:
+        :param port: netconf ssh port
+        :param timeout: connect and read timeout, sec
+        """
+        self.resource_config = resource_config
+        self._logger = logger
+        self._api = api
+        self._port = port
+        self._timeout = timeout
+        self._password = None
+
+    @property
+    def password(self):
+        if not self._password:
+            self._password = self._api.DecryptPassword(self.resource_config.password).Value
+        return self._password
+
+    def _connect(self):
+        """
+        Open netconf subsystem channel
+        :return: ssh client, channel
+        """
+        client = paramiko.SSHClient()
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(self.resource_config.address, self._port, self.resource_config.user, self.password,
+                           timeout=self._timeout, banner_timeout=self._timeout, allow_agent=False,
+                           look_for_keys=False)
+            channel = client.get_transport().open_session()
+            channel.settimeout(self._timeout)
+            channel.invoke_subsystem(self.NETCONF_SUBSYSTEM)
+        except Exception:
+            client.close()
+            raise
+        return client, channel
+
+    @contextmanager
+    def get_netconf_session(self):
+        """
+        Netconf session, closed on exit
+        :rtype: JuniperNetconfSession
+        """
+        self._logger.debug('Open netconf session to {0}:{1}'.format(self.resource_config.address, self._port))
+        client, channel = self._connect()
+        netconf_session = JuniperNetconfSession(channel, self._logger)
+        try:
+            netconf_session.hello()
+            yield netconf_session
+        finally:
+            netconf_session.close()
+            client.close()
+
+
+@contextmanager
+def optional_netconf_session(netconf_handler):
+    """
+    Netconf session of the handler, None if netconf is not used
+    :param netconf_handler:
+    :type netconf_handler: JuniperNetconfHandler
+    :rtype: JuniperNetconfSession
+    """
+    if netconf_handler is None:
+        yield None
+    else:
+        with netconf_handler.get_netconf_session() as netconf_session:
+            yield netconf_session
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import xml.etree.cElementTree as ElementTree
+
+NETCONF_NAMESPACE = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+BASE_CAPABILITY = 'urn:ietf:params:netconf:base:1.0'
+END_OF_MESSAGE = ']]>]]>'
+
+CLIENT_HELLO = ('<?xml version="1.0" encoding="UTF-8"?><hello xmlns="{0}"><capabilities><capability>{1}</capability>'
+                '</capabilities></hello>').format(NETCONF_NAMESPACE, BASE_CAPABILITY)
+RPC = '<?xml version="1.0" encoding="UTF-8"?><rpc xmlns="{0}" message-id="{1}">{2}</rpc>'
+CLOSE_SESSION = '<close-session/>'
+
+
+def local_name(element):
+    """
+    Tag of the element without namespace
+    :param element:
+    :rtype: str
+    """
+    return element.tag.rsplit('}', 1)[-1]
+
+
+def find_text(element, name, default=None):
+    """
+    Text of the first child with the local name
+    :param element:
+    :param name: child tag without namespace
+    :param default:
+    :rtype: str
+    """
+    for child in element:
+        if local_name(child) == name:
+            return (child.text or '').strip()
+    return default
+
+
+class JuniperNetconfSession(object):
+    """
+    NETCONF 1.0 session over a connected channel, replies are parsed incrementally while they are received
+    """
+    RECEIVE_SIZE = 65536
+
+    def __init__(self, channel, logger):
+        """
+        :param channel: connected socket-like channel with send, recv and close, netconf ssh subsystem channel
+        :param logger:
+        """
+        self._channel = channel
+        self._logger = logger
+        self._buffer = ''
+        self._message_started = False
+        self._message_complete = True
+        self._message_id = 0
+        self.session_id = None
+        self.capabilities = []
+
+    def hello(self):
+        """
+        Exchange capabilities with the server
+        """
+        self._send(CLIENT_HELLO)
+        for element in self._iterparse(('capability', 'session-id')):
+            if local_name(element) == 'capability':
+                self.capabilities.append((element.text or '').strip())
+            else:
+                self.session_id = (element.text or '').strip()
+        if BASE_CAPABILITY not in self.capabilities:
+            raise Exception(self.__class__.__name__, 'Server does not support {0}'.format(BASE_CAPABILITY))
+        self._logger.debug('Netconf session {0} started'.format(self.session_id))
+
+    def rpc(self, request, tags):
+        """
+        Send rpc request and iterate over the reply elements with the tags
+        Elements are yielded as soon as they are parsed and cleared after, rpc errors are raised
+        :param request: rpc body
+        :param tags: local names of the yielded elements
+        :return: generator of the elements
+        """
+        self._skip_message()
+        self._message_id += 1
+        self._send(RPC.format(NETCONF_NAMESPACE, self._message_id, request))
+        return self._iterparse(tags)
+
+    def close(self):
+        """
+        Close the netconf session and the channel
+        """
+        try:
+            for _ in self.rpc(CLOSE_SESSION, ()):
+                pass
+        except Exception as e:
+            self._logger.debug('Cannot close netconf session, {0}'.format(e))
+        finally:
+            self._channel.close()
+
+    def _send(self, message):
+        self._channel.sendall(message + END_OF_MESSAGE)
+        self._message_started = False
+        self._message_complete = False
+
+    def _iterparse(self, tags):
+        """
+        :param tags: local names of the yielded elements
+        :return: generator of the elements
+        """
+        for event, element in ElementTree.iterparse(self, events=('end',)):
+            name = local_name(element)
+            if name == 'rpc-error':
+                self._check_error(element)
+            elif name in tags:
+                yield element
+                element.clear()
+
+    def _check_error(self, element):
+        """
+        Raise rpc error, log warning
+        :param element: rpc-error element
+        """
+        message = find_text(element, 'error-message') or find_text(element, 'error-tag', '')
+        if find_text(element, 'error-severity') == 'warning':
+            self._logger.warning('Netconf rpc warning, {0}'.format(message))
+            return
+        self._skip_message()
+        raise Exception(self.__class__.__name__, 'Netconf rpc error, {0}'.format(message))
+
+    def _skip_message(self):
+        """
+        Read the rest of the current message
+        """
+        while self.read(self.RECEIVE_SIZE):
+            pass
+
+    def read(self, size=-1):
+        """
+        File-like read of the current message, the message ends at the end of message delimiter
+        :param size: ignored, the received data is returned as soon as it is available
+        :return: message data, empty string at the end of the message
+        """
+        while not self._message_complete:
+            if not self._message_started:
+                self._buffer = self._buffer.lstrip()
+                self._message_started = bool(self._buffer)
+            index = self._buffer.find(END_OF_MESSAGE)
+            if index == 0:
+                self._buffer = self._buffer[len(END_OF_MESSAGE):]
+                self._message_complete = True
+                break
+            if index > 0:
+                data, self._buffer = self._buffer[:index], self._buffer[index:]
+                return data
+            # the tail of the buffer can be the beginning of the delimiter
+            available = len(self._buffer) - len(END_OF_MESSAGE) + 1
+            if self._message_started and available > 0:
+                data, self._buffer = self._buffer[:available], self._buffer[available:]
+                return data
+            data = self._channel.recv(self.RECEIVE_SIZE)
+            if not data:
+                raise Exception(self.__class__.__name__, 'Netconf session closed by the server')
+            self._buffer += data
+        return ''
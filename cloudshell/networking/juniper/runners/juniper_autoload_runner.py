@@ -12,11 +12,15 @@ class JuniperAutoloadRunner(AutoloadRunner):
         self._cli = cli
         self._api = api
         self._logger = logger
+        self.autoload_profile = None
 
     @property
     def snmp_handler(self):
         return JuniperSnmpHandler(self._cli, self.resource_config, self._logger, self._api)
 
+    def _set_autoload_profile(self, autoload_profile):
+        self.autoload_profile = autoload_profile
+
     @property
     def autoload_flow(self):
-        return JuniperSnmpAutoloadFlow(self.snmp_handler, self._logger)
+        return JuniperSnmpAutoloadFlow(self.snmp_handler, self._logger, profile_handler=self._set_autoload_profile)
@@ -11,13 +11,16 @@ class JuniperConfigurationRunner(ConfigurationRunner):
     def __init__(self, cli, logger, resource_config, api):
         super(JuniperConfigurationRunner, self).__init__(logger, resource_config, api)
         self._cli = cli
+        self._cli_handler = None
 
     @property
     def cli_handler(self):
         """ CLI Handler property
         :return: CLI handler
         """
-        return JuniperCliHandler(self._cli, self.resource_config, self._logger, self._api)
+        if self._cli_handler is None:
+            self._cli_handler = JuniperCliHandler(self._cli, self.resource_config, self._logger, self._api)
+        return self._cli_handler
 
     @property
     def restore_flow(self):
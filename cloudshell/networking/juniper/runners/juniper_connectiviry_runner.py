@@ -5,31 +5,42 @@ from cloudshell.devices.runners.connectivity_runner import ConnectivityRunner
 from cloudshell.networking.juniper.flows.juniper_add_vlan_flow import JuniperAddVlanFlow
 from cloudshell.networking.juniper.flows.juniper_remove_vlan_flow import JuniperRemoveVlanFlow
 from cloudshell.networking.juniper.cli.juniper_cli_handler import JuniperCliHandler
+from cloudshell.networking.juniper.netconf.juniper_netconf_handler import JuniperNetconfHandler
 
 
 class JuniperConnectivityRunner(ConnectivityRunner):
-    def __init__(self, cli, logger, api, resource_config):
+    def __init__(self, cli, logger, api, resource_config, netconf=False):
         """ Handle add/remove vlan flows
 
             :param cli:
             :param logger:
             :param api:
             :param resource_config:
+            :param netconf: read vlans and interfaces over netconf instead of parsing cli output
             """
 
         super(JuniperConnectivityRunner, self).__init__(logger)
         self.cli = cli
         self.api = api
         self.resource_config = resource_config
+        self._cli_handler = None
+        self._netconf = netconf
 
     @property
     def cli_handler(self):
-        return JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        if self._cli_handler is None:
+            self._cli_handler = JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        return self._cli_handler
+
+    @property
+    def netconf_handler(self):
+        if self._netconf:
+            return JuniperNetconfHandler(self.resource_config, self._logger, self.api)
 
     @property
     def remove_vlan_flow(self):
-        return JuniperRemoveVlanFlow(self.cli_handler, self._logger)
+        return JuniperRemoveVlanFlow(self.cli_handler, self._logger, self.netconf_handler)
 
     @property
     def add_vlan_flow(self):
-        return JuniperAddVlanFlow(self.cli_handler, self._logger)
+        return JuniperAddVlanFlow(self.cli_handler, self._logger, self.netconf_handler)
@@ -12,10 +12,13 @@ class JuniperFirmwareRunner(FirmwareRunner):
         self.cli = cli
         self.api = api
         self.resource_config = resource_config
+        self._cli_handler = None
 
     @property
     def cli_handler(self):
-        return JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        if self._cli_handler is None:
+            self._cli_handler = JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        return self._cli_handler
 
     @property
     def load_firmware_flow(self):
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from cloudshell.networking.juniper.runners.juniper_autoload_runner import JuniperAutoloadRunner
+
+
+class FleetAutoloadResult(object):
+    """
+    Autoload result of one device
+    """
+    __slots__ = ('resource_name', 'autoload_details', 'error', 'duration')
+
+    def __init__(self, resource_name, autoload_details=None, error=None, duration=0):
+        """
+        :param resource_name:
+        :param autoload_details: AutoLoadDetails, None if autoload failed
+        :param error: exception raised by autoload, None if succeeded
+        :param duration: sec
+        """
+        self.resource_name = resource_name
+        self.autoload_details = autoload_details
+        self.error = error
+        self.duration = duration
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+
+class JuniperFleetAutoloadRunner(object):
+    """
+    Discover many devices concurrently
+    At most max_concurrency autoloads run at the same time. A device which exceeds the timeout is reported as failed,
+    its autoload keeps the slot until it stops, so the snmp sessions never exceed the limit.
+    MIB modules are compiled once per process and shared by the sessions of all devices, see CachedDirMibSource
+    """
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(self, cli, logger, api, max_concurrency=None, timeout=None):
+        """
+        :param cli:
+        :param logger:
+        :param api:
+        :param max_concurrency: max number of concurrent autoloads
+        :param timeout: max autoload time of one device, sec, not limited by default
+        """
+        self._cli = cli
+        self._logger = logger
+        self._api = api
+        self._max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self._timeout = timeout
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+
+    def _create_autoload_runner(self, resource_config):
+        """
+        :param resource_config:
+        :rtype: JuniperAutoloadRunner
+        """
+        return JuniperAutoloadRunner(self._cli, self._logger, resource_config, self._api)
+
+    def _run_autoload(self, resource_config, outcome, finished):
+        """
+        Run autoload in the acquired slot, release the slot when autoload stops
+        :param resource_config:
+        :param outcome: dict, receives 'autoload_details' or 'error'
+        :param finished: threading.Event
+        """
+        try:
+            outcome['autoload_details'] = self._create_autoload_runner(resource_config).discover()
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            self._slots.release()
+            finished.set()
+
+    def _discover_device(self, resource_config):
+        """
+        :param resource_config:
+        :rtype: FleetAutoloadResult
+        """
+        self._slots.acquire()
+        start_time = time.time()
+        outcome = {}
+        finished = threading.Event()
+        thread = threading.Thread(target=self._run_autoload, args=(resource_config, outcome, finished),
+                                  name='autoload-{0}'.format(resource_config.name))
+        thread.daemon = True
+        thread.start()
+        if not finished.wait(self._timeout):
+            outcome['error'] = Exception(self.__class__.__name__,
+                                         'Autoload timed out after {0} sec'.format(self._timeout))
+        result = FleetAutoloadResult(resource_config.name, outcome.get('autoload_details'), outcome.get('error'),
+                                     time.time() - start_time)
+        if result.succeeded:
+            self._logger.info('Autoload of {0} completed in {1:.1f} sec'.format(result.resource_name,
+                                                                                 result.duration))
+        else:
+            self._logger.error('Autoload of {0} failed in {1:.1f} sec, {2}'.format(result.resource_name,
+                                                                                    result.duration, result.error))
+        return result
+
+    def discover(self, resource_configs, result_handler=None):
+        """
+        Discover the devices
+        :param resource_configs: resource configs of the devices
+        :param result_handler: callable which receives FleetAutoloadResult of each device as soon as it completes,
+            the results are not kept, so autoload details of the whole fleet are not held in memory
+        :return: dict {resource name: FleetAutoloadResult} in the order of resource configs, empty if result handler
+            is set
+        :rtype: OrderedDict
+        """
+        resource_configs = list(resource_configs)
+        results = OrderedDict((resource_config.name, None) for resource_config in resource_configs)
+        if not resource_configs:
+            return results
+        self._logger.info('Discover {0} devices, {1} concurrent autoloads'.format(len(resource_configs),
+                                                                                  self._max_concurrency))
+        pool = ThreadPool(min(self._max_concurrency, len(resource_configs)))
+        try:
+            for result in pool.imap_unordered(self._discover_device, resource_configs):
+                if result_handler:
+                    result_handler(result)
+                    del results[result.resource_name]
+                else:
+                    results[result.resource_name] = result
+        finally:
+            pool.close()
+            pool.join()
+        return results
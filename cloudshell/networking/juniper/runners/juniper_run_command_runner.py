@@ -19,7 +19,10 @@ class JuniperRunCommandRunner(RunCommandRunner):
         self.cli = cli
         self.api = api
         self.resource_config = resource_config
+        self._cli_handler = None
 
     @property
     def cli_handler(self):
-        return JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        if self._cli_handler is None:
+            self._cli_handler = JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        return self._cli_handler
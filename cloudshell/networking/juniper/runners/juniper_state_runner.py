@@ -17,7 +17,10 @@ class JuniperStateRunner(StateRunner):
         super(JuniperStateRunner, self).__init__(logger, api, resource_config)
         self.cli = cli
         self.api = api
+        self._cli_handler = None
 
     @property
     def cli_handler(self):
-        return JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        if self._cli_handler is None:
+            self._cli_handler = JuniperCliHandler(self.cli, self.resource_config, self._logger, self.api)
+        return self._cli_handler
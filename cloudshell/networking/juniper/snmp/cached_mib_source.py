@@ -0,0 +1,52 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import threading
+from errno import ENOENT
+
+from pysnmp.smi.builder import DirMibSource
+
+
+class CachedDirMibSource(DirMibSource):
+    """
+    DirMibSource which reads and compiles each MIB module once per process
+    Compiled modules are shared by the mib builders of all snmp sessions, every builder still executes the module
+    into its own symbols, so sessions do not share MIB objects
+    """
+    _modules = {}
+    _lock = threading.Lock()
+
+    def read(self, f):
+        """
+        :param f: MIB module name
+        :return: (code object, suffix)
+        """
+        key = (self.fullPath(), f)
+        module = self._modules.get(key)
+        if module is None:
+            with self._lock:
+                module = self._modules.get(key)
+                if module is None:
+                    module = self._modules[key] = self._read_module(f)
+        if not module:
+            raise IOError(ENOENT, 'No suitable module found', f)
+        return module
+
+    def _read_module(self, f):
+        """
+        Read precompiled module or compile module source
+        :param f: MIB module name
+        :return: (code object, suffix) or () if module is not found in this folder
+        """
+        try:
+            data, sfx = DirMibSource.read(self, f)
+        except IOError:
+            return ()
+        if isinstance(data, basestring):
+            data = compile(data, self.fullPath(f, sfx), 'exec')
+        return data, sfx
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._modules.clear()
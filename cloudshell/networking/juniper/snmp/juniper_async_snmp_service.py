@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import time
+from collections import deque
+
+from pyasn1.type import univ
+from pysnmp.error import PySnmpError
+from pysnmp.hlapi.asyncore import ContextData, bulkCmd
+from pysnmp.proto.rfc1902 import ObjectName
+from pysnmp.smi.rfc1902 import ObjectIdentity
+
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import JuniperSnmpService, SnmpWalkTimeout
+
+
+class PipelinedWalk(object):
+    """
+    State of one walk of the pipeline
+    """
+    __slots__ = ('oid', 'root', 'last_name', 'var_binds', 'attempt')
+
+    def __init__(self, oid, root, last_name=None, var_binds=None):
+        """
+        :param oid: requested (MIB, OID name) or numeric OID
+        :param root: OID tuple
+        :param last_name: last received OID, None if the walk is not started
+        :param var_binds: received var binds
+        """
+        self.oid = oid
+        self.root = root
+        self.last_name = last_name
+        self.var_binds = var_binds or []
+        self.attempt = 0
+
+
+class JuniperAsyncSnmpService(JuniperSnmpService):
+    """
+    Pipeline GETBULK walks of many tables over one snmp session
+    The next page of a prefetched walk is sent as soon as its response arrives, without waiting for the other walks,
+    up to max_outstanding requests are in flight. Responses are handled by the pysnmp asyncore dispatcher of the
+    session, no threads are used. Prefetched tables are returned by the next walk of the same OID
+    """
+    DEFAULT_MAX_OUTSTANDING = 8
+
+    def __init__(self, snmp_service, logger, max_outstanding=None, **kwargs):
+        """
+        :param snmp_service:
+        :type snmp_service: cloudshell.snmp.quali_snmp.QualiSnmp
+        :param logger:
+        :param max_outstanding: max number of requests in flight
+        :param kwargs: see JuniperSnmpService
+        """
+        JuniperSnmpService.__init__(self, snmp_service, logger, **kwargs)
+        self.max_outstanding = max_outstanding or self.DEFAULT_MAX_OUTSTANDING
+        self._prefetched = {}
+        self._pending_walks = deque()
+        self._errors = {}
+
+    def _resolve(self, oid):
+        """
+        :param oid: (MIB, OID name) or numeric OID
+        :return: OID tuple
+        """
+        object_identity = ObjectIdentity(*oid) if isinstance(oid, tuple) else ObjectIdentity(oid)
+        object_identity.resolveWithMib(self._snmp_service.mib_viewer)
+        return tuple(object_identity.getOid())
+
+    def prefetch(self, oids):
+        """
+        Walk the tables concurrently
+        Failed walks are not kept, the next walk of the OID requests it again and raises the error, timed out walk
+        is resumed from the received part
+        :param oids: list of (MIB, OID name) or numeric OIDs
+        :return: dict {oid: error} of the failed walks
+        """
+        start_time = time.time()
+        request_count = self.request_count
+        self._errors = {}
+        self._pending_walks = deque()
+        for oid in oids:
+            root = self._resolve(oid)
+            if root not in self._prefetched:
+                last_name, var_binds = self._walk_progress.pop(root, (None, []))
+                self._pending_walks.append(PipelinedWalk(oid, root, last_name, var_binds))
+        walks = len(self._pending_walks)
+        for _ in range(min(self.max_outstanding, walks)):
+            self._send_page(self._pending_walks.popleft())
+        if walks:
+            self._snmp_service.cmd_gen.snmpEngine.transportDispatcher.runDispatcher()
+        self._logger.debug('Prefetch {0} walks, {1} failed, {2} requests, {3} outstanding, {4:.3f} sec'.format(
+            walks, len(self._errors), self.request_count - request_count, self.max_outstanding,
+            time.time() - start_time))
+        return self._errors
+
+    def _send_page(self, walk):
+        """
+        Request the next page of the walk
+        :type walk: PipelinedWalk
+        """
+        self.request_count += 1
+        bulkCmd(self._snmp_service.cmd_gen.snmpEngine, self._snmp_service.security, self._snmp_service.target,
+                ContextData(), 0, self.max_repetitions,
+                (ObjectName(walk.root if walk.last_name is None else walk.last_name), univ.Null('')),
+                cbFun=self._handle_page, cbCtx=walk, lookupMib=False)
+
+    def _start_next_walk(self):
+        if self._pending_walks:
+            self._send_page(self._pending_walks.popleft())
+
+    def _fail_walk(self, walk, error):
+        """
+        :type walk: PipelinedWalk
+        :param error: exception
+        """
+        self._logger.debug('Prefetch of {0} failed, {1}'.format(walk.oid, error))
+        self._errors[walk.oid] = error
+        self._start_next_walk()
+
+    def _handle_page(self, snmp_engine, send_request_handle, error_indication, error_status, error_index,
+                     var_bind_table, walk):
+        """
+        Dispatcher callback of the page response
+        Reduce max-repetitions while agent responds tooBig, retry timed out page with reduced max-repetitions,
+        the retry is sent right away, the transport target timeout delays it
+        :type walk: PipelinedWalk
+        """
+        if self._is_too_big(error_status) and self.max_repetitions > 1:
+            self.max_repetitions = max(self.max_repetitions // 2, 1)
+            self._send_page(walk)
+            return
+        if error_indication == self.TIMEOUT_ERROR:
+            if walk.attempt < self.retries:
+                walk.attempt += 1
+                self.max_repetitions = max(self.max_repetitions // 2, 1)
+                self._send_page(walk)
+                return
+            if walk.var_binds:
+                self._walk_progress[walk.root] = walk.last_name, walk.var_binds
+            self._fail_walk(walk, SnmpWalkTimeout(str(error_indication)))
+            return
+        if error_indication or error_status:
+            self._fail_walk(walk, PySnmpError(error_indication or error_status))
+            return
+
+        walk.attempt = 0
+        if self._add_page(walk.root, walk.var_binds, var_bind_table):
+            self._prefetched[walk.root] = walk.var_binds
+            self._start_next_walk()
+            return
+        walk.last_name = walk.var_binds[-1][0][0]
+        self._send_page(walk)
+
+    def _bulk_walk(self, object_identity):
+        """
+        Return the prefetched walk, or execute it
+        :param object_identity: pysnmp ObjectIdentity of the table or column
+        :return: var binds table
+        """
+        object_identity.resolveWithMib(self._snmp_service.mib_viewer)
+        var_binds = self._prefetched.pop(tuple(object_identity.getOid()), None)
+        if var_binds is not None:
+            return var_binds
+        return JuniperSnmpService._bulk_walk(self, object_identity)
@@ -2,6 +2,7 @@ from cloudshell.networking.juniper.cli.juniper_cli_handler import JuniperCliHand
 from cloudshell.networking.juniper.flows.juniper_disable_snmp_flow import JuniperDisableSnmpFlow
 from cloudshell.networking.juniper.flows.juniper_enable_snmp_flow import JuniperEnableSnmpFlow
 from cloudshell.devices.snmp_handler import SnmpHandler
+from cloudshell.snmp.quali_snmp import QualiSnmp
 
 
 class JuniperSnmpHandler(SnmpHandler):
@@ -9,10 +10,20 @@ class JuniperSnmpHandler(SnmpHandler):
         super(JuniperSnmpHandler, self).__init__(resource_config, logger, api)
         self._cli = cli
         self._api = api
+        self._cli_handler = None
 
     @property
     def juniper_cli_handler(self):
-        return JuniperCliHandler(self._cli, self.resource_config, self._logger, self._api)
+        if self._cli_handler is None:
+            self._cli_handler = JuniperCliHandler(self._cli, self.resource_config, self._logger, self._api)
+        return self._cli_handler
+
+    def create_snmp_session(self):
+        """
+        Create additional snmp session, snmp has to be enabled by get_snmp_service
+        :rtype: QualiSnmp
+        """
+        return QualiSnmp(self._snmp_parameters, self._logger)
 
     def _create_enable_flow(self):
         return JuniperEnableSnmpFlow(self.juniper_cli_handler, self._logger)
@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import random
+import time
+
+from pyasn1.type import univ
+from pysnmp.error import PySnmpError
+from pysnmp.proto.rfc1902 import IpAddress
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
+from pysnmp.smi.builder import DirMibSource
+from pysnmp.smi.rfc1902 import ObjectIdentity
+
+from cloudshell.networking.juniper.snmp.cached_mib_source import CachedDirMibSource
+from cloudshell.snmp.quali_snmp import QualiMibTable
+
+
+class SnmpWalkTimeout(PySnmpError):
+    """
+    Walk was interrupted by timeouts, the received part is kept in the walk progress of the service
+    """
+
+
+class JuniperSnmpService(object):
+    """
+    Wrap QualiSnmp service, walk tables with GETBULK requests instead of GETNEXT
+    Walks are paged, a timed out page is requested again from the last received OID
+    """
+    DEFAULT_MAX_REPETITIONS = 25
+    DEFAULT_RETRIES = 3
+    DEFAULT_BACKOFF = 0.5
+    MAX_BACKOFF = 8
+    TOO_BIG_ERROR = 'tooBig'
+    TIMEOUT_ERROR = 'requestTimedOut'
+    EMPTY_VALUE_TYPES = (EndOfMibView, NoSuchInstance, NoSuchObject)
+
+    def __init__(self, snmp_service, logger, max_repetitions=None, retries=None, backoff=None, walk_progress=None):
+        """
+        :param snmp_service:
+        :type snmp_service: cloudshell.snmp.quali_snmp.QualiSnmp
+        :param logger:
+        :param max_repetitions: GETBULK max-repetitions
+        :param retries: number of retries of a timed out page
+        :param backoff: base back-off delay between retries, sec
+        :param walk_progress: received parts of the interrupted walks {root OID: (last OID, var binds)},
+            can be shared by the sessions of one autoload, so the next walk of the OID resumes
+        """
+        self._snmp_service = snmp_service
+        self._logger = logger
+        self.max_repetitions = max_repetitions or self.DEFAULT_MAX_REPETITIONS
+        self.retries = self.DEFAULT_RETRIES if retries is None else retries
+        self.backoff = self.DEFAULT_BACKOFF if backoff is None else backoff
+        self._walk_progress = {} if walk_progress is None else walk_progress
+        self.request_count = 0
+
+    def __getattr__(self, item):
+        return getattr(self._snmp_service, item)
+
+    def update_mib_sources(self, mib_folder_path):
+        """
+        Add MIB folder to the mib sources, MIB modules of all folders are read and compiled once per process
+        :param mib_folder_path:
+        """
+        mib_sources = []
+        for mib_source in self._snmp_service.mib_builder.getMibSources() + (DirMibSource(mib_folder_path),):
+            if isinstance(mib_source, DirMibSource) and not isinstance(mib_source, CachedDirMibSource):
+                mib_source = CachedDirMibSource(mib_source.fullPath())
+            mib_sources.append(mib_source)
+        self._snmp_service.mib_builder.setMibSources(*mib_sources)
+
+    def walk(self, oid, *indexes):
+        """
+        Walk through the given table or column OID using GETBULK
+        :param oid: (MIB, OID name)
+        :param indexes: only return the requested indexes
+        :return: QualiMibTable {index: {attribute: value}}
+        """
+        start_time = time.time()
+        var_binds = self._bulk_walk(ObjectIdentity(*oid))
+        oid_2_value = self._build_table(oid, var_binds)
+        if indexes:
+            oid_2_value = oid_2_value.get_rows(*indexes)
+        self._logger.debug('Walk {0}::{1}, {2} rows, max-repetitions {3}, {4:.3f} sec'.format(
+            oid[0], oid[1], len(oid_2_value), self.max_repetitions, time.time() - start_time))
+        return oid_2_value
+
+    def walk_oid(self, oid):
+        """
+        Walk numeric column OID without MIB lookup of the response
+        :param oid: numeric OID, i.e. '1.3.6.1.2.1.2.2.1.2'
+        :return: dict {index: value}, values are decoded to int, str (octets) or numeric OID string
+        """
+        start_time = time.time()
+        root = tuple(int(number) for number in oid.strip('.').split('.'))
+        root_length = len(root)
+        values = {}
+        for var_bind in self._bulk_walk(ObjectIdentity(oid)):
+            name, value = var_bind[0]
+            if isinstance(value, self.EMPTY_VALUE_TYPES):
+                continue
+            name = name.asTuple()
+            if name[:root_length] != root:
+                continue
+            values[self._build_index('.'.join(str(number) for number in name[root_length:]))] = \
+                self._decode_value(value)
+        self._logger.debug('Walk {0}, {1} rows, max-repetitions {2}, {3:.3f} sec'.format(
+            oid, len(values), self.max_repetitions, time.time() - start_time))
+        return values
+
+    def get_named_values(self, mib, column):
+        """
+        Enumeration of the column syntax, used to decode raw integer values
+        :param mib:
+        :param column:
+        :return: pyasn1 NamedValues or None
+        """
+        mib_node, = self._snmp_service.mib_builder.importSymbols(mib, column)
+        return getattr(mib_node.getSyntax(), 'namedValues', None) or None
+
+    @staticmethod
+    def _decode_value(value):
+        """
+        :param value: pysnmp value
+        :return: int, str or numeric OID string
+        """
+        if isinstance(value, univ.Integer):
+            return int(value)
+        if isinstance(value, (IpAddress, univ.ObjectIdentifier)):
+            return value.prettyPrint()
+        if isinstance(value, univ.OctetString):
+            return value.asOctets()
+        return value.prettyPrint()
+
+    @staticmethod
+    def _build_index(suffix):
+        """
+        We want table index to be numeric if possible
+        :param suffix: OID suffix
+        :return: int, float or str
+        """
+        if suffix.isdigit():
+            return int(suffix)
+        elif suffix.replace('.', '', 1).isdigit():
+            return float(suffix)
+        return suffix
+
+    def _bulk_walk(self, object_identity):
+        """
+        Execute GETBULK walk page by page
+        Reduce max-repetitions while agent responds tooBig, retry timed out page with exponential back-off and
+        reduced max-repetitions, resume the walk interrupted before
+        :param object_identity: pysnmp ObjectIdentity of the table or column
+        :return: var binds table
+        """
+        object_identity.resolveWithMib(self._snmp_service.mib_viewer)
+        root = tuple(object_identity.getOid())
+        last_name, var_binds = self._walk_progress.pop(root, (None, []))
+        if last_name is not None:
+            self._logger.debug('Resume walk {0} from {1}, {2} rows received before'.format(
+                object_identity, last_name, len(var_binds)))
+        attempt = 0
+        while True:
+            self.request_count += 1
+            error_indication, error_status, error_index, var_bind_table = self._snmp_service.cmd_gen.bulkCmd(
+                self._snmp_service.security, self._snmp_service.target, 0, self.max_repetitions,
+                object_identity if last_name is None else ObjectIdentity(last_name),
+                lexicographicMode=True, maxCalls=1)
+            if self._is_too_big(error_status) and self.max_repetitions > 1:
+                self.max_repetitions = max(self.max_repetitions // 2, 1)
+                self._logger.debug('Response is too big, max-repetitions reduced to {0}'.format(self.max_repetitions))
+                continue
+            if error_indication == self.TIMEOUT_ERROR:
+                if attempt < self.retries:
+                    attempt += 1
+                    self._back_off(attempt)
+                    continue
+                if var_binds:
+                    self._walk_progress[root] = last_name, var_binds
+                raise SnmpWalkTimeout(error_indication)
+            if error_indication:
+                raise PySnmpError(error_indication)
+            if error_status:
+                raise PySnmpError(error_status)
+
+            attempt = 0
+            if self._add_page(root, var_binds, var_bind_table):
+                return var_binds
+            last_name = var_binds[-1][0][0]
+
+    @staticmethod
+    def _add_page(root, var_binds, var_bind_table):
+        """
+        Add received page to the walk
+        :param root: OID tuple of the walked table or column
+        :param var_binds: var binds received before
+        :param var_bind_table: received page
+        :return: True if the walk is finished
+        :rtype: bool
+        """
+        page_size = len(var_binds)
+        for var_bind in var_bind_table:
+            name, value = var_bind[0]
+            # end of the subtree, or agent does not increase OIDs
+            if isinstance(value, EndOfMibView) or tuple(name[:len(root)]) != root or \
+                    (var_binds and name <= var_binds[-1][0][0]):
+                return True
+            var_binds.append(var_bind)
+        return len(var_binds) == page_size
+
+    def _back_off(self, attempt):
+        """
+        Wait before retry of the timed out page, exponential back-off with full jitter
+        Timed out page is requested with the halved max-repetitions
+        :param attempt: retry number
+        """
+        self.max_repetitions = max(self.max_repetitions // 2, 1)
+        delay = random.uniform(0, min(self.backoff * 2 ** attempt, self.MAX_BACKOFF))
+        self._logger.debug('Request timed out, retry {0} of {1} in {2:.2f} sec, max-repetitions {3}'.format(
+            attempt, self.retries, delay, self.max_repetitions))
+        time.sleep(delay)
+
+    def _is_too_big(self, error_status):
+        return bool(error_status) and hasattr(error_status, 'prettyPrint') and \
+               error_status.prettyPrint() == self.TOO_BIG_ERROR
+
+    def _build_table(self, oid, var_binds):
+        """
+        Build table the same way as QualiSnmp.walk does
+        :param oid:
+        :param var_binds:
+        :rtype: QualiMibTable
+        """
+        oid_2_value = QualiMibTable(oid[1])
+        for var_bind in var_binds:
+            name, value = var_bind[0]
+            if isinstance(value, self.EMPTY_VALUE_TYPES):
+                continue
+            mod_name, mib_name, suffix = self._snmp_service.mib_viewer.getNodeLocation(name)
+            index = self._build_index(str(suffix))
+            if not oid_2_value.get(index):
+                oid_2_value[index] = {'suffix': str(suffix)}
+            oid_2_value[index][mib_name] = value.prettyPrint()
+        return oid_2_value
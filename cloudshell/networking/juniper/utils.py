@@ -1,26 +1,76 @@
+from operator import attrgetter, itemgetter
+
 from cloudshell.snmp.quali_snmp import QualiMibTable
 
 
+def _index_by_key(elements, get_key, missing_errors, group):
+    """
+    Index elements by the key in one pass
+    :param elements: iterable
+    :param get_key: callable which returns the key of the element
+    :param missing_errors: exceptions of get_key for elements which do not have the attributes, skipped
+    :param group: keep all elements of the key in a list instead of the last one
+    :rtype: dict
+    """
+    index = {}
+    for element in elements:
+        try:
+            key = get_key(element)
+        except missing_errors:
+            continue
+        if group:
+            index.setdefault(key, []).append(element)
+        else:
+            index[key] = element
+    return index
+
+
+def index_elements_by_attributes(elements, *attributes, **kwargs):
+    """
+    Index table rows by the values of the attributes, rows without some of the attributes are skipped
+    :param elements: iterable of rows, i.e. QualiMibTable.itervalues()
+    :param attributes: row keys, the index key is the tuple of their values
+    :keyword group: keep one-to-many groups {key: [row]} instead of overwriting {key: row}
+    :rtype: dict
+    """
+    get_key = itemgetter(*attributes)
+    if len(attributes) == 1:
+        get_key = lambda element, get_value=get_key: (get_value(element),)
+    return _index_by_key(elements, get_key, KeyError, kwargs.get('group', False))
+
+
+def index_objects_by_attributes(objects, *attributes, **kwargs):
+    """
+    Index objects by the values of the attributes, objects without some of the attributes are skipped
+    :param objects: iterable of objects
+    :param attributes: attribute names, the index key is the tuple of their values
+    :keyword group: keep one-to-many groups {key: [object]} instead of overwriting {key: object}
+    :rtype: dict
+    """
+    get_key = attrgetter(*attributes)
+    if len(attributes) == 1:
+        get_key = lambda obj, get_value=get_key: (get_value(obj),)
+    return _index_by_key(objects, get_key, AttributeError, kwargs.get('group', False))
+
+
 def sort_elements_by_attributes(elements, *attributes):
-    sorted_map = {}
-    template = ".".join(["{%s}" % x for x in range(0, len(attributes))])
-    for value_map in elements.values():
-        index_values = [value_map[key] for key in attributes if key in value_map]
-        if len(attributes) == len(index_values):
-            index = template.format(*index_values)
-            sorted_map[index] = value_map
-    return sorted_map
+    """
+    Index table rows by the attribute values joined with '.', rows without some of the attributes are skipped
+    :param elements: dict {index: row}
+    :rtype: dict
+    """
+    return {'.'.join(map(str, key)): element
+            for key, element in index_elements_by_attributes(elements.itervalues(), *attributes).iteritems()}
 
 
 def sort_objects_by_attributes(object_list, *attributes):
-    sorted_map = {}
-    template = ".".join(["{%s}" % x for x in range(0, len(attributes))])
-    for obj in object_list:
-        index_values = [getattr(obj, key) for key in attributes if hasattr(obj, key) and getattr(obj, key) is not None]
-        if len(attributes) == len(index_values):
-            index = template.format(*index_values)
-            sorted_map[index] = obj
-    return sorted_map
+    """
+    Index objects by the attribute values joined with '.', objects without some of the attributes or with None
+    values are skipped
+    :rtype: dict
+    """
+    return {'.'.join(map(str, key)): obj
+            for key, obj in index_objects_by_attributes(object_list, *attributes).iteritems() if None not in key}
 
 
 def build_mib_dict(data, name):
@@ -38,6 +88,15 @@ class FakeSnmpHandler:
         requested_data = '{0}::{1}'.format(*request_tuple)
         return build_mib_dict(self._mib_data_map[requested_data], requested_data)
 
+    def get_property(self, mib, name, index):
+        for key, val in self._mib_data_map.get('{0}::{1}'.format(mib, name), []):
+            if str(key) == str(index):
+                return val.get(name, '')
+        return ''
+
+    def set_snmp_errors(self, errors):
+        pass
+
     def load_mib(self, mib):
         pass
 
@@ -0,0 +1,76 @@
+import cPickle as pickle
+import marshal
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock import Mock
+
+from cloudshell.networking.juniper.autoload.juniper_autoload_cache import JuniperAutoloadCache
+
+
+class TestJuniperAutoloadCache(TestCase):
+    def setUp(self):
+        self._cache_folder = tempfile.mkdtemp()
+        self._logger = Mock()
+        self._instance = JuniperAutoloadCache(os.path.join(self._cache_folder, 'autoload'), 'Router 1/a',
+                                              self._logger)
+        self._indicators = {'sysUpTime': '1000', 'jnxBoxDescr': 'Juniper MX960', 'ifTableLastChange': '500',
+                            'jnxContentsLastChange': '600'}
+        self._table_indicators = {'_port_table': 'ifTableLastChange', '_content_table': 'jnxContentsLastChange'}
+
+    def tearDown(self):
+        shutil.rmtree(self._cache_folder)
+
+    def test_file_path(self):
+        self.assertEqual(self._instance.file_path, os.path.join(self._cache_folder, 'autoload', 'Router_1_a.autoload'))
+
+    def test_load_without_snapshot(self):
+        self.assertIsNone(self._instance.load())
+        self.assertEqual(self._instance.get_unchanged_tables(self._indicators, self._table_indicators), {})
+
+    def test_load_broken_snapshot(self):
+        os.makedirs(os.path.dirname(self._instance.file_path))
+        with open(self._instance.file_path, 'wb') as cache_file:
+            cache_file.write('broken')
+        self.assertIsNone(self._instance.load())
+        self.assertTrue(self._logger.error.called)
+
+    def test_load_other_format(self):
+        os.makedirs(os.path.dirname(self._instance.file_path))
+        with open(self._instance.file_path, 'wb') as cache_file:
+            pickle.dump({'indicators': self._indicators, 'tables': {}}, cache_file, pickle.HIGHEST_PROTOCOL)
+        self.assertIsNone(self._instance.load())
+        with open(self._instance.file_path, 'wb') as cache_file:
+            marshal.dump({'indicators': self._indicators, 'tables': {}}, cache_file)
+        self.assertIsNone(self._instance.load())
+
+    def test_save_and_load(self):
+        tables = {'_port_table': {'ifDescr': {1: 'ge-0/0/1'}}}
+        self._instance.save(self._indicators, tables)
+        self.assertEqual(self._instance.load(), {'version': JuniperAutoloadCache.VERSION,
+                                                 'indicators': self._indicators, 'tables': tables})
+        self.assertFalse(os.path.exists('{0}.tmp'.format(self._instance.file_path)))
+
+    def test_get_unchanged_tables(self):
+        tables = {'_port_table': 'ports', '_content_table': 'content', '_unknown_table': 'unknown'}
+        self._instance.save(self._indicators, tables)
+        indicators = dict(self._indicators, sysUpTime='2000', jnxContentsLastChange='700')
+        self.assertEqual(self._instance.get_unchanged_tables(indicators, self._table_indicators),
+                         {'_port_table': 'ports'})
+
+    def test_get_unchanged_tables_empty_indicator(self):
+        indicators = dict(self._indicators, ifTableLastChange='', jnxContentsLastChange='')
+        self._instance.save(indicators, {'_port_table': 'ports', '_content_table': 'content'})
+        self.assertEqual(self._instance.get_unchanged_tables(indicators, self._table_indicators), {})
+
+    def test_get_unchanged_tables_device_rebooted(self):
+        self._instance.save(self._indicators, {'_port_table': 'ports'})
+        indicators = dict(self._indicators, sysUpTime='10')
+        self.assertEqual(self._instance.get_unchanged_tables(indicators, self._table_indicators), {})
+
+    def test_get_unchanged_tables_device_replaced(self):
+        self._instance.save(self._indicators, {'_port_table': 'ports'})
+        indicators = dict(self._indicators, sysUpTime='2000', jnxBoxDescr='Juniper EX4300')
+        self.assertEqual(self._instance.get_unchanged_tables(indicators, self._table_indicators), {})
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from mock import Mock
+
+from cloudshell.networking.juniper.autoload.juniper_autoload_config import JuniperAutoloadConfig
+
+
+class TestJuniperAutoloadConfig(TestCase):
+    def setUp(self):
+        self._resource_config = Mock()
+        self._resource_config.namespace_prefix = 'Juniper JunOS Router.'
+        self._resource_config.attributes = {}
+        self._instance = JuniperAutoloadConfig(self._resource_config)
+
+    def test_snmp_max_repetitions(self):
+        self._resource_config.attributes['Juniper JunOS Router.SNMP Max Repetitions'] = '40.0'
+        self.assertEqual(self._instance.snmp_max_repetitions, 40)
+
+    def test_snmp_max_repetitions_without_namespace(self):
+        self._resource_config.attributes['SNMP Max Repetitions'] = '30'
+        self.assertEqual(self._instance.snmp_max_repetitions, 30)
+
+    def test_snmp_max_repetitions_not_defined(self):
+        self.assertIsNone(self._instance.snmp_max_repetitions)
+        self._resource_config.attributes['SNMP Max Repetitions'] = 'wrong'
+        self.assertIsNone(self._instance.snmp_max_repetitions)
+        self.assertIsNone(JuniperAutoloadConfig(Mock()).snmp_max_repetitions)
+
+    def test_autoload_max_workers(self):
+        self.assertEqual(self._instance.autoload_max_workers, 1)
+        self._resource_config.attributes['Juniper JunOS Router.Autoload Max Workers'] = '4'
+        self.assertEqual(self._instance.autoload_max_workers, 4)
+
+    def test_autoload_cache_folder(self):
+        self.assertIsNone(self._instance.autoload_cache_folder)
+        self._resource_config.attributes['Juniper JunOS Router.Autoload Cache Folder'] = '/var/cache/autoload'
+        self.assertEqual(self._instance.autoload_cache_folder, '/var/cache/autoload')
+
+    def test_filter_ports(self):
+        self.assertEqual(self._instance.filter_port_names, [])
+        self.assertEqual(self._instance.filter_port_types, [])
+        self._resource_config.attributes['Juniper JunOS Router.Autoload Filter Port Names'] = 'em, pp0,'
+        self._resource_config.attributes['Autoload Filter Port Types'] = 'ieee8023adLag'
+        self.assertEqual(self._instance.filter_port_names, ['em', 'pp0'])
+        self.assertEqual(self._instance.filter_port_types, ['ieee8023adLag'])
+
+    def test_autoload_raw_oids(self):
+        self.assertFalse(self._instance.autoload_raw_oids)
+        self._resource_config.attributes['Juniper JunOS Router.Autoload Raw OIDs'] = 'True'
+        self.assertTrue(self._instance.autoload_raw_oids)
+        self._resource_config.attributes['Juniper JunOS Router.Autoload Raw OIDs'] = 'False'
+        self.assertFalse(self._instance.autoload_raw_oids)
+
+    def test_autoload_profiling(self):
+        self.assertFalse(self._instance.autoload_profiling)
+        self._resource_config.attributes['Autoload Profiling'] = 'True'
+        self.assertTrue(self._instance.autoload_profiling)
+
+    def test_snmp_retries(self):
+        self.assertIsNone(self._instance.snmp_retries)
+        self.assertIsNone(self._instance.snmp_backoff)
+        self._resource_config.attributes['Juniper JunOS Router.SNMP Retries'] = '5'
+        self._resource_config.attributes['Juniper JunOS Router.SNMP Backoff'] = '0.25'
+        self.assertEqual(self._instance.snmp_retries, 5)
+        self.assertEqual(self._instance.snmp_backoff, 0.25)
+        self._resource_config.attributes['Juniper JunOS Router.SNMP Backoff'] = 'wrong'
+        self.assertIsNone(self._instance.snmp_backoff)
+
+    def test_autoload_retries(self):
+        self.assertEqual(self._instance.autoload_retries, JuniperAutoloadConfig.DEFAULT_AUTOLOAD_RETRIES)
+        self._resource_config.attributes['Autoload Retries'] = '0'
+        self.assertEqual(self._instance.autoload_retries, 0)
+        self._resource_config.attributes['Autoload Retries'] = '-2'
+        self.assertEqual(self._instance.autoload_retries, 0)
+
+    def test_snmp_max_outstanding(self):
+        self.assertEqual(self._instance.snmp_max_outstanding, JuniperAutoloadConfig.DEFAULT_MAX_OUTSTANDING)
+        self._resource_config.attributes['SNMP Max Outstanding Requests'] = '16'
+        self.assertEqual(self._instance.snmp_max_outstanding, 16)
+        self._resource_config.attributes['SNMP Max Outstanding Requests'] = '-1'
+        self.assertEqual(self._instance.snmp_max_outstanding, 1)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from cloudshell.devices.autoload.autoload_builder import AutoloadDetailsBuilder
+from cloudshell.devices.standards.networking.autoload_structure import GenericChassis, GenericModule, GenericPort, \
+    GenericPortChannel, GenericResource
+
+from cloudshell.networking.juniper.autoload.juniper_autoload_details_stream import JuniperAutoloadDetailsStream
+
+
+class TestJuniperAutoloadDetailsStream(TestCase):
+    SHELL_NAME = 'Juniper JunOS Router'
+
+    def _build_resource(self):
+        resource = GenericResource(shell_name=self.SHELL_NAME, shell_type='CS_Router', name='mx', unique_id='mx')
+        resource.vendor = 'Juniper'
+        resource.model = 'MX960'
+        for chassis_id in ['1', '2']:
+            chassis = GenericChassis(shell_name=self.SHELL_NAME, name='Chassis ' + chassis_id,
+                                     unique_id='mx.chassis.' + chassis_id)
+            module = GenericModule(shell_name=self.SHELL_NAME, name='Module 1',
+                                   unique_id='mx.module.{0}.1'.format(chassis_id))
+            module.add_sub_resource('1', GenericPort(shell_name=self.SHELL_NAME, name='xe-0-0-1',
+                                                     unique_id='mx.port.{0}.1'.format(chassis_id)))
+            chassis.add_sub_resource('1', module)
+            resource.add_sub_resource(chassis_id, chassis)
+        resource.add_sub_resource('3', GenericPortChannel(shell_name=self.SHELL_NAME, name='ae0',
+                                                          unique_id='mx.port_channel.3'))
+        return resource
+
+    @staticmethod
+    def _flatten(chunks):
+        resources = []
+        attributes = []
+        for chunk in chunks:
+            resources.extend((r.relative_address, r.name, r.unique_identifier, r.model) for r in chunk.resources)
+            attributes.extend((a.relative_address, a.attribute_name, a.attribute_value) for a in chunk.attributes)
+        return sorted(resources), sorted(attributes)
+
+    def test_iter_autoload_details(self):
+        expected = AutoloadDetailsBuilder(self._build_resource()).autoload_details()
+        resource = self._build_resource()
+        chunks = list(JuniperAutoloadDetailsStream(resource).iter_autoload_details())
+        self.assertEqual(self._flatten(chunks), self._flatten([expected]))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0].resources, [])
+        self.assertEqual([chunk.resources[0].relative_address for chunk in chunks[1:]], ['CH1', 'CH2', 'PC3'])
+        self.assertEqual(resource.resources, {})
+
+    def test_iter_autoload_details_keep_resources(self):
+        resource = self._build_resource()
+        chunks = list(JuniperAutoloadDetailsStream(resource, release_resources=False).iter_autoload_details())
+        self.assertEqual(self._flatten(chunks),
+                         self._flatten([AutoloadDetailsBuilder(resource).autoload_details()]))
@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from mock import Mock
+
+from cloudshell.networking.juniper.autoload.juniper_autoload_profiler import JuniperAutoloadProfiler, \
+    ProfiledSnmpHandler
+
+
+class TestJuniperAutoloadProfiler(TestCase):
+    def setUp(self):
+        self._snmp_handler = Mock()
+        self._profiler = JuniperAutoloadProfiler()
+        self._instance = self._profiler.wrap(self._snmp_handler)
+
+    def test_wrap(self):
+        self.assertIsInstance(self._instance, ProfiledSnmpHandler)
+        self.assertIs(self._instance.load_mib, self._snmp_handler.load_mib)
+
+    def test_walk(self):
+        table = {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'}, 2: {'suffix': '2', 'ifDescr': 'ae0'}}
+        self._snmp_handler.walk.return_value = table
+        self.assertIs(self._instance.walk(('IF-MIB', 'ifDescr')), table)
+        self._instance.walk(('IF-MIB', 'ifDescr'))
+        self._snmp_handler.walk.assert_called_with(('IF-MIB', 'ifDescr'))
+        counters = self._profiler.to_dict()['snmp']['IF-MIB::ifDescr']
+        self.assertEqual((counters['calls'], counters['requests'], counters['responses'], counters['bytes']),
+                         (2, 2, 4, 22))
+
+    def test_walk_request_pdus(self):
+        snmp_handler = Mock()
+        snmp_handler.request_count = 3
+
+        def walk(oid):
+            snmp_handler.request_count += 4
+            return {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'}}
+
+        snmp_handler.walk.side_effect = walk
+        self._profiler.wrap(snmp_handler).walk(('IF-MIB', 'ifDescr'))
+        counters = self._profiler.to_dict()['snmp']['IF-MIB::ifDescr']
+        self.assertEqual((counters['calls'], counters['requests']), (1, 4))
+
+    def test_prefetch(self):
+        snmp_handler = Mock()
+        snmp_handler.request_count = 0
+
+        def prefetch(oids):
+            snmp_handler.request_count += 6
+            return {}
+
+        snmp_handler.prefetch.side_effect = prefetch
+        oids = [('IF-MIB', 'ifDescr'), ('IF-MIB', 'ifType')]
+        self.assertEqual(self._profiler.wrap(snmp_handler).prefetch(oids), {})
+        snmp_handler.prefetch.assert_called_once_with(oids)
+        counters = self._profiler.to_dict()['snmp']['prefetch']
+        self.assertEqual((counters['calls'], counters['requests']), (1, 6))
+
+    def test_walk_oid_and_get_property(self):
+        self._snmp_handler.walk_oid.return_value = {501: 6, 502: 161}
+        self._snmp_handler.get_property.return_value = 'JUNOS'
+        self._instance.walk_oid('1.3.6.1.2.1.2.2.1.3')
+        self.assertEqual(self._instance.get_property('SNMPv2-MIB', 'sysDescr', 0), 'JUNOS')
+        self._snmp_handler.get_property.assert_called_once_with('SNMPv2-MIB', 'sysDescr', 0)
+        self._instance.get_property('SNMPv2-MIB', 'sysObjectID', 0, return_type='str')
+        self._snmp_handler.get_property.assert_called_with('SNMPv2-MIB', 'sysObjectID', 0, return_type='str')
+        data = self._profiler.to_dict()
+        self.assertEqual(data['snmp']['1.3.6.1.2.1.2.2.1.3']['bytes'], 4)
+        self.assertEqual(data['snmp']['SNMPv2-MIB::sysDescr']['responses'], 1)
+        self.assertEqual((data['total']['requests'], data['total']['responses'], data['total']['bytes']), (3, 4, 14))
+
+    def test_failed_request(self):
+        self._snmp_handler.walk.side_effect = Exception()
+        with self.assertRaises(Exception):
+            self._instance.walk(('LLDP-MIB', 'lldpRemPortId'))
+        counters = self._profiler.to_dict()['snmp']['LLDP-MIB::lldpRemPortId']
+        self.assertEqual((counters['requests'], counters['responses']), (1, 0))
+
+    def test_stage(self):
+        with self._profiler.stage('_build_root'):
+            pass
+        with self.assertRaises(ValueError):
+            with self._profiler.stage('_build_ports'):
+                raise ValueError()
+        self.assertEqual(self._profiler.to_dict()['stages'].keys(), ['_build_root', '_build_ports'])
+
+    def test_format_summary(self):
+        self._snmp_handler.walk.return_value = {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'}}
+        self._instance.walk(('IF-MIB', 'ifDescr'))
+        with self._profiler.stage('_build_ports'):
+            pass
+        lines = self._profiler.format_summary().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[1].startswith('IF-MIB::ifDescr'))
+        self.assertTrue(lines[2].startswith('TOTAL'))
+        self.assertTrue(lines[4].startswith('_build_ports'))
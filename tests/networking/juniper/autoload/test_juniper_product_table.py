@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from cloudshell.networking.juniper.autoload.juniper_product_table import generate_product_table, get_product_name
+
+
+class TestJuniperProductTable(TestCase):
+    def test_get_product_name(self):
+        self.assertEqual(get_product_name('1.3.6.1.4.1.2636.1.1.1.2.21'), 'jnxProductNameMX960')
+        self.assertEqual(get_product_name('.1.3.6.1.4.1.2636.1.1.1.2.21'), 'jnxProductNameMX960')
+        self.assertEqual(get_product_name('JUNIPER-SMI::jnxProducts.1.1.2.21'), 'jnxProductNameMX960')
+        self.assertEqual(get_product_name('SNMPv2-SMI::enterprises.2636.1.1.1.2.21'), 'jnxProductNameMX960')
+        self.assertEqual(get_product_name('JUNIPER-CHASSIS-DEFINES-MIB::jnxProductNameEX4300'),
+                         'jnxProductNameEX4300')
+
+    def test_get_product_name_unknown(self):
+        self.assertIsNone(get_product_name(''))
+        self.assertIsNone(get_product_name(None))
+        self.assertIsNone(get_product_name('1.3.6.1.4.1.9.1.1'))
+        self.assertIsNone(get_product_name('1.3.6.1.4.1.2636.1.1.1.2.99999'))
+        self.assertIsNone(get_product_name('CISCO-PRODUCTS-MIB::ciscoASR1001'))
+
+    def test_generate_product_table(self):
+        folder = tempfile.mkdtemp()
+        try:
+            mib_file = os.path.join(folder, 'TEST-MIB.py')
+            table_file = os.path.join(folder, 'table.py')
+            with open(mib_file, 'w') as mib:
+                mib.write('jnxProductNameB = MibIdentifier((1, 3, 6, 1, 4, 1, 2636, 1, 1, 1, 2, 10))\n'
+                          'jnxProductNameA = MibIdentifier((1, 3, 6, 1, 4, 1, 2636, 1, 1, 1, 2, 9))\n'
+                          'jnxOther = MibIdentifier((1, 3, 6, 1, 4, 1, 2636, 3, 1))\n')
+            self.assertEqual(generate_product_table(mib_file, table_file), 2)
+            table = {}
+            execfile(table_file, table)
+            self.assertEqual(table['PRODUCT_OIDS'], ('1.1.2.10', '1.1.2.9'))
+            self.assertEqual(table['PRODUCT_NAMES'], ('jnxProductNameB', 'jnxProductNameA'))
+        finally:
+            shutil.rmtree(folder)
@@ -1,9 +1,12 @@
+import logging
 import os
 from unittest import TestCase, skip
 
 import sys
 
-from cloudshell.networking.juniper.autoload.juniper_snmp_autoload import JuniperSnmpAutoload
+from cloudshell.networking.juniper.autoload.juniper_snmp_autoload import JuniperSnmpAutoload, JuniperGenericPort
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import SnmpWalkTimeout
+from cloudshell.shell.core.driver_context import AutoLoadAttribute, AutoLoadDetails, AutoLoadResource
 from mock import MagicMock as Mock, patch, call
 
 
@@ -36,6 +39,10 @@ class TestJuniperSnmpAutoload(TestCase):
 
     def _mock_methods(self):
         self._autoload_operations_instance._is_valid_device_os = Mock()
+        self._autoload_operations_instance._reset_resources = Mock()
+        self._autoload_operations_instance._fetch_snmp_data = Mock()
+        self._autoload_operations_instance._load_cached_tables = Mock()
+        self._autoload_operations_instance._save_cached_tables = Mock()
         self._autoload_operations_instance.enable_snmp = Mock()
         self._autoload_operations_instance.disable_snmp = Mock()
         self._autoload_operations_instance._build_root = Mock()
@@ -51,7 +58,9 @@ class TestJuniperSnmpAutoload(TestCase):
         self.assertIs(self._autoload_operations_instance.shell_name, self._shell_name)
         self.assertIs(self._autoload_operations_instance.shell_type, self._shell_type)
         self.assertIsNone(self._autoload_operations_instance._content_indexes)
+        self.assertIsNone(self._autoload_operations_instance._content_table)
         self.assertIsNone(self._autoload_operations_instance._if_indexes)
+        self.assertIsNone(self._autoload_operations_instance._port_table)
         self.assertIs(self._autoload_operations_instance._logger, self._logger)
         self.assertIs(self._autoload_operations_instance._snmp_handler, self._snmp_handler)
         self.assertIs(self._autoload_operations_instance._resource_name, self._resource_name)
@@ -63,9 +72,13 @@ class TestJuniperSnmpAutoload(TestCase):
         self.assertEqual(self._autoload_operations_instance._logical_generic_ports, {})
         self.assertEqual(self._autoload_operations_instance._physical_generic_ports, {})
         self.assertIsNone(self._autoload_operations_instance._generic_physical_ports_by_name)
+        self.assertIsNone(self._autoload_operations_instance._generic_physical_ports_by_base_name)
         self.assertIsNone(self._autoload_operations_instance._generic_logical_ports_by_name)
         self.assertIsNone(self._autoload_operations_instance._ipv4_table)
         self.assertIsNone(self._autoload_operations_instance._ipv6_table)
+        self.assertIsNone(self._autoload_operations_instance._lag_table)
+        self.assertIsNone(self._autoload_operations_instance._snmp_session_factory)
+        self.assertEqual(self._autoload_operations_instance._max_workers, 1)
         self.assertIsNone(self._autoload_operations_instance._if_duplex_table)
         self.assertIsNone(self._autoload_operations_instance._autoneg)
         self.assertIsNone(self._autoload_operations_instance._lldp_keys)
@@ -76,27 +89,249 @@ class TestJuniperSnmpAutoload(TestCase):
     def test_snm_handler_property(self):
         self.assertIs(self._autoload_operations_instance.snmp_handler, self._snmp_handler)
 
-    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.sort_elements_by_attributes')
-    def test_ipv4_table_prop(self, sort_elements_by_attributes):
-        table = Mock()
-        sort_elements_by_attributes.return_value = table
+    def test_snmp_handler_property_worker_session(self):
+        session = Mock()
+        self._autoload_operations_instance._thread_data.snmp_handler = session
+        self.assertIs(self._autoload_operations_instance.snmp_handler, session)
+
+    def test_lag_table_prop(self):
         walk_result = Mock()
         self._snmp_handler.walk.return_value = walk_result
-        self.assertIs(self._autoload_operations_instance.ipv4_table, table)
+        self.assertIs(self._autoload_operations_instance.lag_table, walk_result)
+        self.assertIs(self._autoload_operations_instance.lag_table, walk_result)
+        self._snmp_handler.walk.assert_called_once_with(('IEEE8023-LAG-MIB', 'dot3adAggPortAttachedAggID'))
+
+    def test_run_in_worker_session(self):
+        session = Mock()
+        instance = self._autoload_operations_instance
+        instance._snmp_session_factory = Mock(return_value=session)
+        instance._initialize_snmp_handler = Mock()
+        task = Mock(side_effect=lambda: instance.snmp_handler)
+        self.assertIs(instance._run_in_worker_session(task), session)
+        self.assertIs(instance._run_in_worker_session(task), session)
+        instance._snmp_session_factory.assert_called_once_with()
+        instance._initialize_snmp_handler.assert_called_once_with(session)
+
+    def test_fetch_snmp_data_sequential(self):
+        instance = self._autoload_operations_instance
+        instance._get_ipv4_table = Mock()
+        instance._fetch_snmp_data()
+        instance._max_workers = 4
+        instance._fetch_snmp_data()
+        instance._get_ipv4_table.assert_not_called()
+
+    def test_fetch_snmp_data(self):
+        instance = self._autoload_operations_instance
+        sessions = []
+
+        def session_factory():
+            sessions.append(Mock())
+            return sessions[-1]
+
+        instance._snmp_session_factory = session_factory
+        instance._max_workers = 3
+        instance._initialize_snmp_handler = Mock()
+        instance._get_ipv4_table = Mock(return_value='ipv4')
+        instance._get_ipv6_table = Mock(return_value='ipv6')
+        instance._get_lag_table = Mock(return_value='lag')
+        instance._build_lldp_keys = Mock(return_value='lldp')
+        instance._get_column = Mock(side_effect=lambda mib, column: {'{0}.1.0.0'.format(column): instance.snmp_handler})
+        instance._build_content_table = Mock(return_value='content')
+        instance._fetch_snmp_data()
+        self.assertEqual(instance._content_table, 'content')
+        content_columns = instance._build_content_table.call_args[0][0]
+        self.assertEqual(sorted(content_columns), sorted(JuniperSnmpAutoload.CONTENT_COLUMNS))
+        self.assertEqual(instance._ipv4_table, 'ipv4')
+        self.assertEqual(instance._ipv6_table, 'ipv6')
+        self.assertEqual(instance._lag_table, 'lag')
+        self.assertEqual(instance._lldp_keys, 'lldp')
+        self.assertEqual(sorted(instance._port_table), sorted(name for mib, name in JuniperGenericPort.SNMP_COLUMNS))
+        self.assertEqual(sorted(instance._lldp_table), sorted(JuniperSnmpAutoload.LLDP_COLUMNS))
+        for column, values in instance._port_table.items() + content_columns.items() + instance._lldp_table.items():
+            self.assertEqual(values.keys(), ['{0}.1.0.0'.format(column)])
+            self.assertIn(values.values()[0], sessions)
+        self.assertTrue(1 <= len(sessions) <= 3)
+        self.assertIs(instance.snmp_handler, self._snmp_handler)
+
+    def test_fetch_snmp_data_keeps_results_of_failed_fetch(self):
+        instance = self._autoload_operations_instance
+        instance._snmp_session_factory = Mock()
+        instance._max_workers = 2
+        instance._initialize_snmp_handler = Mock()
+        instance._get_ipv4_table = Mock(return_value='ipv4')
+        instance._get_ipv6_table = Mock(side_effect=SnmpWalkTimeout('requestTimedOut'))
+        instance._get_lag_table = Mock(return_value='lag')
+        instance._build_lldp_keys = Mock(return_value='lldp')
+        instance._get_column = Mock(return_value={})
+        with self.assertRaises(SnmpWalkTimeout):
+            instance._fetch_snmp_data()
+        self.assertEqual(instance._ipv4_table, 'ipv4')
+        self.assertIsNone(instance._ipv6_table)
+        self.assertEqual(instance._lag_table, 'lag')
+        self.assertIsNone(instance._content_table)
+        self.assertIsNone(instance._port_table)
+
+    def test_fetch_snmp_data_skips_loaded_tables(self):
+        instance = self._autoload_operations_instance
+        instance._snmp_session_factory = Mock()
+        instance._max_workers = 2
+        instance._initialize_snmp_handler = Mock()
+        instance._get_ipv4_table = Mock(return_value='ipv4')
+        instance._get_ipv6_table = Mock(return_value='ipv6')
+        instance._get_lag_table = Mock(return_value='lag')
+        instance._build_lldp_keys = Mock()
+        instance._get_column = Mock()
+        instance._content_table = 'cached content'
+        instance._port_table = 'cached ports'
+        instance._lldp_keys = 'cached lldp'
+        instance._lldp_table = 'cached lldp table'
+        instance._fetch_snmp_data()
+        instance._get_column.assert_not_called()
+        instance._build_lldp_keys.assert_not_called()
+        self.assertEqual(instance._content_table, 'cached content')
+        self.assertEqual(instance._port_table, 'cached ports')
+        self.assertEqual(instance._lldp_keys, 'cached lldp')
+        self.assertEqual(instance._ipv4_table, 'ipv4')
+        self.assertEqual(instance._lag_table, 'lag')
+
+    def test_fetch_snmp_data_prefetch(self):
+        instance = self._autoload_operations_instance
+        instance._prefetch = True
+        instance._get_ipv4_table = Mock()
+        instance._ipv6_table = 'cached ipv6'
+        instance._content_table = 'cached content'
+        instance._columns[('IF-MIB', 'ifDescr')] = {}
+        instance._fetch_snmp_data()
+        instance._get_ipv4_table.assert_not_called()
+        oids = self._snmp_handler.prefetch.call_args[0][0]
+        self.assertEqual(oids[:3], [('IP-MIB', 'ipAddrTable'), ('IEEE8023-LAG-MIB', 'dot3adAggPortAttachedAggID'),
+                                    ('LLDP-MIB', 'lldpRemPortId')])
+        self.assertIn(('IF-MIB', 'ifType'), oids)
+        self.assertIn(('LLDP-MIB', 'lldpRemSysDesc'), oids)
+        self.assertNotIn(('IF-MIB', 'ifDescr'), oids)
+        self.assertNotIn(('JUNIPER-MIB', 'jnxContentsModel'), oids)
+
+    def test_fetch_snmp_data_prefetch_raw_oids(self):
+        instance = self._autoload_operations_instance
+        instance._prefetch = True
+        instance._raw_oids = True
+        instance._fetch_snmp_data()
+        oids = self._snmp_handler.prefetch.call_args[0][0]
+        self.assertIn(JuniperSnmpAutoload.RAW_COLUMN_OIDS['ifDescr'], oids)
+        self.assertNotIn(('IF-MIB', 'ifDescr'), oids)
+
+    def test_fetch_snmp_data_prefetch_loaded_tables(self):
+        instance = self._autoload_operations_instance
+        instance._prefetch = True
+        for name in JuniperSnmpAutoload.TABLE_OIDS.keys() + ['_content_table', '_port_table', '_lldp_table']:
+            setattr(instance, name, 'cached')
+        instance._fetch_snmp_data()
+        self._snmp_handler.prefetch.assert_not_called()
+
+    def test_load_cached_tables(self):
+        instance = self._autoload_operations_instance
+        instance._autoload_cache = Mock()
+        instance._autoload_cache.get_unchanged_tables.return_value = {'_port_identity_table': 'cached ports'}
+        self._snmp_handler.get_property.side_effect = lambda mib, name, index: '{0}::{1}'.format(mib, name)
+        instance._load_cached_tables()
+        self.assertEqual(instance._port_identity_table, 'cached ports')
+        self.assertIsNone(instance._content_table)
+        indicators, table_indicators = instance._autoload_cache.get_unchanged_tables.call_args[0]
+        self.assertEqual(indicators['sysUpTime'], 'SNMPv2-MIB::sysUpTime')
+        self.assertEqual(indicators['ifTableLastChange'], 'IF-MIB::ifTableLastChange')
+        self.assertIs(table_indicators, JuniperSnmpAutoload.CACHED_TABLES)
+
+    def test_load_cached_tables_without_cache(self):
+        self._autoload_operations_instance._load_cached_tables()
+        self._snmp_handler.get_property.assert_not_called()
+
+    def test_save_cached_tables(self):
+        instance = self._autoload_operations_instance
+        instance._autoload_cache = Mock()
+        instance._save_cached_tables()
+        instance._autoload_cache.save.assert_not_called()
+        instance._cache_indicators = {'sysUpTime': '100'}
+        instance._port_table = {'ifDescr': {1: 'ge-0/0/0'}, 'ifAlias': {1: 'uplink'}}
+        instance._lldp_keys = 'lldp'
+        instance._save_cached_tables()
+        instance._autoload_cache.save.assert_called_once_with(
+            {'sysUpTime': '100'}, {'_port_identity_table': {'ifDescr': {1: 'ge-0/0/0'}}, '_lldp_keys': 'lldp'})
+
+    def test_save_cached_tables_failed_column(self):
+        instance = self._autoload_operations_instance
+        instance._autoload_cache = Mock()
+        instance._cache_indicators = {'sysUpTime': '100'}
+        instance._content_table = {'1.1.0.0': {}}
+        instance._lldp_table = {'lldpRemPortDesc': {}, 'lldpRemSysDesc': {}}
+        self._snmp_handler.walk.side_effect = Exception('requestTimedOut')
+        self.assertEqual(instance._get_column('LLDP-MIB', 'lldpRemSysDesc'), {})
+        instance._save_cached_tables()
+        instance._autoload_cache.save.assert_called_once_with({'sysUpTime': '100'},
+                                                              {'_content_table': {'1.1.0.0': {}}})
+
+    def test_get_port_table_cached_identity(self):
+        instance = self._autoload_operations_instance
+        instance._port_identity_table = {column: {1: column} for column in JuniperSnmpAutoload.PORT_IDENTITY_COLUMNS}
+        instance._get_column = Mock(return_value={1: 'value'})
+        port_table = instance._get_port_table()
+        volatile_columns = [(mib, column) for mib, column in JuniperGenericPort.SNMP_COLUMNS
+                            if column not in JuniperSnmpAutoload.PORT_IDENTITY_COLUMNS]
+        self.assertEqual(instance._get_column.call_args_list, [call(mib, column) for mib, column in volatile_columns])
+        self.assertEqual(port_table['ifDescr'], {1: 'ifDescr'})
+        self.assertEqual(port_table['ifAlias'], {1: 'value'})
+
+    def test_ipv4_table_prop(self):
+        self._snmp_handler.walk.return_value = {
+            '10.0.0.1': {'suffix': '10.0.0.1', 'ipAdEntAddr': '10.0.0.1', 'ipAdEntIfIndex': '501'},
+            '10.0.1.1': {'suffix': '10.0.1.1', 'ipAdEntAddr': '10.0.1.1', 'ipAdEntIfIndex': '502'},
+            '10.0.2.1': {'suffix': '10.0.2.1', 'ipAdEntIfIndex': '501'},
+            '127.0.0.1': {'suffix': '127.0.0.1', 'ipAdEntAddr': '127.0.0.1'}}
+        table = self._autoload_operations_instance.ipv4_table
+        self.assertEqual({if_index: sorted(addresses) for if_index, addresses in table.iteritems()},
+                         {501: ['10.0.0.1', '10.0.2.1'], 502: ['10.0.1.1']})
         self.assertIs(self._autoload_operations_instance.ipv4_table, table)
         self._snmp_handler.walk.assert_called_once_with(('IP-MIB', 'ipAddrTable'))
-        sort_elements_by_attributes.assert_called_once_with(walk_result, 'ipAdEntIfIndex')
 
-    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.sort_elements_by_attributes')
-    def test_ipv6_table_prop(self, sort_elements_by_attributes):
-        table = Mock()
-        sort_elements_by_attributes.return_value = table
-        walk_result = Mock()
-        self._snmp_handler.walk.return_value = walk_result
-        self.assertIs(self._autoload_operations_instance.ipv6_table, table)
+    def test_ipv6_table_prop(self):
+        link_local = '254.128.0.0.0.0.0.0.0.0.0.0.0.0.0.1'
+        global_address = '32.1.13.184.0.0.0.1.0.0.0.0.0.0.0.1'
+        self._snmp_handler.walk.return_value = {
+            '501.' + link_local: {'suffix': '501.' + link_local, 'ipv6AddrPfxLength': '64'},
+            '501.' + global_address: {'suffix': '501.' + global_address, 'ipv6AddrPfxLength': '64'},
+            '502.' + link_local: {'suffix': '502.' + link_local, 'ipv6AddrPfxLength': '64'},
+            '503': {'suffix': '503', 'ipv6AddrPfxLength': '64'},
+            '504.' + link_local.replace('254', '512'): {'suffix': '504.' + link_local.replace('254', '512')}}
+        table = self._autoload_operations_instance.ipv6_table
+        self.assertEqual({if_index: sorted(addresses) for if_index, addresses in table.iteritems()},
+                         {501: ['2001:db8:0:1::1', 'fe80::1'], 502: ['fe80::1']})
         self.assertIs(self._autoload_operations_instance.ipv6_table, table)
         self._snmp_handler.walk.assert_called_once_with(('IPV6-MIB', 'ipv6AddrEntry'))
-        sort_elements_by_attributes.assert_called_once_with(walk_result, 'ipAdEntIfIndex')
+
+    def test_format_ipv6_address(self):
+        for octets, address in [('254.128.0.0.0.0.0.0.0.0.0.0.0.0.0.1', 'fe80::1'),
+                                ('0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0', '::'),
+                                ('32.1.13.184.0.0.0.1.0.0.0.0.0.0.0.1', '2001:db8:0:1::1'),
+                                ('32.1.13.184.0.1.0.1.0.1.0.1.0.1.0.0', '2001:db8:1:1:1:1:1:0'),
+                                ('32.1.0.0.0.0.0.0.0.0.0.0.0.0.0.0', '2001::')]:
+            self.assertEqual(JuniperSnmpAutoload._format_ipv6_address(octets.split('.')), address)
+            with patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.socket', spec=['AF_INET6']):
+                self.assertEqual(JuniperSnmpAutoload._format_ipv6_address(octets.split('.')), address)
+
+    def test_associate_ip_addresses(self):
+        instance = self._autoload_operations_instance
+        physical_port = JuniperGenericPort(501, {'ifDescr': {501: 'ge-0/0/0', 502: 'ge-0/0/0.0', 503: 'ge-0/0/1.0'}},
+                                           'shell', 'CS_Router', 'resource')
+        instance._physical_generic_ports = {501: physical_port}
+        instance._logical_generic_ports = {
+            502: JuniperGenericPort(502, physical_port._port_table, 'shell', 'CS_Router', 'resource'),
+            503: JuniperGenericPort(503, physical_port._port_table, 'shell', 'CS_Router', 'resource')}
+        instance._ipv4_table = {502: ['10.0.0.1', '10.0.1.1'], 503: ['10.0.2.1'], 504: ['10.0.3.1']}
+        instance._ipv6_table = {502: ['fe80::1'], 503: ['fe80::2']}
+        instance._associate_ipv4_addresses()
+        instance._associate_ipv6_addresses()
+        self.assertEqual(physical_port.ipv4_addresses, ['10.0.0.1', '10.0.1.1'])
+        self.assertEqual(physical_port.ipv6_addresses, ['fe80::1'])
+        self.assertEqual(instance.physical_ports_by_logical_index, {502: physical_port})
 
     def test_generic_physical_ports_by_name_prop(self):
         port1 = Mock()
@@ -107,6 +342,44 @@ class TestJuniperSnmpAutoload(TestCase):
         self.assertIs(result1, result2)
         self.assertEqual(result1, {port1.port_name: port1, port2.port_name: port2})
 
+    def _set_physical_ports(self, *port_names):
+        ports = []
+        for index, port_name in enumerate(port_names):
+            port = Mock()
+            port.port_name = port_name
+            port.associated_port_names = []
+            ports.append(port)
+            self._autoload_operations_instance._physical_generic_ports[index] = port
+        return ports
+
+    def test_generic_physical_ports_by_base_name_prop(self):
+        port1, port2, port3 = self._set_physical_ports('ge-0/0/1.0', 'ge-0/0/1', 'ae0.0')
+        result1 = self._autoload_operations_instance.generic_physical_ports_by_base_name
+        result2 = self._autoload_operations_instance.generic_physical_ports_by_base_name
+        self.assertIs(result1, result2)
+        self.assertEqual(result1, {'ge-0/0/1': port2, 'ae0': port3})
+
+    def test_get_associated_phisical_port_by_name(self):
+        port1, port10 = self._set_physical_ports('ge-0/0/1', 'ge-0/0/10')
+        instance = self._autoload_operations_instance
+        self.assertIs(instance.get_associated_phisical_port_by_name('ge-0/0/1.0'), port1)
+        self.assertIs(instance.get_associated_phisical_port_by_name('ge-0/0/10.1'), port10)
+        self.assertIs(instance.get_associated_phisical_port_by_name('ge-0/0/1'), port1)
+        self.assertIsNone(instance.get_associated_phisical_port_by_name('ge-0/0/2.0'))
+
+    def test_associate_portchannels(self):
+        physical_port, physical_portchannel = self._set_physical_ports('ge-0/0/1', 'ae0')
+        logical_port = Mock()
+        logical_port.port_name = 'ge-0/0/1.0'
+        logical_portchannel = Mock()
+        logical_portchannel.port_name = 'ae0.0'
+        self._autoload_operations_instance._logical_generic_ports = {501: logical_port, 600: logical_portchannel}
+        self._autoload_operations_instance._lag_table = {501: {'dot3adAggPortAttachedAggID': '600'},
+                                                         502: {'dot3adAggPortAttachedAggID': '600'}}
+        self._autoload_operations_instance._associate_portchannels()
+        self.assertTrue(physical_portchannel.is_portchannel)
+        physical_portchannel.add_associated_port_name.assert_called_once_with('ge-0-0-1')
+
     def test_generic_logical_ports_by_name_prop(self):
         port1 = Mock()
         port2 = Mock()
@@ -116,6 +389,55 @@ class TestJuniperSnmpAutoload(TestCase):
         self.assertIs(result1, result2)
         self.assertEqual(result1, {port1.port_name: port1, port2.port_name: port2})
 
+    def test_port_filtered(self):
+        instance = self._autoload_operations_instance
+        self.assertTrue(instance._port_filtered('fxp0', 'ethernetCsmacd'))
+        self.assertTrue(instance._port_filtered('irb.100', 'propVirtual'))
+        self.assertTrue(instance._port_filtered('ge-0/0/1', 'softwareLoopback'))
+        self.assertFalse(instance._port_filtered('ge-0/0/1', 'ethernetCsmacd'))
+        self.assertFalse(instance._port_filtered('xe-0/0/0.me', 'ethernetCsmacd'))
+
+    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.GenericResource')
+    @patch(
+        'cloudshell.networking.juniper.autoload.juniper_snmp_autoload.JuniperSnmpAutoload._initialize_snmp_handler')
+    def test_port_filtered_extended(self, initialize_snmp, generic_resource):
+        instance = JuniperSnmpAutoload(self._snmp_handler, self._shell_name, self._shell_type, self._resource_name,
+                                       self._logger, filter_port_names=['em', 'pp0'],
+                                       filter_port_types=['ieee8023adLag'])
+        self.assertTrue(instance._port_filtered('em0', 'ethernetCsmacd'))
+        self.assertTrue(instance._port_filtered('pp0.1', 'ppp'))
+        self.assertTrue(instance._port_filtered('ae0', 'ieee8023adLag'))
+        self.assertTrue(instance._port_filtered('fxp0', 'ethernetCsmacd'))
+        self.assertFalse(instance._port_filtered('ge-0/0/1', 'ethernetCsmacd'))
+
+    def test_port_filtered_by_name_and_type(self):
+        instance = self._autoload_operations_instance
+        self.assertTrue(instance._port_filtered_by_name('lsi'))
+        self.assertFalse(instance._port_filtered_by_name('ge-0/0/1'))
+        self.assertTrue(instance._port_filtered_by_type('tunnel'))
+        self.assertFalse(instance._port_filtered_by_type('ethernetCsmacd'))
+
+    def test_compile_port_name_filter_empty(self):
+        port_name_filter = JuniperSnmpAutoload._compile_port_name_filter([])
+        self.assertIsNone(port_name_filter.match('ge-0/0/0'))
+        self.assertIsNone(port_name_filter.match(''))
+        self.assertIsNone(JuniperSnmpAutoload._compile_port_name_filter(['']).match('ge-0/0/0'))
+
+    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.JuniperGenericPort')
+    def test_build_generic_ports(self, generic_port_class):
+        instance = self._autoload_operations_instance
+        instance._port_table = {'ifChassisPort': {1: '1', 2: '2', 3: '0', 4: '4'},
+                                'ifDescr': {1: 'ge-0/0/1', 2: 'ge-0/0/1.0', 3: 'fxp0', 4: 'lo0'},
+                                'ifType': {1: 'ethernetCsmacd', 2: 'propVirtual', 3: 'ethernetCsmacd',
+                                           4: "'softwareLoopback'"}}
+        physical_port = Mock(logical_unit='0')
+        logical_port = Mock(logical_unit='1')
+        generic_port_class.side_effect = [physical_port, logical_port]
+        instance._build_generic_ports()
+        self.assertEqual([kwargs['index'] for args, kwargs in generic_port_class.call_args_list], [1, 2])
+        self.assertEqual(instance._physical_generic_ports, {1: physical_port})
+        self.assertEqual(instance._logical_generic_ports, {2: logical_port})
+
     def test_lldp_keys_prop(self):
         result = Mock()
         self._autoload_operations_instance._build_lldp_keys = Mock()
@@ -124,16 +446,39 @@ class TestJuniperSnmpAutoload(TestCase):
         self.assertIs(self._autoload_operations_instance.lldp_keys, result)
         self._autoload_operations_instance._build_lldp_keys.assert_called_once_with()
 
+    def test_lldp_table_prop(self):
+        instance = self._autoload_operations_instance
+        instance._get_column = Mock(side_effect=lambda mib, column: {'0.501.1': column})
+        self.assertEqual(instance.lldp_table, {'lldpRemPortDesc': {'0.501.1': 'lldpRemPortDesc'},
+                                               'lldpRemSysDesc': {'0.501.1': 'lldpRemSysDesc'}})
+        self.assertIs(instance.lldp_table, instance.lldp_table)
+        self.assertEqual(instance._get_column.call_count, 2)
+
+    def test_associate_adjacent(self):
+        physical_port, = self._set_physical_ports('ge-0/0/1')
+        logical_port = Mock()
+        logical_port.port_name = 'ge-0/0/1.0'
+        unknown_logical_port = Mock()
+        unknown_logical_port.port_name = 'ge-0/0/2.0'
+        instance = self._autoload_operations_instance
+        instance._logical_generic_ports = {501: logical_port, 502: unknown_logical_port}
+        instance._lldp_keys = {'501': '0.501.1', '502': '0.502.1'}
+        instance._lldp_table = {'lldpRemPortDesc': {'0.501.1': 'xe-0/0/5', '0.502.1': 'xe-0/0/6'},
+                                'lldpRemSysDesc': {'0.501.1': 'Juniper Networks, Inc. qfx5100'}}
+        instance._associate_adjacent()
+        self.assertEqual(physical_port.port_adjacent, 'xe-0/0/5, Juniper Networks, Inc. qfx5100')
+        self._snmp_handler.get_property.assert_not_called()
+
     def test_initialize_snmp_handler(self):
         self._autoload_operations_instance._initialize_snmp_handler()
         path = os.path.abspath(
             os.path.join(os.path.dirname(sys.modules[JuniperSnmpAutoload.__module__].__file__), '..', 'mibs'))
         self._snmp_handler.update_mib_sources.assert_called_once_with(path)
-        calls = [call('JUNIPER-MIB'), call('JUNIPER-IF-MIB'), call('IF-MIB'), call('JUNIPER-CHASSIS-DEFINES-MIB'),
-                 call('IEEE8023-LAG-MIB'),
+        calls = [call('JUNIPER-MIB'), call('JUNIPER-IF-MIB'), call('IF-MIB'), call('IEEE8023-LAG-MIB'),
                  call('EtherLike-MIB'), call('IP-MIB'), call('IPV6-MIB'), call('LLDP-MIB')]
         self._snmp_handler.load_mib.assert_has_calls(calls)
         self._snmp_handler.set_snmp_errors.assert_called_once_with(self._autoload_operations_instance.SNMP_ERRORS)
+        self.assertNotIn(call('JUNIPER-CHASSIS-DEFINES-MIB'), self._snmp_handler.load_mib.call_args_list)
 
     def test_build_root(self):
         vendor = 'Test_Vendor'
@@ -159,19 +504,83 @@ class TestJuniperSnmpAutoload(TestCase):
                  call('SNMPv2-MIB', 'sysLocation', '0')]
         self._snmp_handler.get_property.assert_has_calls(calls)
 
+    def test_build_root_resolves_product_oid(self):
+        self._snmp_handler.get_property.side_effect = ['JUNIPER-SMI::jnxProducts.1.1.2.21',
+                                                       'Juniper Networks, Inc. mx960, kernel JUNOS 17.4R2.4, Build',
+                                                       'contact', 'name', 'location']
+        self._autoload_operations_instance._build_root()
+        self.assertEqual(self._resource.vendor, 'Juniper')
+        self.assertEqual(self._resource.model, 'MX960')
+        self.assertEqual(self._resource.os_version, '17.4R2.4')
+
+    def test_get_element_model(self):
+        self.assertEqual(JuniperSnmpAutoload._get_element_model({'jnxContentsModel': 'MPC7E-MRATE'}), 'MPC7E-MRATE')
+        self.assertEqual(JuniperSnmpAutoload._get_element_model(
+            {'jnxContentsModel': '', 'jnxContentsType': 'JUNIPER-SMI::jnxProducts.1.1.2.21'}), 'jnxProductNameMX960')
+        self.assertEqual(JuniperSnmpAutoload._get_element_model(
+            {'jnxContentsModel': '', 'jnxContentsType': 'TEST-MIB::testPic'}), 'testPic')
+
+    def test_build_content_table(self):
+        columns = {'jnxContentsModel': {'1.1.0.0': 'MX960', '7.1.0.0': 'MPC'},
+                   'jnxContentsContainerIndex': {'1.1.0.0': '1', '7.1.0.0': '7'}}
+        content_table = self._autoload_operations_instance._build_content_table(columns)
+        self.assertEqual(sorted(content_table), ['1.1.0.0', '7.1.0.0'])
+        self.assertEqual(content_table['7.1.0.0']['jnxContentsModel'], 'MPC')
+        self.assertEqual(content_table['7.1.0.0']['jnxContentsContainerIndex'], '7')
+        self.assertEqual(content_table['7.1.0.0']['jnxContentsSerialNo'], '')
+        self.assertEqual(sorted(content_table['1.1.0.0']), sorted(JuniperSnmpAutoload.CONTENT_COLUMNS))
+
+    def test_get_content_table(self):
+        result = Mock()
+        self._autoload_operations_instance._get_column = Mock(side_effect=lambda mib, column: column)
+        self._autoload_operations_instance._build_content_table = Mock(return_value=result)
+        self.assertIs(self._autoload_operations_instance._get_content_table(), result)
+        self._autoload_operations_instance._build_content_table.assert_called_once_with(
+            {column: column for column in JuniperSnmpAutoload.CONTENT_COLUMNS})
+        self._autoload_operations_instance._get_column.assert_has_calls(
+            [call('JUNIPER-MIB', column) for column in JuniperSnmpAutoload.CONTENT_COLUMNS], any_order=True)
+
+    def test_content_table_prop(self):
+        value = Mock()
+        self._autoload_operations_instance._get_content_table = Mock(return_value=value)
+        self.assertIs(self._autoload_operations_instance.content_table, value)
+        self.assertIs(self._autoload_operations_instance.content_table, value)
+        self._autoload_operations_instance._get_content_table.assert_called_once_with()
+
     def test_get_content_indexes(self):
-        index1 = 1
-        index2 = 2
-        index3 = 3
-        index4 = 4
-        value1 = {'jnxContentsContainerIndex': 4}
-        value2 = {'jnxContentsContainerIndex': 5}
-        value3 = {'jnxContentsContainerIndex': 6}
-        value4 = {'jnxContentsContainerIndex': 6}
-        container_indexes = {index1: value1, index2: value2, index3: value3, index4: value4}
-        self._snmp_handler.walk.return_value = container_indexes
-        self.assertEqual(self._autoload_operations_instance._get_content_indexes(), {4: [1], 5: [2], 6: [3, 4]})
-        self._snmp_handler.walk.assert_called_once_with(('JUNIPER-MIB', 'jnxContentsContainerIndex'))
+        index1 = '1.1.0.0'
+        index2 = '2.1.0.0'
+        index3 = '7.1.0.0'
+        index4 = '7.2.0.0'
+        value1 = {'jnxContentsContainerIndex': '4'}
+        value2 = {'jnxContentsContainerIndex': '5'}
+        value3 = {'jnxContentsContainerIndex': '6'}
+        value4 = {'jnxContentsContainerIndex': '6'}
+        self._autoload_operations_instance._content_table = {index1: value1, index2: value2, index3: value3,
+                                                             index4: value4}
+        content_indexes = self._autoload_operations_instance._get_content_indexes()
+        self.assertEqual(sorted(content_indexes), ['4', '5', '6'])
+        self.assertEqual(content_indexes['4'], [index1])
+        self.assertEqual(content_indexes['5'], [index2])
+        self.assertEqual(sorted(content_indexes['6']), [index3, index4])
+        self._snmp_handler.walk.assert_not_called()
+
+    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.GenericChassis')
+    def test_build_chassis(self, generic_chassis_class):
+        chassis = Mock()
+        generic_chassis_class.return_value = chassis
+        self._autoload_operations_instance._content_indexes = {'1': ['1.1.0.0']}
+        self._autoload_operations_instance._content_table = {
+            '1.1.0.0': {'jnxContentsModel': 'MX960', 'jnxContentsType': 'jnxChassisMX960', 'jnxContentsSerialNo': 'SN',
+                        'jnxContentsChassisId': "'singleChassis'"}}
+        self._autoload_operations_instance._build_chassis()
+        generic_chassis_class.assert_called_once_with(shell_name=self._shell_name, name='Chassis 1',
+                                                      unique_id='{0}.chassis.1.1.0.0'.format(self._resource_name))
+        self.assertEqual(chassis.model, 'MX960')
+        self.assertEqual(chassis.serial_number, 'SN')
+        self._resource.add_sub_resource.assert_called_once_with('1', chassis)
+        self.assertEqual(self._autoload_operations_instance._chassis, {'singleChassis': chassis})
+        self._snmp_handler.get_properties.assert_not_called()
 
     def test_content_indexes_prop(self):
         value = Mock()
@@ -181,15 +590,96 @@ class TestJuniperSnmpAutoload(TestCase):
         self.assertIs(self._autoload_operations_instance.content_indexes, value)
         self._autoload_operations_instance._get_content_indexes.assert_called_once_with()
 
+    def test_get_column(self):
+        self._snmp_handler.walk.return_value = {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0 '},
+                                                2: {'suffix': '2', 'ifDescr': 'ae0\n'},
+                                                3: {'suffix': '3'}}
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifDescr'),
+                         {1: 'ge-0/0/0', 2: 'ae0'})
+        self._snmp_handler.walk.assert_called_once_with(('IF-MIB', 'ifDescr'))
+
+    def test_get_column_walked_once(self):
+        self._snmp_handler.walk.return_value = {1: {'suffix': '1', 'ifMtu': '1514'}}
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifMtu'), {1: '1514'})
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifMtu'), {1: '1514'})
+        self._snmp_handler.walk.assert_called_once_with(('IF-MIB', 'ifMtu'))
+
+    def test_get_column_walk_timeout(self):
+        self._snmp_handler.walk.side_effect = SnmpWalkTimeout('requestTimedOut')
+        with self.assertRaises(SnmpWalkTimeout):
+            self._autoload_operations_instance._get_column('IF-MIB', 'ifMtu')
+        self.assertEqual(self._autoload_operations_instance._failed_columns, set())
+
+    def test_get_column_failed(self):
+        self._snmp_handler.walk.side_effect = Exception()
+        self.assertEqual(self._autoload_operations_instance._get_column('EtherLike-MIB', 'dot3StatsDuplexStatus'), {})
+
+    def test_get_column_required_failed(self):
+        self._snmp_handler.walk.side_effect = Exception('requestTimedOut')
+        for mib, column in [('IF-MIB', 'ifDescr'), ('JUNIPER-IF-MIB', 'ifChassisPort'),
+                            ('JUNIPER-MIB', 'jnxContentsContainerIndex')]:
+            with self.assertRaisesRegexp(Exception, 'requestTimedOut'):
+                self._autoload_operations_instance._get_column(mib, column)
+
+    def test_get_column_raw_oids(self):
+        self._autoload_operations_instance._raw_oids = True
+        self._snmp_handler.walk_oid.return_value = {501: 'ge-0/0/0 ', 502: 'ae0'}
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifDescr'),
+                         {501: 'ge-0/0/0', 502: 'ae0'})
+        self._snmp_handler.walk_oid.assert_called_once_with('1.3.6.1.2.1.2.2.1.2')
+        self._snmp_handler.walk.assert_not_called()
+
+    def test_get_column_raw_oids_integer(self):
+        self._autoload_operations_instance._raw_oids = True
+        self._snmp_handler.walk_oid.return_value = {501: 0, 502: 1}
+        self.assertEqual(self._autoload_operations_instance._get_column('JUNIPER-IF-MIB', 'ifChassisLogicalUnit'),
+                         {501: '0', 502: '1'})
+
+    def test_get_column_raw_oids_enumerated(self):
+        self._autoload_operations_instance._raw_oids = True
+        self._snmp_handler.walk_oid.return_value = {501: 6, 502: 161, 503: 999}
+        self._snmp_handler.get_named_values.return_value.getName.side_effect = {6: 'ethernetCsmacd',
+                                                                                 161: 'ieee8023adLag'}.get
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifType'),
+                         {501: 'ethernetCsmacd', 502: 'ieee8023adLag', 503: '999'})
+        self._snmp_handler.get_named_values.assert_called_once_with('IF-MIB', 'ifType')
+
+    def test_get_column_raw_oids_phys_address(self):
+        self._autoload_operations_instance._raw_oids = True
+        self._snmp_handler.walk_oid.return_value = {501: '\x2c\x6b\xf5\x00\x01\xf5', 502: ''}
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifPhysAddress'),
+                         {501: '0x2c6bf50001f5', 502: ''})
+
+    def test_get_column_raw_oids_failed(self):
+        self._autoload_operations_instance._raw_oids = True
+        self._snmp_handler.walk_oid.side_effect = Exception()
+        self.assertEqual(self._autoload_operations_instance._get_column('IF-MIB', 'ifType'), {})
+        with self.assertRaises(Exception):
+            self._autoload_operations_instance._get_column('IF-MIB', 'ifDescr')
+
+    def test_get_port_table(self):
+        column = Mock()
+        self._autoload_operations_instance._get_column = Mock(return_value=column)
+        port_table = self._autoload_operations_instance._get_port_table()
+        self.assertEqual(port_table, {name: column for mib, name in JuniperGenericPort.SNMP_COLUMNS})
+        self._autoload_operations_instance._get_column.assert_has_calls(
+            [call(mib, name) for mib, name in JuniperGenericPort.SNMP_COLUMNS])
+
+    def test_port_table_prop(self):
+        value = Mock()
+        self._autoload_operations_instance._get_port_table = Mock(return_value=value)
+        self.assertIs(self._autoload_operations_instance.port_table, value)
+        self.assertIs(self._autoload_operations_instance.port_table, value)
+        self._autoload_operations_instance._get_port_table.assert_called_once_with()
+
     def test_if_indexes(self):
         result = Mock()
-        value = Mock()
-        value.keys.return_value = result
-        self._snmp_handler.walk.return_value = value
+        column = Mock()
+        column.keys.return_value = result
+        self._autoload_operations_instance._port_table = {'ifChassisPort': column}
         self.assertIs(self._autoload_operations_instance.if_indexes, result)
         self.assertIs(self._autoload_operations_instance.if_indexes, result)
-        self._snmp_handler.walk.assert_called_once_with(('JUNIPER-IF-MIB', 'ifChassisPort'))
-        value.keys.assert_called_once_with()
+        column.keys.assert_called_once_with()
 
     @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.AutoloadDetailsBuilder')
     def test_discover(self, autoload_details_builder_class):
@@ -200,6 +690,10 @@ class TestJuniperSnmpAutoload(TestCase):
         self._mock_methods()
         self.assertIs(self._autoload_operations_instance.discover(self._supported_os), autoload_details)
         self._autoload_operations_instance._is_valid_device_os.assert_called_once_with(self._supported_os)
+        self._autoload_operations_instance._reset_resources.assert_called_once_with()
+        self._autoload_operations_instance._load_cached_tables.assert_called_once_with()
+        self._autoload_operations_instance._fetch_snmp_data.assert_called_once_with()
+        self._autoload_operations_instance._save_cached_tables.assert_called_once_with()
         self._autoload_operations_instance._build_root.assert_called_once_with()
         self._autoload_operations_instance._build_chassis.assert_called_once_with()
         self._autoload_operations_instance._build_power_modules.assert_called_once_with()
@@ -209,3 +703,61 @@ class TestJuniperSnmpAutoload(TestCase):
         self._autoload_operations_instance._log_autoload_details.assert_called_once_with(autoload_details)
         autoload_details_builder_class.assert_called_once_with(self._resource)
         autoload_details_builder.autoload_details.assert_called_once_with()
+
+    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.JuniperAutoloadDetailsStream')
+    def test_iter_discover(self, details_stream_class):
+        chunks = [Mock(), Mock()]
+        details_stream_class.return_value.iter_autoload_details.return_value = iter(chunks)
+        self._mock_methods()
+        result = self._autoload_operations_instance.iter_discover(self._supported_os)
+        self._autoload_operations_instance._build_root.assert_not_called()
+        self.assertEqual(list(result), chunks)
+        self._autoload_operations_instance._build_ports.assert_called_once_with()
+        self._autoload_operations_instance._save_cached_tables.assert_called_once_with()
+        details_stream_class.assert_called_once_with(self._resource)
+        self._autoload_operations_instance._log_autoload_details.assert_has_calls([call(chunk) for chunk in chunks])
+
+    def test_log_autoload_details_debug_disabled(self):
+        self._logger.isEnabledFor.return_value = False
+        autoload_details = Mock()
+        JuniperSnmpAutoload._log_autoload_details(self._autoload_operations_instance, autoload_details)
+        self._logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        self._logger.debug.assert_not_called()
+
+    def test_log_autoload_details(self):
+        self._logger.isEnabledFor.return_value = True
+        autoload_details = AutoLoadDetails([AutoLoadResource('Generic Chassis', 'Chassis 1', 'CH1', 'mx.chassis.1')],
+                                           [AutoLoadAttribute('CH1', 'Model', 'MX960')])
+        self._logger.debug.reset_mock()
+        JuniperSnmpAutoload._log_autoload_details(self._autoload_operations_instance, autoload_details)
+        self.assertEqual(self._logger.debug.call_count, 6)
+
+    @patch('cloudshell.networking.juniper.autoload.juniper_snmp_autoload.GenericResource')
+    def test_reset_resources(self, generic_resource):
+        instance = self._autoload_operations_instance
+        instance._chassis = {1: Mock()}
+        instance._ports = {1: Mock()}
+        instance._generic_physical_ports_by_name = {'ge-0/0/0': Mock()}
+        instance._port_table = port_table = {'ifDescr': {}}
+        instance._reset_resources()
+        self.assertIs(instance.resource, generic_resource.return_value)
+        self.assertEqual(instance._chassis, {})
+        self.assertEqual(instance._ports, {})
+        self.assertIsNone(instance._generic_physical_ports_by_name)
+        self.assertIs(instance._port_table, port_table)
+
+    def test_discover_profiler(self):
+        profiler = Mock()
+        self._autoload_operations_instance.profiler = profiler
+        self._mock_methods()
+        JuniperSnmpAutoload._discover_resources(self._autoload_operations_instance, self._supported_os)
+        profiler.stage.assert_has_calls([call(stage) for stage in JuniperSnmpAutoload.DISCOVER_STAGES],
+                                        any_order=True)
+        self._autoload_operations_instance._build_ports.assert_called_once_with()
+
+    def test_log_profiler_summary(self):
+        profiler = Mock()
+        profiler.format_summary.return_value = 'summary'
+        self._autoload_operations_instance.profiler = profiler
+        self._autoload_operations_instance._log_profiler_summary()
+        self._logger.info.assert_called_with('Autoload profile:\nsummary')
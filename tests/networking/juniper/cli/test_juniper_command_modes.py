@@ -4,7 +4,7 @@ from unittest import TestCase, skip
 from mock import Mock, patch
 
 from cloudshell.networking.juniper.cli.junipr_command_modes import DefaultCommandMode, CliCommandMode, \
-    ConfigCommandMode, EditSnmpCommandMode
+    ConfigCommandMode, EditSnmpCommandMode, JuniperPromptDetector, get_session_state, reset_session_state
 from cloudshell.cli.command_mode import CommandMode
 
 
@@ -100,6 +100,23 @@ class TestJuniperDefaultCommandMode(TestCase):
         self._instance.enter_actions(cli_operations)
         cli_operations.send_command.assert_called_once_with('set cli screen-length 0')
 
+    def test_enter_action_reused_session(self):
+        cli_operations = Mock(session=Mock(spec=[]))
+        self._instance.enter_actions(cli_operations)
+        self._instance.enter_actions(cli_operations)
+        cli_operations.send_command.assert_called_once_with('set cli screen-length 0')
+        reset_session_state(cli_operations.session)
+        self._instance.enter_actions(cli_operations)
+        self.assertEqual(cli_operations.send_command.call_count, 2)
+
+    @patch('cloudshell.networking.juniper.cli.junipr_command_modes.CommandMode.step_down')
+    def test_step_down(self, step_down):
+        cli_service = Mock(session=Mock(spec=[]))
+        get_session_state(cli_service.session).screen_length = 0
+        self._instance.step_down(cli_service)
+        step_down.assert_called_once_with(self._instance, cli_service)
+        self.assertIsNone(get_session_state(cli_service.session).screen_length)
+
     def test_enter_action_map(self):
         self.assertEqual(self._instance.enter_action_map(), OrderedDict())
 
@@ -151,6 +168,37 @@ class TestJuniperConfigCommandMode(TestCase):
     def test_enter_action_map(self):
         pass
 
+    @patch('cloudshell.networking.juniper.cli.junipr_command_modes.CommandMode.step_up')
+    def test_step_up(self, step_up):
+        cli_service = Mock(session=Mock(spec=[]))
+        self._instance.step_up(cli_service)
+        step_up.assert_called_once_with(self._instance, cli_service)
+        self.assertEqual(get_session_state(cli_service.session).edit_hierarchy, [])
+
+    @patch('cloudshell.networking.juniper.cli.junipr_command_modes.CommandMode.step_down')
+    def test_step_down(self, step_down):
+        cli_service = Mock(session=Mock(spec=[]))
+        get_session_state(cli_service.session).edit_hierarchy = []
+        self._instance.step_down(cli_service)
+        step_down.assert_called_once_with(self._instance, cli_service)
+        cli_service.send_command.assert_not_called()
+        self.assertIsNone(get_session_state(cli_service.session).edit_hierarchy)
+
+    @patch('cloudshell.networking.juniper.cli.junipr_command_modes.CommandMode.step_down')
+    def test_step_down_from_hierarchy(self, step_down):
+        cli_service = Mock(session=Mock(spec=[]))
+        get_session_state(cli_service.session).edit_hierarchy = ['snmp']
+        self._instance.parent_node = Mock()
+        self._instance._exit_action_map = exit_action_map = Mock()
+        self._instance._exit_error_map = exit_error_map = Mock()
+        self._instance.step_down(cli_service)
+        step_down.assert_not_called()
+        cli_service.send_command.assert_called_once_with('exit configuration-mode',
+                                                         expected_string=self._instance.parent_node.prompt,
+                                                         action_map=exit_action_map, error_map=exit_error_map)
+        self.assertIs(cli_service.command_mode, self._instance.parent_node)
+        self.assertIsNone(get_session_state(cli_service.session).edit_hierarchy)
+
     def test_enter_error_map(self):
         self.assertEqual(self._instance.enter_error_map(), OrderedDict([(r'[Ee]rror:', 'Command error')]))
 
@@ -185,3 +233,45 @@ class TestEditSnmpCommandMode(TestCase):
         command_mode_init.assert_called_once_with(instance, EditSnmpCommandMode.PROMPT,
                                                   EditSnmpCommandMode.ENTER_COMMAND,
                                                   EditSnmpCommandMode.EXIT_COMMAND)
+
+    @patch('cloudshell.networking.juniper.cli.junipr_command_modes.CommandMode.step_down')
+    @patch('cloudshell.networking.juniper.cli.junipr_command_modes.CommandMode.step_up')
+    def test_edit_hierarchy(self, step_up, step_down):
+        instance = EditSnmpCommandMode()
+        cli_service = Mock(session=Mock(spec=[]))
+        get_session_state(cli_service.session).edit_hierarchy = []
+        instance.step_up(cli_service)
+        step_up.assert_called_once_with(instance, cli_service)
+        self.assertEqual(get_session_state(cli_service.session).edit_hierarchy, ['snmp'])
+        instance.step_down(cli_service)
+        step_down.assert_called_once_with(instance, cli_service)
+        self.assertEqual(get_session_state(cli_service.session).edit_hierarchy, [])
+
+
+class TestJuniperPromptDetector(TestCase):
+    OUTPUT = 'interfaces {\n    ge-0/0/0 {\n        description "uplink -> core";\n    }\n}\n' * 1000
+
+    def test_feed(self):
+        instance = JuniperPromptDetector(ConfigCommandMode.PROMPT, window=64)
+        output = self.OUTPUT + '\n[edit]\nroot@switch# '
+        results = [instance.feed(output[start:start + 10]) for start in range(0, len(output), 10)]
+        self.assertTrue(results[-1])
+        self.assertFalse(any(results[:len(self.OUTPUT) // 10]))
+        self.assertEqual(len(instance._tail), 64)
+        instance.reset()
+        self.assertFalse(instance.feed('root@switch# '))
+
+    def test_search(self):
+        instance = JuniperPromptDetector.for_mode(Mock(prompt=DefaultCommandMode.PROMPT))
+        self.assertIsNotNone(instance.search(self.OUTPUT + 'root@switch> '))
+        self.assertIsNone(instance.search(self.OUTPUT))
+        self.assertIsNone(instance.search('root@switch> ' + self.OUTPUT))
+        self.assertIsNotNone(instance.search('root@switch> '))
+
+    def test_prompts(self):
+        for prompt, output in ((CliCommandMode.PROMPT, 'root@switch:RE:0% '),
+                               (DefaultCommandMode.PROMPT, 'root@switch> '),
+                               (ConfigCommandMode.PROMPT, '\n[edit]\nroot@switch# '),
+                               (EditSnmpCommandMode.PROMPT, '\n[edit snmp]\nroot@switch# ')):
+            self.assertTrue(JuniperPromptDetector(prompt).feed(self.OUTPUT + output), prompt)
+        self.assertFalse(JuniperPromptDetector(ConfigCommandMode.PROMPT).feed('[edit]\nset vlans\n# comment\nset'))
@@ -0,0 +1,146 @@
+import threading
+import time
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from cloudshell.cli.session_manager_impl import SessionManagerException
+from cloudshell.cli.session_pool_manager import SessionPoolException
+from cloudshell.networking.juniper.cli.juniper_session_pool import JuniperSessionPoolManager, create_cli, \
+    get_session_pool
+
+
+class FakeSession(object):
+    session_type = 'SSH'
+
+    def __init__(self, host, username='root', fail_connect=False):
+        self.host = host
+        self.username = username
+        self.connect_count = 0
+        self.connected = False
+        self.fail_connect = fail_connect
+        self.probe_for_prompt = Mock()
+
+    def __eq__(self, other):
+        return self.host == other.host and self.username == other.username
+
+    def connect(self, prompt, logger):
+        if self.fail_connect:
+            raise Exception('Cannot connect')
+        self.connect_count += 1
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def active(self):
+        return self.connected
+
+
+class TestJuniperSessionPoolManager(TestCase):
+    def setUp(self):
+        self._logger = Mock()
+        self._instance = JuniperSessionPoolManager(max_sessions_per_device=2, pool_timeout=0.2, max_idle_time=30,
+                                                   health_check_interval=10)
+
+    def _get_session(self, host, **kwargs):
+        return self._instance.get_session(FakeSession(host, **kwargs), '>', self._logger)
+
+    def test_reuse_session(self):
+        session = self._get_session('10.0.0.1')
+        self.assertTrue(session.new_session)
+        self._instance.return_session(session, self._logger)
+        reused_session = self._get_session('10.0.0.1')
+        self.assertIs(reused_session, session)
+        self.assertFalse(reused_session.new_session)
+        self.assertEqual(session.connect_count, 1)
+        session.probe_for_prompt.assert_not_called()
+
+    def test_new_session_state(self):
+        session = self._get_session('10.0.0.1')
+        self.assertIsNone(session.juniper_session_state.screen_length)
+        session.juniper_session_state.screen_length = 0
+        self._instance.return_session(session, self._logger)
+        self.assertEqual(self._get_session('10.0.0.1').juniper_session_state.screen_length, 0)
+
+    def test_sessions_are_keyed_by_device(self):
+        session1 = self._get_session('10.0.0.1')
+        self._instance.return_session(session1, self._logger)
+        session2 = self._get_session('10.0.0.2')
+        self.assertIsNot(session2, session1)
+        self.assertTrue(session1.connected)
+
+    def test_incompatible_session_is_replaced(self):
+        session = self._get_session('10.0.0.1')
+        self._instance.return_session(session, self._logger)
+        new_session = self._get_session('10.0.0.1', username='admin')
+        self.assertIsNot(new_session, session)
+        self.assertFalse(session.connected)
+
+    def test_inactive_session_is_replaced(self):
+        session = self._get_session('10.0.0.1')
+        self._instance.return_session(session, self._logger)
+        session.connected = False
+        self.assertIsNot(self._get_session('10.0.0.1'), session)
+
+    @patch('cloudshell.networking.juniper.cli.juniper_session_pool.time')
+    def test_health_check(self, time_mock):
+        time_mock.time.return_value = 100
+        session = self._get_session('10.0.0.1')
+        self._instance.return_session(session, self._logger)
+        time_mock.time.return_value = 115
+        self.assertIs(self._get_session('10.0.0.1'), session)
+        session.probe_for_prompt.assert_called_once_with('>', self._logger)
+
+        self._instance.return_session(session, self._logger)
+        session.probe_for_prompt.side_effect = Exception('timeout')
+        time_mock.time.return_value = 130
+        new_session = self._get_session('10.0.0.1')
+        self.assertIsNot(new_session, session)
+        self.assertFalse(session.connected)
+
+    @patch('cloudshell.networking.juniper.cli.juniper_session_pool.time')
+    def test_close_idle_sessions(self, time_mock):
+        time_mock.time.return_value = 100
+        session1 = self._get_session('10.0.0.1')
+        session2 = self._get_session('10.0.0.2')
+        self._instance.return_session(session1, self._logger)
+        time_mock.time.return_value = 120
+        self._instance.return_session(session2, self._logger)
+        time_mock.time.return_value = 140
+        self._instance.close_idle_sessions(self._logger)
+        self.assertFalse(session1.connected)
+        self.assertTrue(session2.connected)
+        self.assertIs(self._get_session('10.0.0.2'), session2)
+
+    def test_per_device_limit(self):
+        session1 = self._get_session('10.0.0.1')
+        self._get_session('10.0.0.1')
+        self._get_session('10.0.0.2')
+        with self.assertRaises(SessionPoolException):
+            self._get_session('10.0.0.1')
+
+        threading.Timer(0.05, self._instance.return_session, (session1, self._logger)).start()
+        self.assertIs(self._get_session('10.0.0.1'), session1)
+
+    def test_removed_session_frees_place(self):
+        session1 = self._get_session('10.0.0.1')
+        self._get_session('10.0.0.1')
+        self._instance.remove_session(session1, self._logger)
+        self.assertFalse(session1.connected)
+        self.assertIsNot(self._get_session('10.0.0.1'), session1)
+
+    def test_failed_connect_frees_place(self):
+        for _ in range(3):
+            with self.assertRaises(SessionManagerException):
+                self._get_session('10.0.0.1', fail_connect=True)
+        self._get_session('10.0.0.1')
+
+    def test_connect_in_preference_order(self):
+        sessions = [FakeSession('10.0.0.1', fail_connect=True), FakeSession('10.0.0.1')]
+        self.assertIs(self._instance.get_session(sessions, '>', self._logger), sessions[1])
+
+    def test_get_session_pool(self):
+        self.assertIsInstance(get_session_pool(), JuniperSessionPoolManager)
+        self.assertIs(get_session_pool(), get_session_pool())
+        self.assertIs(create_cli()._session_pool, get_session_pool())
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from mock import Mock, patch
+from mock import Mock, patch, call
 
 from cloudshell.networking.juniper.command_actions.add_remove_vlan_actions import AddRemoveVlanActions
 
@@ -53,3 +53,18 @@ class TestAddRemoveVlanActions(TestCase):
         self.assertEqual(self._instance.create_qnq_vlan(vlan_name, vlan_range), create_vlan_out + exec_out)
         command_template_executor.assert_called_once_with(self._cli_service, command_template.CONFIGURE_VLAN_QNQ)
         execute_command.execute_command.assert_called_once_with(vlan_name=vlan_name)
+
+    @patch('cloudshell.networking.juniper.command_actions.add_remove_vlan_actions.command_template')
+    @patch('cloudshell.networking.juniper.command_actions.add_remove_vlan_actions.CommandTemplateExecutor')
+    def test_batched_configuration(self, command_template_executor, command_template):
+        batch = Mock()
+        self._instance = AddRemoveVlanActions(self._cli_service, self._logger, batch)
+        port = Mock()
+        vlan_range = Mock()
+        mode = Mock()
+        self.assertEqual(self._instance.assign_member(port, vlan_range, mode), '')
+        self.assertEqual(self._instance.delete_member(port, vlan_range), '')
+        self.assertEqual(batch.add.call_args_list, [
+            call(command_template.ASSIGN_VLAN_MEMBER, port=port, vlan_range=vlan_range, mode=mode),
+            call(command_template.DELETE_VLAN_MEMBER, port=port, vlan_range=vlan_range)])
+        command_template_executor.assert_not_called()
@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from mock import Mock, call
+
+from cloudshell.cli.command_template.command_template import CommandTemplate
+from cloudshell.cli.session.session_exceptions import CommandExecutionException
+from cloudshell.networking.juniper.command_actions.batch_configuration_actions import BatchConfigurationActions, \
+    BatchConfigurationException
+from cloudshell.networking.juniper.command_templates import batch_configuration as command_template
+
+CREATE_VLAN = CommandTemplate('set vlans {vlan_name} vlan-id {vlan_id}')
+
+LOAD_OUTPUT = '''set vlans v10 vlan-id 10
+set vlans v20 vlan-id 20000
+set vlans v30 vlan-id 30
+terminal:2:(23) error: value 20000 is not within range (1..4094)
+  [edit vlans v20]
+    'vlan-id 20000'
+      error: value 20000 is not within range (1..4094)
+load complete (1 errors)
+
+[edit]
+root@switch# '''
+
+
+class TestBatchConfigurationActions(TestCase):
+    def setUp(self):
+        self._cli_service = Mock()
+        self._cli_service.send_command.return_value = ''
+        self._logger = Mock()
+        self._instance = BatchConfigurationActions(self._cli_service, self._logger, batch_size=2)
+
+    def test_init(self):
+        self.assertIs(self._instance._cli_service, self._cli_service)
+        self.assertIs(self._instance._logger, self._logger)
+        self.assertEqual(self._instance._batch_size, 2)
+        self.assertEqual(self._instance.statements, [])
+
+    def test_add(self):
+        self.assertEqual(self._instance.add(CREATE_VLAN, vlan_name='v10', vlan_id=10), 'set vlans v10 vlan-id 10')
+        self.assertEqual(self._instance.statements, ['set vlans v10 vlan-id 10'])
+        self._cli_service.send_command.assert_not_called()
+
+    def test_load(self):
+        for vlan_id in (10, 20, 30):
+            self._instance.add(CREATE_VLAN, vlan_name='v{0}'.format(vlan_id), vlan_id=vlan_id)
+        self._instance.load()
+        self.assertEqual(self._cli_service.send_command.call_args_list, [
+            call('load set terminal', action_map=command_template.LOAD_SET_TERMINAL.action_map,
+                 error_map=command_template.LOAD_SET_TERMINAL.error_map,
+                 expected_string=command_template.LOAD_SET_TERMINAL_PROMPT),
+            call('set vlans v10 vlan-id 10\nset vlans v20 vlan-id 20\n\x04'),
+            call('load set terminal', action_map=command_template.LOAD_SET_TERMINAL.action_map,
+                 error_map=command_template.LOAD_SET_TERMINAL.error_map,
+                 expected_string=command_template.LOAD_SET_TERMINAL_PROMPT),
+            call('set vlans v30 vlan-id 30\n\x04')])
+        self.assertEqual(self._instance.statements, [])
+
+    def test_load_empty(self):
+        self.assertEqual(self._instance.load(), '')
+        self._cli_service.send_command.assert_not_called()
+
+    def test_load_errors(self):
+        self._instance = BatchConfigurationActions(self._cli_service, self._logger)
+        self._cli_service.send_command.side_effect = ['[Type ^D at a new line to end input]', LOAD_OUTPUT]
+        for vlan_name, vlan_id in (('v10', 10), ('v20', 20000), ('v30', 30)):
+            self._instance.add(CREATE_VLAN, vlan_name=vlan_name, vlan_id=vlan_id)
+        with self.assertRaises(BatchConfigurationException) as context:
+            self._instance.load()
+        self.assertIsInstance(context.exception, CommandExecutionException)
+        self.assertEqual(context.exception.errors, [
+            ('set vlans v20 vlan-id 20000', 'error: value 20000 is not within range (1..4094)')])
+
+    def test_load_errors_without_line(self):
+        self._instance.add(CREATE_VLAN, vlan_name='v10', vlan_id=10)
+        self._cli_service.send_command.side_effect = ['', 'error: configuration database locked by:\n']
+        with self.assertRaises(BatchConfigurationException) as context:
+            self._instance.load()
+        self.assertEqual(context.exception.errors, [(None, 'configuration database locked by:')])
+
+        self._instance.add(CREATE_VLAN, vlan_name='v10', vlan_id=10)
+        self._cli_service.send_command.side_effect = ['', 'load complete (2 errors)\n']
+        with self.assertRaises(BatchConfigurationException) as context:
+            self._instance.load()
+        self.assertEqual(context.exception.errors, [(None, 'load complete (2 errors)')])
+
+    def test_load_stops_on_errors(self):
+        for vlan_id in (10, 20, 30):
+            self._instance.add(CREATE_VLAN, vlan_name='v{0}'.format(vlan_id), vlan_id=vlan_id)
+        self._cli_service.send_command.side_effect = ['', 'terminal:1:(1) syntax error: vlans\n']
+        with self.assertRaises(BatchConfigurationException) as context:
+            self._instance.load()
+        self.assertEqual(context.exception.errors, [('set vlans v10 vlan-id 10', 'syntax error: vlans')])
+        self.assertEqual(self._cli_service.send_command.call_count, 2)
@@ -0,0 +1,149 @@
+from unittest import TestCase
+
+from mock import MagicMock as Mock, patch
+
+from cloudshell.networking.juniper.autoload.juniper_autoload_profiler import JuniperAutoloadProfiler
+from cloudshell.networking.juniper.flows.juniper_autoload_flow import JuniperSnmpAutoloadFlow
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import SnmpWalkTimeout
+
+
+class TestJuniperSnmpAutoloadFlow(TestCase):
+    def setUp(self):
+        self._snmp_handler = Mock()
+        self._logger = Mock()
+        self._instance = JuniperSnmpAutoloadFlow(self._snmp_handler, self._logger)
+
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperSnmpService')
+    def test_create_snmp_service(self, snmp_service_class):
+        autoload_config = Mock()
+        snmp_session = Mock()
+        self.assertIs(self._instance._create_snmp_service(autoload_config, snmp_session),
+                      snmp_service_class.return_value)
+        snmp_service_class.assert_called_once_with(snmp_session, self._logger, autoload_config.snmp_max_repetitions,
+                                                   retries=autoload_config.snmp_retries,
+                                                   backoff=autoload_config.snmp_backoff, walk_progress=None)
+        self._snmp_handler.create_snmp_session.assert_not_called()
+
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperSnmpService')
+    def test_create_snmp_service_new_session(self, snmp_service_class):
+        autoload_config = Mock()
+        self.assertIs(self._instance._create_snmp_service(autoload_config), snmp_service_class.return_value)
+        walk_progress = {}
+        self.assertIs(self._instance._create_snmp_service(autoload_config, walk_progress=walk_progress),
+                      snmp_service_class.return_value)
+        snmp_service_class.assert_called_with(self._snmp_handler.create_snmp_session.return_value, self._logger,
+                                              autoload_config.snmp_max_repetitions,
+                                              retries=autoload_config.snmp_retries,
+                                              backoff=autoload_config.snmp_backoff, walk_progress=walk_progress)
+
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperAsyncSnmpService')
+    def test_create_snmp_service_pipelined(self, async_snmp_service_class):
+        autoload_config = Mock()
+        autoload_config.snmp_max_outstanding = 8
+        snmp_session = Mock()
+        walk_progress = {}
+        self.assertIs(self._instance._create_snmp_service(autoload_config, snmp_session, walk_progress),
+                      async_snmp_service_class.return_value)
+        async_snmp_service_class.assert_called_once_with(snmp_session, self._logger, 8,
+                                                         max_repetitions=autoload_config.snmp_max_repetitions,
+                                                         retries=autoload_config.snmp_retries,
+                                                         backoff=autoload_config.snmp_backoff,
+                                                         walk_progress=walk_progress)
+
+    def test_create_autoload_cache_disabled(self):
+        autoload_config = Mock()
+        autoload_config.autoload_cache_folder = None
+        self.assertIsNone(self._instance._create_autoload_cache(autoload_config, 'resource'))
+
+    def test_create_profiler_disabled(self):
+        autoload_config = Mock()
+        autoload_config.autoload_profiling = False
+        self.assertIsNone(self._instance._create_profiler(autoload_config))
+
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperAutoloadCache')
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperSnmpAutoload')
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperAutoloadConfig')
+    def test_execute_flow(self, autoload_config_class, snmp_autoload_class, autoload_cache_class):
+        supported_os = Mock()
+        shell_name = Mock()
+        shell_type = Mock()
+        resource_name = Mock()
+        snmp_service = Mock()
+        self._instance._create_snmp_service = Mock(return_value=snmp_service)
+        autoload_config = autoload_config_class.return_value
+        quali_snmp = self._snmp_handler.get_snmp_service.return_value.__enter__.return_value
+        result = self._instance.execute_flow(supported_os, shell_name, shell_type, resource_name)
+        self.assertIs(result, snmp_autoload_class.return_value.discover.return_value)
+        autoload_config_class.assert_called_once_with(self._snmp_handler.resource_config)
+        self._instance._create_snmp_service.assert_called_once_with(autoload_config, quali_snmp, {})
+        walk_progress = self._instance._create_snmp_service.call_args[0][2]
+        args, kwargs = snmp_autoload_class.call_args
+        self.assertEqual(args, (snmp_service, shell_name, shell_type, resource_name, self._logger))
+        self.assertEqual(kwargs['max_workers'], autoload_config.autoload_max_workers)
+        self.assertIs(kwargs['autoload_cache'], autoload_cache_class.return_value)
+        self.assertIs(kwargs['filter_port_names'], autoload_config.filter_port_names)
+        self.assertIs(kwargs['filter_port_types'], autoload_config.filter_port_types)
+        self.assertIs(kwargs['raw_oids'], autoload_config.autoload_raw_oids)
+        self.assertIsInstance(kwargs['profiler'], JuniperAutoloadProfiler)
+        self.assertFalse(kwargs['prefetch'])
+        autoload_cache_class.assert_called_once_with(autoload_config.autoload_cache_folder, resource_name,
+                                                     self._logger)
+        kwargs['snmp_session_factory']()
+        self._instance._create_snmp_service.assert_called_with(autoload_config, walk_progress=walk_progress)
+        self.assertIs(self._instance._create_snmp_service.call_args[1]['walk_progress'], walk_progress)
+        snmp_autoload_class.return_value.discover.assert_called_once_with(supported_os)
+        self.assertEqual(self._instance.autoload_profile, kwargs['profiler'].to_dict())
+
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperSnmpAutoload')
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperAutoloadConfig')
+    def test_execute_flow_reports_profile(self, autoload_config_class, snmp_autoload_class):
+        profile_handler = Mock()
+        instance = JuniperSnmpAutoloadFlow(self._snmp_handler, self._logger, profile_handler=profile_handler)
+        instance._create_snmp_service = Mock()
+        instance._create_autoload_cache = Mock()
+        profiler = Mock()
+        instance._create_profiler = Mock(return_value=profiler)
+        snmp_autoload_class.return_value.discover.side_effect = Exception('Unsupported device OS')
+        with self.assertRaises(Exception):
+            instance.execute_flow('JUNOS', 'shell', 'CS_Router', 'resource')
+        self.assertIs(instance.autoload_profile, profiler.to_dict.return_value)
+        profile_handler.assert_called_once_with(profiler.to_dict.return_value)
+
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperSnmpAutoload')
+    @patch('cloudshell.networking.juniper.flows.juniper_autoload_flow.JuniperAutoloadConfig')
+    def test_execute_flow_without_profiling(self, autoload_config_class, snmp_autoload_class):
+        profile_handler = Mock()
+        instance = JuniperSnmpAutoloadFlow(self._snmp_handler, self._logger, profile_handler=profile_handler)
+        instance._create_snmp_service = Mock()
+        instance._create_autoload_cache = Mock()
+        autoload_config_class.return_value.autoload_profiling = False
+        instance.execute_flow('JUNOS', 'shell', 'CS_Router', 'resource')
+        self.assertIsNone(instance.autoload_profile)
+        profile_handler.assert_not_called()
+
+    def test_discover_retry(self):
+        autoload = Mock()
+        autoload.discover.side_effect = [SnmpWalkTimeout('requestTimedOut'), 'details']
+        autoload_config = Mock()
+        autoload_config.autoload_retries = 1
+        self.assertEqual(self._instance._discover(autoload, 'JUNOS', autoload_config, {}), 'details')
+        self.assertEqual(autoload.discover.call_count, 2)
+        self._logger.warning.assert_called_once()
+
+    def test_discover_retries_exhausted(self):
+        autoload = Mock()
+        autoload.discover.side_effect = SnmpWalkTimeout('requestTimedOut')
+        autoload_config = Mock()
+        autoload_config.autoload_retries = 2
+        with self.assertRaises(SnmpWalkTimeout):
+            self._instance._discover(autoload, 'JUNOS', autoload_config, {})
+        self.assertEqual(autoload.discover.call_count, 3)
+
+    def test_discover_other_errors_not_retried(self):
+        autoload = Mock()
+        autoload.discover.side_effect = Exception('Unsupported device OS')
+        autoload_config = Mock()
+        autoload_config.autoload_retries = 2
+        with self.assertRaises(Exception):
+            self._instance._discover(autoload, 'JUNOS', autoload_config, {})
+        autoload.discover.assert_called_once_with('JUNOS')
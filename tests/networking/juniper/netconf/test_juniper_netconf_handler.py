@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from mock import MagicMock, Mock, patch
+
+from cloudshell.networking.juniper.netconf.juniper_netconf_handler import JuniperNetconfHandler, \
+    optional_netconf_session
+
+
+class TestJuniperNetconfHandler(TestCase):
+    def setUp(self):
+        self._resource_config = Mock(address='10.0.0.1', user='root', password='encrypted')
+        self._logger = Mock()
+        self._api = Mock()
+        self._api.DecryptPassword.return_value.Value = 'password'
+        self._instance = JuniperNetconfHandler(self._resource_config, self._logger, self._api, timeout=5)
+
+    def test_password(self):
+        self.assertEqual(self._instance.password, 'password')
+        self.assertEqual(self._instance.password, 'password')
+        self._api.DecryptPassword.assert_called_once_with('encrypted')
+
+    @patch('cloudshell.networking.juniper.netconf.juniper_netconf_handler.JuniperNetconfSession')
+    @patch('cloudshell.networking.juniper.netconf.juniper_netconf_handler.paramiko')
+    def test_get_netconf_session(self, paramiko, netconf_session_class):
+        client = paramiko.SSHClient.return_value
+        channel = client.get_transport.return_value.open_session.return_value
+        netconf_session = netconf_session_class.return_value
+        with self._instance.get_netconf_session() as session:
+            self.assertIs(session, netconf_session)
+            client.connect.assert_called_once_with('10.0.0.1', 830, 'root', 'password', timeout=5, banner_timeout=5,
+                                                   allow_agent=False, look_for_keys=False)
+            channel.invoke_subsystem.assert_called_once_with('netconf')
+            netconf_session_class.assert_called_once_with(channel, self._logger)
+            netconf_session.hello.assert_called_once_with()
+            netconf_session.close.assert_not_called()
+        netconf_session.close.assert_called_once_with()
+        client.close.assert_called_once_with()
+
+    @patch('cloudshell.networking.juniper.netconf.juniper_netconf_handler.JuniperNetconfSession')
+    @patch('cloudshell.networking.juniper.netconf.juniper_netconf_handler.paramiko')
+    def test_subsystem_failed(self, paramiko, netconf_session_class):
+        client = paramiko.SSHClient.return_value
+        client.get_transport.return_value.open_session.return_value.invoke_subsystem.side_effect = Exception()
+        with self.assertRaises(Exception):
+            with self._instance.get_netconf_session():
+                pass
+        client.close.assert_called_once_with()
+        netconf_session_class.assert_not_called()
+
+    def test_optional_netconf_session(self):
+        with optional_netconf_session(None) as session:
+            self.assertIsNone(session)
+        netconf_handler = MagicMock()
+        with optional_netconf_session(netconf_handler) as session:
+            self.assertIs(session, netconf_handler.get_netconf_session.return_value.__enter__.return_value)
@@ -0,0 +1,215 @@
+import socket
+import threading
+import xml.etree.cElementTree as ElementTree
+from unittest import TestCase
+
+from mock import Mock
+
+from cloudshell.networking.juniper.command_actions.add_remove_vlan_actions import AddRemoveVlanActions
+from cloudshell.networking.juniper.netconf.juniper_netconf_session import JuniperNetconfSession, END_OF_MESSAGE, \
+    NETCONF_NAMESPACE, local_name
+
+SERVER_HELLO = '''<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <capabilities>
+    <capability>urn:ietf:params:netconf:base:1.0</capability>
+    <capability>http://xml.juniper.net/netconf/junos/1.0</capability>
+  </capabilities>
+  <session-id>4242</session-id>
+</hello>'''
+
+VLANS_CONFIGURATION = '''<configuration xmlns="http://xml.juniper.net/xnm/1.1/xnm">
+  <vlans>
+    <vlan><name>default</name></vlan>
+    <vlan><name>v10</name><vlan-id>10</vlan-id></vlan>
+    <vlan><name>v20-30</name><vlan-range>20-30</vlan-range><dot1q-tunneling/></vlan>
+  </vlans>
+</configuration>'''
+
+INTERFACE_CONFIGURATION = '''<configuration xmlns="http://xml.juniper.net/xnm/1.1/xnm">
+  <interfaces><interface><name>ge-0/0/1</name><unit><name>0</name><family><ethernet-switching>
+    <port-mode>trunk</port-mode><vlan><members>v10</members><members>v20-30</members></vlan>
+  </ethernet-switching></family></unit></interface></interfaces>
+</configuration>'''
+
+VLAN_INFORMATION = '''<l2ng-l2ald-vlan-instance-information xmlns="http://xml.juniper.net/junos/15.1X53/junos-l2al">
+  <l2ng-l2ald-vlan-instance-group>
+    <l2ng-l2rtb-vlan-name>v10</l2ng-l2rtb-vlan-name>
+    <l2ng-l2rtb-vlan-member><l2ng-l2rtb-vlan-member-interface>ge-0/0/1.0*</l2ng-l2rtb-vlan-member-interface>
+    </l2ng-l2rtb-vlan-member>
+    <l2ng-l2rtb-vlan-member><l2ng-l2rtb-vlan-member-interface>ae1.0</l2ng-l2rtb-vlan-member-interface>
+    </l2ng-l2rtb-vlan-member>
+  </l2ng-l2ald-vlan-instance-group>
+</l2ng-l2ald-vlan-instance-information>'''
+
+RPC_ERROR = '''<rpc-error>
+  <error-type>protocol</error-type><error-tag>operation-failed</error-tag><error-severity>{0}</error-severity>
+  <error-message>{1}</error-message>
+</rpc-error>'''
+
+
+class FakeNetconfServer(object):
+    """
+    NETCONF 1.0 server on one end of a socket pair, replies are sent in small chunks
+    """
+
+    def __init__(self, replies, chunk_size=7):
+        """
+        :param replies: dict {rpc operation: reply body or callable(rpc element) returning the body},
+            the connection is closed in the middle of the reply if the body is None
+        :param chunk_size: size of the sent chunks
+        """
+        self._replies = replies
+        self._chunk_size = chunk_size
+        self.requests = []
+        self.client_hello = None
+        self.hello_received = threading.Event()
+        self.client_socket, self._socket = socket.socketpair()
+        self.client_socket.settimeout(5)
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._socket.close()
+        self.client_socket.close()
+        self._thread.join(5)
+
+    def _send(self, message):
+        data = '<?xml version="1.0" encoding="UTF-8"?>\n' + message + END_OF_MESSAGE + '\n'
+        for start in range(0, len(data), self._chunk_size):
+            self._socket.sendall(data[start:start + self._chunk_size])
+
+    def _messages(self):
+        data = ''
+        while True:
+            try:
+                received = self._socket.recv(4096)
+            except socket.error:
+                return
+            if not received:
+                return
+            data += received
+            while END_OF_MESSAGE in data:
+                message, data = data.split(END_OF_MESSAGE, 1)
+                yield ElementTree.fromstring(message)
+
+    def _serve(self):
+        self._send(SERVER_HELLO)
+        messages = self._messages()
+        self.client_hello = next(messages, None)
+        self.hello_received.set()
+        for rpc in messages:
+            operation = list(rpc)[0]
+            self.requests.append(operation)
+            reply = self._replies.get(local_name(operation), '<ok/>')
+            if callable(reply):
+                reply = reply(operation)
+            if reply is None:
+                self._socket.sendall('<rpc-reply xmlns="{0}"><vlan>'.format(NETCONF_NAMESPACE))
+                self._socket.shutdown(socket.SHUT_RDWR)
+                return
+            self._send('<rpc-reply xmlns="{0}" message-id="{1}">{2}</rpc-reply>'.format(
+                NETCONF_NAMESPACE, rpc.get('message-id'), reply))
+            if local_name(operation) == 'close-session':
+                self._socket.close()
+                return
+
+
+class TestJuniperNetconfSession(TestCase):
+    def setUp(self):
+        self._logger = Mock()
+        self._server = FakeNetconfServer({
+            'get-configuration': VLANS_CONFIGURATION,
+            'get-error': RPC_ERROR.format('error', 'syntax error'),
+            'get-warning': RPC_ERROR.format('warning', 'statement not found') + '<ok/>',
+            'get-truncated': None,
+        })
+        self._instance = JuniperNetconfSession(self._server.client_socket, self._logger)
+
+    def tearDown(self):
+        self._server.stop()
+
+    def test_hello(self):
+        self._instance.hello()
+        self.assertEqual(self._instance.session_id, '4242')
+        self.assertEqual(len(self._instance.capabilities), 2)
+        self.assertTrue(self._server.hello_received.wait(5))
+        self.assertEqual([capability.text for capability in self._server.client_hello.iter()
+                          if local_name(capability) == 'capability'], ['urn:ietf:params:netconf:base:1.0'])
+
+    def test_rpc(self):
+        self._instance.hello()
+        for _ in range(2):
+            vlans = [(element.find('{http://xml.juniper.net/xnm/1.1/xnm}name').text, len(element))
+                     for element in self._instance.rpc('<get-configuration/>', ('vlan',))]
+            self.assertEqual(vlans, [('default', 1), ('v10', 2), ('v20-30', 3)])
+        self.assertEqual([local_name(request) for request in self._server.requests],
+                         ['get-configuration', 'get-configuration'])
+
+    def test_rpc_elements_are_cleared(self):
+        self._instance.hello()
+        elements = list(self._instance.rpc('<get-configuration/>', ('vlan',)))
+        self.assertEqual([len(element) for element in elements], [0, 0, 0])
+
+    def test_rpc_partially_read(self):
+        self._instance.hello()
+        next(self._instance.rpc('<get-configuration/>', ('vlan',)))
+        self.assertEqual(len(list(self._instance.rpc('<get-configuration/>', ('vlan',)))), 3)
+
+    def test_rpc_error(self):
+        self._instance.hello()
+        with self.assertRaisesRegexp(Exception, 'syntax error'):
+            list(self._instance.rpc('<get-error/>', ('vlan',)))
+        self.assertEqual(len(list(self._instance.rpc('<get-configuration/>', ('vlan',)))), 3)
+
+    def test_rpc_warning(self):
+        self._instance.hello()
+        self.assertEqual([local_name(element) for element in self._instance.rpc('<get-warning/>', ('ok',))], ['ok'])
+        self._logger.warning.assert_called_once_with('Netconf rpc warning, statement not found')
+
+    def test_closed_by_server(self):
+        self._instance.hello()
+        with self.assertRaisesRegexp(Exception, 'closed'):
+            list(self._instance.rpc('<get-truncated/>', ('vlan',)))
+
+    def test_close(self):
+        self._instance.hello()
+        self._instance.close()
+        self._server._thread.join(5)
+        self.assertEqual([local_name(request) for request in self._server.requests], ['close-session'])
+
+
+class TestNetconfVlanActions(TestCase):
+    def setUp(self):
+        self._logger = Mock()
+        self._cli_service = Mock()
+
+        def get_configuration(operation):
+            if 'interfaces' in ElementTree.tostring(operation):
+                return INTERFACE_CONFIGURATION
+            return VLANS_CONFIGURATION
+
+        self._server = FakeNetconfServer({'get-configuration': get_configuration,
+                                          'get-vlan-information': VLAN_INFORMATION})
+        self._netconf_session = JuniperNetconfSession(self._server.client_socket, self._logger)
+        self._netconf_session.hello()
+        self._instance = AddRemoveVlanActions(self._cli_service, self._logger, netconf_session=self._netconf_session)
+
+    def tearDown(self):
+        self._server.stop()
+
+    def test_get_vlans(self):
+        self.assertEqual(self._instance.get_vlans(), {'v10': '10', 'v20-30': '20-30'})
+        self._cli_service.send_command.assert_not_called()
+
+    def test_get_vlans_for_port(self):
+        self.assertEqual(self._instance.get_vlans_for_port('ge-0/0/1'), ['v10', 'v20-30'])
+        self.assertEqual([element.text for element in self._server.requests[0].iter()
+                          if local_name(element) == 'name'], ['ge-0/0/1'])
+
+    def test_get_vlan_ports(self):
+        self.assertEqual(sorted(self._instance.get_vlan_ports('v10')), ['ae1', 'ge-0/0/1'])
+
+    def test_check_vlan_qnq(self):
+        self.assertTrue(self._instance.check_vlan_qnq('v20-30'))
+        self.assertEqual(self._instance.get_vlans(), {'v10': '10', 'v20-30': '20-30'})
@@ -37,4 +37,9 @@ class TestJuniperAutoloadRunner(TestCase):
         snmp_handler_prop.return_value = snmp_handler
         juniper_snmp_autoload_flow.return_value = result
         self.assertIs(self._instance.autoload_flow, result)
-        juniper_snmp_autoload_flow.assert_called_once_with(snmp_handler, self._logger)
+        juniper_snmp_autoload_flow.assert_called_once_with(snmp_handler, self._logger,
+                                                           profile_handler=self._instance._set_autoload_profile)
+        profile_handler = juniper_snmp_autoload_flow.call_args[1]['profile_handler']
+        self.assertIsNone(self._instance.autoload_profile)
+        profile_handler({'total': {}})
+        self.assertEqual(self._instance.autoload_profile, {'total': {}})
@@ -0,0 +1,98 @@
+import threading
+import time
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from cloudshell.networking.juniper.runners.juniper_fleet_autoload_runner import JuniperFleetAutoloadRunner
+
+
+class TestJuniperFleetAutoloadRunner(TestCase):
+    def setUp(self):
+        self._cli = Mock()
+        self._logger = Mock()
+        self._api = Mock()
+        self._resource_configs = []
+        for name in ['device1', 'device2', 'device3', 'device4']:
+            resource_config = Mock()
+            resource_config.name = name
+            self._resource_configs.append(resource_config)
+
+    @patch('cloudshell.networking.juniper.runners.juniper_fleet_autoload_runner.JuniperAutoloadRunner')
+    def test_create_autoload_runner(self, juniper_autoload_runner):
+        instance = JuniperFleetAutoloadRunner(self._cli, self._logger, self._api)
+        self.assertIs(instance._create_autoload_runner(self._resource_configs[0]),
+                      juniper_autoload_runner.return_value)
+        juniper_autoload_runner.assert_called_once_with(self._cli, self._logger, self._resource_configs[0],
+                                                        self._api)
+
+    def test_discover(self):
+        instance = JuniperFleetAutoloadRunner(self._cli, self._logger, self._api, max_concurrency=2)
+        error = Exception('test')
+
+        def discover(resource_config):
+            if resource_config.name == 'device2':
+                raise error
+            return 'details-' + resource_config.name
+
+        instance._create_autoload_runner = lambda resource_config: Mock(
+            discover=lambda: discover(resource_config))
+        results = instance.discover(self._resource_configs)
+        self.assertEqual(results.keys(), ['device1', 'device2', 'device3', 'device4'])
+        self.assertEqual(results['device1'].autoload_details, 'details-device1')
+        self.assertTrue(results['device1'].succeeded)
+        self.assertIsNone(results['device2'].autoload_details)
+        self.assertIs(results['device2'].error, error)
+        self.assertFalse(results['device2'].succeeded)
+
+    def test_discover_concurrency_limit(self):
+        instance = JuniperFleetAutoloadRunner(self._cli, self._logger, self._api, max_concurrency=2)
+        lock = threading.Lock()
+        running = {'now': 0, 'max': 0}
+
+        def discover():
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.05)
+            with lock:
+                running['now'] -= 1
+
+        instance._create_autoload_runner = Mock(return_value=Mock(discover=discover))
+        results = instance.discover(self._resource_configs)
+        self.assertTrue(all(result.succeeded for result in results.values()))
+        self.assertEqual(running['max'], 2)
+
+    def test_discover_timeout_keeps_slot(self):
+        instance = JuniperFleetAutoloadRunner(self._cli, self._logger, self._api, max_concurrency=1, timeout=0.05)
+        release = threading.Event()
+        started = []
+
+        def discover(resource_config):
+            started.append((resource_config.name, time.time()))
+            if resource_config.name == 'device1':
+                release.wait(1)
+            return 'details'
+
+        instance._create_autoload_runner = lambda resource_config: Mock(
+            discover=lambda: discover(resource_config))
+        threading.Timer(0.2, release.set).start()
+        results = instance.discover(self._resource_configs[:2])
+        self.assertIsNone(results['device1'].autoload_details)
+        self.assertIn('timed out', results['device1'].error.args[1])
+        self.assertTrue(results['device2'].succeeded)
+        # the second device waited for the timed out autoload to stop
+        self.assertGreaterEqual(started[1][1] - started[0][1], 0.15)
+
+    def test_discover_result_handler(self):
+        instance = JuniperFleetAutoloadRunner(self._cli, self._logger, self._api)
+        instance._create_autoload_runner = Mock(return_value=Mock(discover=Mock(return_value='details')))
+        handled = []
+        results = instance.discover(self._resource_configs, result_handler=handled.append)
+        self.assertEqual(len(results), 0)
+        self.assertEqual(sorted(result.resource_name for result in handled),
+                         ['device1', 'device2', 'device3', 'device4'])
+
+    def test_discover_empty(self):
+        instance = JuniperFleetAutoloadRunner(self._cli, self._logger, self._api)
+        self.assertEqual(len(instance.discover([])), 0)
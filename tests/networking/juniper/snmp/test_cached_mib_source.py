@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock import patch
+from pysnmp.smi.builder import DirMibSource, MibBuilder
+
+from cloudshell.networking.juniper.snmp.cached_mib_source import CachedDirMibSource
+
+
+class TestCachedDirMibSource(TestCase):
+    def setUp(self):
+        self._mib_folder = tempfile.mkdtemp()
+        with open(os.path.join(self._mib_folder, 'TEST-MIB.py'), 'w') as mib_file:
+            mib_file.write('class TestNode(object):\n'
+                           '    def getLabel(self):\n'
+                           '        return "testNode"\n'
+                           'mibBuilder.exportSymbols("TEST-MIB", testNode=TestNode())\n')
+        CachedDirMibSource.clear()
+
+    def tearDown(self):
+        CachedDirMibSource.clear()
+        shutil.rmtree(self._mib_folder)
+
+    def _create_mib_builder(self):
+        mib_builder = MibBuilder()
+        mib_builder.setMibSources(CachedDirMibSource(self._mib_folder))
+        return mib_builder
+
+    def test_read_compiles_once(self):
+        with patch.object(DirMibSource, 'read', return_value=('x = 1\n', '.py')) as read:
+            first = CachedDirMibSource(self._mib_folder).init().read('TEST-MIB')
+            second = CachedDirMibSource(self._mib_folder).init().read('TEST-MIB')
+        self.assertIs(first, second)
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(first[1], '.py')
+        self.assertFalse(isinstance(first[0], basestring))
+
+    def test_read_missing_module(self):
+        mib_source = CachedDirMibSource(self._mib_folder).init()
+        self.assertRaises(IOError, mib_source.read, 'UNKNOWN-MIB')
+        self.assertRaises(IOError, mib_source.read, 'UNKNOWN-MIB')
+
+    def test_builders_do_not_share_symbols(self):
+        first_builder = self._create_mib_builder()
+        first_builder.loadModules('TEST-MIB')
+        second_builder = self._create_mib_builder()
+        second_builder.loadModules('TEST-MIB')
+        first_node, = first_builder.importSymbols('TEST-MIB', 'testNode')
+        second_node, = second_builder.importSymbols('TEST-MIB', 'testNode')
+        self.assertEqual(first_node.getLabel(), 'testNode')
+        self.assertIsNot(first_node, second_node)
+        self.assertIsNot(first_node.__class__, second_node.__class__)
@@ -0,0 +1,150 @@
+import socket
+import threading
+from bisect import bisect_right
+from unittest import TestCase
+
+from mock import Mock, patch
+from pyasn1.codec.ber import decoder, encoder
+from pysnmp.entity.rfc3413.oneliner import cmdgen
+from pysnmp.proto import api
+from pysnmp.proto.rfc1902 import Integer32, OctetString
+from pysnmp.proto.rfc1905 import endOfMibView
+
+from cloudshell.networking.juniper.snmp.juniper_async_snmp_service import JuniperAsyncSnmpService
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import SnmpWalkTimeout
+from cloudshell.snmp.quali_snmp import QualiSnmp
+from cloudshell.snmp.snmp_parameters import SNMPV2Parameters
+
+P_MOD = api.protoModules[api.protoVersion2c]
+IF_DESCR = (1, 3, 6, 1, 2, 1, 2, 2, 1, 2)
+IF_TYPE = (1, 3, 6, 1, 2, 1, 2, 2, 1, 3)
+IF_MTU = (1, 3, 6, 1, 2, 1, 2, 2, 1, 4)
+
+
+class FakeUdpSnmpAgent(object):
+    """
+    In-process SNMPv2c agent, answers GETBULK requests from the sorted OIDs after the latency
+    """
+
+    def __init__(self, values, latency=0):
+        self._oids = sorted(values)
+        self._values = values
+        self._latency = latency
+        self._lock = threading.Lock()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.drop = None
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(('127.0.0.1', 0))
+        self._socket.settimeout(0.05)
+        self.address = self._socket.getsockname()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        self._socket.close()
+
+    def _serve(self):
+        while not self._stopped.is_set():
+            try:
+                message, address = self._socket.recvfrom(65535)
+            except socket.timeout:
+                continue
+            request, _ = decoder.decode(message, asn1Spec=P_MOD.Message())
+            oid = tuple(P_MOD.apiPDU.getVarBinds(P_MOD.apiMessage.getPDU(request))[0][0])
+            with self._lock:
+                self.requests.append(oid)
+                if self.drop and self.drop(oid):
+                    continue
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            timer = threading.Timer(self._latency, self._respond, (request, oid, address))
+            timer.daemon = True
+            timer.start()
+
+    def _respond(self, request, oid, address):
+        response = P_MOD.apiMessage.getResponse(request)
+        max_repetitions = int(P_MOD.apiBulkPDU.getMaxRepetitions(P_MOD.apiMessage.getPDU(request)))
+        position = bisect_right(self._oids, oid)
+        var_binds = [(name, self._values[name]) for name in self._oids[position:position + max_repetitions]]
+        if len(var_binds) < max_repetitions:
+            var_binds.append((var_binds[-1][0] if var_binds else oid, endOfMibView))
+        P_MOD.apiPDU.setVarBinds(P_MOD.apiMessage.getPDU(response), var_binds)
+        with self._lock:
+            self.in_flight -= 1
+        if not self._stopped.is_set():
+            self._socket.sendto(encoder.encode(response), address)
+
+
+class TestJuniperAsyncSnmpService(TestCase):
+    def setUp(self):
+        values = {}
+        for index in range(1, 26):
+            values[IF_DESCR + (index,)] = OctetString('ge-0/0/{0}'.format(index))
+            values[IF_TYPE + (index,)] = Integer32(6)
+            values[IF_MTU + (index,)] = Integer32(1514)
+        self._agent = FakeUdpSnmpAgent(values, latency=0.02)
+        self._logger = Mock()
+        with patch.object(QualiSnmp, '_test_snmp_agent'):
+            snmp_service = QualiSnmp(SNMPV2Parameters(self._agent.address[0], 'public', port=self._agent.address[1]),
+                                     self._logger)
+        snmp_service.target = cmdgen.UdpTransportTarget(self._agent.address, timeout=0.2, retries=0)
+        snmp_service.load_mib('IF-MIB')
+        self._walk_progress = {}
+        self._instance = JuniperAsyncSnmpService(snmp_service, self._logger, max_outstanding=2, max_repetitions=10,
+                                                 retries=1, walk_progress=self._walk_progress)
+
+    def tearDown(self):
+        self._agent.stop()
+
+    def test_init(self):
+        self.assertEqual(self._instance.max_outstanding, 2)
+        self.assertEqual(self._instance.max_repetitions, 10)
+        self.assertEqual(self._instance.retries, 1)
+
+    def test_prefetch(self):
+        errors = self._instance.prefetch([('IF-MIB', 'ifDescr'), ('IF-MIB', 'ifType'), '1.3.6.1.2.1.2.2.1.4'])
+        self.assertEqual(errors, {})
+        # 25 rows in pages of 10 rows
+        self.assertEqual(self._instance.request_count, 9)
+        self.assertEqual(self._agent.max_in_flight, 2)
+
+        if_descr = self._instance.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(len(if_descr), 25)
+        self.assertEqual(if_descr[3], {'suffix': '3', 'ifDescr': 'ge-0/0/3'})
+        self.assertEqual(self._instance.walk(('IF-MIB', 'ifType'))[25]['ifType'], '6')
+        self.assertEqual(self._instance.walk_oid('1.3.6.1.2.1.2.2.1.4'), dict.fromkeys(range(1, 26), 1514))
+        self.assertEqual(self._instance.request_count, 9)
+
+        # prefetched walk is returned once
+        self.assertEqual(len(self._instance.walk(('IF-MIB', 'ifDescr'))), 25)
+        self.assertEqual(self._instance.request_count, 12)
+
+    def test_prefetch_empty(self):
+        self.assertEqual(self._instance.prefetch([]), {})
+        self.assertEqual(self._instance.request_count, 0)
+
+    def test_prefetch_timeout_resumes_walk(self):
+        # the second page of ifType is lost
+        self._agent.drop = lambda oid: oid == IF_TYPE + (10,)
+        errors = self._instance.prefetch([('IF-MIB', 'ifDescr'), ('IF-MIB', 'ifType')])
+        self.assertEqual(errors.keys(), [('IF-MIB', 'ifType')])
+        self.assertIsInstance(errors[('IF-MIB', 'ifType')], SnmpWalkTimeout)
+        last_name, var_binds = self._walk_progress[IF_TYPE]
+        self.assertEqual(len(var_binds), 10)
+        # timed out page was requested again with the halved max-repetitions
+        self.assertEqual(self._instance.max_repetitions, 5)
+
+        self._agent.drop = None
+        request_count = self._instance.request_count
+        self.assertEqual(len(self._instance.walk(('IF-MIB', 'ifDescr'))), 25)
+        self.assertEqual(self._instance.request_count, request_count)
+        if_type = self._instance.walk(('IF-MIB', 'ifType'))
+        self.assertEqual(sorted(if_type), range(1, 26))
+        self.assertEqual(self._agent.requests[-1], IF_TYPE + (25,))
+        self.assertNotIn(IF_TYPE, self._walk_progress)
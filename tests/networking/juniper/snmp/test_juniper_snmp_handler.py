@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from cloudshell.networking.juniper.snmp.juniper_snmp_handler import JuniperSnmpHandler
+
+
+class TestJuniperSnmpHandler(TestCase):
+    @patch('cloudshell.devices.snmp_handler.get_snmp_parameters_from_command_context')
+    def setUp(self, get_snmp_parameters):
+        self._cli = Mock()
+        self._resource_config = Mock()
+        self._logger = Mock()
+        self._api = Mock()
+        self._snmp_parameters = get_snmp_parameters.return_value
+        self._instance = JuniperSnmpHandler(self._cli, self._resource_config, self._logger, self._api)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_handler.QualiSnmp')
+    def test_create_snmp_session(self, quali_snmp_class):
+        self.assertIs(self._instance.create_snmp_session(), quali_snmp_class.return_value)
+        quali_snmp_class.assert_called_once_with(self._snmp_parameters, self._logger)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_handler.JuniperCliHandler')
+    def test_juniper_cli_handler(self, cli_handler_class):
+        self.assertIs(self._instance.juniper_cli_handler, cli_handler_class.return_value)
+        cli_handler_class.assert_called_once_with(self._cli, self._resource_config, self._logger, self._api)
@@ -0,0 +1,247 @@
+from unittest import TestCase
+
+from mock import Mock, call, patch
+from pysnmp.error import PySnmpError
+from pysnmp.proto.rfc1902 import Integer32, IpAddress, ObjectIdentifier, ObjectName, OctetString
+from pysnmp.proto.rfc1905 import endOfMibView
+from pysnmp.smi.builder import DirMibSource, ZipMibSource
+
+from cloudshell.networking.juniper.snmp.cached_mib_source import CachedDirMibSource
+from cloudshell.networking.juniper.snmp.juniper_snmp_service import JuniperSnmpService, SnmpWalkTimeout
+
+
+class TestJuniperSnmpService(TestCase):
+    COLUMNS = {'1.3.6.1.2.1.2.2.1.2': ('IF-MIB', 'ifDescr'),
+               '1.3.6.1.2.1.2.2.1.3': ('IF-MIB', 'ifType'),
+               '1.3.6.1.2.1.2.2.1.4': ('IF-MIB', 'ifMtu'),
+               '1.3.6.1.4.1.2636.3.1.8.1.14': ('JUNIPER-MIB', 'jnxContentsModel')}
+
+    def setUp(self):
+        self._snmp_service = Mock()
+        self._logger = Mock()
+        self._snmp_service.mib_viewer.getNodeLocation.side_effect = self._get_node_location
+        self._walk_progress = {}
+        self._instance = JuniperSnmpService(self._snmp_service, self._logger, 10, walk_progress=self._walk_progress)
+
+    def _get_node_location(self, name):
+        for oid, (mib, column) in self.COLUMNS.iteritems():
+            root = ObjectName(oid)
+            if root.isPrefixOf(name):
+                return mib, column, ObjectName(name[len(root):])
+
+    def _set_root(self, object_identity, mib, column):
+        oid = [oid for oid, location in self.COLUMNS.iteritems() if location == (mib, column)][0]
+        object_identity.return_value.getOid.return_value = ObjectName(oid)
+        return oid
+
+    def _var_bind(self, mib, column, suffix, value):
+        oid = [oid for oid, location in self.COLUMNS.iteritems() if location == (mib, column)][0]
+        snmp_value = Mock()
+        snmp_value.prettyPrint.return_value = value
+        return [(ObjectName('{0}.{1}'.format(oid, suffix)), snmp_value)]
+
+    def _too_big(self):
+        error_status = Mock()
+        error_status.prettyPrint.return_value = JuniperSnmpService.TOO_BIG_ERROR
+        return None, error_status, 1, []
+
+    def test_init(self):
+        self.assertIs(self._instance._snmp_service, self._snmp_service)
+        self.assertIs(self._instance._logger, self._logger)
+        self.assertEqual(self._instance.max_repetitions, 10)
+        self.assertEqual(JuniperSnmpService(self._snmp_service, self._logger).max_repetitions,
+                         JuniperSnmpService.DEFAULT_MAX_REPETITIONS)
+
+    def test_delegates_to_snmp_service(self):
+        self.assertIs(self._instance.get_property, self._snmp_service.get_property)
+
+    def test_update_mib_sources(self):
+        zip_source = ZipMibSource('pysnmp.smi.mibs')
+        cached_source = CachedDirMibSource('/opt/mibs')
+        self._snmp_service.mib_builder.getMibSources.return_value = (zip_source, DirMibSource('/quali/mibs'),
+                                                                     cached_source)
+        self._instance.update_mib_sources('/juniper/mibs')
+        mib_sources = self._snmp_service.mib_builder.setMibSources.call_args[0]
+        self.assertIs(mib_sources[0], zip_source)
+        self.assertIs(mib_sources[2], cached_source)
+        self.assertEqual([(source.__class__, source.fullPath()) for source in mib_sources[1::2]],
+                         [(CachedDirMibSource, '/quali/mibs'), (CachedDirMibSource, '/juniper/mibs')])
+
+    def _assert_bulk_calls(self, *max_repetitions_and_oids):
+        self.assertEqual(self._snmp_service.cmd_gen.bulkCmd.call_args_list,
+                         [call(self._snmp_service.security, self._snmp_service.target, 0, max_repetitions, oid,
+                               lexicographicMode=True, maxCalls=1)
+                          for max_repetitions, oid in max_repetitions_and_oids])
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifDescr')
+        var_binds = [self._var_bind('IF-MIB', 'ifDescr', '1', 'ge-0/0/0'),
+                     self._var_bind('IF-MIB', 'ifDescr', '2', 'ge-0/0/1'),
+                     self._var_bind('IF-MIB', 'ifType', '1', '6')]
+        self._snmp_service.cmd_gen.bulkCmd.return_value = None, 0, 0, var_binds
+        result = self._instance.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(result, {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'},
+                                  2: {'suffix': '2', 'ifDescr': 'ge-0/0/1'}})
+        object_identity.assert_called_once_with('IF-MIB', 'ifDescr')
+        object_identity.return_value.resolveWithMib.assert_called_once_with(self._snmp_service.mib_viewer)
+        self._assert_bulk_calls((10, object_identity.return_value))
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_end_of_mib_view(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifDescr')
+        var_binds = [self._var_bind('IF-MIB', 'ifDescr', '1', 'ge-0/0/0'),
+                     [(ObjectName('1.3.6.1.2.1.2.2.1.2.2'), endOfMibView)]]
+        self._snmp_service.cmd_gen.bulkCmd.return_value = None, 0, 0, var_binds
+        self.assertEqual(self._instance.walk(('IF-MIB', 'ifDescr')), {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'}})
+        self.assertEqual(self._snmp_service.cmd_gen.bulkCmd.call_count, 1)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_pages(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifDescr')
+        self._snmp_service.cmd_gen.bulkCmd.side_effect = [
+            (None, 0, 0, [self._var_bind('IF-MIB', 'ifDescr', '1', 'ge-0/0/0')]),
+            (None, 0, 0, [self._var_bind('IF-MIB', 'ifDescr', '2', 'ge-0/0/1')]),
+            (None, 0, 0, [])]
+        result = self._instance.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(result, {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'},
+                                  2: {'suffix': '2', 'ifDescr': 'ge-0/0/1'}})
+        self.assertEqual(object_identity.call_args_list,
+                         [call('IF-MIB', 'ifDescr'), call(ObjectName('1.3.6.1.2.1.2.2.1.2.1')),
+                          call(ObjectName('1.3.6.1.2.1.2.2.1.2.2'))])
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_not_increasing(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifDescr')
+        self._snmp_service.cmd_gen.bulkCmd.return_value = None, 0, 0, [
+            self._var_bind('IF-MIB', 'ifDescr', '2', 'ge-0/0/1')]
+        self.assertEqual(self._instance.walk(('IF-MIB', 'ifDescr')), {2: {'suffix': '2', 'ifDescr': 'ge-0/0/1'}})
+        self.assertEqual(self._snmp_service.cmd_gen.bulkCmd.call_count, 2)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_indexes(self, object_identity):
+        self._set_root(object_identity, 'JUNIPER-MIB', 'jnxContentsModel')
+        var_binds = [self._var_bind('JUNIPER-MIB', 'jnxContentsModel', '1.1.0.0', 'MX960'),
+                     self._var_bind('JUNIPER-MIB', 'jnxContentsModel', '2.1.0.0', 'PWR')]
+        self._snmp_service.cmd_gen.bulkCmd.side_effect = [(None, 0, 0, var_binds), (None, 0, 0, [])]
+        result = self._instance.walk(('JUNIPER-MIB', 'jnxContentsModel'), '2.1.0.0')
+        self.assertEqual(result, {'2.1.0.0': {'suffix': '2.1.0.0', 'jnxContentsModel': 'PWR'}})
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_too_big(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifMtu')
+        var_binds = [self._var_bind('IF-MIB', 'ifMtu', '1', '1514')]
+        self._snmp_service.cmd_gen.bulkCmd.side_effect = [self._too_big(), self._too_big(), (None, 0, 0, var_binds),
+                                                          (None, 0, 0, [])]
+        result = self._instance.walk(('IF-MIB', 'ifMtu'))
+        self.assertEqual(result, {1: {'suffix': '1', 'ifMtu': '1514'}})
+        self.assertEqual([c[0][3] for c in self._snmp_service.cmd_gen.bulkCmd.call_args_list], [10, 5, 2, 2])
+        self.assertEqual(self._instance.max_repetitions, 2)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_too_big_single_repetition(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifMtu')
+        self._instance.max_repetitions = 1
+        self._snmp_service.cmd_gen.bulkCmd.return_value = self._too_big()
+        with self.assertRaises(PySnmpError):
+            self._instance.walk(('IF-MIB', 'ifMtu'))
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_error_indication(self, object_identity):
+        self._set_root(object_identity, 'IF-MIB', 'ifMtu')
+        self._snmp_service.cmd_gen.bulkCmd.return_value = 'unknownUserName', 0, 0, []
+        with self.assertRaises(PySnmpError):
+            self._instance.walk(('IF-MIB', 'ifMtu'))
+        self.assertEqual(self._snmp_service.cmd_gen.bulkCmd.call_count, 1)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.random')
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.time.sleep')
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_timeout_retry(self, object_identity, sleep, random):
+        self._set_root(object_identity, 'IF-MIB', 'ifDescr')
+        random.uniform.side_effect = lambda low, high: high
+        self._snmp_service.cmd_gen.bulkCmd.side_effect = [
+            (None, 0, 0, [self._var_bind('IF-MIB', 'ifDescr', '1', 'ge-0/0/0')]),
+            ('requestTimedOut', 0, 0, []),
+            ('requestTimedOut', 0, 0, []),
+            (None, 0, 0, [self._var_bind('IF-MIB', 'ifDescr', '2', 'ge-0/0/1')]),
+            (None, 0, 0, [])]
+        result = self._instance.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(result, {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'},
+                                  2: {'suffix': '2', 'ifDescr': 'ge-0/0/1'}})
+        self.assertEqual(sleep.call_args_list, [call(1.0), call(2.0)])
+        self.assertEqual(self._instance.request_count, 5)
+        self.assertEqual([c[0][3] for c in self._snmp_service.cmd_gen.bulkCmd.call_args_list], [10, 10, 5, 2, 2])
+        self.assertEqual(object_identity.call_args_list[1:],
+                         [call(ObjectName('1.3.6.1.2.1.2.2.1.2.1'))] * 3 + [call(ObjectName('1.3.6.1.2.1.2.2.1.2.2'))])
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.random')
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.time.sleep')
+    def test_back_off_limit(self, sleep, random):
+        random.uniform.side_effect = lambda low, high: high
+        self._instance._back_off(10)
+        sleep.assert_called_once_with(JuniperSnmpService.MAX_BACKOFF)
+        self.assertEqual(self._instance.max_repetitions, 5)
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.random')
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.time.sleep')
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_timeout_resume(self, object_identity, sleep, random):
+        oid = self._set_root(object_identity, 'IF-MIB', 'ifDescr')
+        random.uniform.return_value = 0.5
+        self._instance.retries = 1
+        first_row = self._var_bind('IF-MIB', 'ifDescr', '1', 'ge-0/0/0')
+        self._snmp_service.cmd_gen.bulkCmd.side_effect = [(None, 0, 0, [first_row]),
+                                                          ('requestTimedOut', 0, 0, []),
+                                                          ('requestTimedOut', 0, 0, [])]
+        with self.assertRaises(SnmpWalkTimeout):
+            self._instance.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(self._walk_progress, {ObjectName(oid).asTuple(): (first_row[0][0], [first_row])})
+
+        session = JuniperSnmpService(self._snmp_service, self._logger, 10, walk_progress=self._walk_progress)
+        self._snmp_service.cmd_gen.bulkCmd.side_effect = [
+            (None, 0, 0, [self._var_bind('IF-MIB', 'ifDescr', '2', 'ge-0/0/1')]), (None, 0, 0, [])]
+        result = session.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(result, {1: {'suffix': '1', 'ifDescr': 'ge-0/0/0'},
+                                  2: {'suffix': '2', 'ifDescr': 'ge-0/0/1'}})
+        self.assertEqual(object_identity.call_args_list[-3:],
+                         [call('IF-MIB', 'ifDescr'), call(ObjectName('1.3.6.1.2.1.2.2.1.2.1')),
+                          call(ObjectName('1.3.6.1.2.1.2.2.1.2.2'))])
+        self.assertEqual(self._walk_progress, {})
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_oid(self, object_identity):
+        object_identity.return_value.getOid.return_value = ObjectName('1.3.6.1.2.1.2.2.1.2')
+        var_binds = [[(ObjectName('1.3.6.1.2.1.2.2.1.2.501'), OctetString('ge-0/0/0'))],
+                     [(ObjectName('1.3.6.1.2.1.2.2.1.2.502'), OctetString('ge-0/0/1 '))],
+                     [(ObjectName('1.3.6.1.2.1.2.2.1.3.501'), Integer32(6))],
+                     [(ObjectName('1.3.6.1.2.1.2.2.1.3.502'), endOfMibView)]]
+        self._snmp_service.cmd_gen.bulkCmd.return_value = None, 0, 0, var_binds
+        self.assertEqual(self._instance.walk_oid('1.3.6.1.2.1.2.2.1.2'), {501: 'ge-0/0/0', 502: 'ge-0/0/1 '})
+        object_identity.assert_called_once_with('1.3.6.1.2.1.2.2.1.2')
+        self._snmp_service.mib_viewer.getNodeLocation.assert_not_called()
+
+    @patch('cloudshell.networking.juniper.snmp.juniper_snmp_service.ObjectIdentity')
+    def test_walk_oid_indexes(self, object_identity):
+        object_identity.return_value.getOid.return_value = ObjectName('1.3.6.1.4.1.2636.3.1.8.1.5')
+        var_binds = [[(ObjectName('1.3.6.1.4.1.2636.3.1.8.1.5.1.1.0.0'), ObjectIdentifier('1.3.6.1.4.1.2636.1.1.1.2.21'))],
+                     [(ObjectName('1.3.6.1.4.1.2636.3.1.8.1.5.4'), ObjectIdentifier('1.3.6.1.4.1.2636.1.1.3'))],
+                     [(ObjectName('1.3.6.1.4.1.2636.3.1.8.1.5.9.1.0'), ObjectIdentifier('1.3.6.1.4.1.2636.1.1.2'))]]
+        self._snmp_service.cmd_gen.bulkCmd.return_value = None, 0, 0, var_binds
+        self.assertEqual(self._instance.walk_oid('.1.3.6.1.4.1.2636.3.1.8.1.5'),
+                         {'1.1.0.0': '1.3.6.1.4.1.2636.1.1.1.2.21', '9.1.0': '1.3.6.1.4.1.2636.1.1.2',
+                          4: '1.3.6.1.4.1.2636.1.1.3'})
+
+    def test_decode_value(self):
+        self.assertEqual(JuniperSnmpService._decode_value(Integer32(1514)), 1514)
+        self.assertEqual(JuniperSnmpService._decode_value(OctetString('\x2c\x6b')), '\x2c\x6b')
+        self.assertEqual(JuniperSnmpService._decode_value(IpAddress('10.0.0.1')), '10.0.0.1')
+        self.assertEqual(JuniperSnmpService._decode_value(ObjectIdentifier('1.3.6.1')), '1.3.6.1')
+
+    def test_get_named_values(self):
+        mib_node = Mock()
+        self._snmp_service.mib_builder.importSymbols.return_value = (mib_node,)
+        self.assertIs(self._instance.get_named_values('IF-MIB', 'ifType'), mib_node.getSyntax.return_value.namedValues)
+        self._snmp_service.mib_builder.importSymbols.assert_called_once_with('IF-MIB', 'ifType')
+        mib_node.getSyntax.return_value.namedValues = None
+        self.assertIsNone(self._instance.get_named_values('IF-MIB', 'ifType'))
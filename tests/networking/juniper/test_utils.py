@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from mock import Mock
+
+from cloudshell.networking.juniper.utils import FakeSnmpHandler, index_elements_by_attributes, \
+    index_objects_by_attributes, sort_elements_by_attributes, sort_objects_by_attributes
+
+
+class TestFakeSnmpHandler(TestCase):
+    def setUp(self):
+        self._instance = FakeSnmpHandler({
+            'IF-MIB::ifDescr': [(1, {'suffix': '1', 'ifDescr': 'ge-0/0/0'}), (2, {'suffix': '2', 'ifDescr': 'ae0'})],
+            'SNMPv2-MIB::sysName': [(0, {'suffix': '0', 'sysName': 'mx960'})]})
+
+    def test_walk(self):
+        result = self._instance.walk(('IF-MIB', 'ifDescr'))
+        self.assertEqual(result[2]['ifDescr'], 'ae0')
+
+    def test_get_property(self):
+        self.assertEqual(self._instance.get_property('IF-MIB', 'ifDescr', 1), 'ge-0/0/0')
+        self.assertEqual(self._instance.get_property('SNMPv2-MIB', 'sysName', '0'), 'mx960')
+        self.assertEqual(self._instance.get_property('IF-MIB', 'ifDescr', 3), '')
+        self.assertEqual(self._instance.get_property('IF-MIB', 'ifAlias', 1), '')
+
+
+class TestIndexByAttributes(TestCase):
+    def setUp(self):
+        self._rows = {'10.0.0.1': {'suffix': '10.0.0.1', 'ipAdEntAddr': '10.0.0.1', 'ipAdEntIfIndex': '501'},
+                      '10.0.1.1': {'suffix': '10.0.1.1', 'ipAdEntAddr': '10.0.1.1', 'ipAdEntIfIndex': '501'},
+                      '10.0.2.1': {'suffix': '10.0.2.1', 'ipAdEntAddr': '10.0.2.1', 'ipAdEntIfIndex': '502'},
+                      '127.0.0.1': {'suffix': '127.0.0.1', 'ipAdEntAddr': '127.0.0.1'}}
+
+    def test_index_elements_by_attributes(self):
+        result = index_elements_by_attributes(self._rows.itervalues(), 'ipAdEntIfIndex', 'ipAdEntAddr')
+        self.assertEqual(sorted(result), [('501', '10.0.0.1'), ('501', '10.0.1.1'), ('502', '10.0.2.1')])
+        self.assertIs(result[('502', '10.0.2.1')], self._rows['10.0.2.1'])
+
+    def test_index_elements_by_attributes_group(self):
+        result = index_elements_by_attributes(self._rows.itervalues(), 'ipAdEntIfIndex', group=True)
+        self.assertEqual(sorted(result), [('501',), ('502',)])
+        self.assertEqual(sorted(row['suffix'] for row in result[('501',)]), ['10.0.0.1', '10.0.1.1'])
+        self.assertEqual(len(index_elements_by_attributes(self._rows.itervalues(), 'ipAdEntIfIndex')), 2)
+
+    def test_index_objects_by_attributes(self):
+        ports = [Mock(port_name='ge-0/0/0', unit='0'), Mock(port_name='ge-0/0/0', unit='1'),
+                 Mock(spec=['port_name'], port_name='ae0')]
+        self.assertEqual(index_objects_by_attributes(ports, 'port_name', 'unit'),
+                         {('ge-0/0/0', '0'): ports[0], ('ge-0/0/0', '1'): ports[1]})
+        self.assertEqual(index_objects_by_attributes(ports, 'port_name', group=True),
+                         {('ge-0/0/0',): ports[:2], ('ae0',): ports[2:]})
+
+    def test_sort_elements_by_attributes(self):
+        result = sort_elements_by_attributes(self._rows, 'ipAdEntIfIndex', 'ipAdEntAddr')
+        self.assertEqual(sorted(result), ['501.10.0.0.1', '501.10.0.1.1', '502.10.0.2.1'])
+
+    def test_sort_objects_by_attributes(self):
+        ports = [Mock(port_name='ge-0/0/0', unit=0), Mock(port_name='ae0', unit=None)]
+        self.assertEqual(sort_objects_by_attributes(ports, 'port_name', 'unit'), {'ge-0/0/0.0': ports[0]})